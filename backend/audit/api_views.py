@@ -13,6 +13,8 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
+from common.pagination import CursorOptInPagination
+
 from .models import AuditLog
 from .serializers import (
     AuditLogSerializer,
@@ -61,6 +63,10 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     ordering_fields = ['created_at', 'category', 'level', 'action']
     ordering = ['-created_at']  # Default: most recent first
 
+    # ?cursor= switches the list to keyset pagination (no COUNT/OFFSET on large tables)
+    pagination_class = CursorOptInPagination
+    cursor_ordering = ('-created_at', 'id')
+
     def get_serializer_class(self):
         """Use lightweight serializer for list, complete for detail."""
         if self.action == 'list':
@@ -535,6 +535,38 @@ class AuditService:
             metadata=error_details or {}
         )
 
+    @staticmethod
+    def log_bulk(action, resource_type, entries, category=AuditLog.Category.SYSTEM, level=AuditLog.Level.INFO):
+        """
+        Log one system row per affected resource in a single INSERT.
+
+        Used by set-based jobs (lifecycle sweeper) that transition many rows
+        with one UPDATE and must not write their audit trail row by row.
+
+        Args:
+            action: Action performed (e.g., 'booking_expired')
+            resource_type: Type of the affected resources
+            entries: Iterable of (resource_id, message, metadata) tuples
+            category: Log category (defaults to SYSTEM)
+            level: Log level (defaults to INFO)
+
+        Returns:
+            list: Created AuditLog instances
+        """
+        return AuditLog.objects.bulk_create([
+            AuditLog(
+                category=category,
+                level=level,
+                action=action,
+                message=message,
+                user=None,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                metadata=metadata,
+            )
+            for resource_id, message, metadata in entries
+        ])
+
     # ==========================================================================
     # PAYMENT EVENTS
     # ==========================================================================
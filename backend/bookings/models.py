@@ -8,7 +8,7 @@ for a language exchange event.
 import uuid
 from datetime import timedelta
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q, CheckConstraint, UniqueConstraint
 from django.utils import timezone
 
@@ -158,6 +158,73 @@ class Booking(models.Model):
     def __str__(self) -> str:
         return f"Booking({self.public_id}) {self.user} -> {self.event} [{self.status}]"
 
+    def save(self, *args, **kwargs):
+        """
+        Save booking and keep Event.confirmed_seats and the partner slot
+        occupancy ledger in sync.
+
+        Only status changes move confirmed seats; a new non-confirmed booking
+        does not occupy a seat yet. The previous status is read under a row
+        lock so concurrent transitions of the same booking count once.
+        """
+        from partners.services import OccupancyService
+        from events.services import EventFeedCacheService
+
+        update_fields = kwargs.get("update_fields")
+        touches_slots = (update_fields is None or "status" in update_fields) and not (
+            self._state.adding and self.status != BookingStatus.CONFIRMED
+        )
+
+        with transaction.atomic():
+            was_confirmed = False
+            if touches_slots and not self._state.adding and self.pk:
+                was_confirmed = (
+                    type(self).objects.select_for_update()
+                    .filter(pk=self.pk, status=BookingStatus.CONFIRMED)
+                    .exists()
+                )
+            super().save(*args, **kwargs)
+            if touches_slots:
+                self._move_confirmed_seats(
+                    int(self.status == BookingStatus.CONFIRMED) - int(was_confirmed)
+                )
+                OccupancyService.refresh_for_event(self.event)
+            EventFeedCacheService.invalidate()
+
+    def delete(self, *args, **kwargs):
+        """Delete booking and release its seat in the slot occupancy ledger."""
+        from partners.services import OccupancyService
+        from events.services import EventFeedCacheService
+
+        with transaction.atomic():
+            was_confirmed = (
+                type(self).objects.select_for_update()
+                .filter(pk=self.pk, status=BookingStatus.CONFIRMED)
+                .exists()
+            )
+            result = super().delete(*args, **kwargs)
+            if was_confirmed:
+                self._move_confirmed_seats(-1)
+                OccupancyService.refresh_for_event(self.event)
+            EventFeedCacheService.invalidate()
+        return result
+
+    def _move_confirmed_seats(self, delta):
+        """
+        Apply delta to Event.confirmed_seats with an F-expression.
+
+        The loaded event instance (if any) is adjusted too, so callers holding
+        it read the new value without a refresh.
+        """
+        if not delta:
+            return
+        from django.db.models import F
+        from events.models import Event
+
+        Event.objects.filter(pk=self.event_id).update(confirmed_seats=F("confirmed_seats") + delta)
+        if "event" in self._state.fields_cache:
+            self.event.confirmed_seats = max(0, self.event.confirmed_seats + delta)
+
     @property
     def is_expired(self) -> bool:
         """
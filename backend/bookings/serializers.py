@@ -1,9 +1,15 @@
 """Booking serializers for API endpoints."""
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_serializer, OpenApiExample
+from common.mixins import SparseFieldsetMixin
 from .models import Booking, BookingStatus
 
 
+def _expanded_event():
+    from events.serializers import EventSerializer
+    return EventSerializer(read_only=True, sparse=False)
+
+
 @extend_schema_serializer(
     examples=[
         OpenApiExample(
@@ -31,8 +37,15 @@ from .models import Booking, BookingStatus
         )
     ]
 )
-class BookingSerializer(serializers.ModelSerializer):
-    """Booking read serializer with HATEOAS links."""
+class BookingSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Booking read serializer with HATEOAS links.
+
+    Supports `?fields=` and `?expand=event` (see SparseFieldsetMixin).
+    """
+
+    expandable_fields = {"event": _expanded_event}
+    field_select_related = {"event": ("event__partner", "event__language")}
 
     links = serializers.SerializerMethodField(help_text="HATEOAS links for related resources")
 
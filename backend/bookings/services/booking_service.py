@@ -105,7 +105,7 @@ class BookingService(BaseService):
 
     @staticmethod
     @transaction.atomic
-    def cancel_booking(booking, cancelled_by=None, system_cancellation=False):
+    def cancel_booking(booking, cancelled_by=None, system_cancellation=False, defer_refund=False):
         """
         Cancel a booking if allowed.
 
@@ -119,6 +119,8 @@ class BookingService(BaseService):
             booking: Booking to cancel
             cancelled_by: User cancelling the booking (defaults to booking.user, None for system)
             system_cancellation: If True, bypass cancellation deadline (for auto-cancel)
+            defer_refund: If True, record the refund in the outbox (executed
+                after commit) instead of calling Stripe now
 
         Returns:
             dict: Cancellation result with refund info (if applicable)
@@ -136,8 +138,15 @@ class BookingService(BaseService):
         cancelled_by = cancelled_by or booking.user
         result = {"cancelled": False, "refunded": False, "refund_message": None}
 
+        # Event cancellations: refund after commit, off the request
+        if booking.status == BookingStatus.CONFIRMED and defer_refund:
+            from payments.services import RefundOutboxService
+
+            RefundOutboxService.enqueue([booking], requested_by=cancelled_by)
+            result["refund_pending"] = True
+
         # If CONFIRMED, process refund first
-        if booking.status == BookingStatus.CONFIRMED:
+        elif booking.status == BookingStatus.CONFIRMED:
             from payments.services import RefundService
             from payments.exceptions import (
                 PaymentIntentMissingError,
@@ -185,25 +194,14 @@ class BookingService(BaseService):
         """
         Automatically expire pending bookings past their expiration time.
 
+        Runs as chunked bulk updates (see events LifecycleSweeper).
+
         Returns:
             int: Number of bookings expired
         """
-        from bookings.models import Booking, BookingStatus
-
-        now = timezone.now()
-        expired_bookings = Booking.objects.filter(
-            status=BookingStatus.PENDING,
-            expires_at__lte=now
-        )
-
-        count = expired_bookings.count()
-        expired_bookings.update(
-            status=BookingStatus.CANCELLED,
-            cancelled_at=now,
-            updated_at=now
-        )
+        from events.services import LifecycleSweeper
 
-        return count
+        return len(LifecycleSweeper.expire_bookings())
 
     @staticmethod
     @transaction.atomic
@@ -232,7 +230,10 @@ class BookingService(BaseService):
             raise BookingExpiredError()
 
         # CRITICAL: Validate capacity before confirmation to prevent overbooking
-        # This protects against race conditions where multiple users pay simultaneously
+        # Locking the event row serializes concurrent confirmations: each one
+        # reads confirmed_seats after the previous one has moved it
+        from events.models import Event
+        list(Event.objects.select_for_update().filter(pk=booking.event_id).values_list("pk"))
         validate_event_capacity(booking.event)
 
         # Mark as confirmed
@@ -122,10 +122,13 @@ def validate_event_capacity(event):
         ValidationError: If event is full (no available slots)
     """
     # Enforce per-event maximum (6 per event by business rule)
-    from bookings.models import BookingStatus
+    from events.models import Event
     # Count only CONFIRMED seats - PENDING bookings don't reserve capacity
-    # until payment is completed (prevents unpaid bookings from blocking spots)
-    confirmed_count = event.bookings.filter(status=BookingStatus.CONFIRMED).count()
+    # until payment is completed (prevents unpaid bookings from blocking spots).
+    # Column read of the maintained counter (fresh from the database).
+    confirmed_count = (
+        Event.objects.filter(pk=event.pk).values_list("confirmed_seats", flat=True).first() or 0
+    )
     per_event_cap = int(getattr(event, 'max_participants', MAX_PARTICIPANTS_PER_EVENT) or MAX_PARTICIPANTS_PER_EVENT)
     if confirmed_count >= per_event_cap:
         raise ValidationError(
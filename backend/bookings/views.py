@@ -7,6 +7,7 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiRespon
 from .models import Booking, BookingStatus
 from .serializers import BookingSerializer, BookingCreateSerializer
 from common.permissions import IsAuthenticatedAndActive
+from common.pagination import CursorOptInPagination
 
 
 class BookingViewSet(mixins.CreateModelMixin,
@@ -18,6 +19,10 @@ class BookingViewSet(mixins.CreateModelMixin,
     lookup_field = "public_id"
     lookup_value_regex = r"[0-9a-fA-F-]{36}"
 
+    # ?cursor= switches the list to keyset pagination (no COUNT/OFFSET)
+    pagination_class = CursorOptInPagination
+    cursor_ordering = ("-created_at", "id")
+
     def get_queryset(self):
         """
         Get user's bookings with optional filtering.
@@ -29,7 +34,7 @@ class BookingViewSet(mixins.CreateModelMixin,
         # Scope to user's bookings only
         qs = (
             Booking.objects
-            .select_related("event")
+            .select_related("event", *BookingSerializer.get_select_related(self.request))
             .filter(user=self.request.user)
             .filter(event__isnull=False)  # Securité: exclure références orphelines
         )
@@ -24,6 +24,32 @@ DEFAULT_EVENT_DURATION_HOURS = 1  # All events are exactly 1 hour long
 MIN_ADVANCE_BOOKING_HOURS = 3  # Events must be created at least 3h in advance
 MAX_FUTURE_BOOKING_DAYS = 7  # Events cannot be scheduled more than 1 week in advance
 
+# Event recommendations (same scale as the client-side sorting service)
+RECOMMENDATION_SCORE_BIDIRECTIONAL = 300  # Speaks AND learns the event language
+RECOMMENDATION_SCORE_NATIVE = 200  # Speaks the event language
+RECOMMENDATION_SCORE_MIN = 100  # Minimum score to be flagged "recommended"
+RECOMMENDATION_BONUS_NEARBY = 40  # Partner in the user's city
+RECOMMENDATION_BONUS_FREE = 20  # Free event
+RECOMMENDATION_BONUS_SOON = 10  # Starts within 7 days
+RECOMMENDATION_BONUS_ALMOST_FULL = 5  # >= 80% booked, not full
+RECOMMENDATION_PENALTY_BOOKED = 300  # User already booked
+RECOMMENDATION_PENALTY_FULL = 1200  # No seat left
+RECOMMENDATION_DEFAULT_LIMIT = 5
+RECOMMENDATION_MAX_LIMIT = 20
+
+# Public events feed cache (PUBLISHED, now..+7d), versioned on every event/booking change
+EVENT_FEED_CACHE_TIMEOUT = 60  # Seconds; also bounds drift of the sliding 7-day window
+
+# Lifecycle sweeper (finish/cancel events, expire drafts and bookings)
+LIFECYCLE_SWEEP_CHUNK_SIZE = 500  # Rows claimed and transitioned per UPDATE
+
+# Lifecycle scheduler (run_scheduler worker, fires the sweeper on exact deadlines)
+SCHEDULER_TICK_SECONDS = 1  # Timer wheel resolution = max firing delay
+SCHEDULER_REFRESH_SECONDS = 30  # Re-read next deadlines (new rows are >= 15 min out)
+SCHEDULER_ELECTION_SECONDS = 10  # How often a standby retries the leader lock
+SCHEDULER_HEALTH_STALE_SECONDS = 30  # Unhealthy if no tick for this long
+SCHEDULER_ADVISORY_LOCK_KEY = 1129272918  # pg advisory lock id shared by replicas
+
 # ==============================================================================
 # BOOKING CONSTANTS
 # ==============================================================================
@@ -50,6 +76,12 @@ MAX_PARTNER_REPUTATION = 5.0
 # Partner API
 PARTNER_API_KEY_LENGTH = 64  # Length of generated API keys (hex characters)
 
+# Partner availability grid
+AVAILABILITY_FIRST_SLOT_HOUR = 12  # First bookable slot (12:00)
+AVAILABILITY_LAST_SLOT_HOUR = 21  # Last bookable slot (21:00 exact)
+AVAILABILITY_MAX_PARTNERS = 20  # Max partners per availability grid request
+AVAILABILITY_CACHE_TIMEOUT = 60 * 60  # Grid cache TTL (seconds), invalidated on change
+
 # ==============================================================================
 # USER CONSTANTS
 # ==============================================================================
@@ -5,12 +5,16 @@ This middleware logs all HTTP requests with method, path, status code,
 and response time for monitoring and debugging.
 """
 
+import re
 import time
 import logging
 from django.utils.deprecation import MiddlewareMixin
 
 logger = logging.getLogger("http")
 
+# Access tokens passed in the query string (game streams) are not logged
+TOKEN_PARAM = re.compile(r"(access_token=)[^&]*")
+
 
 class RequestLogMiddleware(MiddlewareMixin):
     """
@@ -39,7 +43,7 @@ class RequestLogMiddleware(MiddlewareMixin):
             logger.info(
                 "%s %s -> %s (%d ms)",
                 request.method,
-                request.get_full_path(),
+                TOKEN_PARAM.sub(r"\1***", request.get_full_path()),
                 response.status_code,
                 duration_ms,
             )
@@ -11,3 +11,194 @@ class HateoasOptionsMixin:
         metadata = self.metadata_class()
         data = metadata.determine_metadata(request, self)
         return Response(data, status=status.HTTP_200_OK)
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET (ETag / Last-Modified) for list and retrieve.
+
+    Viewsets implement get_conditional_state(), which must be cheap (an
+    aggregate or a cache version, never the serialized body). When the client
+    sends a matching If-None-Match / If-Modified-Since, a 304 is returned
+    before the queryset is evaluated or the response body built.
+
+    The ETag also covers the requesting user, the full path and the
+    negotiated format, since payloads embed per-user fields and absolute links.
+    """
+
+    def get_conditional_state(self, request):
+        """
+        Return (state, last_modified) for the current action.
+
+        state: hashable values that change whenever the payload changes
+        last_modified: datetime or None
+
+        Returning None disables conditional handling for this request. On
+        retrieve, return None when the object does not exist or is not
+        visible to the user, so that the normal 404 is served (a state means
+        a representation exists, which is what `If-None-Match: *` matches).
+        """
+        return None
+
+    def get_conditional_object_queryset(self, queryset):
+        """
+        Narrow queryset to the object requested by a retrieve.
+
+        Returns None when the lookup value is not a valid id (e.g.
+        /partners/abc/), so the normal lookup answers with its 404.
+        """
+        from django.core.exceptions import ValidationError
+
+        lookup_field = self.lookup_field
+        value = self.kwargs.get(self.lookup_url_kwarg or lookup_field)
+        model_field = queryset.model._meta.pk if lookup_field == "pk" else queryset.model._meta.get_field(lookup_field)
+        try:
+            value = model_field.to_python(value)
+        except ValidationError:
+            return None
+        return queryset.filter(**{lookup_field: value})
+
+    def conditional_response(self, request, build, *args, **kwargs):
+        """Return 304 if the client's copy is current, else build() with validators."""
+        import hashlib
+        from django.utils.http import http_date, parse_http_date_safe, parse_etags
+
+        if request.method not in ("GET", "HEAD"):
+            return build(request, *args, **kwargs)
+
+        conditional = self.get_conditional_state(request)
+        if conditional is None:
+            return build(request, *args, **kwargs)
+
+        state, last_modified = conditional
+        raw = "|".join(str(part) for part in (
+            *state,
+            getattr(request.user, "pk", None),
+            request.get_full_path(),
+            request.headers.get("Accept", ""),
+            request.headers.get("Accept-Language", ""),
+        ))
+        etag = f'W/"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"'
+
+        if_none_match = request.headers.get("If-None-Match")
+        if_modified_since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        if if_none_match:
+            client_tags = {tag.removeprefix("W/") for tag in parse_etags(if_none_match)}
+            not_modified = "*" in client_tags or etag.removeprefix("W/") in client_tags
+        else:
+            not_modified = bool(
+                last_modified and if_modified_since
+                and int(last_modified.timestamp()) <= if_modified_since
+            )
+
+        if not_modified:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = build(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+        response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+
+
+class SparseFieldsetMixin:
+    """
+    `?fields=` and `?expand=` for read serializers.
+
+    - `?fields=title,datetime_start` renders only the listed fields (plus
+      `id`); the others are dropped when the serializer is built, so their
+      getters and the joins they need never run.
+    - `?expand=partner,language` replaces a foreign key id by the nested
+      object (see `expandable_fields`).
+
+    Only applies to GET/HEAD requests and to the top-level serializer; nested
+    serializers (or ones built with `sparse=False`) render all their fields.
+
+    Serializers declare what each field reads so views can build the
+    matching queryset (see get_select_related() / requires()):
+
+        expandable_fields = {"partner": lambda: PartnerSerializer(read_only=True)}
+        field_select_related = {"partner_name": ("partner",), "partner": ("partner",)}
+    """
+
+    expandable_fields = {}
+    field_select_related = {}
+
+    def __init__(self, *args, **kwargs):
+        self.sparse = kwargs.pop("sparse", True)
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def _split(value):
+        return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+    @classmethod
+    def get_sparse_params(cls, request):
+        """
+        Parse the request's fieldset parameters.
+
+        Returns:
+            tuple: (fields, expand) where fields is a set of names or None (all)
+        """
+        if request is None or request.method not in ("GET", "HEAD"):
+            return None, set()
+        params = getattr(request, "query_params", None) or getattr(request, "GET", {})
+        fields = cls._split(params.get("fields")) if "fields" in params else None
+        expand = cls._split(params.get("expand")) & set(cls.expandable_fields)
+        return fields or None, expand
+
+    @classmethod
+    def requires(cls, request, names):
+        """Check whether any of `names` will be rendered for this request."""
+        fields, _ = cls.get_sparse_params(request)
+        return fields is None or bool(fields & set(names))
+
+    @classmethod
+    def get_select_related(cls, request, default=()):
+        """
+        Relations to join for this request.
+
+        Args:
+            request: Current request
+            default: Relations to join when no ?fields= is given
+
+        Returns:
+            list: select_related() paths
+        """
+        fields, expand = cls.get_sparse_params(request)
+        if fields is None:
+            related = set(default)
+        else:
+            related = set()
+            for name in fields:
+                related.update(cls.field_select_related.get(name, ()))
+        for name in expand:
+            related.update(cls.field_select_related.get(name, ()))
+        return sorted(related)
+
+    def _is_top_level(self):
+        parent = self.parent
+        return parent is None or (getattr(parent, "child", None) is self and parent.parent is None)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.sparse or not self._is_top_level():
+            return fields
+
+        requested, expand = self.get_sparse_params(self.context.get("request"))
+        if requested is not None:
+            keep = requested | expand | {"id"}
+            fields = {name: field for name, field in fields.items() if name in keep}
+        for name in expand:
+            fields[name] = self.expandable_fields[name]()
+        return fields
@@ -2,10 +2,13 @@
 Standard pagination for all Conversa API endpoints.
 
 Provides consistent pagination across all list endpoints using
-page number pagination with configurable page size.
+page number pagination with configurable page size, and opt-in keyset
+(cursor) pagination for large, deep-paged listings.
 """
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
 from .constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 
@@ -44,3 +47,87 @@ class DefaultPagination(PageNumberPagination):
     page_size = DEFAULT_PAGE_SIZE  # 20
     page_size_query_param = "page_size"
     max_page_size = MAX_PAGE_SIZE  # 100
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination on the view's `cursor_ordering`.
+
+    Pages are fetched with `WHERE <first ordering field> < cursor position
+    ORDER BY ... LIMIT n`: no COUNT(*) and no OFFSET scan, so deep pages cost
+    the same as page 1. Rows sharing the position value are skipped with a
+    small offset encoded in the cursor.
+
+    The ordering is `view.cursor_ordering` (e.g. ("-datetime_start", "id")),
+    else `ordering`, or the client's `?ordering=` when the view uses
+    OrderingFilter. The first
+    field must be a model field or an annotation of the queryset.
+
+    Response keeps the page-number envelope; `count` is always null:
+        {"count": null, "next": "...?cursor=cD0y...", "previous": null, "results": [...]}
+    """
+    page_size = DEFAULT_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        for backend in getattr(view, "filter_backends", []):
+            if issubclass(backend, OrderingFilter) and request.query_params.get(backend.ordering_param):
+                ordering = list(backend().get_ordering(request, queryset, view) or [])
+                if ordering:
+                    if not {"id", "-id", "pk", "-pk"} & set(ordering):
+                        ordering.append("id")
+                    return tuple(ordering)
+        return tuple(getattr(view, "cursor_ordering", None) or self.ordering)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "count": None,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+
+class CursorOptInPagination(DefaultPagination):
+    """
+    Page-number pagination with opt-in keyset mode.
+
+    Viewsets opt in by setting `pagination_class = CursorOptInPagination` and a
+    `cursor_ordering`. Clients keep page-number behavior by default and switch
+    to keyset mode by sending `?cursor=` (empty for the first page), then
+    follow the `next` / `previous` links.
+
+    Example requests:
+        GET /api/v1/events/?page=3           → page-number (with count)
+        GET /api/v1/events/?cursor=          → first keyset page (count: null)
+        GET /api/v1/events/?cursor=cD0yMDI…  → next keyset page
+    """
+    cursor_query_param = "cursor"
+
+    def is_cursor_request(self, request):
+        """Check whether the client asked for keyset pagination."""
+        return self.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if view is not None and getattr(view, "cursor_ordering", None) and self.is_cursor_request(request):
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if getattr(self, "keyset", None) is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append({
+            "name": self.cursor_query_param,
+            "required": False,
+            "in": "query",
+            "description": "Keyset pagination cursor (send empty for the first page; count is then null)",
+            "schema": {"type": "string"},
+        })
+        return parameters
@@ -75,3 +75,119 @@ class DateTimeUtilsTestCase(TestCase):
 
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0], single_day)
+
+
+class TimerWheelTestCase(TestCase):
+    """Test suite for the hashed TimerWheel."""
+
+    def setUp(self):
+        from common.utils.timer_wheel import TimerWheel
+
+        self.start = timezone.now().replace(microsecond=0)
+        self.wheel = TimerWheel(tick=1.0, slots=8, start=self.start)
+
+    def test_fires_on_deadline_never_early(self):
+        """Timers fire once their deadline tick is reached, earliest first."""
+        self.wheel.schedule("b", self.start + timedelta(seconds=3))
+        self.wheel.schedule("a", self.start + timedelta(seconds=2, milliseconds=500))
+
+        self.assertEqual(self.wheel.advance(self.start + timedelta(seconds=2)), [])
+        fired = self.wheel.advance(self.start + timedelta(seconds=3))
+
+        self.assertEqual([key for key, _ in fired], ["a", "b"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_reschedule_and_cancel(self):
+        """Scheduling a key again moves its timer; cancel removes it."""
+        self.wheel.schedule("a", self.start + timedelta(seconds=1))
+        self.wheel.schedule("a", self.start + timedelta(seconds=5))
+        self.wheel.schedule("b", self.start + timedelta(seconds=2))
+        self.wheel.cancel("b")
+
+        self.assertEqual(self.wheel.advance(self.start + timedelta(seconds=4)), [])
+        self.assertEqual(
+            self.wheel.advance(self.start + timedelta(seconds=5)),
+            [("a", self.start + timedelta(seconds=5))],
+        )
+
+    def test_deadlines_beyond_one_revolution_and_past(self):
+        """Far deadlines wait for their tick; past deadlines fire on next advance."""
+        far = self.start + timedelta(seconds=20)  # 2.5 revolutions of 8 slots
+        self.wheel.schedule("far", far)
+        self.wheel.schedule("late", self.start - timedelta(minutes=5))
+
+        self.assertEqual(self.wheel.advance(self.start + timedelta(seconds=1))[0][0], "late")
+        for second in range(2, 20):
+            self.assertEqual(self.wheel.advance(self.start + timedelta(seconds=second)), [])
+        self.assertEqual(self.wheel.advance(far), [("far", far)])
+
+    def test_long_pause_fires_everything_due(self):
+        """Advancing over many revolutions at once still fires every due timer."""
+        for i in range(10):
+            self.wheel.schedule(i, self.start + timedelta(seconds=i + 1))
+
+        fired = self.wheel.advance(self.start + timedelta(minutes=10))
+
+        self.assertEqual([key for key, _ in fired], list(range(10)))
+
+
+class CircuitBreakerTestCase(TestCase):
+    """Test suite for CircuitBreaker."""
+
+    def setUp(self):
+        from common.utils.circuit_breaker import CircuitBreaker
+
+        self.now = 0.0
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=lambda: self.now)
+
+    def test_opens_after_consecutive_failures(self):
+        """Threshold consecutive failures open the circuit; a success resets the count."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, "open")
+        self.assertFalse(self.breaker.allow())
+
+    def test_half_open_lets_one_probe_through(self):
+        """After the reset timeout one probe runs; its result closes or reopens the circuit."""
+        for _ in range(3):
+            self.breaker.record_failure()
+
+        self.now = 10
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())  # Probe in flight
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "open")
+
+        self.now = 20
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, "closed")
+        self.assertEqual(self.breaker.snapshot()["opened_count"], 2)
+
+
+class LatencyHistogramTestCase(TestCase):
+    """Test suite for LatencyHistogram."""
+
+    def test_buckets_and_percentiles(self):
+        """Observations land in cumulative buckets; percentiles are bucket bounds."""
+        from common.utils.latency_histogram import LatencyHistogram
+
+        histogram = LatencyHistogram(buckets=(10, 100, 1000))
+        for ms in [5] * 90 + [50] * 9 + [5000]:
+            histogram.observe(ms)
+
+        snapshot = histogram.snapshot()
+
+        self.assertEqual(snapshot["count"], 100)
+        self.assertEqual(snapshot["buckets"], {"10": 90, "100": 99, "1000": 99, "+Inf": 100})
+        self.assertEqual(snapshot["p50_ms"], 10)
+        self.assertEqual(snapshot["p95_ms"], 100)
+        self.assertEqual(snapshot["max_ms"], 5000)
+        self.assertIsNone(LatencyHistogram().snapshot()["p99_ms"])
@@ -0,0 +1,104 @@
+"""
+Database advisory lock for leader election.
+
+On PostgreSQL, pg_try_advisory_lock() takes a session-level lock owned by the
+current connection: it survives transactions and is released by the server as
+soon as the connection closes, so a crashed leader never blocks the others.
+Other backends (SQLite in dev/tests) have no advisory locks; the lock is then
+always granted, which is fine for a single process.
+"""
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.utils import DatabaseError
+
+
+class AdvisoryLock:
+    """
+    Non-blocking session-level advisory lock.
+
+    Example:
+        >>> lock = AdvisoryLock(SCHEDULER_ADVISORY_LOCK_KEY)
+        >>> if lock.acquire():
+        ...     run_as_leader()
+        >>> lock.release()
+    """
+
+    def __init__(self, key, using=DEFAULT_DB_ALIAS):
+        """
+        Args:
+            key (int): Lock id shared by all replicas (fits in 32 bits)
+            using (str): Database alias
+        """
+        self.key = int(key)
+        self.using = using
+        self.held = False
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    @property
+    def supported(self):
+        return self.connection.vendor == "postgresql"
+
+    def acquire(self):
+        """
+        Try to take the lock without waiting.
+
+        Returns:
+            bool: True if this connection holds the lock
+        """
+        if not self.supported:
+            self.held = True
+            return True
+
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute("SELECT pg_try_advisory_lock(%s)", [self.key])
+                self.held = bool(cursor.fetchone()[0])
+        except DatabaseError:
+            self._reset()
+        return self.held
+
+    def verify(self):
+        """
+        Check that the lock is still held by this connection.
+
+        A dropped connection loses its lock on the server: the connection is
+        closed so the next acquire() starts from a fresh session.
+
+        Returns:
+            bool: True if the lock is still held
+        """
+        if not self.held or not self.supported:
+            return self.held
+
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pg_locks WHERE locktype = 'advisory'"
+                    " AND pid = pg_backend_pid() AND classid = 0 AND objid = %s"
+                    " AND objsubid = 1 AND granted)",
+                    [self.key],
+                )
+                self.held = bool(cursor.fetchone()[0])
+        except DatabaseError:
+            self._reset()
+        return self.held
+
+    def release(self):
+        """Release the lock if held."""
+        if self.held and self.supported:
+            try:
+                with self.connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", [self.key])
+            except DatabaseError:
+                self._reset()
+        self.held = False
+
+    def _reset(self):
+        self.held = False
+        try:
+            self.connection.close()
+        except DatabaseError:
+            pass
@@ -0,0 +1,104 @@
+"""
+Circuit breaker for calls to an external service.
+
+After `failure_threshold` consecutive failures the circuit opens: calls are
+refused at once instead of waiting on a service that is down. Once
+`reset_timeout` seconds have passed, one probe call is let through
+(half-open); its success closes the circuit, its failure opens it again.
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        >>> if not breaker.allow():
+        ...     raise ServiceUnavailable()
+        >>> try:
+        ...     call()
+        ... except TransientError:
+        ...     breaker.record_failure()
+        ...     raise
+        >>> breaker.record_success()
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds before a probe call is allowed
+            clock (callable): Monotonic time source (seconds)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self.opened_count = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def allow(self):
+        """
+        Whether a call may go through now.
+
+        In half-open state only one caller gets True until the probe result
+        is recorded.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        """A call succeeded: close the circuit."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        """A call failed: open the circuit on threshold or failed probe."""
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+            if state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if state != self.OPEN:
+                    self.opened_count += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+
+    def snapshot(self):
+        """State and counters, for metrics."""
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "opened_count": self.opened_count,
+            }
@@ -0,0 +1,84 @@
+"""
+Fixed-bucket latency histogram.
+
+Counts observations in cumulative buckets (Prometheus style) so that memory
+is constant whatever the traffic, and estimates percentiles from the bucket
+bounds. Thread-safe: observe() may be called from request threads and
+worker pools at once.
+"""
+
+import bisect
+import threading
+
+# Upper bounds in milliseconds (last bucket is +Inf)
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class LatencyHistogram:
+    """
+    Latency distribution of one operation.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> histogram.observe(42.0)
+        >>> histogram.snapshot()["p95_ms"]
+        50
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        """
+        Args:
+            buckets (tuple): Sorted bucket upper bounds in milliseconds
+        """
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, ms):
+        """Record one observation, in milliseconds."""
+        index = bisect.bisect_left(self.buckets, ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += ms
+            self._max = max(self._max, ms)
+
+    def _percentile(self, counts, total, fraction):
+        """Upper bound of the bucket holding the given fraction of observations."""
+        rank = fraction * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else self._max
+        return self._max
+
+    def snapshot(self):
+        """
+        Current distribution.
+
+        Returns:
+            dict: count, sum/avg/max (ms), p50/p95/p99 estimates (ms) and
+                  cumulative bucket counts keyed by upper bound ("+Inf" last)
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = sum(counts)
+            result = {
+                "count": total,
+                "sum_ms": round(self._sum, 1),
+                "avg_ms": round(self._sum / total, 1) if total else None,
+                "max_ms": round(self._max, 1),
+                "p50_ms": self._percentile(counts, total, 0.50) if total else None,
+                "p95_ms": self._percentile(counts, total, 0.95) if total else None,
+                "p99_ms": self._percentile(counts, total, 0.99) if total else None,
+            }
+
+        cumulative = {}
+        running = 0
+        for bound, count in zip(list(self.buckets) + ["+Inf"], counts):
+            running += count
+            cumulative[str(bound)] = running
+        result["buckets"] = cumulative
+        return result
@@ -0,0 +1,49 @@
+"""
+Search text helpers.
+
+Search documents and queries are normalized the same way (lowercase, accents
+stripped) so matching does not depend on the database's unaccent support.
+"""
+
+import re
+import unicodedata
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_search_text(*parts):
+    """
+    Build normalized search text from parts.
+
+    Args:
+        *parts: Strings (None/empty ignored)
+
+    Returns:
+        str: Lowercase words without accents, separated by single spaces
+
+    Example:
+        >>> normalize_search_text("Café Élysée", "Bruxelles")
+        "cafe elysee bruxelles"
+    """
+    text = " ".join(str(part) for part in parts if part)
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(WORD_RE.findall(text.lower()))
+
+
+def search_terms(query, max_terms=8):
+    """
+    Split a user query into normalized search terms.
+
+    Args:
+        query (str): Raw user input (e.g. "Business English Brussels")
+        max_terms (int): Extra terms are ignored
+
+    Returns:
+        list: Unique terms in input order (e.g. ["business", "english", "brussels"])
+    """
+    terms = []
+    for term in normalize_search_text(query).split():
+        if term not in terms:
+            terms.append(term)
+    return terms[:max_terms]
@@ -0,0 +1,107 @@
+"""
+Hashed timing wheel.
+
+Keyed one-shot timers on wall-clock deadlines. The wheel is a ring of slots,
+one per tick; a timer lives in the slot of the tick it is due on and is
+checked only when the cursor reaches that slot, so scheduling, cancelling and
+advancing by one tick are O(1) regardless of how far the deadline is.
+Timers further away than one revolution simply stay in their slot until the
+cursor has passed it enough times.
+
+Deadlines are rounded up to the next tick: a timer never fires early, and at
+most one tick late.
+"""
+
+import math
+
+
+class TimerWheel:
+    """
+    Ring of tick slots holding keyed timers.
+
+    Example:
+        >>> wheel = TimerWheel(tick=1.0, start=now)
+        >>> wheel.schedule("expire_bookings", booking.expires_at)
+        >>> wheel.advance(timezone.now())
+        [("expire_bookings", datetime(...))]
+    """
+
+    def __init__(self, tick=1.0, slots=512, start=None):
+        """
+        Args:
+            tick (float): Slot width in seconds
+            slots (int): Number of slots in one revolution
+            start (datetime): Time the cursor starts at (defaults to 0)
+        """
+        self.tick = float(tick)
+        self.slots = [dict() for _ in range(slots)]
+        self._timers = {}  # key -> (due tick, deadline)
+        self._cursor = self._tick_of(start) if start else 0
+
+    def _tick_of(self, moment):
+        return int(math.floor(moment.timestamp() / self.tick))
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, key):
+        return key in self._timers
+
+    def deadline(self, key):
+        """Deadline of the timer for key, or None."""
+        timer = self._timers.get(key)
+        return timer[1] if timer else None
+
+    def pending(self):
+        """Dict {key: deadline} of all scheduled timers."""
+        return {key: deadline for key, (_, deadline) in self._timers.items()}
+
+    def schedule(self, key, deadline):
+        """
+        Schedule (or move) the timer for key.
+
+        A deadline already in the past fires on the next advance().
+
+        Args:
+            key: Hashable timer id
+            deadline (datetime): When the timer is due
+        """
+        self.cancel(key)
+        due = max(int(math.ceil(deadline.timestamp() / self.tick)), self._cursor + 1)
+        self.slots[due % len(self.slots)][key] = due
+        self._timers[key] = (due, deadline)
+
+    def cancel(self, key):
+        """Remove the timer for key (no-op if absent)."""
+        timer = self._timers.pop(key, None)
+        if timer:
+            self.slots[timer[0] % len(self.slots)].pop(key, None)
+
+    def advance(self, now):
+        """
+        Move the cursor up to now and pop the timers that became due.
+
+        Args:
+            now (datetime): Current time
+
+        Returns:
+            list: (key, deadline) tuples, earliest deadline first
+        """
+        target = self._tick_of(now)
+        if target <= self._cursor:
+            return []
+
+        # After a long pause every slot is visited at most once
+        span = range(self._cursor + 1, target + 1)
+        if len(span) > len(self.slots):
+            span = range(target - len(self.slots) + 1, target + 1)
+
+        fired = []
+        for tick in span:
+            slot = self.slots[tick % len(self.slots)]
+            for key in [key for key, due in slot.items() if due <= target]:
+                del slot[key]
+                fired.append((key, self._timers.pop(key)[1]))
+
+        self._cursor = target
+        return sorted(fired, key=lambda item: item[1])
@@ -0,0 +1,35 @@
+"""
+Process-wide bounded thread pools.
+
+Outbox services hand work to a named pool after commit. Each pool is created
+on first use and shared by the whole process, so the number of threads (and
+database connections) a process opens stays bounded. Workers must close their
+connection when done (django.db.connection.close()).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def get_pool(name, max_workers):
+    """
+    Return the pool called name, creating it on first use.
+
+    Args:
+        name (str): Pool name (also the worker thread name prefix)
+        max_workers (int): Size of the pool when it is created
+
+    Returns:
+        ThreadPoolExecutor: Shared pool
+    """
+    with _lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = _pools[name] = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=name,
+            )
+        return pool
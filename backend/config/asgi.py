@@ -16,3 +16,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
 
 application = get_asgi_application()
+
+# Server processes only (not migrate or other management commands)
+from games.services.question_bank import warm_up  # noqa: E402
+
+warm_up()
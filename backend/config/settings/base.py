@@ -107,6 +107,8 @@ DATABASES = {}
 STRIPE_SECRET_KEY = os.getenv("DJANGO_STRIPE_SECRET_KEY", "")
 STRIPE_WEBHOOK_SECRET = os.getenv("DJANGO_STRIPE_WEBHOOK_SECRET", "")
 STRIPE_CURRENCY = (os.getenv("DJANGO_STRIPE_CURRENCY", "eur") or "eur").lower()
+# Empty = Stripe's API; e.g. http://localhost:12111 for `manage.py fake_stripe`
+STRIPE_API_BASE = os.getenv("DJANGO_STRIPE_API_BASE", "")
 
 FRONTEND_BASE_URL = os.getenv(
     "DJANGO_FRONTEND_BASE_URL", "http://localhost:4200"
@@ -303,6 +305,22 @@ BOOKING_TTL_MINUTES = int(os.getenv("DJANGO_BOOKING_TTL_MINUTES", "15"))
 # Set via: DJANGO_INITIAL_STAFF_SECRET environment variable
 INITIAL_STAFF_SECRET = os.getenv("DJANGO_INITIAL_STAFF_SECRET", "")
 
+# =============================================================================
+# CACHE
+# =============================================================================
+
+# Local memory by default. With several workers, use a shared backend
+# (e.g. django.core.cache.backends.db.DatabaseCache + `createcachetable`)
+# so cache invalidations are seen by every process.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "conversa"),
+    }
+}
+
 # =============================================================================
 # SCHEDULED TASKS CONFIGURATION
 # =============================================================================
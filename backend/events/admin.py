@@ -27,10 +27,18 @@ class EventAdmin(admin.ModelAdmin):
     @admin.action(description="Publier les événements sélectionnés")
     def publish_events(self, request, queryset):
         """Publish selected events."""
-        updated = queryset.filter(status=Event.Status.DRAFT).update(
+        from partners.services import OccupancyService
+        from events.services import EventFeedCacheService
+
+        drafts = queryset.filter(status=Event.Status.DRAFT)
+        windows = list(drafts.values_list("partner_id", "datetime_start"))
+        updated = drafts.update(
             status=Event.Status.PUBLISHED,
             published_at=timezone.now()
         )
+        # Bulk update bypasses Event.save(): refresh confirmed seats and feed explicitly
+        OccupancyService.refresh_for_windows(windows)
+        EventFeedCacheService.invalidate()
         self.message_user(
             request,
             f"{updated} événement(s) publié(s) avec succès.",
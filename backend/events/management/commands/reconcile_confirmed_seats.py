@@ -0,0 +1,71 @@
+"""
+Django management command to reconcile Event.confirmed_seats counters.
+
+Compares each event's denormalized confirmed_seats with its CONFIRMED
+bookings and repairs drift (e.g. after bulk updates or manual SQL). Repaired
+events also get their slot occupancy buckets refreshed.
+
+Usage:
+    python manage.py reconcile_confirmed_seats
+    python manage.py reconcile_confirmed_seats --verify
+    python manage.py reconcile_confirmed_seats --event 42
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.services import EventService
+
+
+class Command(BaseCommand):
+    help = "Reconcile (or verify) the confirmed_seats counter of events"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only report events whose counter differs from their confirmed bookings",
+        )
+        parser.add_argument(
+            "--event",
+            type=int,
+            default=None,
+            help="Restrict the check/repair to one event id",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the verification or the repair."""
+        event_id = options["event"]
+
+        try:
+            self.stdout.write(
+                f'[{timezone.now()}] Starting confirmed seats {"verification" if options["verify"] else "reconciliation"}...'
+            )
+
+            if options["verify"]:
+                drift = EventService.find_confirmed_seat_drift(event_id=event_id)
+            else:
+                drift = EventService.reconcile_confirmed_seats(event_id=event_id)
+
+            for item in drift:
+                self.stdout.write(
+                    f'  event={item["event_id"]} stored={item["stored"]} expected={item["expected"]}'
+                )
+
+            if options["verify"] and drift:
+                self.stdout.write(self.style.ERROR(f'✗ {len(drift)} event(s) out of sync'))
+            elif drift:
+                self.stdout.write(self.style.SUCCESS(f'✓ Repaired {len(drift)} event(s)'))
+            else:
+                self.stdout.write(self.style.SUCCESS('✓ Confirmed seat counters are in sync'))
+
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'Error during confirmed seats reconciliation: {str(e)}')
+            )
+            raise
+
+        finally:
+            self.stdout.write(
+                f'[{timezone.now()}] Confirmed seats command completed.'
+            )
@@ -0,0 +1,69 @@
+"""
+Django management command running the set-based lifecycle sweeper.
+
+Usage:
+    python manage.py sweep_lifecycle
+    python manage.py sweep_lifecycle --phase finish_events --phase cleanup_drafts
+    python manage.py sweep_lifecycle --chunk-size 200
+
+Replaces the per-job crons (expire_bookings, cancel_underpopulated_events,
+auto_finish_events, cleanup_expired_drafts) with one run that transitions rows
+in chunks and reports the duration of each phase.
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from common.constants import LIFECYCLE_SWEEP_CHUNK_SIZE
+from events.services import LifecycleSweeper
+
+
+class Command(BaseCommand):
+    help = "Expire bookings and drafts, auto-cancel and finish events, purge game channel events in bulk"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--phase",
+            action="append",
+            choices=LifecycleSweeper.PHASES,
+            help="Run only this phase (repeatable, default: all phases)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=LIFECYCLE_SWEEP_CHUNK_SIZE,
+            help="Rows transitioned per UPDATE",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the sweep."""
+        try:
+            self.stdout.write(
+                f'[{timezone.now()}] Starting lifecycle sweep...'
+            )
+
+            report = LifecycleSweeper.sweep(
+                phases=options["phase"],
+                chunk_size=max(1, options["chunk_size"]),
+            )
+
+            for phase, stats in report.items():
+                self.stdout.write(
+                    f'  {phase}: {stats["count"]} row(s) in {stats["duration_ms"]}ms'
+                )
+
+            total = sum(stats["count"] for stats in report.values())
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Swept {total} row(s)')
+            )
+
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'Error during lifecycle sweep: {str(e)}')
+            )
+            raise
+
+        finally:
+            self.stdout.write(
+                f'[{timezone.now()}] Lifecycle sweep completed.'
+            )
@@ -0,0 +1,65 @@
+"""
+Add a generated `time_range` column with a GiST index on events (PostgreSQL only).
+
+time_range = tstzrange(datetime_start, datetime_start + 1h, '[)') lets
+EventQuerySet.overlapping() use the `&&` operator served by a
+(partner_id, time_range) GiST index. `timestamptz + interval` is only STABLE,
+so the range is built by an IMMUTABLE helper (a fixed 1-hour interval does
+not depend on the session time zone).
+
+On other backends (SQLite dev/test) this migration is a no-op and
+overlapping() falls back to a datetime_start range.
+"""
+from django.db import migrations
+
+from common.constants import DEFAULT_EVENT_DURATION_HOURS
+
+FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist;",
+    f"""
+    CREATE OR REPLACE FUNCTION events_event_time_range(ts timestamptz)
+    RETURNS tstzrange
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$ SELECT tstzrange(ts, ts + interval '{DEFAULT_EVENT_DURATION_HOURS} hour', '[)') $$;
+    """,
+    """
+    ALTER TABLE events_event
+    ADD COLUMN IF NOT EXISTS time_range tstzrange
+    GENERATED ALWAYS AS (events_event_time_range(datetime_start)) STORED;
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS events_event_partner_time_range_gist
+    ON events_event USING gist (partner_id, time_range);
+    """,
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS events_event_partner_time_range_gist;",
+    "ALTER TABLE events_event DROP COLUMN IF EXISTS time_range;",
+    "DROP FUNCTION IF EXISTS events_event_time_range(timestamptz);",
+]
+
+
+def add_time_range(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for statement in FORWARD_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_time_range(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for statement in REVERSE_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0015_update_booking_unique_constraint"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_time_range, drop_time_range),
+    ]
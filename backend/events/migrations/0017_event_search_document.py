@@ -0,0 +1,73 @@
+"""
+Add the maintained search document of events and its full-text index.
+
+search_document holds normalized text (theme, title, address, partner name
+and city, language code/labels) kept current by Event.save() and
+Partner.save(). Existing rows are backfilled here.
+
+On PostgreSQL, a GIN index on to_tsvector('simple', search_document) serves
+EventQuerySet.search(). On other backends (SQLite dev/test) search() falls
+back to LIKE and no index is created.
+"""
+from django.db import migrations, models
+
+from common.utils.search_utils import normalize_search_text
+
+FORWARD_SQL = """
+CREATE INDEX IF NOT EXISTS events_event_search_gin
+ON events_event USING gin (to_tsvector('simple', search_document));
+"""
+
+REVERSE_SQL = "DROP INDEX IF EXISTS events_event_search_gin;"
+
+
+def backfill_search_documents(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    events = list(Event.objects.select_related("partner", "language"))
+    for event in events:
+        event.search_document = normalize_search_text(
+            event.theme,
+            event.title,
+            event.address,
+            event.partner.name,
+            event.partner.city,
+            event.language.code,
+            event.language.label_fr,
+            event.language.label_en,
+            event.language.label_nl,
+        )
+    Event.objects.bulk_update(events, ["search_document"], batch_size=500)
+
+
+def add_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(FORWARD_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(REVERSE_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0016_event_time_range_gist"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="search_document",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Theme, title, address, partner name/city and language labels (normalized)",
+            ),
+        ),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+        migrations.RunPython(add_search_index, drop_search_index),
+    ]
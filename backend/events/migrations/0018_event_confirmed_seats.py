@@ -0,0 +1,45 @@
+"""
+Add the denormalized Event.confirmed_seats counter and backfill it.
+
+The counter is moved by Booking.save()/delete() with F-expressions; the
+reconcile_confirmed_seats command detects and repairs drift.
+"""
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_confirmed_seats(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    Booking = apps.get_model("bookings", "Booking")
+    confirmed = (
+        Booking.objects.filter(event=OuterRef("pk"), status="CONFIRMED")
+        .order_by()
+        .values("event")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    Event.objects.update(
+        confirmed_seats=Coalesce(Subquery(confirmed, output_field=IntegerField()), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0017_event_search_document"),
+        ("bookings", "0012_update_booking_unique_constraint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="confirmed_seats",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of CONFIRMED bookings (maintained counter)",
+            ),
+        ),
+        migrations.RunPython(backfill_confirmed_seats, migrations.RunPython.noop),
+    ]
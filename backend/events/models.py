@@ -5,15 +5,146 @@ This module defines the Event model which represents a language practice session
 organized at a partner venue.
 """
 
+from datetime import timedelta
+
 from django.conf import settings
 from django.core import validators
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from common.constants import DEFAULT_EVENT_PRICE_CENTS
 from .validators import validate_event_datetime
 
 
+class EventQuerySet(models.QuerySet):
+    """Event queryset with time-slot helpers."""
+
+    def overlapping(self, datetime_start, datetime_end):
+        """
+        Filter events whose 1h slot overlaps [datetime_start, datetime_end).
+
+        On PostgreSQL, uses the generated `time_range` column and its GiST index
+        (range overlap operator `&&`, see migration 0016). Elsewhere (SQLite
+        dev/test), falls back to an equivalent datetime_start range, which is
+        served by the (partner, datetime_start) index since every event lasts
+        exactly DEFAULT_EVENT_DURATION_HOURS.
+
+        Args:
+            datetime_start (datetime): Start of the window (timezone-aware)
+            datetime_end (datetime): End of the window (exclusive)
+
+        Returns:
+            EventQuerySet: Overlapping events
+        """
+        from django.db import connections
+        from django.db.models import BooleanField
+        from django.db.models.expressions import RawSQL
+
+        if connections[self.db].vendor == "postgresql":
+            return self.filter(
+                RawSQL(
+                    f'"{self.model._meta.db_table}"."time_range" && tstzrange(%s, %s, \'[)\')',
+                    (datetime_start, datetime_end),
+                    output_field=BooleanField(),
+                )
+            )
+
+        from common.constants import DEFAULT_EVENT_DURATION_HOURS
+
+        return self.filter(
+            datetime_start__lt=datetime_end,
+            datetime_start__gt=datetime_start - timedelta(hours=DEFAULT_EVENT_DURATION_HOURS),
+        )
+
+    def search(self, query):
+        """
+        Full-text search over the events' search documents, best match first.
+
+        The query is split into normalized terms, all of which must match as
+        prefixes ("busi engl brux" finds "Business English" in Bruxelles).
+
+        On PostgreSQL, matches `to_tsvector('simple', search_document)` against
+        a prefix tsquery, served by the GIN index of migration 0017, and ranks
+        with ts_rank. Elsewhere (SQLite dev/test), falls back to one LIKE per
+        term on search_document (rank 0).
+
+        Args:
+            query (str): User input
+
+        Returns:
+            EventQuerySet: Matching events annotated with `search_rank`,
+            ordered by rank desc then datetime_start (empty query: no rows)
+        """
+        from django.db import connections
+        from django.db.models import BooleanField, FloatField, Value
+        from django.db.models.expressions import RawSQL
+        from common.utils.search_utils import search_terms
+
+        terms = search_terms(query)
+        if not terms:
+            return self.none()
+
+        if connections[self.db].vendor == "postgresql":
+            tsquery = " & ".join(f"{term}:*" for term in terms)
+            document = f"to_tsvector('simple', \"{self.model._meta.db_table}\".\"search_document\")"
+            return self.filter(
+                RawSQL(f"{document} @@ to_tsquery('simple', %s)", (tsquery,), output_field=BooleanField())
+            ).annotate(
+                search_rank=RawSQL(f"ts_rank({document}, to_tsquery('simple', %s))", (tsquery,), output_field=FloatField())
+            ).order_by("-search_rank", "datetime_start", "id")
+
+        qs = self
+        for term in terms:
+            qs = qs.filter(search_document__contains=term)
+        return qs.annotate(search_rank=Value(0.0, output_field=FloatField())).order_by("datetime_start", "id")
+
+    def with_occupancy(self):
+        """
+        Annotate booked seats and slot occupancy for list/detail rendering.
+
+        Adds:
+            annotated_booked_seats: Confirmed bookings of the event (the
+                confirmed_seats counter column, no subquery)
+            annotated_slot_confirmed_seats: Peak confirmed seats of the partner
+                over the event slot (slot occupancy ledger)
+
+        The booked_seats, participants_count, is_full and available_slots
+        properties read these annotations when present, so serializing a page
+        of events costs a constant number of queries.
+
+        Returns:
+            EventQuerySet: Annotated events
+        """
+        from django.db.models import DateTimeField, ExpressionWrapper, F, IntegerField, Max, OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+        from common.constants import DEFAULT_EVENT_DURATION_HOURS
+        from partners.models import PartnerSlotOccupancy
+
+        duration = Value(timedelta(hours=DEFAULT_EVENT_DURATION_HOURS))
+        # Hour buckets touched by [datetime_start, datetime_start + duration)
+        slot_peak = (
+            PartnerSlotOccupancy.objects.filter(
+                partner=OuterRef("partner"),
+                slot_start__gt=ExpressionWrapper(
+                    OuterRef("datetime_start") - duration, output_field=DateTimeField()
+                ),
+                slot_start__lt=ExpressionWrapper(
+                    OuterRef("datetime_start") + duration, output_field=DateTimeField()
+                ),
+            )
+            .order_by()
+            .values("partner")
+            .annotate(peak=Max("confirmed_seats"))
+            .values("peak")
+        )
+        return self.annotate(
+            annotated_booked_seats=F("confirmed_seats"),
+            annotated_slot_confirmed_seats=Coalesce(
+                Subquery(slot_peak, output_field=IntegerField()), Value(0)
+            ),
+        )
+
+
 class Event(models.Model):
     """
     Language exchange event model.
@@ -44,6 +175,11 @@ class Event(models.Model):
         CANCELLED = "CANCELLED", "Cancelled"
         FINISHED = "FINISHED", "Finished"  # NEW
 
+    # Fields whose change moves seats in the partner slot occupancy ledger
+    OCCUPANCY_FIELDS = frozenset({"status", "datetime_start", "partner", "max_participants"})
+    # Fields feeding the search document
+    SEARCH_FIELDS = frozenset({"theme", "partner", "language", "title", "address"})
+
     # Relationships
     organizer = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -170,10 +306,28 @@ class Event(models.Model):
         help_text="When event was cancelled"
     )
 
+    # Denormalized count of CONFIRMED bookings, moved by Booking.save()/delete()
+    # with F-expressions (see reconcile_confirmed_seats for drift repair)
+    confirmed_seats = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of CONFIRMED bookings (maintained counter)"
+    )
+
+    # Normalized text for EventQuerySet.search() (GIN full-text index on PostgreSQL)
+    search_document = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Theme, title, address, partner name/city and language labels (normalized)"
+    )
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         ordering = ["-datetime_start"]
         indexes = [
@@ -184,6 +338,29 @@ class Event(models.Model):
         verbose_name = "Event"
         verbose_name_plural = "Events"
 
+    def build_search_document(self):
+        """
+        Build the normalized search document of this event.
+
+        Returns:
+            str: Theme, title, address, partner name/city and language code/labels
+        """
+        from common.utils.search_utils import normalize_search_text
+
+        partner = self.partner if self.partner_id else None
+        language = self.language if self.language_id else None
+        return normalize_search_text(
+            self.theme,
+            self.title,
+            self.address,
+            getattr(partner, "name", ""),
+            getattr(partner, "city", ""),
+            getattr(language, "code", ""),
+            getattr(language, "label_fr", ""),
+            getattr(language, "label_en", ""),
+            getattr(language, "label_nl", ""),
+        )
+
     def _partner_address_str(self):
         """Build full address string from partner data."""
         p = self.partner
@@ -196,10 +373,58 @@ class Event(models.Model):
 
         Note: price_cents is enforced as constant, cannot be changed.
         """
+        from partners.services import OccupancyService
+        from events.services import EventFeedCacheService
+
         self.title = getattr(self.partner, "name", "") or ""
         self.address = self._partner_address_str()
         self.price_cents = DEFAULT_EVENT_PRICE_CENTS  # Enforce constant price
-        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None and not self._state.adding and self.pk:
+            # Never write back a possibly stale confirmed_seats: the counter is
+            # only moved by F-expressions (Booking.save/delete)
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = update_fields = {
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name != "confirmed_seats"
+                and field.attname not in deferred
+            }
+        if update_fields is None or self.SEARCH_FIELDS.intersection(update_fields):
+            self.search_document = self.build_search_document()
+            if update_fields is not None:
+                kwargs["update_fields"] = update_fields = {*update_fields, "search_document"}
+
+        touches_slots = update_fields is None or bool(
+            self.OCCUPANCY_FIELDS.intersection(update_fields)
+        )
+
+        # Previous slot, so a moved event releases the buckets it occupied
+        previous = None
+        if touches_slots and not self._state.adding and self.pk:
+            previous = (
+                type(self).objects.filter(pk=self.pk)
+                .values_list("partner_id", "datetime_start")
+                .first()
+            )
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if touches_slots:
+                OccupancyService.refresh_for_event(self, previous=previous)
+            EventFeedCacheService.invalidate()
+
+    def delete(self, *args, **kwargs):
+        """Delete the event and release its seats in the slot occupancy ledger."""
+        from partners.services import OccupancyService
+        from events.services import EventFeedCacheService
+
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            OccupancyService.refresh_for_event(self)
+            EventFeedCacheService.invalidate()
+        return result
 
     def can_cancel(self, user) -> bool:
         """
@@ -260,19 +485,22 @@ class Event(models.Model):
         Returns:
             int: Number of confirmed bookings
         """
-        from bookings.models import BookingStatus
-        return self.bookings.filter(status=BookingStatus.CONFIRMED).count()
+        return self.booked_seats
 
     @property
     def booked_seats(self):
         """
         Get count of seats taken (confirmed bookings only).
 
+        Reads the confirmed_seats counter (no query).
+
         Returns:
             int: Number of confirmed bookings consuming a seat
         """
-        from bookings.models import BookingStatus
-        return self.bookings.filter(status=BookingStatus.CONFIRMED).count()
+        annotated = getattr(self, "annotated_booked_seats", None)
+        if annotated is not None:
+            return annotated
+        return self.confirmed_seats
 
     @property
     def is_full(self):
@@ -291,11 +519,7 @@ class Event(models.Model):
             if self.booked_seats >= self.max_participants:
                 return True
 
-        available = self.partner.get_available_capacity(
-            self.datetime_start,
-            self.datetime_end
-        )
-        return available == 0
+        return self.available_slots == 0
 
     @property
     def available_slots(self):
@@ -306,9 +530,15 @@ class Event(models.Model):
             Returns partner's available capacity for this time slot.
             This is dynamic and depends on other events at same partner.
 
+        Uses the with_occupancy() annotation when present.
+
         Returns:
             int: Number of slots available on partner at this time
         """
+        annotated = getattr(self, "annotated_slot_confirmed_seats", None)
+        if annotated is not None:
+            return max(0, self.partner.capacity - annotated)
+
         return self.partner.get_available_capacity(
             self.datetime_start,
             self.datetime_end
@@ -327,7 +557,6 @@ class Event(models.Model):
         Returns:
             datetime: Event end time (start + duration)
         """
-        from datetime import timedelta
         from common.constants import DEFAULT_EVENT_DURATION_HOURS
         return self.datetime_start + timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
 
@@ -1,16 +1,122 @@
 from rest_framework import serializers
 from rest_framework.reverse import reverse
 from django.utils import timezone
+from common.mixins import SparseFieldsetMixin
 from .models import Event
 
 
-class EventSerializer(serializers.ModelSerializer):
+class UserBookingContext:
+    """
+    Request-scoped view of the current user's bookings for serialized events.
+
+    Stored once in the serializer context and shared by every user-scoped
+    field (my_booking, permissions, can_cancel_booking...) and every row of a
+    list: the bookings of all events being serialized are loaded in ONE query
+    on first access. Also memoizes the 3h-deadline check per event.
+    """
+
+    CONTEXT_KEY = "user_booking_context"
+
+    def __init__(self, user, events=None):
+        self.user = user
+        self._events = events
+        self._bookings = None
+        self._loaded_ids = set()
+        self._can_cancel_now = {}
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        """Get (or create) the context shared by the serializer tree."""
+        context = serializer.context
+        booking_context = context.get(cls.CONTEXT_KEY)
+        if booking_context is None:
+            request = context.get("request")
+            booking_context = cls(getattr(request, "user", None), events=serializer.root.instance)
+            context[cls.CONTEXT_KEY] = booking_context
+        return booking_context
+
+    @property
+    def is_authenticated(self):
+        return bool(self.user and getattr(self.user, "is_authenticated", False))
+
+    def _event_ids(self, event):
+        events = self._events
+        if events is None or isinstance(events, Event):
+            return {event.pk}
+        if hasattr(events, "values_list"):
+            ids = set(events.values_list("pk", flat=True)) if events.model is Event else set()
+        else:
+            # Root may serialize other objects (e.g. bookings with ?expand=event)
+            ids = {e.pk for e in events if isinstance(e, Event)}
+        ids.add(event.pk)
+        return ids
+
+    def get_booking(self, event):
+        """Return the user's latest booking for event (or None)."""
+        if not self.is_authenticated:
+            return None
+
+        if event.pk not in self._loaded_ids:
+            from bookings.models import Booking
+
+            self._loaded_ids = self._event_ids(event)
+            self._bookings = {}
+            for booking in (
+                Booking.objects
+                .filter(user_id=self.user.id, event_id__in=self._loaded_ids)
+                .order_by("event_id", "-created_at")
+            ):
+                self._bookings.setdefault(booking.event_id, booking)
+        return self._bookings.get(event.pk)
+
+    def can_cancel_now(self, event):
+        """EventService.can_perform_action(event, 3h), computed once per event."""
+        if event.pk not in self._can_cancel_now:
+            from .services import EventService
+            can_cancel, _ = EventService.can_perform_action(event, required_hours=3)
+            self._can_cancel_now[event.pk] = can_cancel
+        return self._can_cancel_now[event.pk]
+
+
+def _expanded_partner():
+    from partners.serializers import PartnerSerializer
+    return PartnerSerializer(read_only=True)
+
+
+def _expanded_language():
+    from languages.serializers import LanguageSerializer
+    return LanguageSerializer(read_only=True)
+
+
+class EventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Event serializer (list view).
+
+    Supports `?fields=` and `?expand=partner,language` (see SparseFieldsetMixin).
+    """
+
+    expandable_fields = {
+        "partner": _expanded_partner,
+        "language": _expanded_language,
+    }
+    field_select_related = {
+        "partner": ("partner",),
+        "partner_name": ("partner",),
+        "partner_city": ("partner",),
+        "partner_address": ("partner",),
+        "is_full": ("partner",),
+        "language": ("language",),
+        "language_code": ("language",),
+    }
+    # Fields reading the with_occupancy() annotations
+    occupancy_fields = ("is_full", "booked_seats")
+
     # Read-only practical fields
     partner_name = serializers.CharField(source="partner.name", read_only=True)
     partner_city = serializers.CharField(source="partner.city", read_only=True)
     partner_address = serializers.CharField(source="partner.address", read_only=True)
     language_code = serializers.CharField(source="language.code", read_only=True)
-    organizer_id = serializers.IntegerField(source="organizer.id", read_only=True)
+    organizer_id = serializers.IntegerField(read_only=True)
 
     # Auto-generated / locked fields
     title = serializers.CharField(read_only=True)
@@ -24,7 +130,7 @@ class EventSerializer(serializers.ModelSerializer):
     _links = serializers.SerializerMethodField()
     is_full = serializers.SerializerMethodField()
     booked_seats = serializers.SerializerMethodField()
-    is_full = serializers.SerializerMethodField()
+    my_booking = serializers.SerializerMethodField()
 
     class Meta:
         model = Event
@@ -47,6 +153,7 @@ class EventSerializer(serializers.ModelSerializer):
             "_links",
             "is_full",
             "booked_seats",
+            "my_booking",
         ]
         read_only_fields = [
             "id", "organizer", "organizer_id",
@@ -59,6 +166,7 @@ class EventSerializer(serializers.ModelSerializer):
             "created_at", "updated_at", "_links",
             "is_full",
             "booked_seats",
+            "my_booking",
         ]
         extra_kwargs = {
             "partner": {"required": True},
@@ -117,8 +225,7 @@ class EventSerializer(serializers.ModelSerializer):
                 links["delete_draft"] = links["self"]
             # Annuler l'événement (uniquement si possible)
             try:
-                from .services import EventService
-                can_cancel, _ = EventService.can_perform_action(obj, required_hours=3)
+                can_cancel = UserBookingContext.for_serializer(self).can_cancel_now(obj)
                 if obj.status == obj.Status.PUBLISHED and can_cancel:
                     links["cancel"] = reverse("event-cancel", args=[obj.pk], request=request)
             except Exception:
@@ -142,6 +249,13 @@ class EventSerializer(serializers.ModelSerializer):
     def get_booked_seats(self, obj):
         return obj.booked_seats
 
+    def get_my_booking(self, obj):
+        """Return current user's booking public_id and status for this event, if any."""
+        booking = UserBookingContext.for_serializer(self).get_booking(obj)
+        if not booking:
+            return None
+        return {"public_id": str(booking.public_id), "status": booking.status}
+
 
 class EventDetailSerializer(EventSerializer):
     """
@@ -155,6 +269,19 @@ class EventDetailSerializer(EventSerializer):
     Also exposes additional partner and organizer details.
     """
 
+    field_select_related = {
+        **EventSerializer.field_select_related,
+        "partner_capacity": ("partner",),
+        "available_slots": ("partner",),
+        "permissions": ("partner",),
+        "language_name": ("language",),
+        "organizer_first_name": ("organizer",),
+        "organizer_last_name": ("organizer",),
+    }
+    occupancy_fields = EventSerializer.occupancy_fields + (
+        "participants_count", "available_slots", "permissions",
+    )
+
     # Additional partner information
     partner_address = serializers.CharField(source="partner.address", read_only=True)
     partner_capacity = serializers.IntegerField(source="partner.capacity", read_only=True)
@@ -186,8 +313,7 @@ class EventDetailSerializer(EventSerializer):
             "organizer_last_name",
             "participants_count",
             "available_slots",
-            # user-scoped
-            "my_booking",
+            # user-scoped (my_booking inherited from EventSerializer)
             "can_cancel_booking",
             "is_starting_soon",
             "cancellation_deadline_hours",
@@ -203,56 +329,18 @@ class EventDetailSerializer(EventSerializer):
         return obj.available_slots
 
     # --------------------- User-scoped helpers ---------------------
-    def _get_current_user(self):
-        request = self.context.get("request")
-        return getattr(request, "user", None)
-
-    def get_my_booking(self, obj):
-        """Return current user's booking public_id and status for this event, if any."""
-        user = self._get_current_user()
-        if not user or not getattr(user, "is_authenticated", False):
-            return None
-        try:
-            from bookings.models import Booking
-            booking = (
-                Booking.objects
-                .filter(user_id=user.id, event_id=obj.id)
-                .order_by("-created_at")
-                .first()
-            )
-            if not booking:
-                return None
-            return {"public_id": str(booking.public_id), "status": booking.status}
-        except Exception:
-            return None
+    # All user-scoped fields share one UserBookingContext (one bookings query)
 
     def get_can_cancel_booking(self, obj):
-        user = self._get_current_user()
-        if not user or not getattr(user, "is_authenticated", False):
-            return False
-        try:
-            from bookings.models import Booking, BookingStatus
-            booking = (
-                Booking.objects
-                .filter(user_id=user.id, event_id=obj.id)
-                .order_by("-created_at")
-                .first()
-            )
-            if not booking or booking.status != BookingStatus.CONFIRMED:
-                return False
-            from .services import EventService
-            can_cancel, _ = EventService.can_perform_action(obj, required_hours=3)
-            return can_cancel
-        except Exception:
+        booking_context = UserBookingContext.for_serializer(self)
+        from bookings.models import BookingStatus
+        booking = booking_context.get_booking(obj)
+        if not booking or booking.status != BookingStatus.CONFIRMED:
             return False
+        return booking_context.can_cancel_now(obj)
 
     def get_is_starting_soon(self, obj):
-        try:
-            from .services import EventService
-            can_cancel, _ = EventService.can_perform_action(obj, required_hours=3)
-            return not can_cancel
-        except Exception:
-            return False
+        return not UserBookingContext.for_serializer(self).can_cancel_now(obj)
 
     def get_cancellation_deadline_hours(self, obj):
         try:
@@ -278,11 +366,7 @@ class EventDetailSerializer(EventSerializer):
 
         # Organizer permissions
         is_organizer = bool(user and (getattr(user, "is_staff", False) or getattr(user, "id", None) == getattr(obj, "organizer_id", None)))
-        try:
-            from .services import EventService
-            can_cancel_event_now, _ = EventService.can_perform_action(obj, required_hours=3)
-        except Exception:
-            can_cancel_event_now = False
+        can_cancel_event_now = UserBookingContext.for_serializer(self).can_cancel_now(obj)
 
         if is_organizer and obj.status == obj.Status.DRAFT and getattr(obj, "can_request_publication", False):
             perms["can_request_publication"] = True
@@ -318,3 +402,24 @@ class EventDetailSerializer(EventSerializer):
                     perms["can_book"] = obj.status == obj.Status.PUBLISHED
 
         return perms
+
+
+class RecommendedEventSerializer(EventSerializer):
+    """
+    Event list item for /events/recommended/.
+
+    Adds the database-computed score (see EventService.get_recommended_events)
+    so the client can display the same badges as its local sorting.
+    """
+
+    score = serializers.IntegerField(source="recommendation_score", read_only=True)
+    is_recommended = serializers.SerializerMethodField()
+    is_nearby = serializers.BooleanField(read_only=True)
+
+    class Meta(EventSerializer.Meta):
+        fields = EventSerializer.Meta.fields + ["score", "is_recommended", "is_nearby"]
+        read_only_fields = EventSerializer.Meta.read_only_fields + ["score", "is_recommended", "is_nearby"]
+
+    def get_is_recommended(self, obj):
+        from common.constants import RECOMMENDATION_SCORE_MIN
+        return obj.recommendation_score >= RECOMMENDATION_SCORE_MIN
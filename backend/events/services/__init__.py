@@ -1,5 +1,8 @@
 """Event services package."""
 
 from .event_service import EventService
+from .feed_cache_service import EventFeedCacheService
+from .lifecycle_sweeper import LifecycleSweeper
+from .lifecycle_scheduler import LifecycleScheduler
 
-__all__ = ["EventService"]
+__all__ = ["EventService", "EventFeedCacheService", "LifecycleSweeper", "LifecycleScheduler"]
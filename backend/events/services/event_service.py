@@ -25,9 +25,7 @@ from rest_framework.exceptions import ValidationError as DRFValidationError
 from common.services.base import BaseService
 from common.exceptions import EventAlreadyCancelledError
 from common.constants import (
-    MIN_PARTICIPANTS_PER_EVENT as MIN_PARTICIPANTS,
     MAX_PARTICIPANTS_PER_EVENT as MAX_PARTICIPANTS,
-    AUTO_CANCEL_CHECK_HOURS as AUTO_CANCEL_THRESHOLD_HOURS,
     CANCELLATION_DEADLINE_HOURS,
 )
 from audit.services import AuditService
@@ -77,11 +75,17 @@ class EventService(BaseService):
             datetime_start=event_data.get("datetime_start")
         )
 
-        # Create event in DRAFT status
-        event = Event.objects.create(
-            organizer=organizer,
-            status=Event.Status.DRAFT,
-            **event_data
+        # Create event in DRAFT status, seats allocated under the (partner, slot) lock
+        from partners.services import OccupancyService
+        event = OccupancyService.allocate_event_seats(
+            partner=event_data.get("partner"),
+            datetime_start=event_data.get("datetime_start"),
+            create_event=lambda seats: Event.objects.create(
+                organizer=organizer,
+                status=Event.Status.DRAFT,
+                max_participants=seats,
+                **event_data
+            ),
         )
 
         # Create organizer's booking
@@ -124,8 +128,9 @@ class EventService(BaseService):
         # Mark event as cancelled (validations handled in model/service transition)
         event.mark_cancelled()
 
-        # Cascade cancel all non-cancelled bookings using BookingService
-        # to ensure proper refund processing for CONFIRMED bookings
+        # Cascade cancel all non-cancelled bookings using BookingService.
+        # Refunds of CONFIRMED bookings go to the outbox and run after commit,
+        # so no Stripe call happens while the event rows are locked
         from bookings.services import BookingService
         bookings_to_cancel = event.bookings.exclude(status=BookingStatus.CANCELLED)
         for booking in bookings_to_cancel:
@@ -136,6 +141,7 @@ class EventService(BaseService):
                     booking=booking,
                     cancelled_by=cancelled_by,
                     system_cancellation=False,
+                    defer_refund=True,
                 )
             except Exception as e:
                 # Log but continue cancelling the rest
@@ -167,26 +173,86 @@ class EventService(BaseService):
 
         This prevents old drafts from cluttering the database and
         ensures organizers cannot publish events in the past.
+        Runs as a chunked bulk delete (see LifecycleSweeper).
 
         Returns:
             int: Number of drafts deleted
         """
+        from .lifecycle_sweeper import LifecycleSweeper
+
+        return len(LifecycleSweeper.cleanup_drafts())
+
+    @staticmethod
+    def find_confirmed_seat_drift(event_id=None):
+        """
+        Compare Event.confirmed_seats with the actual CONFIRMED bookings.
+
+        Args:
+            event_id (int): Optional event to restrict the check to
+
+        Returns:
+            list: Dicts {"event_id", "stored", "expected"} for drifted events
+        """
+        from django.db.models import Count, F, Q
         from events.models import Event
+        from bookings.models import BookingStatus
 
-        now = timezone.now()
+        events = Event.objects.all()
+        if event_id is not None:
+            events = events.filter(pk=event_id)
 
-        # Find all DRAFT events whose start time has passed
-        expired_drafts = Event.objects.filter(
-            status=Event.Status.DRAFT,
-            datetime_start__lt=now
+        drifted = (
+            events.order_by()
+            .annotate(expected=Count("bookings", filter=Q(bookings__status=BookingStatus.CONFIRMED)))
+            .exclude(confirmed_seats=F("expected"))
+            .values_list("pk", "confirmed_seats", "expected")
         )
+        return [
+            {"event_id": pk, "stored": stored, "expected": expected}
+            for pk, stored, expected in drifted
+        ]
 
-        count = expired_drafts.count()
+    @staticmethod
+    @transaction.atomic
+    def reconcile_confirmed_seats(event_id=None):
+        """
+        Repair drifted Event.confirmed_seats counters.
 
-        # Hard delete these drafts (they were never published)
-        expired_drafts.delete()
+        Drifted events are locked, recounted and updated; their slot
+        occupancy buckets are refreshed from the repaired counters.
 
-        return count
+        Args:
+            event_id (int): Optional event to restrict the repair to
+
+        Returns:
+            list: The drift that was repaired (see find_confirmed_seat_drift)
+        """
+        from django.db.models import Count, Q
+        from events.models import Event
+        from bookings.models import BookingStatus
+        from partners.services import OccupancyService
+        from .feed_cache_service import EventFeedCacheService
+
+        drift = EventService.find_confirmed_seat_drift(event_id=event_id)
+        if not drift:
+            return []
+
+        ids = [item["event_id"] for item in drift]
+        list(Event.objects.select_for_update().filter(pk__in=ids).values_list("pk"))
+        recounted = (
+            Event.objects.filter(pk__in=ids)
+            .order_by()
+            .annotate(expected=Count("bookings", filter=Q(bookings__status=BookingStatus.CONFIRMED)))
+            .values_list("pk", "expected")
+        )
+        for pk, expected in recounted:
+            Event.objects.filter(pk=pk).update(confirmed_seats=expected)
+
+        OccupancyService.refresh_for_windows(
+            Event.objects.filter(pk__in=ids).values_list("partner_id", "datetime_start")
+        )
+        EventFeedCacheService.invalidate()
+        return drift
 
     @staticmethod
     def auto_finish_completed_events():
@@ -195,49 +261,14 @@ class EventService(BaseService):
         - Event started more than 1 hour ago (event duration exceeded)
 
         Also force-completes any ACTIVE games for these events (timeout).
+        Runs as chunked bulk updates (see LifecycleSweeper).
 
         Returns:
             int: Number of events marked as FINISHED
         """
-        from events.models import Event
-        from games.models import Game, GameStatus
-
-        now = timezone.now()
+        from .lifecycle_sweeper import LifecycleSweeper
 
-        # Events that should be finished (started > 1h ago and still PUBLISHED)
-        events_to_finish = Event.objects.filter(
-            status=Event.Status.PUBLISHED,
-            datetime_start__lt=now - timedelta(hours=1)  # 1h after event start
-        ).select_related('organizer')
-
-        finished_count = 0
-
-        for event in events_to_finish:
-            # Check if event has an active game that needs to be force-completed
-            active_game = Game.objects.filter(
-                event=event,
-                status=GameStatus.ACTIVE
-            ).first()
-
-            if active_game:
-                # Force-complete the game (timeout after 1h)
-                active_game.status = GameStatus.COMPLETED
-                active_game.completed_at = now
-                active_game.save(update_fields=['status', 'completed_at', 'updated_at'])
-
-                # Calculate and save final results even if game wasn't finished normally
-                from games.services import GameService
-                try:
-                    GameService._calculate_final_results(active_game)
-                except Exception:
-                    # If result calculation fails, continue anyway
-                    pass
-
-            # Mark event as finished
-            event.mark_finished()
-            finished_count += 1
-
-        return finished_count
+        return len(LifecycleSweeper.finish_events())
 
     @staticmethod
     def check_and_cancel_underpopulated_events():
@@ -245,73 +276,21 @@ class EventService(BaseService):
         Check for events starting soon with insufficient participants.
 
         Automatically cancels events that:
-        - Are scheduled to start within AUTO_CANCEL_THRESHOLD_HOURS
-        - Have fewer than MIN_PARTICIPANTS confirmed bookings
+        - Are scheduled to start within AUTO_CANCEL_CHECK_HOURS
+        - Have fewer than MIN_PARTICIPANTS_PER_EVENT confirmed seats
         - Are in PUBLISHED status
 
+        Events and pending bookings are cancelled in bulk; confirmed
+        bookings are cancelled with a refund (see LifecycleSweeper).
+
         Returns:
             list: Cancelled events
         """
         from events.models import Event
-        from bookings.models import BookingStatus
-
-        threshold_time = timezone.now() + timedelta(hours=AUTO_CANCEL_THRESHOLD_HOURS)
-        now = timezone.now()
-
-        upcoming_events = Event.objects.filter(
-            status=Event.Status.PUBLISHED,
-            datetime_start__lte=threshold_time,
-            datetime_start__gte=now
-        ).select_related('organizer').prefetch_related('bookings')
-
-        cancelled_events = []
-
-        for event in upcoming_events:
-            confirmed_count = event.bookings.filter(
-                status=BookingStatus.CONFIRMED
-            ).count()
-
-            if confirmed_count < MIN_PARTICIPANTS:
-                # Cancel event (system cancellation bypasses 3h rule)
-                event.mark_cancelled(system_cancellation=True)
-
-                # Cancel all non-cancelled bookings WITH refunds
-                # Import here to avoid circular dependency
-                from bookings.services import BookingService
-
-                bookings_to_cancel = event.bookings.exclude(status=BookingStatus.CANCELLED)
-                for booking in bookings_to_cancel:
-                    try:
-                        # Use service to handle refunds automatically
-                        # system_cancellation=True bypasses 3h deadline (event auto-cancelled)
-                        BookingService.cancel_booking(
-                            booking=booking,
-                            cancelled_by=None,  # System action
-                            system_cancellation=True  # Bypass deadline check
-                        )
-                    except Exception as e:
-                        # Log but don't stop auto-cancel process
-                        AuditService.log_error(
-                            action="auto_cancel_booking_failed",
-                            message=f"Failed to cancel booking {booking.public_id} during event auto-cancel: {str(e)}",
-                            user=booking.user,
-                            error_details={
-                                "booking_id": booking.id,
-                                "event_id": event.id,
-                                "error": str(e)
-                            }
-                        )
-
-                # Audit log: auto-cancelled due to insufficient participants
-                AuditService.log_event_cancelled(
-                    event,
-                    cancelled_by=None,  # System action
-                    reason=f"Auto-cancelled: Only {confirmed_count}/{MIN_PARTICIPANTS} participants"
-                )
+        from .lifecycle_sweeper import LifecycleSweeper
 
-                cancelled_events.append(event)
-
-        return cancelled_events
+        cancelled_ids = LifecycleSweeper.cancel_underpopulated()
+        return list(Event.objects.filter(pk__in=cancelled_ids).order_by("datetime_start"))
 
     @staticmethod
     def get_available_events_for_user(user=None):
@@ -344,6 +323,120 @@ class EventService(BaseService):
 
         return queryset.order_by('-datetime_start')
 
+    @staticmethod
+    def get_recommended_events(user, limit=None):
+        """
+        Get the top-N events recommended to a user, scored in the database.
+
+        Candidates are the public feed: PUBLISHED events starting within the
+        next 7 days. The score mirrors the client-side sorting service:
+
+            Language (user native_langs / target_langs vs event language):
+                +300  speaks AND learns the event language
+                +200  speaks the event language
+                (the client's +100 "support" rule requires speaking the event
+                language too, so it is always covered by +200)
+            Bonuses:
+                +40 partner in the user's city, +20 free, +10 starts within 7 days,
+                +5 almost full (>= 80% of max_participants booked, not full)
+            Penalties:
+                -300 already booked (PENDING/CONFIRMED), -1200 full
+            (cancelled and past events are not candidates)
+
+        Only the top `limit` rows leave the database, annotated with
+        recommendation_score, is_nearby and already_booked.
+
+        Args:
+            user: Authenticated user
+            limit (int): Number of events (default 5, max 20)
+
+        Returns:
+            list: Events ordered by score desc, then datetime_start
+        """
+        from django.db.models import BooleanField, Case, Exists, F, IntegerField, OuterRef, Q, Value, When
+        from events.models import Event
+        from bookings.models import Booking, BookingStatus
+        from common.constants import (
+            MAX_FUTURE_BOOKING_DAYS,
+            RECOMMENDATION_BONUS_ALMOST_FULL,
+            RECOMMENDATION_BONUS_FREE,
+            RECOMMENDATION_BONUS_NEARBY,
+            RECOMMENDATION_BONUS_SOON,
+            RECOMMENDATION_DEFAULT_LIMIT,
+            RECOMMENDATION_MAX_LIMIT,
+            RECOMMENDATION_PENALTY_BOOKED,
+            RECOMMENDATION_PENALTY_FULL,
+            RECOMMENDATION_SCORE_BIDIRECTIONAL,
+            RECOMMENDATION_SCORE_NATIVE,
+        )
+
+        limit = max(1, min(int(limit or RECOMMENDATION_DEFAULT_LIMIT), RECOMMENDATION_MAX_LIMIT))
+        now = timezone.now()
+        native = list(user.native_langs.values_list("id", flat=True))
+        target = list(user.target_langs.values_list("id", flat=True))
+        city = (getattr(user, "city", "") or "").strip()
+
+        def bonus(condition, points):
+            return Case(When(condition, then=Value(points)), default=Value(0), output_field=IntegerField())
+
+        def flag(condition):
+            return Case(When(condition, then=Value(True)), default=Value(False), output_field=BooleanField())
+
+        is_full = (
+            Q(max_participants__gt=0, annotated_booked_seats__gte=F("max_participants"))
+            | Q(annotated_slot_confirmed_seats__gte=F("partner__capacity"))
+        )
+        almost_full = (
+            Q(max_participants__gt=0)
+            & Q(annotated_booked_seats__lt=F("max_participants"))
+            & Q(booked_x5__gte=F("max_participants") * 4)
+        )
+
+        queryset = (
+            Event.objects.select_related("organizer", "partner", "language")
+            .filter(
+                status=Event.Status.PUBLISHED,
+                datetime_start__gte=now,
+                datetime_start__lte=now + timedelta(days=MAX_FUTURE_BOOKING_DAYS),
+            )
+            .with_occupancy()
+            .annotate(
+                booked_x5=F("annotated_booked_seats") * 5,
+                already_booked=Exists(
+                    Booking.objects.filter(
+                        event=OuterRef("pk"),
+                        user_id=user.id,
+                        status__in=[BookingStatus.PENDING, BookingStatus.CONFIRMED],
+                    )
+                ),
+                is_nearby=flag(Q(partner__city__icontains=city)) if city else Value(False),
+            )
+            .annotate(
+                recommendation_score=(
+                    Case(
+                        When(
+                            Q(language_id__in=native) & Q(language_id__in=target),
+                            then=Value(RECOMMENDATION_SCORE_BIDIRECTIONAL),
+                        ),
+                        When(language_id__in=native, then=Value(RECOMMENDATION_SCORE_NATIVE)),
+                        default=Value(0),
+                        output_field=IntegerField(),
+                    )
+                    + bonus(Q(is_nearby=True), RECOMMENDATION_BONUS_NEARBY)
+                    + bonus(Q(price_cents=0), RECOMMENDATION_BONUS_FREE)
+                    + bonus(
+                        Q(datetime_start__gt=now, datetime_start__lte=now + timedelta(days=7)),
+                        RECOMMENDATION_BONUS_SOON,
+                    )
+                    + bonus(almost_full & ~is_full, RECOMMENDATION_BONUS_ALMOST_FULL)
+                    - bonus(Q(already_booked=True), RECOMMENDATION_PENALTY_BOOKED)
+                    - bonus(is_full, RECOMMENDATION_PENALTY_FULL)
+                )
+            )
+            .order_by("-recommendation_score", "datetime_start", "id")
+        )
+        return list(queryset[:limit])
+
     @staticmethod
     def is_event_full(event):
         """
@@ -380,18 +473,11 @@ class EventService(BaseService):
         Returns:
             int: Total participant count
         """
-        from bookings.models import Booking, BookingStatus
-
         # Organizer always counts as 1 participant
         organizer_count = 1
 
-        # Add confirmed bookings (paid participants)
-        confirmed_bookings = Booking.objects.filter(
-            event=event,
-            status=BookingStatus.CONFIRMED
-        ).count()
-
-        return organizer_count + confirmed_bookings
+        # Add confirmed bookings (paid participants): maintained counter
+        return organizer_count + event.confirmed_seats
 
     @staticmethod
     def get_available_slots(event):
@@ -0,0 +1,157 @@
+"""
+Shared cache for the public events feed.
+
+For non-staff users, most of the event list is the same set: PUBLISHED events
+from now to +7 days. This service stores the serialized page once per query
+string (partner, language, ordering, page, page_size...) and lets the view
+merge the per-user part (my_booking) on top.
+
+Cache keys carry a global feed version. The version changes on every event or
+booking write (Event/Booking save and delete, bulk status updates), so a
+cached page is never served after the data it was built from changed.
+
+Users who organize active events (drafts, pending, own published events with
+edit links) see a different list and always bypass the cache.
+"""
+
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+from common.services.base import BaseService
+from common.constants import EVENT_FEED_CACHE_TIMEOUT
+
+
+FEED_CACHE_VERSION_KEY = "events:feed:version"
+FEED_CACHE_KEY = "events:feed:{version}:{digest}"
+
+
+class EventFeedCacheService(BaseService):
+    """Versioned cache of the serialized public events feed."""
+
+    @staticmethod
+    def get_version():
+        """Get the current feed version (created on first use)."""
+        version = cache.get(FEED_CACHE_VERSION_KEY)
+        if version is None:
+            cache.add(FEED_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+            version = cache.get(FEED_CACHE_VERSION_KEY)
+        return version
+
+    @staticmethod
+    def invalidate():
+        """
+        Change the feed version now and again once the transaction commits.
+
+        The immediate bump drops pages cached before the write; the post-commit
+        bump drops pages a concurrent reader may have cached from pre-commit
+        data in between.
+        """
+        cache.delete(FEED_CACHE_VERSION_KEY)
+        transaction.on_commit(lambda: cache.delete(FEED_CACHE_VERSION_KEY))
+
+    @staticmethod
+    def is_cacheable_for(user):
+        """
+        Check whether the user's event list is exactly the public feed.
+
+        Args:
+            user: Authenticated user
+
+        Returns:
+            bool: False for staff and for organizers of active events
+        """
+        from events.models import Event
+
+        if getattr(user, "is_staff", False):
+            return False
+        return not Event.objects.filter(organizer_id=user.id).exclude(
+            status__in=[Event.Status.CANCELLED, Event.Status.FINISHED]
+        ).exists()
+
+    @staticmethod
+    def page_key(request):
+        """
+        Build the cache key of a feed page.
+
+        The full query string and the host are part of the key: pagination and
+        _links URLs are absolute and echo the request's parameters.
+        """
+        params = "&".join(
+            f"{name}={value}"
+            for name, values in sorted(request.query_params.lists())
+            for value in values
+        )
+        raw = f"{request.build_absolute_uri(request.path)}?{params}"
+        digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+        return FEED_CACHE_KEY.format(version=EventFeedCacheService.get_version(), digest=digest)
+
+    @staticmethod
+    def get_page(key):
+        """Get a cached feed page, or None on miss."""
+        return cache.get(key)
+
+    @staticmethod
+    def store_page(key, data):
+        """
+        Cache the user-independent part of a serialized feed page.
+
+        Args:
+            key (str): Key from page_key()
+            data: Paginated dict ({"count", "next", "previous", "results"}) or list
+
+        Returns:
+            Plain copy of data with my_booking cleared, as stored in the cache
+        """
+        def strip(row):
+            row = dict(row)
+            if "my_booking" in row:
+                row["my_booking"] = None
+            return row
+
+        if isinstance(data, dict):
+            page = dict(data)
+            page["results"] = [strip(row) for row in data.get("results", [])]
+        else:
+            page = [strip(row) for row in data]
+        cache.set(key, page, timeout=EVENT_FEED_CACHE_TIMEOUT)
+        return page
+
+    @staticmethod
+    def with_user_bookings(page, user):
+        """
+        Merge the user's bookings (my_booking) into a cached feed page.
+
+        Loads the user's bookings of all events on the page in ONE query and
+        keeps the latest booking per event, like UserBookingContext.
+
+        Args:
+            page: Page returned by get_page()/store_page()
+            user: Authenticated user
+
+        Returns:
+            New page with my_booking filled for this user
+        """
+        from bookings.models import Booking
+
+        rows = page.get("results", []) if isinstance(page, dict) else page
+        if not any("my_booking" in row for row in rows):
+            return page  # excluded with ?fields=
+
+        bookings = {}
+        ids = [row["id"] for row in rows]
+        if ids:
+            for event_id, public_id, status in (
+                Booking.objects
+                .filter(user_id=user.id, event_id__in=ids)
+                .order_by("event_id", "-created_at")
+                .values_list("event_id", "public_id", "status")
+            ):
+                bookings.setdefault(event_id, {"public_id": str(public_id), "status": status})
+
+        merged = [dict(row, my_booking=bookings.get(row["id"])) for row in rows]
+        if isinstance(page, dict):
+            return dict(page, results=merged)
+        return merged
@@ -0,0 +1,347 @@
+"""
+Deadline-driven scheduler for the lifecycle sweeper.
+
+Replaces the 10-15 minute crons (expire_bookings, cancel_underpopulated_events,
+auto_finish_events, cleanup_expired_drafts) with one persistent worker
+(`manage.py run_scheduler`) that pays Django startup once. Each sweeper phase
+has one timer on a TimerWheel, set to the earliest real deadline in the
+database:
+
+- expire_bookings: min(expires_at) of PENDING bookings
+- cancel_underpopulated: min(datetime_start) - 1h of PUBLISHED events below
+  MIN_PARTICIPANTS
+- finish_events: min(datetime_start) + 1h of PUBLISHED events
+- cleanup_drafts: min(datetime_start) of DRAFT events
+- purge_game_channel: min(created_at) + GAME_CHANNEL_RETENTION_HOURS of game
+  channel events
+- refund_outbox: min(next_attempt_at) of pending refund requests (retries
+  with backoff of refunds the after-commit pool could not complete)
+- webhook_inbox: min(next_attempt_at) of pending Stripe webhook events
+  (same, for webhook events)
+
+When a timer fires, the phase runs set-based (every row due by then is
+handled at once) and its next deadline is read again. Deadlines are also
+re-read every SCHEDULER_REFRESH_SECONDS to pick up new rows: a new booking
+expires BOOKING_TTL_MINUTES after creation, so it is always seen long before
+it is due.
+
+Only the replica holding the database advisory lock fires timers; the others
+stay on standby and retry the lock every SCHEDULER_ELECTION_SECONDS.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.utils import timezone
+
+from common.constants import (
+    AUTO_CANCEL_CHECK_HOURS,
+    DEFAULT_EVENT_DURATION_HOURS,
+    LIFECYCLE_SWEEP_CHUNK_SIZE,
+    MIN_PARTICIPANTS_PER_EVENT as MIN_PARTICIPANTS,
+    SCHEDULER_ADVISORY_LOCK_KEY,
+    SCHEDULER_ELECTION_SECONDS,
+    SCHEDULER_HEALTH_STALE_SECONDS,
+    SCHEDULER_REFRESH_SECONDS,
+    SCHEDULER_TICK_SECONDS,
+)
+from common.utils.advisory_lock import AdvisoryLock
+from common.utils.timer_wheel import TimerWheel
+from .lifecycle_sweeper import LifecycleSweeper
+
+logger = logging.getLogger("event")
+
+# Timers running an outbox drain() rather than a sweeper phase
+REFUND_OUTBOX_JOB = "refund_outbox"
+WEBHOOK_INBOX_JOB = "webhook_inbox"
+OUTBOX_JOBS = {
+    REFUND_OUTBOX_JOB: "RefundOutboxService",
+    WEBHOOK_INBOX_JOB: "WebhookInboxService",
+}
+JOBS = LifecycleSweeper.PHASES + tuple(OUTBOX_JOBS)
+
+
+def _iso(moment):
+    return moment.isoformat() if moment else None
+
+
+class LifecycleScheduler:
+    """
+    Timer wheel of sweeper phases, fired by the elected leader.
+
+    Example:
+        >>> scheduler = LifecycleScheduler()
+        >>> scheduler.run_forever(stop_event)  # or run_once() per tick
+    """
+
+    def __init__(
+        self,
+        tick=SCHEDULER_TICK_SECONDS,
+        refresh=SCHEDULER_REFRESH_SECONDS,
+        election=SCHEDULER_ELECTION_SECONDS,
+        chunk_size=LIFECYCLE_SWEEP_CHUNK_SIZE,
+        lock=None,
+        now=None,
+    ):
+        now = now or timezone.now()
+        self.tick = tick
+        self.refresh_interval = timedelta(seconds=refresh)
+        self.election_interval = timedelta(seconds=election)
+        self.chunk_size = chunk_size
+        self.lock = lock or AdvisoryLock(SCHEDULER_ADVISORY_LOCK_KEY)
+        self.wheel = TimerWheel(tick=tick, start=now)
+
+        self.started_at = now
+        self.leader_since = None
+        self.last_tick_at = None
+        self.tick_lag_ms = 0.0
+        self.ticks = 0
+        self.phases = {
+            phase: {
+                "runs": 0,
+                "errors": 0,
+                "last_run_at": None,
+                "last_count": 0,
+                "last_duration_ms": None,
+                "fire_lag_ms": None,
+                "last_error": None,
+            }
+            for phase in JOBS
+        }
+        self._next_refresh = None
+        self._next_election = None
+        self._published = None
+
+    # ==========================================================================
+    # DEADLINES
+    # ==========================================================================
+
+    @staticmethod
+    def next_deadlines(now=None):
+        """
+        Read the earliest deadline of every phase from the database.
+
+        Returns:
+            dict: {phase: datetime or None (nothing to do)}
+        """
+        from django.db.models import Min
+        from events.models import Event
+        from bookings.models import Booking, BookingStatus
+        from games.constants import GAME_CHANNEL_RETENTION_HOURS
+        from games.models import GameChannelEvent
+        import payments.services
+
+        now = now or timezone.now()
+
+        def earliest(queryset, field):
+            return queryset.aggregate(deadline=Min(field))["deadline"]
+
+        expires = earliest(Booking.objects.filter(status=BookingStatus.PENDING), "expires_at")
+        underpopulated = earliest(
+            Event.objects.filter(
+                status=Event.Status.PUBLISHED,
+                datetime_start__gte=now,
+                confirmed_seats__lt=MIN_PARTICIPANTS,
+            ),
+            "datetime_start",
+        )
+        published = earliest(Event.objects.filter(status=Event.Status.PUBLISHED), "datetime_start")
+        drafts = earliest(Event.objects.filter(status=Event.Status.DRAFT), "datetime_start")
+        channel_events = earliest(GameChannelEvent.objects.all(), "created_at")
+
+        return {
+            "expire_bookings": expires,
+            "cancel_underpopulated": (
+                underpopulated - timedelta(hours=AUTO_CANCEL_CHECK_HOURS) if underpopulated else None
+            ),
+            "finish_events": (
+                published + timedelta(hours=DEFAULT_EVENT_DURATION_HOURS) if published else None
+            ),
+            "cleanup_drafts": drafts,
+            "purge_game_channel": (
+                channel_events + timedelta(hours=GAME_CHANNEL_RETENTION_HOURS) if channel_events else None
+            ),
+            **{
+                job: getattr(payments.services, service).next_deadline()
+                for job, service in OUTBOX_JOBS.items()
+            },
+        }
+
+    def refresh(self, now=None, phases=None):
+        """
+        Re-read deadlines and move the timers of the given phases (default all).
+        """
+        now = now or timezone.now()
+        for phase, deadline in self.next_deadlines(now).items():
+            if phases is not None and phase not in phases:
+                continue
+            if deadline is None:
+                self.wheel.cancel(phase)
+            else:
+                self.wheel.schedule(phase, deadline)
+        if phases is None:
+            self._next_refresh = now + self.refresh_interval
+
+    # ==========================================================================
+    # LEADER ELECTION
+    # ==========================================================================
+
+    def _ensure_leader(self, now):
+        """Acquire or re-check the advisory lock; returns True when leader."""
+        due = self._next_election is None or now >= self._next_election
+        if not due:
+            return self.lock.held
+        self._next_election = now + self.election_interval
+
+        if self.lock.held:
+            if not self.lock.verify():
+                logger.warning("[SCHEDULER] Leader lock lost, stepping down")
+                self.leader_since = None
+                self.wheel = TimerWheel(tick=self.tick, start=now)
+            return self.lock.held
+
+        if self.lock.acquire():
+            logger.info("[SCHEDULER] Acquired leader lock")
+            self.leader_since = now
+            self._next_refresh = None  # Read deadlines right away
+        return self.lock.held
+
+    # ==========================================================================
+    # RUN LOOP
+    # ==========================================================================
+
+    def run_once(self, now=None):
+        """
+        Run one tick: elect, refresh deadlines when due and fire due phases.
+
+        Each phase runs on its own so a failing phase does not hold back the
+        others; it is retried after SCHEDULER_REFRESH_SECONDS.
+
+        Returns:
+            dict: Sweeper report of the phases that fired
+        """
+        now = now or timezone.now()
+        self.last_tick_at = now
+        self.ticks += 1
+
+        if not self._ensure_leader(now):
+            return {}
+
+        if self._next_refresh is None or now >= self._next_refresh:
+            self.refresh(now)
+
+        report = {}
+        for phase, deadline in self.wheel.advance(now):
+            stats = self.phases[phase]
+            stats["fire_lag_ms"] = round(max(0.0, (now - deadline).total_seconds()) * 1000, 1)
+            try:
+                result = self._run_job(phase, now)
+            except Exception as e:
+                stats["errors"] += 1
+                stats["last_error"] = str(e)
+                logger.exception(f"[SCHEDULER] Phase {phase} failed")
+                self.wheel.schedule(phase, now + self.refresh_interval)
+                continue
+
+            stats["runs"] += 1
+            stats["last_run_at"] = now
+            stats["last_count"] = result["count"]
+            stats["last_duration_ms"] = result["duration_ms"]
+            stats["last_error"] = None
+            report[phase] = result
+            if result["count"]:
+                logger.info(
+                    f"[SCHEDULER] {phase}: {result['count']} row(s) in {result['duration_ms']}ms"
+                )
+
+        if report:
+            self.refresh(now, phases=set(report))
+        return report
+
+    def _run_job(self, phase, now):
+        """Run one timer's job; returns {"count", "duration_ms"}."""
+        if phase not in OUTBOX_JOBS:
+            return LifecycleSweeper.sweep(now=now, phases=[phase], chunk_size=self.chunk_size)[phase]
+
+        import payments.services
+
+        started = time.perf_counter()
+        results = getattr(payments.services, OUTBOX_JOBS[phase]).drain(now=now)
+        return {
+            "count": len(results),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def run_forever(self, stop):
+        """
+        Tick every `tick` seconds until stop (threading.Event) is set.
+
+        Args:
+            stop (threading.Event): Set by the signal handler to exit
+        """
+        planned = time.monotonic()
+        try:
+            while not stop.is_set():
+                lag = max(0.0, time.monotonic() - planned)
+                self.tick_lag_ms = round(lag * 1000, 1)
+                self.run_once()
+                self._published = self.snapshot()
+
+                planned += self.tick
+                if time.monotonic() - planned > self.refresh_interval.total_seconds():
+                    planned = time.monotonic()  # Stalled for long: don't replay missed ticks
+                stop.wait(max(0.0, planned - time.monotonic()))
+        finally:
+            self.lock.release()
+
+    # ==========================================================================
+    # HEALTH & METRICS
+    # ==========================================================================
+
+    def snapshot(self, now=None):
+        """
+        Health and lag metrics of this replica.
+
+        Returns:
+            dict: role, healthy, tick lag, overdue timers, per-phase stats and
+                  Stripe client metrics
+        """
+        from payments.services import StripeGateway
+
+        now = now or timezone.now()
+        timers = self.wheel.pending()
+        overdue = [(now - deadline).total_seconds() for deadline in timers.values() if deadline < now]
+        age = (now - self.last_tick_at).total_seconds() if self.last_tick_at else None
+
+        return {
+            "role": "leader" if self.lock.held else "standby",
+            "healthy": age is not None and age <= SCHEDULER_HEALTH_STALE_SECONDS,
+            "started_at": _iso(self.started_at),
+            "leader_since": _iso(self.leader_since),
+            "ticks": self.ticks,
+            "last_tick_at": _iso(self.last_tick_at),
+            "tick_lag_ms": self.tick_lag_ms,
+            "max_overdue_seconds": round(max(overdue, default=0.0), 3),
+            "timers": {phase: _iso(deadline) for phase, deadline in sorted(timers.items())},
+            "phases": {
+                phase: {**stats, "last_run_at": _iso(stats["last_run_at"])}
+                for phase, stats in self.phases.items()
+            },
+            # Stripe calls of the refund outbox / webhook inbox run in this process
+            "stripe": StripeGateway.default_metrics(),
+        }
+
+    def published_snapshot(self, now=None):
+        """
+        Last snapshot published by the run loop, with health re-evaluated.
+
+        Safe to call from another thread (the metrics HTTP server).
+        """
+        now = now or timezone.now()
+        snapshot = dict(self._published or {"role": "standby", "last_tick_at": None})
+        last_tick = self.last_tick_at
+        snapshot["healthy"] = bool(
+            last_tick and (now - last_tick).total_seconds() <= SCHEDULER_HEALTH_STALE_SECONDS
+        )
+        return snapshot
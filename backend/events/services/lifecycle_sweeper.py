@@ -0,0 +1,363 @@
+"""
+Set-based lifecycle sweeper.
+
+Runs the periodic state transitions of events and bookings:
+
+- expire_bookings: PENDING bookings past their TTL -> CANCELLED
+- cancel_underpopulated: PUBLISHED events starting within the auto-cancel
+  window with too few confirmed seats -> CANCELLED
+- finish_events: PUBLISHED events past their duration -> FINISHED, their
+  ACTIVE games force-completed
+- cleanup_drafts: DRAFT events whose start has passed -> deleted
+- purge_game_channel: real-time game channel events past their retention
+  -> deleted (see games.services.game_channel)
+
+Each phase claims rows in chunks (SELECT ... FOR UPDATE SKIP LOCKED, reading
+back the columns it needs, like UPDATE ... RETURNING) and transitions a whole
+chunk with one UPDATE, then writes its audit rows with one INSERT. A sweep is
+O(chunks) statements, not O(rows).
+
+Bulk writes bypass Model.save(): the slot occupancy ledger is refreshed per
+chunk and the feed cache is invalidated once per phase. Refunds of confirmed
+bookings go to the refund outbox (executed after commit); only game scoring
+stays per row, after the chunk has committed.
+"""
+
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from common.services.base import BaseService
+from common.constants import (
+    AUTO_CANCEL_CHECK_HOURS,
+    DEFAULT_EVENT_DURATION_HOURS,
+    LIFECYCLE_SWEEP_CHUNK_SIZE,
+    MIN_PARTICIPANTS_PER_EVENT as MIN_PARTICIPANTS,
+)
+from audit.services import AuditService
+
+
+class LifecycleSweeper(BaseService):
+    """Chunked, set-based transitions for the periodic lifecycle jobs."""
+
+    # Run order: bookings first so cancelled pending seats are released
+    PHASES = (
+        "expire_bookings",
+        "cancel_underpopulated",
+        "finish_events",
+        "cleanup_drafts",
+        "purge_game_channel",
+    )
+
+    @staticmethod
+    def sweep(now=None, phases=None, chunk_size=LIFECYCLE_SWEEP_CHUNK_SIZE):
+        """
+        Run the sweeper phases in order and time each one.
+
+        Args:
+            now (datetime): Reference time (defaults to timezone.now())
+            phases (iterable): Subset of PHASES to run (defaults to all)
+            chunk_size (int): Rows transitioned per UPDATE
+
+        Returns:
+            dict: {phase: {"count": int, "duration_ms": float}} in run order
+        """
+        now = now or timezone.now()
+        selected = set(phases or LifecycleSweeper.PHASES)
+
+        report = {}
+        for phase in LifecycleSweeper.PHASES:
+            if phase not in selected:
+                continue
+            started = time.perf_counter()
+            ids = getattr(LifecycleSweeper, phase)(now=now, chunk_size=chunk_size)
+            report[phase] = {
+                "count": len(ids),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+        return report
+
+    @staticmethod
+    def _run_chunks(queryset, fields, chunk_size, apply):
+        """
+        Claim and transition rows of queryset until none are left.
+
+        Each chunk is locked, read and handed to apply() in its own
+        transaction. apply() must move the rows out of queryset (status
+        change or delete), otherwise they would be claimed again.
+
+        Args:
+            queryset (QuerySet): Rows to transition
+            fields (tuple): Columns read back with the pk
+            chunk_size (int): Rows per chunk
+            apply (callable): Receives the list of ("pk", *fields) tuples
+
+        Returns:
+            list: pks of all transitioned rows
+        """
+        processed = []
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    queryset.select_for_update(skip_locked=True)
+                    .order_by("pk")
+                    .values_list("pk", *fields)[:chunk_size]
+                )
+                if rows:
+                    apply(rows)
+            processed.extend(row[0] for row in rows)
+            if len(rows) < chunk_size:
+                return processed
+
+    @staticmethod
+    def expire_bookings(now=None, chunk_size=LIFECYCLE_SWEEP_CHUNK_SIZE):
+        """
+        Cancel PENDING bookings whose TTL has passed.
+
+        Pending bookings hold no confirmed seat, so neither the event counter
+        nor the occupancy ledger moves.
+
+        Returns:
+            list: Expired booking ids
+        """
+        from bookings.models import Booking, BookingStatus
+        from .feed_cache_service import EventFeedCacheService
+
+        now = now or timezone.now()
+
+        def apply(rows):
+            Booking.objects.filter(pk__in=[pk for pk, *_ in rows]).update(
+                status=BookingStatus.CANCELLED,
+                cancelled_at=now,
+                updated_at=now,
+            )
+            AuditService.log_bulk("booking_expired", "Booking", [
+                (
+                    pk,
+                    "Booking expired (not paid within TTL)",
+                    {"booking_id": pk, "event_id": event_id, "user_id": user_id},
+                )
+                for pk, event_id, user_id in rows
+            ])
+
+        expired = LifecycleSweeper._run_chunks(
+            Booking.objects.filter(status=BookingStatus.PENDING, expires_at__lte=now),
+            ("event_id", "user_id"),
+            chunk_size,
+            apply,
+        )
+        if expired:
+            EventFeedCacheService.invalidate()
+        return expired
+
+    @staticmethod
+    def cancel_underpopulated(now=None, chunk_size=LIFECYCLE_SWEEP_CHUNK_SIZE):
+        """
+        Cancel PUBLISHED events starting soon with too few confirmed seats.
+
+        Events and all their active bookings are cancelled in bulk. Refunds
+        of CONFIRMED bookings are written to the refund outbox in the same
+        transaction and executed after commit.
+
+        Returns:
+            list: Cancelled event ids
+        """
+        from events.models import Event
+        from bookings.models import Booking, BookingStatus
+        from audit.models import AuditLog
+        from partners.services import OccupancyService
+        from payments.services import RefundOutboxService
+        from .feed_cache_service import EventFeedCacheService
+
+        now = now or timezone.now()
+
+        def apply(rows):
+            ids = [pk for pk, *_ in rows]
+            RefundOutboxService.enqueue(
+                Booking.objects.filter(event_id__in=ids, status=BookingStatus.CONFIRMED).only("pk", "public_id"),
+                reason="event_auto_cancelled",
+            )
+            # Bulk update bypasses Booking.save(): reset the seat counter with the event
+            Event.objects.filter(pk__in=ids).update(
+                status=Event.Status.CANCELLED,
+                cancelled_at=now,
+                confirmed_seats=0,
+                updated_at=now,
+            )
+            Booking.objects.filter(event_id__in=ids).exclude(status=BookingStatus.CANCELLED).update(
+                status=BookingStatus.CANCELLED,
+                cancelled_at=now,
+                updated_at=now,
+            )
+            entries = []
+            for pk, partner_id, start, theme, confirmed in rows:
+                reason = f"Auto-cancelled: Only {confirmed}/{MIN_PARTICIPANTS} participants"
+                entries.append((
+                    pk,
+                    f"Event '{theme}' auto-cancelled by system: {reason}",
+                    {
+                        "event_id": pk,
+                        "theme": theme,
+                        "cancelled_by_email": "system",
+                        "cancelled_at": now.isoformat(),
+                        "reason": reason,
+                    },
+                ))
+            AuditService.log_bulk(
+                "event_cancelled", "Event", entries,
+                category=AuditLog.Category.EVENT,
+                level=AuditLog.Level.WARNING,
+            )
+            OccupancyService.refresh_for_windows(
+                (partner_id, start) for _, partner_id, start, *_ in rows
+            )
+
+        cancelled = LifecycleSweeper._run_chunks(
+            Event.objects.filter(
+                status=Event.Status.PUBLISHED,
+                datetime_start__gte=now,
+                datetime_start__lte=now + timedelta(hours=AUTO_CANCEL_CHECK_HOURS),
+                confirmed_seats__lt=MIN_PARTICIPANTS,
+            ),
+            ("partner_id", "datetime_start", "theme", "confirmed_seats"),
+            chunk_size,
+            apply,
+        )
+        if cancelled:
+            EventFeedCacheService.invalidate()
+        return cancelled
+
+    @staticmethod
+    def finish_events(now=None, chunk_size=LIFECYCLE_SWEEP_CHUNK_SIZE):
+        """
+        Mark PUBLISHED events past their duration as FINISHED.
+
+        ACTIVE games of these events are force-completed with one UPDATE per
+        chunk. Once the chunks committed, exactly those games are scored and
+        a "completed" event is published on their channel (open game streams
+        end), even if a later chunk failed.
+
+        Returns:
+            list: Finished event ids
+        """
+        from events.models import Event
+        from games.models import Game, GameStatus
+        from partners.services import OccupancyService
+        from .feed_cache_service import EventFeedCacheService
+
+        now = now or timezone.now()
+        completed_games = []
+
+        def apply(rows):
+            ids = [pk for pk, *_ in rows]
+            Event.objects.filter(pk__in=ids).update(
+                status=Event.Status.FINISHED,
+                updated_at=now,
+            )
+            # Rows of the events are locked: no game can change status in between
+            active = Game.objects.filter(event_id__in=ids, status=GameStatus.ACTIVE)
+            game_ids = list(active.values_list("pk", flat=True))
+            active.filter(pk__in=game_ids).update(
+                status=GameStatus.COMPLETED,
+                completed_at=now,
+                updated_at=now,
+            )
+            completed_games.extend(game_ids)
+            AuditService.log_bulk("event_finished", "Event", [
+                (pk, f"Event '{theme}' finished", {"event_id": pk, "theme": theme})
+                for pk, _, _, theme in rows
+            ])
+            OccupancyService.refresh_for_windows(
+                (partner_id, start) for _, partner_id, start, _ in rows
+            )
+
+        try:
+            finished = LifecycleSweeper._run_chunks(
+                Event.objects.filter(
+                    status=Event.Status.PUBLISHED,
+                    datetime_start__lt=now - timedelta(hours=DEFAULT_EVENT_DURATION_HOURS),
+                ),
+                ("partner_id", "datetime_start", "theme"),
+                chunk_size,
+                apply,
+            )
+        finally:
+            if completed_games:
+                LifecycleSweeper._complete_games(completed_games)
+
+        if finished:
+            EventFeedCacheService.invalidate()
+        return finished
+
+    @staticmethod
+    def _complete_games(game_ids):
+        """
+        Score force-completed games and publish their "completed" event.
+
+        Args:
+            game_ids (list): Games completed by finish_events() (those of a
+                rolled back chunk are still ACTIVE and skipped)
+        """
+        from games.models import Game, GameStatus
+        from games.services import GameService
+
+        completed = Game.objects.filter(pk__in=game_ids, status=GameStatus.COMPLETED).select_related("event")
+        for game in completed:
+            # Calculate final results even if games weren't finished normally
+            try:
+                with transaction.atomic():
+                    game_result = GameService._calculate_final_results(game)
+            except Exception:
+                # If result calculation fails, continue anyway
+                game_result = None
+            with transaction.atomic():
+                GameService._publish(game, "completed", GameService._completed_result(game_result, "Event finished"))
+
+    @staticmethod
+    def cleanup_drafts(now=None, chunk_size=LIFECYCLE_SWEEP_CHUNK_SIZE):
+        """
+        Delete DRAFT events whose datetime_start has passed.
+
+        Returns:
+            list: Deleted event ids
+        """
+        from events.models import Event
+        from partners.services import OccupancyService
+        from .feed_cache_service import EventFeedCacheService
+
+        now = now or timezone.now()
+
+        def apply(rows):
+            Event.objects.filter(pk__in=[pk for pk, *_ in rows]).delete()
+            AuditService.log_bulk("event_draft_expired", "Event", [
+                (pk, f"Expired draft '{theme}' deleted", {"event_id": pk, "theme": theme})
+                for pk, _, _, theme in rows
+            ])
+            # Bulk delete bypasses Event.delete(): release their seats explicitly
+            OccupancyService.refresh_for_windows(
+                (partner_id, start) for _, partner_id, start, _ in rows
+            )
+
+        deleted = LifecycleSweeper._run_chunks(
+            Event.objects.filter(status=Event.Status.DRAFT, datetime_start__lt=now),
+            ("partner_id", "datetime_start", "theme"),
+            chunk_size,
+            apply,
+        )
+        if deleted:
+            EventFeedCacheService.invalidate()
+        return deleted
+
+    @staticmethod
+    def purge_game_channel(now=None, chunk_size=LIFECYCLE_SWEEP_CHUNK_SIZE):
+        """
+        Delete game channel events kept longer than GAME_CHANNEL_RETENTION_HOURS.
+
+        Returns:
+            list: Deleted channel event ids
+        """
+        from games.services import GameChannel
+
+        return GameChannel.purge(now=now, chunk_size=chunk_size)
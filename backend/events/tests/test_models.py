@@ -0,0 +1,55 @@
+"""Tests for Event model and queryset helpers."""
+
+from datetime import timedelta
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from events.models import Event
+from languages.models import Language
+from partners.models import Partner
+
+User = get_user_model()
+
+
+class EventOverlappingQuerysetTests(TestCase):
+    """Test EventQuerySet.overlapping()."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="orga@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.language = Language.objects.create(
+            code="fr", label_fr="Francais", label_en="French", label_nl="Frans"
+        )
+        self.partner = Partner.objects.create(name="Bar", address="Rue 1", capacity=50)
+        self.slot = (timezone.now() + timedelta(days=2)).replace(
+            hour=18, minute=0, second=0, microsecond=0
+        )
+
+    def _event(self, offset_minutes):
+        return Event.objects.create(
+            organizer=self.user,
+            partner=self.partner,
+            language=self.language,
+            theme="Overlap",
+            difficulty="easy",
+            datetime_start=self.slot + timedelta(minutes=offset_minutes),
+        )
+
+    def test_returns_only_overlapping_events(self):
+        """Events touching [18:00, 19:00) match; adjacent ones do not."""
+        before = self._event(-60)   # 17:00-18:00, adjacent
+        early = self._event(-30)    # 17:30-18:30
+        same = self._event(0)       # 18:00-19:00
+        late = self._event(45)      # 18:45-19:45
+        after = self._event(60)     # 19:00-20:00, adjacent
+
+        ids = set(
+            Event.objects.overlapping(self.slot, self.slot + timedelta(hours=1))
+            .values_list("id", flat=True)
+        )
+
+        self.assertEqual(ids, {early.id, same.id, late.id})
+        self.assertNotIn(before.id, ids)
+        self.assertNotIn(after.id, ids)
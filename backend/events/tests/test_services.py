@@ -381,3 +381,344 @@ class EventServiceTestCase(TestCase):
         self.assertEqual(event.status, Event.Status.CANCELLED)
         self.assertIsNotNone(event.cancelled_at)
 
+
+
+class ConfirmedSeatsCounterTestCase(TestCase):
+    """Test suite for the denormalized Event.confirmed_seats counter."""
+
+    def setUp(self):
+        """Create test fixtures."""
+        self.organizer = User.objects.create_user(
+            email="organizer@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        self.participant = User.objects.create_user(
+            email="participant@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        language = Language.objects.create(
+            code="fr", label_fr="Francais", label_en="French", label_nl="Frans", is_active=True,
+        )
+        partner = Partner.objects.create(
+            name="Test Bar", address="123 Test St", city="Brussels", capacity=50, is_active=True,
+        )
+        self.event = Event.objects.create(
+            organizer=self.organizer,
+            partner=partner,
+            language=language,
+            theme="Counter",
+            difficulty="easy",
+            datetime_start=(timezone.now() + timedelta(days=2)).replace(hour=18, minute=0, second=0, microsecond=0),
+            status=Event.Status.PUBLISHED,
+        )
+
+    def _stored(self):
+        return Event.objects.values_list("confirmed_seats", flat=True).get(pk=self.event.pk)
+
+    def test_counter_follows_booking_lifecycle(self):
+        """Confirming, cancelling and deleting bookings move the counter."""
+        booking = Booking.objects.create(user=self.participant, event=self.event, amount_cents=700)
+        self.assertEqual(self._stored(), 0)
+
+        booking.mark_confirmed(payment_intent_id="pi_counter")
+        self.assertEqual(self._stored(), 1)
+
+        booking.mark_cancelled()
+        self.assertEqual(self._stored(), 0)
+
+        confirmed = Booking.objects.create(
+            user=self.organizer, event=self.event, amount_cents=700, status=BookingStatus.CONFIRMED,
+        )
+        self.assertEqual(self._stored(), 1)
+        confirmed.delete()
+        self.assertEqual(self._stored(), 0)
+
+    def test_full_event_save_keeps_counter(self):
+        """A stale in-memory Event saved without update_fields must not reset the counter."""
+        stale = Event.objects.get(pk=self.event.pk)
+        Booking.objects.create(
+            user=self.participant, event=self.event, amount_cents=700, status=BookingStatus.CONFIRMED,
+        )
+
+        stale.theme = "Renamed"
+        stale.save()
+
+        self.assertEqual(self._stored(), 1)
+        self.assertEqual(Event.objects.get(pk=self.event.pk).theme, "Renamed")
+
+    def test_reconcile_repairs_drift(self):
+        """reconcile_confirmed_seats restores the counter from CONFIRMED bookings."""
+        from io import StringIO
+        from django.core.management import call_command
+
+        Booking.objects.create(
+            user=self.participant, event=self.event, amount_cents=700, status=BookingStatus.CONFIRMED,
+        )
+        Event.objects.filter(pk=self.event.pk).update(confirmed_seats=7)
+
+        out = StringIO()
+        call_command("reconcile_confirmed_seats", "--verify", stdout=out)
+        self.assertIn(f"event={self.event.pk} stored=7 expected=1", out.getvalue())
+        self.assertEqual(self._stored(), 7)
+
+        call_command("reconcile_confirmed_seats", stdout=StringIO())
+        self.assertEqual(self._stored(), 1)
+        self.assertEqual(EventService.find_confirmed_seat_drift(), [])
+
+
+class LifecycleSweeperTestCase(TestCase):
+    """Test suite for the set-based LifecycleSweeper."""
+
+    def setUp(self):
+        """Create test fixtures."""
+        self.organizer = User.objects.create_user(
+            email="organizer@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        self.language = Language.objects.create(
+            code="fr", label_fr="Francais", label_en="French", label_nl="Frans", is_active=True,
+        )
+        self.partner = Partner.objects.create(
+            name="Test Bar", address="123 Test St", city="Brussels", capacity=50, is_active=True,
+        )
+
+    def _event(self, start, status=Event.Status.PUBLISHED, theme="Sweep"):
+        return Event.objects.create(
+            organizer=self.organizer,
+            partner=self.partner,
+            language=self.language,
+            theme=theme,
+            difficulty="easy",
+            datetime_start=start,
+            status=status,
+        )
+
+    def _sweep_statements(self, phase, chunk_size=500):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from events.services import LifecycleSweeper
+
+        with CaptureQueriesContext(connection) as ctx:
+            report = LifecycleSweeper.sweep(phases=[phase], chunk_size=chunk_size)
+        return report, len(ctx.captured_queries)
+
+    def test_finish_events_force_completes_active_games(self):
+        """Past events are FINISHED and their ACTIVE games completed with results."""
+        from games.models import Game, GameChannelEvent, GameResult, GameStatus
+        from audit.models import AuditLog
+
+        event = self._event(timezone.now() - timedelta(hours=2))
+        game = Game.objects.create(
+            event=event,
+            created_by=self.organizer,
+            game_type="picture_description",
+            difficulty="easy",
+            language_code="en",
+            question_id="test_01",
+            question_text="What do you see?",
+            correct_answer="mountain",
+        )
+        upcoming = self._event(timezone.now() + timedelta(days=1), theme="Upcoming")
+
+        report, _ = self._sweep_statements("finish_events")
+
+        self.assertEqual(report["finish_events"]["count"], 1)
+        event.refresh_from_db()
+        game.refresh_from_db()
+        upcoming.refresh_from_db()
+        self.assertEqual(event.status, Event.Status.FINISHED)
+        self.assertEqual(upcoming.status, Event.Status.PUBLISHED)
+        self.assertEqual(game.status, GameStatus.COMPLETED)
+        self.assertIsNotNone(game.completed_at)
+        self.assertTrue(GameResult.objects.filter(game=game).exists())
+        self.assertTrue(
+            AuditLog.objects.filter(action="event_finished", resource_id=event.id).exists()
+        )
+        # Open game streams receive the completion and end
+        (completed,) = GameChannelEvent.objects.filter(game=game)
+        self.assertEqual(completed.event_type, GameChannelEvent.Type.COMPLETED)
+        self.assertEqual(completed.payload["game_status"], GameStatus.COMPLETED)
+        self.assertEqual(completed.payload["result"]["total_questions"], game.total_questions)
+
+    def test_finish_events_scores_games_of_committed_chunks_on_error(self):
+        """Games completed by a committed chunk are scored even if a later chunk fails."""
+        from unittest import mock
+        from games.models import Game, GameResult, GameStatus
+        from events.services import LifecycleSweeper
+
+        past = timezone.now() - timedelta(hours=3)
+        games = [
+            Game.objects.create(
+                event=self._event(past - timedelta(hours=i), theme=f"Sweep {i}"),
+                created_by=self.organizer,
+                game_type="picture_description",
+                difficulty="easy",
+                language_code="en",
+                question_id=f"test_{i}",
+                question_text="What do you see?",
+                correct_answer="mountain",
+            )
+            for i in range(2)
+        ]
+        refresh = mock.patch(
+            "partners.services.OccupancyService.refresh_for_windows",
+            side_effect=[None, RuntimeError("boom")],
+        )
+
+        with refresh, self.assertRaises(RuntimeError):
+            LifecycleSweeper.finish_events(chunk_size=1)
+
+        first, second = sorted(games, key=lambda game: game.event_id)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.status, GameStatus.COMPLETED)
+        self.assertTrue(GameResult.objects.filter(game=first).exists())
+        self.assertEqual(second.status, GameStatus.ACTIVE)
+        self.assertFalse(GameResult.objects.filter(game=second).exists())
+
+    def test_statement_count_does_not_grow_with_rows(self):
+        """A phase issues the same statements for 1 or many rows of a chunk."""
+        past = timezone.now() - timedelta(hours=2)
+        self._event(past)
+        _, single = self._sweep_statements("finish_events")
+
+        for i in range(5):
+            self._event(past - timedelta(hours=i + 1), theme=f"Sweep {i}")
+        report, many = self._sweep_statements("finish_events")
+
+        self.assertEqual(report["finish_events"]["count"], 5)
+        self.assertEqual(single, many)
+
+    def test_expire_bookings_in_chunks_with_audit_rows(self):
+        """Expired PENDING bookings are cancelled chunk by chunk and audited in bulk."""
+        from audit.models import AuditLog
+
+        event = self._event(timezone.now() + timedelta(days=1))
+        expired = []
+        for i in range(3):
+            user = User.objects.create_user(
+                email=f"user{i}@example.com", password="testpass123", age=25, consent_given=True,
+            )
+            expired.append(Booking.objects.create(
+                user=user,
+                event=event,
+                amount_cents=700,
+                expires_at=timezone.now() - timedelta(minutes=1),
+            ))
+        fresh = Booking.objects.create(
+            user=self.organizer,
+            event=event,
+            amount_cents=700,
+            expires_at=timezone.now() + timedelta(minutes=10),
+        )
+
+        report, _ = self._sweep_statements("expire_bookings", chunk_size=2)
+
+        self.assertEqual(report["expire_bookings"]["count"], 3)
+        self.assertIn("duration_ms", report["expire_bookings"])
+        self.assertEqual(
+            Booking.objects.filter(pk__in=[b.pk for b in expired], status=BookingStatus.CANCELLED).count(),
+            3,
+        )
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.status, BookingStatus.PENDING)
+        self.assertEqual(AuditLog.objects.filter(action="booking_expired").count(), 3)
+
+    def test_cleanup_drafts_and_command_report(self):
+        """The sweep_lifecycle command deletes expired drafts and reports every phase."""
+        from io import StringIO
+        from django.core.management import call_command
+
+        draft = self._event(timezone.now() - timedelta(hours=1), status=Event.Status.DRAFT)
+
+        out = StringIO()
+        call_command("sweep_lifecycle", stdout=out)
+
+        self.assertFalse(Event.objects.filter(pk=draft.pk).exists())
+        output = out.getvalue()
+        self.assertIn("cleanup_drafts: 1 row(s)", output)
+        for phase in ("expire_bookings", "cancel_underpopulated", "finish_events", "purge_game_channel"):
+            self.assertIn(f"{phase}: 0 row(s)", output)
+
+
+class LifecycleSchedulerTestCase(TestCase):
+    """Test suite for the deadline-driven LifecycleScheduler."""
+
+    def setUp(self):
+        """Create test fixtures."""
+        self.user = User.objects.create_user(
+            email="scheduler@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        language = Language.objects.create(
+            code="fr", label_fr="Francais", label_en="French", label_nl="Frans", is_active=True,
+        )
+        partner = Partner.objects.create(
+            name="Test Bar", address="123 Test St", city="Brussels", capacity=50, is_active=True,
+        )
+        self.now = timezone.now().replace(microsecond=0)
+        self.event = Event.objects.create(
+            organizer=self.user,
+            partner=partner,
+            language=language,
+            theme="Scheduled",
+            difficulty="easy",
+            datetime_start=self.now + timedelta(days=1),
+            status=Event.Status.PUBLISHED,
+        )
+        self.booking = Booking.objects.create(
+            user=self.user,
+            event=self.event,
+            amount_cents=700,
+            expires_at=self.now + timedelta(minutes=15),
+        )
+
+    def _scheduler(self):
+        from events.services import LifecycleScheduler
+
+        return LifecycleScheduler(tick=1, now=self.now)
+
+    def test_timers_follow_database_deadlines(self):
+        """Each phase timer sits on the earliest real deadline."""
+        scheduler = self._scheduler()
+        scheduler.run_once(now=self.now)
+
+        timers = scheduler.wheel.pending()
+        self.assertEqual(timers["expire_bookings"], self.booking.expires_at)
+        self.assertEqual(timers["cancel_underpopulated"], self.event.datetime_start - timedelta(hours=1))
+        self.assertEqual(timers["finish_events"], self.event.datetime_start + timedelta(hours=1))
+        self.assertNotIn("cleanup_drafts", timers)
+
+    def test_booking_expires_on_its_deadline(self):
+        """The booking is expired on the first tick after expires_at, not before."""
+        scheduler = self._scheduler()
+        scheduler.run_once(now=self.now)
+
+        report = scheduler.run_once(now=self.booking.expires_at - timedelta(seconds=1))
+        self.assertEqual(report, {})
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, BookingStatus.PENDING)
+
+        report = scheduler.run_once(now=self.booking.expires_at + timedelta(seconds=1))
+        self.assertEqual(report["expire_bookings"]["count"], 1)
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, BookingStatus.CANCELLED)
+        self.assertNotIn("expire_bookings", scheduler.wheel.pending())
+
+        snapshot = scheduler.snapshot(now=self.booking.expires_at + timedelta(seconds=1))
+        self.assertEqual(snapshot["role"], "leader")
+        self.assertTrue(snapshot["healthy"])
+        self.assertEqual(snapshot["phases"]["expire_bookings"]["runs"], 1)
+        self.assertEqual(snapshot["phases"]["expire_bookings"]["fire_lag_ms"], 1000.0)
+
+    def test_standby_does_not_fire(self):
+        """A replica that cannot take the advisory lock never runs phases."""
+        from unittest.mock import MagicMock
+
+        scheduler = self._scheduler()
+        scheduler.lock = MagicMock(held=False)
+        scheduler.lock.acquire.return_value = False
+
+        report = scheduler.run_once(now=self.booking.expires_at + timedelta(minutes=1))
+
+        self.assertEqual(report, {})
+        self.assertEqual(len(scheduler.wheel), 0)
+        self.assertEqual(scheduler.snapshot()["role"], "standby")
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, BookingStatus.PENDING)
@@ -0,0 +1,129 @@
+"""
+Tests for concurrency-safe seat allocation on event creation.
+
+The contention benchmark fires N parallel creations at the same (partner, slot)
+and checks that the venue is never over-allocated and that the p95 latency of
+an allocation stays bounded. It needs real row locks, so it only runs on
+PostgreSQL:
+
+  SLOT_BENCH_WORKERS=30 SLOT_BENCH_P95_MS=500 \
+  python manage.py test events.tests.test_slot_allocation -v 2
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from common.exceptions import InsufficientCapacityError
+from events.models import Event
+from languages.models import Language
+from partners.models import Partner
+from partners.services import OccupancyService
+
+User = get_user_model()
+
+
+class SlotAllocationFixturesMixin:
+    """Venue, organizer and slot shared by the allocation tests."""
+
+    capacity = 20
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            email="orga@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.language = Language.objects.create(
+            code="fr", label_fr="Francais", label_en="French", label_nl="Frans"
+        )
+        self.partner = Partner.objects.create(
+            name="Busy Bar", address="Rue 1", capacity=self.capacity, is_active=True
+        )
+        self.slot = (timezone.now() + timedelta(days=2)).replace(
+            hour=19, minute=0, second=0, microsecond=0
+        )
+
+    def _allocate(self):
+        return OccupancyService.allocate_event_seats(
+            partner=self.partner,
+            datetime_start=self.slot,
+            create_event=lambda seats: Event.objects.create(
+                organizer=self.organizer,
+                partner=self.partner,
+                language=self.language,
+                theme="Rush",
+                difficulty="easy",
+                datetime_start=self.slot,
+                max_participants=seats,
+            ),
+        )
+
+
+class SlotAllocationTests(SlotAllocationFixturesMixin, TestCase):
+    """Test OccupancyService.allocate_event_seats()."""
+
+    def test_allocations_fill_the_venue_then_fail(self):
+        """Each event gets min(6, seats left); below 3 seats the slot is refused."""
+        seats = [self._allocate().max_participants for _ in range(3)]
+        self.assertEqual(seats, [6, 6, 6])
+
+        with self.assertRaises(InsufficientCapacityError):
+            self._allocate()
+
+        self.assertLessEqual(
+            sum(Event.objects.values_list("max_participants", flat=True)), self.capacity
+        )
+
+    def test_allocation_recounts_a_stale_ledger(self):
+        """The check under lock recounts events, so a drifted ledger cannot over-allocate."""
+        for _ in range(3):
+            self._allocate()
+        from partners.models import PartnerSlotOccupancy
+        PartnerSlotOccupancy.objects.update(reserved_seats=0)
+
+        with self.assertRaises(InsufficientCapacityError):
+            self._allocate()
+
+
+@skipUnless(connection.vendor == "postgresql", "Contention benchmark needs PostgreSQL row locks")
+class SlotAllocationContentionBenchmark(SlotAllocationFixturesMixin, TransactionTestCase):
+    """Fire N parallel allocations at one slot."""
+
+    capacity = 50
+    workers = int(os.getenv("SLOT_BENCH_WORKERS", "20"))
+    p95_budget_ms = float(os.getenv("SLOT_BENCH_P95_MS", "1000"))
+
+    def _timed_allocate(self, _):
+        started = time.perf_counter()
+        try:
+            self._allocate()
+            ok = True
+        except InsufficientCapacityError:
+            ok = False
+        finally:
+            connections.close_all()
+        return ok, (time.perf_counter() - started) * 1000
+
+    def test_parallel_creates_never_over_allocate(self):
+        """Exactly capacity // 6 (+1 partial) events win; p95 latency stays in budget."""
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(self._timed_allocate, range(self.workers)))
+
+        reserved = sum(
+            Event.objects.filter(partner=self.partner).values_list("max_participants", flat=True)
+        )
+        winners = sum(ok for ok, _ in results)
+        latencies = sorted(ms for _, ms in results)
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+
+        # 50 seats: 8 events of 6 then 2 seats left (< 3) -> 8 winners
+        self.assertLessEqual(reserved, self.capacity)
+        self.assertEqual(winners, min(self.workers, self.capacity // 6))
+        self.assertEqual(OccupancyService.verify(self.partner.pk), [])
+        self.assertLess(p95, self.p95_budget_ms, f"p95={p95:.1f}ms latencies={latencies}")
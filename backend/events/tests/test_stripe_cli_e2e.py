@@ -103,7 +103,7 @@ class EventsStripeCliE2ETest(LiveServerTestCase):
             cmd.extend(["--override", ov])
         return subprocess.run(cmd, capture_output=True, text=True, timeout=30)
 
-    @patch('payments.services.payment_service.stripe.checkout.Session.create')
+    @patch('payments.services.stripe_gateway.StripeGateway.create_checkout_session')
     def test_pay_and_publish_e2e(self, mock_stripe_create):
         """Organizer pays to publish event → webhook publishes event."""
         from bookings.models import Booking
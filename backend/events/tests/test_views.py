@@ -6,7 +6,9 @@ for list and detail views, and that API endpoints work as expected.
 """
 
 from datetime import timedelta
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -179,6 +181,42 @@ class EventAPIListTestCase(TestCase):
         self.assertNotIn('organizer_first_name', event_data)
 
 
+    def _list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/events/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries), response
+
+    def test_list_query_count_is_constant(self):
+        """A page costs the same number of queries whatever its size."""
+        baseline, _ = self._list_queries()
+
+        for i in range(10):
+            event = Event.objects.create(
+                organizer=self.user,
+                partner=self.partner,
+                language=self.language,
+                theme=f"Conversation {i}",
+                difficulty=Event.Difficulty.EASY,
+                datetime_start=self.event.datetime_start + timedelta(hours=i % 3),
+                status=Event.Status.PUBLISHED,
+            )
+            participant = User.objects.create_user(
+                email=f"p{i}@example.com", password="testpass123", age=25, consent_given=True
+            )
+            Booking.objects.create(
+                user=participant, event=event, amount_cents=700, status="CONFIRMED"
+            )
+
+        count, response = self._list_queries()
+
+        self.assertEqual(len(response.data['results']), 11)
+        self.assertEqual(count, baseline)
+        booked = {e['theme']: e['booked_seats'] for e in response.data['results']}
+        self.assertEqual(booked["Conversation 0"], 1)
+        self.assertEqual(booked["English Conversation"], 0)
+
+
 class EventAPIDetailTestCase(TestCase):
     """Test Event detail API endpoint."""
 
@@ -339,6 +377,31 @@ class EventAPIDetailTestCase(TestCase):
         self.assertEqual(response.data['available_slots'], 0)
         self.assertTrue(response.data['is_full'])
 
+    def test_detail_user_fields_share_one_bookings_query(self):
+        """my_booking, can_cancel_booking and permissions read one preloaded booking."""
+        self.client.force_authenticate(user=self.participant)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/v1/events/{self.event.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['my_booking']['status'], "CONFIRMED")
+        self.assertTrue(response.data['can_cancel_booking'])
+        self.assertTrue(response.data['permissions']['can_cancel_booking'])
+        booking_queries = [
+            q for q in ctx.captured_queries
+            if q['sql'].startswith('SELECT "bookings_booking"')
+        ]
+        self.assertEqual(len(booking_queries), 1)
+
+    def test_list_shows_my_booking_badge(self):
+        """The list exposes the current user's booking per event."""
+        self.client.force_authenticate(user=self.participant)
+        response = self.client.get('/api/v1/events/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['my_booking']['status'], "CONFIRMED")
+
     def test_detail_endpoint_requires_authentication(self):
         """Detail endpoint should require authentication."""
         self.client.force_authenticate(user=None)  # Unauthenticate
@@ -346,3 +409,420 @@ class EventAPIDetailTestCase(TestCase):
         response = self.client.get(f'/api/v1/events/{self.event.id}/')
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class EventRecommendedAPITestCase(TestCase):
+    """Test /events/recommended/ database-side scoring."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.organizer = User.objects.create_user(
+            email="orga@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.user = User.objects.create_user(
+            email="reco@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.user.city = "Brussels"
+        self.user.save(update_fields=["city"])
+
+        self.fr = Language.objects.create(code="fr", label_fr="Français", label_en="French", label_nl="Frans")
+        self.en = Language.objects.create(code="en", label_fr="Anglais", label_en="English", label_nl="Engels")
+        self.nl = Language.objects.create(code="nl", label_fr="Néerlandais", label_en="Dutch", label_nl="Nederlands")
+        self.user.native_langs.set([self.fr, self.en])
+        self.user.target_langs.set([self.en])
+
+        self.brussels = Partner.objects.create(
+            name="Brussels Bar", address="Rue 1", city="Brussels", capacity=30, is_active=True
+        )
+        self.ghent = Partner.objects.create(
+            name="Ghent Bar", address="Straat 1", city="Ghent", capacity=30, is_active=True
+        )
+        self.start = (timezone.now() + timedelta(days=2)).replace(hour=18, minute=0, second=0, microsecond=0)
+        self.client.force_authenticate(user=self.user)
+
+    def _event(self, language, partner, hours=0, theme="Talk"):
+        return Event.objects.create(
+            organizer=self.organizer,
+            partner=partner,
+            language=language,
+            theme=theme,
+            difficulty=Event.Difficulty.EASY,
+            datetime_start=self.start + timedelta(hours=hours),
+            status=Event.Status.PUBLISHED,
+        )
+
+    def test_scores_and_orders_like_the_client(self):
+        """Bidirectional > native > other language; nearby, booked and full adjust the score."""
+        both = self._event(self.en, self.ghent, theme="both")
+        native_near = self._event(self.fr, self.brussels, theme="native-near")
+        booked = self._event(self.fr, self.ghent, hours=1, theme="booked")
+        other = self._event(self.nl, self.brussels, theme="other")
+        Booking.objects.create(user=self.user, event=booked, amount_cents=700, status="CONFIRMED")
+
+        response = self.client.get('/api/v1/events/recommended/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        scores = {e['theme']: e['score'] for e in response.data}
+        self.assertEqual(
+            [e['theme'] for e in response.data], ["both", "native-near", "other", "booked"]
+        )
+        # price_cents is fixed by the model, so the free bonus never applies here
+        self.assertEqual(scores["both"], 300 + 10)
+        self.assertEqual(scores["native-near"], 200 + 40 + 10)
+        self.assertEqual(scores["other"], 40 + 10)
+        self.assertEqual(scores["booked"], 200 + 10 - 300)
+        flags = {e['theme']: (e['is_recommended'], e['is_nearby']) for e in response.data}
+        self.assertEqual(flags["native-near"], (True, True))
+        self.assertEqual(flags["other"], (False, True))
+        self.assertEqual(response.data[0]['id'], both.id)
+        self.assertEqual(response.data[1]['id'], native_near.id)
+        self.assertEqual(response.data[2]['id'], other.id)
+
+    def test_returns_only_top_n_in_constant_queries(self):
+        """limit caps the rows, and the query count does not grow with candidates."""
+        self._event(self.fr, self.brussels)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get('/api/v1/events/recommended/?limit=2')
+        baseline = len(ctx.captured_queries)
+
+        for i in range(1, 6):
+            self._event(self.fr, self.brussels, hours=i % 3, theme=f"Talk {i}")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/events/recommended/?limit=2')
+
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(ctx.captured_queries), baseline)
+
+    def test_invalid_limit(self):
+        """A non-numeric limit is rejected."""
+        response = self.client.get('/api/v1/events/recommended/?limit=abc')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class EventFeedCacheTestCase(TestCase):
+    """Test the shared cache of the public events feed."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+
+        self.client = APIClient()
+        self.organizer = User.objects.create_user(
+            email="orga@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.user = User.objects.create_user(
+            email="viewer@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.other = User.objects.create_user(
+            email="other@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.language = Language.objects.create(
+            code="en", label_fr="Anglais", label_en="English", label_nl="Engels"
+        )
+        self.partner = Partner.objects.create(
+            name="Feed Bar", address="Rue 1", city="Brussels", capacity=30, is_active=True
+        )
+        self.start = (timezone.now() + timedelta(days=2)).replace(hour=18, minute=0, second=0, microsecond=0)
+        self.event = self._event("Cached talk")
+
+    def _event(self, theme, status=Event.Status.PUBLISHED):
+        return Event.objects.create(
+            organizer=self.organizer,
+            partner=self.partner,
+            language=self.language,
+            theme=theme,
+            difficulty=Event.Difficulty.EASY,
+            datetime_start=self.start,
+            status=status,
+        )
+
+    def _list(self, user, query=""):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/v1/events/{query}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        event_queries = [q for q in ctx.captured_queries if 'FROM "events_event"' in q['sql']]
+        return response, event_queries
+
+    def test_second_request_is_served_from_cache(self):
+        """A warm page does not re-query the feed."""
+        self._list(self.user)
+        response, event_queries = self._list(self.other)
+
+        self.assertEqual([e['theme'] for e in response.data['results']], ["Cached talk"])
+        # Only the "organizes active events?" check hits the events table
+        self.assertEqual(len(event_queries), 1)
+
+    def test_my_booking_is_merged_per_user(self):
+        """The cached page is shared but my_booking is the current user's."""
+        Booking.objects.create(user=self.user, event=self.event, amount_cents=700, status="CONFIRMED")
+        self._list(self.other)
+
+        mine, _ = self._list(self.user)
+        theirs, _ = self._list(self.other)
+
+        self.assertEqual(mine.data['results'][0]['my_booking']['status'], "CONFIRMED")
+        self.assertIsNone(theirs.data['results'][0]['my_booking'])
+
+    def test_event_and_booking_changes_bump_the_version(self):
+        """New events and bookings are visible on the next request."""
+        self._list(self.user)
+
+        self._event("Fresh talk")
+        response, _ = self._list(self.user)
+        self.assertEqual(response.data['count'], 2)
+
+        Booking.objects.create(user=self.other, event=self.event, amount_cents=700, status="CONFIRMED")
+        response, _ = self._list(self.user)
+        seats = {e['theme']: e['booked_seats'] for e in response.data['results']}
+        self.assertEqual(seats["Cached talk"], 1)
+
+    def test_filters_are_cached_separately(self):
+        """Each query string has its own cached page."""
+        self._list(self.user)
+        response, _ = self._list(self.user, f"?partner={self.partner.id + 1}")
+        self.assertEqual(response.data['count'], 0)
+
+    def test_conditional_get_follows_the_feed_version(self):
+        """304 while the feed is unchanged; ETags are per user; a booking invalidates."""
+        etag = self._list(self.user)[0]["ETag"]
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get('/api/v1/events/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        detail = self.client.get(f'/api/v1/events/{self.event.id}/')
+        self.assertNotEqual(detail["ETag"], etag)
+
+        self.client.force_authenticate(user=self.other)
+        self.assertEqual(self.client.get('/api/v1/events/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        Booking.objects.create(user=self.user, event=self.event, amount_cents=700, status="CONFIRMED")
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get('/api/v1/events/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['my_booking']['status'], "CONFIRMED")
+
+    def test_retrieve_conditional_get_requires_a_visible_event(self):
+        """Missing or hidden events answer 404 whatever the validators sent."""
+        self.client.force_authenticate(user=self.user)
+        url = f'/api/v1/events/{self.event.id}/'
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        missing = self.client.get('/api/v1/events/99999/', HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
+        draft = self._event("Hidden draft", status=Event.Status.DRAFT)
+        hidden = self.client.get(f'/api/v1/events/{draft.id}/', HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(hidden.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_organizers_bypass_the_cache(self):
+        """Own drafts are listed for their organizer, never cached for others."""
+        self._list(self.user)
+        self._event("Secret draft", status=Event.Status.DRAFT)
+
+        organizer_view, _ = self._list(self.organizer)
+        user_view, _ = self._list(self.user)
+
+        self.assertIn("Secret draft", [e['theme'] for e in organizer_view.data['results']])
+        self.assertNotIn("Secret draft", [e['theme'] for e in user_view.data['results']])
+
+
+class EventCursorPaginationTestCase(TestCase):
+    """Test opt-in keyset pagination on the event list."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+
+        self.client = APIClient()
+        self.staff = User.objects.create_user(
+            email="staff@example.com", password="testpass123", age=25, consent_given=True, is_staff=True
+        )
+        language = Language.objects.create(code="en", label_fr="Anglais", label_en="English", label_nl="Engels")
+        partner = Partner.objects.create(name="Deep Bar", address="Rue 1", capacity=200, is_active=True)
+        start = (timezone.now() + timedelta(days=1)).replace(hour=12, minute=0, second=0, microsecond=0)
+        for i in range(7):
+            Event.objects.create(
+                organizer=self.staff,
+                partner=partner,
+                language=language,
+                theme=f"Talk {i}",
+                difficulty=Event.Difficulty.EASY,
+                # Two events per slot: ties on datetime_start are resolved by id
+                datetime_start=start + timedelta(days=i // 2),
+                status=Event.Status.PUBLISHED,
+            )
+        self.client.force_authenticate(user=self.staff)
+
+    def test_cursor_walk_matches_page_numbers_without_count(self):
+        """Following next links returns every event once, in order, without COUNT(*)."""
+        expected = [e['id'] for e in self.client.get('/api/v1/events/?page_size=100').data['results']]
+
+        seen, url = [], '/api/v1/events/?cursor=&page_size=3'
+        while url:
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIsNone(response.data['count'])
+            self.assertFalse(any(q['sql'].startswith('SELECT COUNT(') for q in ctx.captured_queries))
+            seen += [e['id'] for e in response.data['results']]
+            url = response.data['next']
+
+        self.assertEqual(len(seen), 7)
+        self.assertEqual(set(seen), set(expected))
+        starts = dict(Event.objects.values_list("id", "datetime_start"))
+        self.assertEqual(seen, sorted(seen, key=lambda pk: (-starts[pk].timestamp(), pk)))
+
+    def test_page_number_mode_is_unchanged(self):
+        """Without ?cursor= the envelope still carries the total count."""
+        response = self.client.get('/api/v1/events/?page=2&page_size=3')
+        self.assertEqual(response.data['count'], 7)
+        self.assertEqual(len(response.data['results']), 3)
+
+
+class EventSparseFieldsetTestCase(TestCase):
+    """Test ?fields= / ?expand= on events and bookings."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+
+        self.client = APIClient()
+        self.organizer = User.objects.create_user(
+            email="orga@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.user = User.objects.create_user(
+            email="mobile@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.language = Language.objects.create(code="en", label_fr="Anglais", label_en="English", label_nl="Engels")
+        self.partner = Partner.objects.create(name="Sparse Bar", address="Rue 1", capacity=30, is_active=True)
+        self.event = Event.objects.create(
+            organizer=self.organizer,
+            partner=self.partner,
+            language=self.language,
+            theme="Sparse",
+            difficulty=Event.Difficulty.EASY,
+            datetime_start=(timezone.now() + timedelta(days=2)).replace(hour=18, minute=0, second=0, microsecond=0),
+            status=Event.Status.PUBLISHED,
+        )
+        self.booking = Booking.objects.create(
+            user=self.user, event=self.event, amount_cents=700, status="CONFIRMED"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_fields_skip_unrequested_joins_and_annotations(self):
+        """Only the requested fields are rendered, without partner join or occupancy subqueries."""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/events/?fields=title,datetime_start,my_booking')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = response.data['results'][0]
+        self.assertEqual(set(row), {"id", "title", "datetime_start", "my_booking"})
+        self.assertEqual(row['my_booking']['status'], "CONFIRMED")
+        event_sql = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('SELECT "events_event"')]
+        self.assertTrue(event_sql)
+        self.assertFalse(any('partners_partner' in sql or 'bookings_booking' in sql for sql in event_sql))
+
+    def test_expand_nests_related_objects(self):
+        """?expand= replaces ids by nested objects on detail and bookings."""
+        response = self.client.get(f'/api/v1/events/{self.event.id}/?expand=partner,language&fields=partner,language')
+        self.assertEqual(response.data['partner']['name'], "Sparse Bar")
+        self.assertEqual(response.data['language']['code'], "en")
+
+        response = self.client.get('/api/v1/bookings/?expand=event&fields=status,event')
+        row = response.data['results'][0]
+        self.assertEqual(set(row), {"id", "status", "event"})
+        self.assertEqual(row['event']['theme'], "Sparse")
+        self.assertEqual(row['event']['my_booking']['status'], "CONFIRMED")
+
+    def test_default_payload_is_unchanged(self):
+        """Without parameters every field is still rendered."""
+        row = self.client.get('/api/v1/events/').data['results'][0]
+        self.assertEqual(set(row), set(EventSerializer.Meta.fields))
+
+
+class EventSearchTestCase(TestCase):
+    """Test /events/search/ over the maintained search document."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="search@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.organizer = User.objects.create_user(
+            email="orga@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.en = Language.objects.create(code="en", label_fr="Anglais", label_en="English", label_nl="Engels")
+        self.fr = Language.objects.create(code="fr", label_fr="Français", label_en="French", label_nl="Frans")
+        self.brussels = Partner.objects.create(
+            name="Le Café Central", address="Rue Haute 1", city="Bruxelles", capacity=30, is_active=True
+        )
+        self.ghent = Partner.objects.create(
+            name="Ghent Pub", address="Straat 1", city="Gent", capacity=30, is_active=True
+        )
+        start = (timezone.now() + timedelta(days=2)).replace(hour=18, minute=0, second=0, microsecond=0)
+        self.business = self._event("Business meetings", self.en, self.brussels, start)
+        self._event("Business meetings", self.en, self.ghent, start)
+        self._event("Cuisine", self.fr, self.brussels, start + timedelta(hours=1))
+        self._event("Hidden draft business", self.en, self.brussels, start, status=Event.Status.DRAFT)
+        self.client.force_authenticate(user=self.user)
+
+    def _event(self, theme, language, partner, start, status=Event.Status.PUBLISHED):
+        return Event.objects.create(
+            organizer=self.organizer, partner=partner, language=language, theme=theme,
+            difficulty=Event.Difficulty.EASY, datetime_start=start, status=status,
+        )
+
+    def _search(self, q):
+        response = self.client.get('/api/v1/events/search/', {"q": q})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [e['id'] for e in response.data['results']]
+
+    def test_all_terms_match_across_fields(self):
+        """Terms match theme, language labels and partner city as accent-free prefixes."""
+        self.assertEqual(self._search("business english bruxelles"), [self.business.id])
+        self.assertEqual(self._search("BUSI angl brux"), [self.business.id])
+        self.assertEqual(len(self._search("cafe")), 2)
+
+    def test_search_respects_visibility(self):
+        """Drafts of other organizers are never returned."""
+        self.assertEqual(len(self._search("business")), 2)
+
+    def test_partner_rename_refreshes_documents(self):
+        """Saving a partner rebuilds its events' search documents."""
+        self.ghent.city = "Antwerpen"
+        self.ghent.save()
+        self.assertEqual(len(self._search("antwerpen")), 1)
+        self.assertEqual(self._search("gent"), [])
+
+    def test_cursor_parameter_keeps_rank_order(self):
+        """?cursor= does not switch search to keyset pagination (rank order kept)."""
+        ranked = self._search("cafe")
+        response = self.client.get('/api/v1/events/search/', {"q": "cafe", "cursor": ""})
+        self.assertEqual([e['id'] for e in response.data['results']], ranked)
+        self.assertEqual(response.data['count'], 2)
+
+    def test_partner_save_without_searched_changes_keeps_documents(self):
+        """Saving a partner whose name, city and address are unchanged rewrites no event."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from events.services import EventFeedCacheService
+
+        version = EventFeedCacheService.get_version()
+        self.ghent.api_key = ""
+        with CaptureQueriesContext(connection) as ctx:
+            self.ghent.save()  # New API key only
+            self.ghent.save(update_fields=["api_key"])
+        self.assertFalse([q for q in ctx.captured_queries if 'UPDATE "events_event"' in q["sql"]])
+        self.assertEqual(EventFeedCacheService.get_version(), version)
+
+        self.ghent.capacity = 40
+        self.ghent.save()
+        self.assertNotEqual(EventFeedCacheService.get_version(), version)
+        self.assertEqual(len(self._search("gent")), 1)
+
+    def test_missing_query(self):
+        """q is required."""
+        response = self.client.get('/api/v1/events/search/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
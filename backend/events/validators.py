@@ -100,27 +100,14 @@ def validate_partner_capacity(partner, datetime_start, duration_hours=None, excl
         partner, datetime_start, datetime_end, exclude_event_id=exclude_event_id
     )
 
-    # If updating an existing event, add back its current bookings
+    # If updating an existing event overlapping the new slot, add back its current bookings
     if exclude_event_id:
         from events.models import Event
-        from bookings.models import BookingStatus
-        try:
-            existing_event = Event.objects.get(id=exclude_event_id)
-            # Calculate existing event end time (consistent with duration_hours parameter)
-            # NOTE: existing_event.datetime_end uses DEFAULT_EVENT_DURATION_HOURS
-            # We use it here for consistency with current implementation
-            existing_event_end = existing_event.datetime_end
-
-            # Check if existing event overlaps with the new time slot
-            if (existing_event.datetime_start < datetime_end and
-                existing_event_end > datetime_start):
-                # Add back the number of confirmed bookings
-                confirmed_bookings = existing_event.bookings.filter(
-                    status=BookingStatus.CONFIRMED
-                ).count()
-                available += confirmed_bookings
-        except Event.DoesNotExist:
-            pass
+        available += sum(
+            Event.objects.filter(id=exclude_event_id)
+            .overlapping(datetime_start, datetime_end)
+            .values_list("confirmed_seats", flat=True)
+        )
 
     # Validate minimum capacity requirement
     if available < MIN_PARTICIPANTS:
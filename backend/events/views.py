@@ -20,9 +20,11 @@ from drf_spectacular.utils import (
 
 from common.permissions import IsAuthenticatedAndActive, IsOrganizerOrAdmin, IsOrganizerOrReadOnly
 from common.exceptions import EventAlreadyCancelledError
+from common.mixins import ConditionalGetMixin
+from common.pagination import CursorOptInPagination, DefaultPagination
 
 from .models import Event
-from .serializers import EventSerializer, EventDetailSerializer
+from .serializers import EventSerializer, EventDetailSerializer, RecommendedEventSerializer
 from .services import EventService
 
 
@@ -129,7 +131,7 @@ from .services import EventService
         },
     ),
 )
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for event management.
 
@@ -138,16 +140,24 @@ class EventViewSet(viewsets.ModelViewSet):
     - Permission checks (organizer or admin for updates)
     - Rate limiting (throttling)
     - Filtering and ordering
+    - Conditional GET (ETag) on list/retrieve
     """
 
-    queryset = Event.objects.select_related("organizer", "partner", "language").all()
+    queryset = Event.objects.all()
     serializer_class = EventSerializer
+
+    # Relations joined when the client does not narrow the payload with ?fields=
+    default_select_related = ("organizer", "partner", "language")
     permission_classes = [IsAuthenticatedAndActive]
 
     filter_backends = [filters.OrderingFilter]
     ordering_fields = ["datetime_start", "created_at"]
     ordering = ["-datetime_start"]
 
+    # ?cursor= switches the list to keyset pagination (no COUNT/OFFSET)
+    pagination_class = CursorOptInPagination
+    cursor_ordering = ("-datetime_start", "id")
+
     def get_serializer_class(self):
         """Use detailed serializer for single event retrieval."""
         if self.action == "retrieve":
@@ -173,11 +183,17 @@ class EventViewSet(viewsets.ModelViewSet):
         - Organizers: Own events (any status, any date)
         - Participants: For retrieve action, allow accessing events they booked (any status)
         - Staff: All events
+
+        Joins and occupancy annotations follow the requested ?fields= / ?expand=.
         """
         from django.utils import timezone
         from datetime import timedelta
 
+        serializer_class = self.get_serializer_class()
         qs = super().get_queryset()
+        related = serializer_class.get_select_related(self.request, default=self.default_select_related)
+        if related:
+            qs = qs.select_related(*related)
 
         # Apply filters from query parameters
         partner_id = self.request.query_params.get("partner")
@@ -214,8 +230,69 @@ class EventViewSet(viewsets.ModelViewSet):
                     Q(datetime_start__gte=now, datetime_start__lte=max_date)  # Public events: today to +7 days
                 )
 
+        # Read-only rendering: booked seats and slot occupancy computed in SQL
+        # (one subquery each) instead of per-row COUNT/capacity queries,
+        # skipped when ?fields= excludes every field that reads them
+        if getattr(self, "action", None) in ("list", "retrieve", "search") and serializer_class.requires(
+            self.request, serializer_class.occupancy_fields
+        ):
+            qs = qs.with_occupancy()
+
         return qs
 
+    def get_conditional_state(self, request):
+        """
+        Validators for list/retrieve: the events feed cache version.
+
+        The version changes on every event, booking or partner write. The time
+        bucket expires validators like the feed cache, since the 7-day window
+        and the 3h deadlines move with the clock. On retrieve, the event is
+        first looked up with the visibility rules: a missing or hidden event
+        gets no validators (normal 404).
+        """
+        import time
+        from common.constants import EVENT_FEED_CACHE_TIMEOUT
+        from .services import EventFeedCacheService
+
+        bucket = int(time.time()) // EVENT_FEED_CACHE_TIMEOUT
+        state = (EventFeedCacheService.get_version(), bucket)
+
+        if self.action == "retrieve":
+            queryset = self.get_conditional_object_queryset(self.get_queryset())
+            event = queryset.order_by().values_list("id", "updated_at").first() if queryset is not None else None
+            if event is None:
+                return None
+            event_id, updated_at = event
+            return (*state, event_id, updated_at.isoformat()), None
+
+        return state, None
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, self._list_public_feed, *args, **kwargs)
+
+    def _list_public_feed(self, request, *args, **kwargs):
+        """
+        List events, serving the public feed from the shared cache.
+
+        For users whose list is exactly the public feed (PUBLISHED, now..+7d),
+        the serialized page is cached once per query string and only
+        my_booking is computed per request. Staff and organizers of active
+        events are served from the database.
+        """
+        from .services import EventFeedCacheService
+
+        # Skip ConditionalGetMixin.list: validators were already checked
+        base = super(ConditionalGetMixin, self)
+        if not EventFeedCacheService.is_cacheable_for(request.user):
+            return base.list(request, *args, **kwargs)
+
+        key = EventFeedCacheService.page_key(request)
+        page = EventFeedCacheService.get_page(key)
+        if page is None:
+            response = base.list(request, *args, **kwargs)
+            page = EventFeedCacheService.store_page(key, response.data)
+        return Response(EventFeedCacheService.with_user_bookings(page, request.user))
+
     def destroy(self, request, *args, **kwargs):
         """Safely delete events.
 
@@ -326,43 +403,32 @@ class EventViewSet(viewsets.ModelViewSet):
                 )
                 raise
 
-            # Compute allowed per-event capacity based on partner availability for this slot
-            from partners.services import PartnerService
-            from common.constants import MIN_PARTICIPANTS_PER_EVENT as MIN_PAX, MAX_PARTICIPANTS_PER_EVENT as MAX_PAX
+            # Allocate seats under the (partner, slot) lock and create the event
+            # in DRAFT status (no payment) with the computed max_participants.
+            # The check above is a fast pre-check; this one is authoritative.
+            from partners.services import OccupancyService
+            from common.exceptions import InsufficientCapacityError
 
-            dt_start = validated_data.get("datetime_start")
-            # End based on default duration (validators already enforce exact 1h)
-            from datetime import timedelta
-            from common.constants import DEFAULT_EVENT_DURATION_HOURS
-            dt_end = dt_start + timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
-
-            available_for_slot = PartnerService.get_available_capacity_by_reservations(
-                partner=validated_data.get("partner"),
-                datetime_start=dt_start,
-                datetime_end=dt_end,
-            )
-
-            # Per-event capacity is capped by MAX_PAX (6) and slot availability
-            per_event_cap = min(MAX_PAX, max(0, int(available_for_slot)))
-            if per_event_cap < MIN_PAX:
-                # Safety: should be caught by validate_partner_capacity, but double-check
-                error_msg = f"Insufficient capacity to create event (available {available_for_slot}, minimum {MIN_PAX})."
+            try:
+                event = OccupancyService.allocate_event_seats(
+                    partner=validated_data.get("partner"),
+                    datetime_start=validated_data.get("datetime_start"),
+                    create_event=lambda seats: Event.objects.create(
+                        organizer=self.request.user,
+                        status=Event.Status.DRAFT,
+                        is_draft_visible=True,
+                        max_participants=seats,
+                        **validated_data
+                    ),
+                )
+            except InsufficientCapacityError as e:
                 LoggingService.log_validation_error(
-                    error_msg,
+                    "Slot allocation failed",
                     category="event",
-                    validation_errors={"capacity": error_msg},
+                    validation_errors={"capacity": str(e.detail)},
                     user=self.request.user
                 )
-                raise ValidationError({"capacity": error_msg})
-
-            # Create event in DRAFT status (no payment) with computed max_participants
-            event = Event.objects.create(
-                organizer=self.request.user,
-                status=Event.Status.DRAFT,
-                is_draft_visible=True,
-                max_participants=per_event_cap,
-                **validated_data
-            )
+                raise
 
             # Log success
             LoggingService.log_event_creation_success(event, self.request.user)
@@ -400,7 +466,9 @@ class EventViewSet(viewsets.ModelViewSet):
             "- Mark event as CANCELLED\n"
             "- Cancel all bookings (PENDING and CONFIRMED)\n\n"
             "Permissions: Organizer or admin only\n\n"
-            "Refunds: Automatic refunds are processed for confirmed bookings"
+            "Refunds: Refunds of confirmed bookings are queued and executed "
+            "right after the cancellation commits; `refunds_pending` is the "
+            "number not executed yet"
         ),
         responses={
             200: EventSerializer,
@@ -415,7 +483,11 @@ class EventViewSet(viewsets.ModelViewSet):
         try:
             EventService.cancel_event(event=event, cancelled_by=request.user)
             serializer = self.get_serializer(event)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+
+            from payments.services import RefundOutboxService
+
+            data = {**serializer.data, "refunds_pending": RefundOutboxService.pending_count(event)}
+            return Response(data, status=status.HTTP_200_OK)
         except EventAlreadyCancelledError:
             # Raise a DRF API exception so the global handler formats the envelope
             class Conflict(APIException):
@@ -654,6 +726,84 @@ class EventViewSet(viewsets.ModelViewSet):
         """Alias pour compat: utilise pay_and_publish sous le capot."""
         return self.pay_and_publish(request, pk)
 
+    @extend_schema(
+        tags=["Events"],
+        summary="Recommended events",
+        description=(
+            "Top N des événements publiés des 7 prochains jours pour l'utilisateur courant, "
+            "classés en base selon ses langues natives/cibles, la ville du partenaire, "
+            "le prix et le remplissage (même barème que le tri côté client)."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="limit",
+                description="Number of events to return (default 5, max 20)",
+                required=False,
+                type=int,
+            ),
+        ],
+        responses={
+            200: RecommendedEventSerializer(many=True),
+            400: OpenApiResponse(description="Invalid limit"),
+        },
+    )
+    @action(detail=False, methods=["GET"], url_path="recommended", url_name="recommended")
+    def recommended(self, request):
+        """Return the user's top-N events scored in the database."""
+        limit = request.query_params.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                raise ValidationError({"limit": "Must be an integer."})
+            if limit < 1:
+                raise ValidationError({"limit": "Must be greater than 0."})
+
+        events = EventService.get_recommended_events(request.user, limit=limit)
+        serializer = RecommendedEventSerializer(
+            events, many=True, context=self.get_serializer_context()
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        tags=["Events"],
+        summary="Search events",
+        description=(
+            "Recherche plein texte dans les événements visibles (thème, titre, adresse, "
+            "nom et ville du partenaire, langue). Tous les mots doivent correspondre "
+            "(préfixes, accents ignorés), meilleurs résultats d'abord.\n\n"
+            "Exemple : `/api/v1/events/search/?q=business english brussels`"
+        ),
+        parameters=[
+            OpenApiParameter(name="q", description="Search text", required=True, type=str),
+        ],
+        responses={
+            200: EventSerializer(many=True),
+            400: OpenApiResponse(description="Missing q"),
+        },
+    )
+    # Results keep the rank order: no keyset mode (it re-sorts on cursor_ordering)
+    @action(
+        detail=False,
+        methods=["GET"],
+        url_path="search",
+        url_name="search",
+        pagination_class=DefaultPagination,
+    )
+    def search(self, request):
+        """Full-text search over the user's visible events (one indexed query)."""
+        query = (request.query_params.get("q") or "").strip()
+        if not query:
+            raise ValidationError({"q": "This parameter is required."})
+
+        queryset = self.get_queryset().search(query)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @extend_schema(
         tags=["Events"],
         summary="Force publish (admin only)",
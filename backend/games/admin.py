@@ -1,7 +1,7 @@
 """Admin interface for games management."""
 
 from django.contrib import admin
-from .models import Game, GameVote
+from .models import Game, GameQuestion, GameVote
 
 
 @admin.register(Game)
@@ -77,3 +77,13 @@ class GameVoteAdmin(admin.ModelAdmin):
     list_filter = ["created_at"]
     search_fields = ["game__public_id", "user__username", "answer"]
     readonly_fields = ["created_at"]
+
+
+@admin.register(GameQuestion)
+class GameQuestionAdmin(admin.ModelAdmin):
+    """Admin interface for GameQuestion model (imported with import_game_content)."""
+
+    list_display = ["question_id", "language_code", "game_type", "difficulty", "updated_at"]
+    list_filter = ["language_code", "game_type", "difficulty"]
+    search_fields = ["question_id", "question", "correct_answer"]
+    readonly_fields = ["random_key", "created_at", "updated_at"]
@@ -0,0 +1,39 @@
+"""
+Game-specific constants.
+
+Defines constants for the real-time game channel, vote tallies and
+question content (file bank and database store).
+"""
+
+# ==============================================================================
+# REAL-TIME CHANNEL (games.services.game_channel)
+# ==============================================================================
+
+# Each process polls the shared GameChannelEvent table once per interval
+# (only while it has subscribers) and fans new rows out to its streams
+GAME_CHANNEL_POLL_SECONDS = 0.5
+GAME_CHANNEL_LOOKBACK_SECONDS = 30  # Rows committed late (concurrent votes) are still picked up
+GAME_CHANNEL_HEARTBEAT_SECONDS = 15  # SSE comment so proxies keep idle streams open
+GAME_CHANNEL_QUEUE_SIZE = 100  # Pending events per stream, a slower client is disconnected
+GAME_CHANNEL_RETENTION_HOURS = 24  # Channel rows kept for Last-Event-ID replays
+GAME_CHANNEL_RETRY_MS = 3000  # Reconnection delay advertised to EventSource clients
+
+# ==============================================================================
+# VOTE TALLY (GameQuestionTally)
+# ==============================================================================
+
+GAME_TALLY_CACHE_TIMEOUT = 2 * 60 * 60  # Longer than a game, the DB row stays the source of truth
+
+# ==============================================================================
+# QUESTION BANK (games.services.question_bank)
+# ==============================================================================
+
+QUESTION_BANK_CHECK_SECONDS = 5  # Content files are checked for changes at most this often
+
+# ==============================================================================
+# QUESTION STORE (GameQuestion, manage.py import_game_content)
+# ==============================================================================
+
+GAME_QUESTIONS_PER_GAME = 10  # Questions sampled into a game (content files hold fewer per difficulty)
+QUESTION_IMPORT_BATCH_SIZE = 1000  # Questions per bulk_create
+QUESTION_IMPORT_MAX_ERRORS = 20  # Invalid records reported in detail by an import
@@ -0,0 +1,94 @@
+"""
+Django management command to import game questions into the database.
+
+Usage:
+    python manage.py import_game_content picture_description_en.jsonl
+    python manage.py import_game_content questions.json --language fr --game-type word_association
+    python manage.py import_game_content content/*.jsonl --update       # Overwrite existing ids
+    python manage.py import_game_content big.jsonl --dry-run            # Validate only
+
+Files are JSON arrays (fixtures/games format) or JSONL (one question per
+line) and are streamed, so large sets do not need to fit in memory. Language
+and game type come from each record ("language", "game_type"), from the
+options, or from a {game_type}_{language}.json(l) file name.
+
+Once a language and game type have imported questions, create_game samples
+them from the GameQuestion table instead of the fixtures/games files.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from games.constants import QUESTION_IMPORT_BATCH_SIZE
+from games.models import GameType
+from games.services import QuestionStore
+
+
+class Command(BaseCommand):
+    help = "Import game questions from JSON/JSONL files into the question store"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "files",
+            nargs="+",
+            metavar="FILE",
+            help="JSON array or JSONL file of questions",
+        )
+        parser.add_argument(
+            "--language",
+            help="Language code of records without a 'language' key",
+        )
+        parser.add_argument(
+            "--game-type",
+            choices=GameType.values,
+            help="Game type of records without a 'game_type' key",
+        )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Overwrite questions whose id already exists (default: keep them)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate the files without writing",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=QUESTION_IMPORT_BATCH_SIZE,
+            help=f"Questions per insert (default: {QUESTION_IMPORT_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        """Import each file, then report totals."""
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+
+        invalid = 0
+        for path in options["files"]:
+            defaults = QuestionStore.defaults_from_filename(path)
+            try:
+                stats = QuestionStore.import_questions(
+                    QuestionStore.read_file(path),
+                    language_code=options["language"] or defaults.get("language_code"),
+                    game_type=options["game_type"] or defaults.get("game_type"),
+                    update=options["update"],
+                    dry_run=options["dry_run"],
+                    batch_size=options["batch_size"],
+                )
+            except (OSError, ValueError) as e:
+                raise CommandError(f"{path}: {e}")
+
+            verb = "valid (dry run)" if options["dry_run"] else "written"
+            count = stats["valid"] - stats["duplicates"] if options["dry_run"] else stats["written"]
+            self.stdout.write(
+                f"{path}: read={stats['read']} {verb}={count} "
+                f"duplicates={stats['duplicates']} invalid={stats['invalid']}"
+            )
+            for position, message in stats["errors"]:
+                self.stdout.write(f"  {position}: {message}")
+            invalid += stats["invalid"]
+
+        if invalid:
+            raise CommandError(f"✗ {invalid} invalid question(s) skipped")
+        self.stdout.write(self.style.SUCCESS("✓ Game content imported"))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0007_remove_game_timeout_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameChannelEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('vote', 'Vote tally'), ('reveal', 'Answer revealed'), ('next_question', 'Next question'), ('completed', 'Game completed')], help_text='SSE event name', max_length=20)),
+                ('payload', models.JSONField(default=dict, help_text='SSE event data')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Game Channel Event',
+                'verbose_name_plural': 'Game Channel Events',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='gamechannelevent',
+            name='game',
+            field=models.ForeignKey(help_text='Game this event belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='channel_events', to='games.game'),
+        ),
+        migrations.AddIndex(
+            model_name='gamechannelevent',
+            index=models.Index(fields=['game', 'id'], name='games_gamec_game_id_863905_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0008_gamechannelevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameQuestionTally',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question_index', models.PositiveIntegerField(help_text='Index of the question (0-based)')),
+                ('vote_counts', models.JSONField(default=dict, help_text='Number of votes per answer')),
+                ('total_votes', models.PositiveIntegerField(default=0, help_text='Number of votes for the question')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Game Question Tally',
+                'verbose_name_plural': 'Game Question Tallies',
+            },
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='confirmed_participants',
+            field=models.PositiveIntegerField(blank=True, help_text='Confirmed participants when the game was created (NULL: read from the event)', null=True),
+        ),
+        migrations.AddField(
+            model_name='gamequestiontally',
+            name='game',
+            field=models.ForeignKey(help_text='Game being voted on', on_delete=django.db.models.deletion.CASCADE, related_name='tallies', to='games.game'),
+        ),
+        migrations.AddConstraint(
+            model_name='gamequestiontally',
+            constraint=models.UniqueConstraint(fields=('game', 'question_index'), name='unique_tally_per_question'),
+        ),
+    ]
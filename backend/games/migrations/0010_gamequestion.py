@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:31
+
+import games.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0009_question_tally'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameQuestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question_id', models.CharField(help_text='Question ID from the content file (dedupe key)', max_length=50, unique=True)),
+                ('language_code', models.CharField(help_text='Language code (fr, en, nl)', max_length=5)),
+                ('game_type', models.CharField(choices=[('picture_description', 'Picture Description'), ('word_association', 'Word Association'), ('debate', 'Debate'), ('role_play', 'Role Play')], help_text='Type of game', max_length=32)),
+                ('difficulty', models.CharField(choices=[('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')], help_text='Difficulty level', max_length=10)),
+                ('question', models.TextField(help_text='Question text')),
+                ('correct_answer', models.CharField(help_text='Correct answer', max_length=255)),
+                ('options', models.JSONField(default=list, help_text='Answer options')),
+                ('context', models.TextField(blank=True, help_text='Explanation or context', null=True)),
+                ('image_url', models.URLField(blank=True, help_text='Optional image URL', null=True)),
+                ('random_key', models.FloatField(default=games.models.random_key, help_text='Random sampling key')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Game Question',
+                'verbose_name_plural': 'Game Questions',
+                'ordering': ['language_code', 'game_type', 'difficulty', 'question_id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='gamequestion',
+            index=models.Index(fields=['language_code', 'game_type', 'difficulty', 'random_key'], name='games_gameq_languag_9a41ba_idx'),
+        ),
+    ]
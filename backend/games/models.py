@@ -5,6 +5,7 @@ This module defines models for interactive language learning games
 that can be played during events.
 """
 
+import random
 import uuid
 from django.conf import settings
 from django.core import validators
@@ -34,6 +35,98 @@ class GameStatus(models.TextChoices):
     COMPLETED = "COMPLETED", "Completed"
 
 
+def random_key():
+    """Uniform random sampling key of a GameQuestion."""
+    return random.random()
+
+
+class GameQuestion(models.Model):
+    """
+    Question of the game content store.
+
+    Imported with `manage.py import_game_content` (JSON/JSONL files, same
+    structure as fixtures/games/*.json). create_game() samples questions of a
+    (language, game type, difficulty) through the random_key index instead of
+    loading whole content files in every process.
+    """
+
+    question_id = models.CharField(
+        max_length=50,
+        unique=True,
+        help_text="Question ID from the content file (dedupe key)"
+    )
+    language_code = models.CharField(
+        max_length=5,
+        help_text="Language code (fr, en, nl)"
+    )
+    game_type = models.CharField(
+        max_length=32,
+        choices=GameType.choices,
+        help_text="Type of game"
+    )
+    difficulty = models.CharField(
+        max_length=10,
+        choices=GameDifficulty.choices,
+        help_text="Difficulty level"
+    )
+
+    # Content
+    question = models.TextField(
+        help_text="Question text"
+    )
+    correct_answer = models.CharField(
+        max_length=255,
+        help_text="Correct answer"
+    )
+    options = models.JSONField(
+        default=list,
+        help_text="Answer options"
+    )
+    context = models.TextField(
+        blank=True,
+        null=True,
+        help_text="Explanation or context"
+    )
+    image_url = models.URLField(
+        blank=True,
+        null=True,
+        help_text="Optional image URL"
+    )
+
+    # Uniform random position, for O(k) sampling through the index
+    random_key = models.FloatField(
+        default=random_key,
+        help_text="Random sampling key"
+    )
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["language_code", "game_type", "difficulty", "question_id"]
+        indexes = [
+            models.Index(fields=["language_code", "game_type", "difficulty", "random_key"]),
+        ]
+        verbose_name = "Game Question"
+        verbose_name_plural = "Game Questions"
+
+    def __str__(self):
+        return f"{self.question_id} ({self.language_code}/{self.game_type}/{self.difficulty})"
+
+    def as_content(self):
+        """Question as a content-file dict (the format stored in Game.questions_data)."""
+        return {
+            "id": self.question_id,
+            "difficulty": self.difficulty,
+            "question": self.question,
+            "image_url": self.image_url,
+            "correct_answer": self.correct_answer,
+            "options": self.options,
+            "context": self.context,
+        }
+
+
 class Game(models.Model):
     """
     Game instance for an event.
@@ -100,6 +193,11 @@ class Game(models.Model):
         default=list,
         help_text="All questions loaded from JSON file"
     )
+    confirmed_participants = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Confirmed participants when the game was created (NULL: read from the event)"
+    )
 
     # Current question (denormalized for performance)
     question_id = models.CharField(
@@ -255,6 +353,50 @@ class GameVote(models.Model):
         return f"Vote by {self.user} on Game {self.game.public_id} Q{self.question_index}"
 
 
+class GameQuestionTally(models.Model):
+    """
+    Vote tally of one question of a game.
+
+    Source of truth for vote statistics: GameService.submit_vote() updates it
+    in the vote's transaction (row locked), and a copy is cached for
+    get_game_stats(), so stats reads never scan GameVote.
+    """
+
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="tallies",
+        help_text="Game being voted on"
+    )
+    question_index = models.PositiveIntegerField(
+        help_text="Index of the question (0-based)"
+    )
+    vote_counts = models.JSONField(
+        default=dict,
+        help_text="Number of votes per answer"
+    )
+    total_votes = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of votes for the question"
+    )
+
+    # Timestamps
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "question_index"],
+                name="unique_tally_per_question"
+            )
+        ]
+        verbose_name = "Game Question Tally"
+        verbose_name_plural = "Game Question Tallies"
+
+    def __str__(self):
+        return f"Tally of Game {self.game_id} Q{self.question_index}: {self.total_votes} vote(s)"
+
+
 class BadgeType(models.TextChoices):
     """Types of badges that can be earned."""
     VICTORY = "victory", "Victory"
@@ -364,3 +506,51 @@ class Badge(models.Model):
 
     def __str__(self):
         return f"{self.badge_type} badge for {self.user.email} - Game {self.game_result.game.public_id}"
+
+
+class GameChannelEvent(models.Model):
+    """
+    Event pushed on a game's real-time channel (GET /games/{id}/stream/).
+
+    This table is the broker shared by all workers: GameService writes one
+    row per state change inside its own transaction, and each process polls
+    new rows once and fans them out to its SSE subscribers
+    (games.services.game_channel). The row id is the SSE event id, used to
+    resume a stream after a reconnection (Last-Event-ID).
+    """
+
+    class Type(models.TextChoices):
+        VOTE = "vote", "Vote tally"
+        REVEAL = "reveal", "Answer revealed"
+        NEXT_QUESTION = "next_question", "Next question"
+        COMPLETED = "completed", "Game completed"
+
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="channel_events",
+        help_text="Game this event belongs to"
+    )
+    event_type = models.CharField(
+        max_length=20,
+        choices=Type.choices,
+        help_text="SSE event name"
+    )
+    payload = models.JSONField(
+        default=dict,
+        help_text="SSE event data"
+    )
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["game", "id"]),
+        ]
+        verbose_name = "Game Channel Event"
+        verbose_name_plural = "Game Channel Events"
+
+    def __str__(self):
+        return f"{self.event_type} #{self.pk} on Game {self.game_id}"
@@ -1,5 +1,8 @@
 """Games services."""
 
+from .game_channel import GameChannel
 from .game_service import GameService
+from .question_bank import QuestionBank
+from .question_store import QuestionStore
 
-__all__ = ["GameService"]
+__all__ = ["GameChannel", "GameService", "QuestionBank", "QuestionStore"]
@@ -0,0 +1,339 @@
+"""
+Real-time game channel: in-process fan-out fed by a database broker.
+
+Each game has a Server-Sent Events stream (GET /api/v1/games/{id}/stream/)
+replacing the polling of /games/active/ and /games/{id}/stats/. It pushes:
+
+- vote: tally of the current question after each vote
+- reveal: result of reveal_answer()
+- next_question: result of next_question() when a question is loaded
+- completed: final result (the stream then ends)
+
+Publishing: GameService calls GameChannel.publish() inside its transaction.
+The event is stored as a GameChannelEvent row and, after commit, handed at
+once to the subscribers of the publishing process.
+
+Broker: the GameChannelEvent table is shared by all workers. While a process
+has subscribers, one poller thread reads the new rows of the subscribed games
+every GAME_CHANNEL_POLL_SECONDS and delivers those written by other workers:
+one query per process per interval, however many clients are connected.
+Rows are read back over GAME_CHANNEL_LOOKBACK_SECONDS so that a transaction
+committing after a later one (concurrent votes) is not missed; ids already
+delivered are skipped. Rows older than GAME_CHANNEL_RETENTION_HOURS are
+deleted by the lifecycle sweeper (purge()).
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from common.constants import LIFECYCLE_SWEEP_CHUNK_SIZE
+from ..constants import (
+    GAME_CHANNEL_LOOKBACK_SECONDS,
+    GAME_CHANNEL_POLL_SECONDS,
+    GAME_CHANNEL_QUEUE_SIZE,
+    GAME_CHANNEL_RETENTION_HOURS,
+)
+
+logger = logging.getLogger("games.channel")
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def format_sse(event, data, event_id=None):
+    """
+    Encode one Server-Sent Events message.
+
+    Args:
+        event (str): Event name
+        data: JSON-serializable payload
+        event_id (int): Message id (sent back by the client as Last-Event-ID)
+
+    Returns:
+        str: SSE message, terminated by a blank line
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, cls=DjangoJSONEncoder)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _message(event):
+    return {"id": event.pk, "event": event.event_type, "data": event.payload}
+
+
+class Subscription:
+    """
+    One stream client: an asyncio queue fed from any thread.
+
+    A None message means the stream must end: the client fell more than
+    queue_size events behind and reconnects with Last-Event-ID instead.
+    """
+
+    def __init__(self, game_id, loop, queue_size=GAME_CHANNEL_QUEUE_SIZE):
+        self.game_id = game_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def push(self, message):
+        """Queue a message (runs in the subscriber's event loop)."""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class GameChannel:
+    """
+    Per-process fan-out of game channel events to stream subscribers.
+
+    Example:
+        >>> channel = GameChannel.default()
+        >>> subscription = channel.subscribe(game.pk)
+        >>> message = await subscription.queue.get()
+        >>> channel.unsubscribe(subscription)
+    """
+
+    def __init__(
+        self,
+        poll_interval=GAME_CHANNEL_POLL_SECONDS,
+        lookback=GAME_CHANNEL_LOOKBACK_SECONDS,
+        queue_size=GAME_CHANNEL_QUEUE_SIZE,
+        autostart=True,
+    ):
+        """
+        Args:
+            poll_interval (float): Seconds between broker polls
+            lookback (float): Seconds of rows re-read by each poll
+            queue_size (int): Pending messages per subscription
+            autostart (bool): Start the poller on first subscription
+        """
+        self.poll_interval = poll_interval
+        self.lookback = lookback
+        self.queue_size = queue_size
+        self.autostart = autostart
+        self._lock = threading.Lock()
+        self._subscriptions = {}  # game_id -> set of Subscription
+        self._delivered = {}  # event id -> monotonic time of delivery
+        self._thread = None
+
+    @classmethod
+    def default(cls):
+        """Process-wide channel."""
+        global _default
+        with _default_lock:
+            if _default is None:
+                _default = cls()
+            return _default
+
+    # ==========================================================================
+    # PUBLISHING
+    # ==========================================================================
+
+    @staticmethod
+    def publish(game, event_type, payload):
+        """
+        Store an event for the game and deliver it after commit.
+
+        Must be called inside the transaction changing the game, so that an
+        event is visible to other workers only if the change is.
+
+        Args:
+            game: Game instance
+            event_type (str): GameChannelEvent.Type value
+            payload (dict): Event data
+
+        Returns:
+            GameChannelEvent: Stored event
+        """
+        from games.models import GameChannelEvent
+
+        event = GameChannelEvent.objects.create(game=game, event_type=event_type, payload=payload)
+        transaction.on_commit(lambda: GameChannel.default().deliver([event]))
+        return event
+
+    @staticmethod
+    def purge(now=None, chunk_size=LIFECYCLE_SWEEP_CHUNK_SIZE):
+        """
+        Delete channel events older than GAME_CHANNEL_RETENTION_HOURS.
+
+        Runs periodically as the purge_game_channel phase of the lifecycle
+        sweeper (never on a game request), one DELETE per chunk of rows.
+
+        Args:
+            now (datetime): Reference time (defaults to timezone.now())
+            chunk_size (int): Rows deleted per statement
+
+        Returns:
+            list: Deleted event ids
+        """
+        from games.models import GameChannelEvent
+
+        now = now or timezone.now()
+        cutoff = now - timedelta(hours=GAME_CHANNEL_RETENTION_HOURS)
+        expired = GameChannelEvent.objects.filter(created_at__lt=cutoff).order_by("pk")
+
+        deleted = []
+        while True:
+            ids = list(expired.values_list("pk", flat=True)[:chunk_size])
+            if ids:
+                GameChannelEvent.objects.filter(pk__in=ids).delete()
+                deleted.extend(ids)
+            if len(ids) < chunk_size:
+                return deleted
+
+    # ==========================================================================
+    # SUBSCRIPTIONS
+    # ==========================================================================
+
+    def subscribe(self, game_id, loop=None):
+        """
+        Register a subscriber for a game's events.
+
+        Args:
+            game_id (int): Game primary key
+            loop: Event loop of the subscriber (defaults to the running one)
+
+        Returns:
+            Subscription
+        """
+        subscription = Subscription(game_id, loop or asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscriptions.setdefault(game_id, set()).add(subscription)
+            if self.autostart and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="game-channel", daemon=True)
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Remove a subscriber (the poller stops with the last one)."""
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.game_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[subscription.game_id]
+
+    def subscriber_count(self, game_id=None):
+        """Number of subscribers of a game (of all games if None)."""
+        with self._lock:
+            if game_id is not None:
+                return len(self._subscriptions.get(game_id, ()))
+            return sum(len(subscribers) for subscribers in self._subscriptions.values())
+
+    # ==========================================================================
+    # FAN-OUT
+    # ==========================================================================
+
+    def deliver(self, events):
+        """
+        Hand stored events to this process's subscribers, each id once.
+
+        Args:
+            events: GameChannelEvent instances, in id order
+
+        Returns:
+            int: Messages queued
+        """
+        now = time.monotonic()
+        targets = []
+        with self._lock:
+            for event in events:
+                if event.pk in self._delivered:
+                    continue
+                self._delivered[event.pk] = now
+                message = _message(event)
+                for subscription in self._subscriptions.get(event.game_id, ()):
+                    targets.append((subscription, message))
+
+            horizon = now - 2 * self.lookback
+            expired = [pk for pk, delivered_at in self._delivered.items() if delivered_at < horizon]
+            for pk in expired:
+                del self._delivered[pk]
+
+        for subscription, message in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.push, message)
+            except RuntimeError:
+                # Loop closed: the client is gone, its stream unsubscribes
+                pass
+        return len(targets)
+
+    def poll_once(self, now=None):
+        """
+        Read recent events of the subscribed games and deliver the new ones.
+
+        Returns:
+            int: Messages queued
+        """
+        from games.models import GameChannelEvent
+
+        with self._lock:
+            game_ids = list(self._subscriptions)
+        if not game_ids:
+            return 0
+
+        now = now or timezone.now()
+        recent = GameChannelEvent.objects.filter(
+            game_id__in=game_ids,
+            created_at__gte=now - timedelta(seconds=self.lookback),
+        )
+        with self._lock:
+            new_ids = [pk for pk in recent.values_list("id", flat=True) if pk not in self._delivered]
+        if not new_ids:
+            return 0
+        return self.deliver(GameChannelEvent.objects.filter(id__in=new_ids).order_by("id"))
+
+    def _run(self):
+        """Poller loop, runs while the process has subscribers."""
+        try:
+            while True:
+                with self._lock:
+                    if not self._subscriptions:
+                        self._thread = None
+                        return
+                close_old_connections()
+                try:
+                    self.poll_once()
+                except Exception:
+                    logger.exception("Game channel poll failed")
+                time.sleep(self.poll_interval)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def replay(game_id, after_id):
+        """
+        Stored messages of a game after an id (Last-Event-ID resume).
+
+        Returns:
+            list: Messages in id order
+        """
+        from games.models import GameChannelEvent
+
+        events = GameChannelEvent.objects.filter(game_id=game_id, id__gt=after_id).order_by("id")
+        return [_message(event) for event in events]
+
+    @staticmethod
+    def last_event_id(game_id):
+        """Id of the latest stored event of a game (0 if none)."""
+        from games.models import GameChannelEvent
+
+        latest = GameChannelEvent.objects.filter(game_id=game_id).order_by("-id").values_list("id", flat=True).first()
+        return latest or 0
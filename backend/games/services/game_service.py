@@ -14,15 +14,23 @@ Business Rules:
 - One active game per event at a time
 - Majority vote wins (>=50% of votes)
 - Games can only be created during active events
+
+Vote statistics come from a per-question tally (GameQuestionTally) updated by
+submit_vote() and cached (versioned key, see get_question_tally()), and from
+the confirmed-participant count
+snapshotted on the game at creation: stats reads never scan GameVote.
+
+Every state change (vote, reveal, next question, completion) is published on
+the game's real-time channel (see game_channel.GameChannel).
 """
 
-import json
 import random
-from pathlib import Path
+import uuid
 from typing import Dict, List, Optional, Tuple
 
-from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Count, Max
 from django.utils import timezone
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework.exceptions import ValidationError, PermissionDenied, NotFound
@@ -30,48 +38,35 @@ from rest_framework.exceptions import ValidationError, PermissionDenied, NotFoun
 from common.services.base import BaseService
 from bookings.models import BookingStatus
 from events.models import Event
+from ..constants import GAME_QUESTIONS_PER_GAME, GAME_TALLY_CACHE_TIMEOUT
+from .game_channel import GameChannel
+from .question_bank import QuestionBank
+from .question_store import QuestionStore
+
+
+GAME_TALLY_CACHE_KEY = "games:tally:{game_id}:{question_index}"
+GAME_TALLY_VERSION_KEY = "games:tally-version:{game_id}:{question_index}"
 
 
 class GameService(BaseService):
     """Service layer for Game business logic."""
 
-    # Game content cache
-    _game_content_cache: Dict[str, List[Dict]] = {}
-
     @staticmethod
-    def _load_game_content(language_code: str, game_type: str) -> List[Dict]:
+    def _sample_questions(language_code: str, game_type: str, difficulty: str, k: int) -> List[Dict]:
         """
-        Load game content from JSON files.
-
-        Args:
-            language_code: Language code (fr, en, nl)
-            game_type: Type of game (picture_description, word_association, etc.)
+        Get up to k random questions, in random order.
 
-        Returns:
-            List of game questions
+        Questions imported in the database (import_game_content) are sampled
+        through their index; languages and game types without imported
+        questions fall back to the preloaded content files.
 
         Raises:
-            FileNotFoundError: If JSON file doesn't exist
+            FileNotFoundError: If there is no content for the language and type
         """
-        cache_key = f"{language_code}_{game_type}"
-
-        # Check cache first
-        if cache_key in GameService._game_content_cache:
-            return GameService._game_content_cache[cache_key]
-
-        # Load from file
-        base_path = Path(settings.BASE_DIR) / "fixtures" / "games"
-        file_path = base_path / f"{game_type}_{language_code}.json"
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Game content file not found: {file_path}")
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = json.load(f)
-
-        # Cache and return
-        GameService._game_content_cache[cache_key] = content
-        return content
+        questions = QuestionStore.sample(language_code, game_type, difficulty, k)
+        if questions is None:
+            questions = QuestionBank.default().sample(language_code, game_type, difficulty, k=k)
+        return questions
 
     @staticmethod
     def _get_random_question(language_code: str, game_type: str, difficulty: str) -> Dict:
@@ -87,24 +82,24 @@ class GameService(BaseService):
             Random question dict
 
         Raises:
+            FileNotFoundError: If there is no content for the language and type
             ValidationError: If no questions available for criteria
         """
-        questions = GameService._load_game_content(language_code, game_type)
-
-        # Filter by difficulty
-        filtered = [q for q in questions if q.get("difficulty") == difficulty]
+        questions = GameService._sample_questions(language_code, game_type, difficulty, k=1)
 
-        if not filtered:
+        if not questions:
             raise ValidationError({
                 "difficulty": f"No questions available for {game_type} at {difficulty} level in {language_code}"
             })
 
-        return random.choice(filtered)
+        return questions[0]
 
     @staticmethod
     def _get_questions_by_difficulty(language_code: str, game_type: str, difficulty: str) -> List[Dict]:
         """
-        Get ALL questions for given parameters (for multi-question games).
+        Get the questions of a multi-question game for given parameters.
+
+        Up to GAME_QUESTIONS_PER_GAME questions, in random order.
 
         Args:
             language_code: Language code
@@ -115,21 +110,17 @@ class GameService(BaseService):
             List of question dicts
 
         Raises:
+            FileNotFoundError: If there is no content for the language and type
             ValidationError: If no questions available for criteria
         """
-        questions = GameService._load_game_content(language_code, game_type)
-
-        # Filter by difficulty
-        filtered = [q for q in questions if q.get("difficulty") == difficulty]
+        questions = GameService._sample_questions(language_code, game_type, difficulty, k=GAME_QUESTIONS_PER_GAME)
 
-        if not filtered:
+        if not questions:
             raise ValidationError({
                 "difficulty": f"No questions available for {game_type} at {difficulty} level in {language_code}"
             })
 
-        # Shuffle questions for variety
-        random.shuffle(filtered)
-        return filtered
+        return questions
 
     @staticmethod
     def _validate_organizer_permission(event: Event, user) -> None:
@@ -238,8 +229,10 @@ class GameService(BaseService):
         """
         Create a new game for an event.
 
-        This loads ALL questions from the JSON file and creates a multi-question game.
-        The organizer will control progression through questions.
+        Samples up to GAME_QUESTIONS_PER_GAME questions (from the database
+        question store, else the preloaded content files, see
+        _sample_questions()) and creates a multi-question game. The organizer
+        will control progression through questions.
 
         The game automatically uses the event's language and difficulty level.
 
@@ -267,13 +260,13 @@ class GameService(BaseService):
         language_code = event.language.code if hasattr(event.language, 'code') else 'en'
         difficulty = event.difficulty
 
-        # Load ALL questions for this game type and difficulty
+        # Sample the questions of this game type and difficulty
         all_questions = GameService._get_questions_by_difficulty(language_code, game_type, difficulty)
 
         # Get first question
         first_question = all_questions[0]
 
-        # Create game with all questions loaded (no timeout - organizer controls progression)
+        # Create game with its sampled questions (no timeout - organizer controls progression)
         game = Game.objects.create(
             event=event,
             created_by=created_by,
@@ -284,6 +277,7 @@ class GameService(BaseService):
             questions_data=all_questions,
             total_questions=len(all_questions),
             current_question_index=0,
+            confirmed_participants=event.confirmed_seats,
             # Current question (denormalized)
             question_id=first_question.get("id"),
             question_text=first_question.get("question"),
@@ -326,6 +320,10 @@ class GameService(BaseService):
         # Validate user is confirmed participant
         GameService._validate_participant_permission(game.event, user)
 
+        # Lock the question's tally: concurrent votes are counted one at a time
+        question_index = game.current_question_index
+        tally = GameService._lock_tally(game, question_index)
+
         # Check if user already voted for this question
         existing_vote = GameVote.objects.filter(
             game=game,
@@ -348,6 +346,19 @@ class GameService(BaseService):
             answer=answer
         )
 
+        # Count the vote, expire the cached tally once committed
+        tally.vote_counts[answer] = tally.vote_counts.get(answer, 0) + 1
+        tally.total_votes += 1
+        tally.save(update_fields=["vote_counts", "total_votes", "updated_at"])
+        counts = {"vote_counts": tally.vote_counts, "total_votes": tally.total_votes}
+        transaction.on_commit(lambda: GameService._invalidate_tally(game.pk, question_index))
+
+        # Push the new tally to the game's stream subscribers
+        GameService._publish(game, "vote", {
+            "question_index": question_index,
+            **GameService._stats(game, counts),
+        })
+
         # Check if we should complete the game (majority reached)
         game_completed = GameService._check_and_complete_game(game)
 
@@ -374,39 +385,195 @@ class GameService(BaseService):
         return False
 
     @staticmethod
-    def get_game_stats(game) -> Dict:
+    def _publish(game, event_type: str, payload: Dict) -> None:
         """
-        Get statistics for a game's current question.
+        Publish a state change on the game's real-time channel.
 
         Args:
             game: Game instance
+            event_type: GameChannelEvent.Type value
+            payload: Event data pushed to stream subscribers
+        """
+        GameChannel.publish(game, event_type, {"game_id": game.pk, "game_status": game.status, **payload})
+
+    @staticmethod
+    def _completed_result(game_result, message: str) -> Dict:
+        """
+        Result of a completed game (API response and "completed" event).
+
+        Args:
+            game_result: GameResult instance, or None if it could not be computed
+            message: Why the game completed
+        """
+        return {
+            "status": "completed",
+            "message": message,
+            "result": {
+                "total_questions": game_result.total_questions,
+                "correct_answers": game_result.correct_answers,
+                "score_percentage": float(game_result.score_percentage),
+                "badge_type": game_result.badge_type
+            } if game_result else None
+        }
+
+    @staticmethod
+    def can_access_game(game, user) -> bool:
+        """
+        Check whether a user may follow a game.
+
+        Same rule as the games API: staff, the event organizer, or a
+        confirmed participant of the event.
+
+        Args:
+            game: Game instance
+            user: User instance
 
         Returns:
-            Dict with vote counts and statistics for current question
+            bool: True if the user has access
+        """
+        if user.is_staff or game.event.organizer_id == user.id:
+            return True
+        return game.event.bookings.filter(user=user, status=BookingStatus.CONFIRMED).exists()
+
+    @staticmethod
+    def _tally_from_votes(game_id: int, question_index: int) -> Dict:
+        """
+        Count the votes of a question (only when it has no tally row yet).
+
+        Args:
+            game_id: Game primary key
+            question_index: Question index
+
+        Returns:
+            Dict with vote_counts and total_votes
         """
         from games.models import GameVote
-        from collections import Counter
 
-        # Get votes for current question only
-        votes = GameVote.objects.filter(
-            game=game,
-            question_index=game.current_question_index
-        ).values_list('answer', flat=True)
-        vote_counts = dict(Counter(votes))
+        rows = GameVote.objects.filter(
+            game_id=game_id,
+            question_index=question_index
+        ).order_by().values("answer").annotate(count=Count("id"))
+        vote_counts = {row["answer"]: row["count"] for row in rows}
+        return {"vote_counts": vote_counts, "total_votes": sum(vote_counts.values())}
 
-        confirmed_count = game.event.bookings.filter(
-            status=BookingStatus.CONFIRMED
-        ).count()
+    @staticmethod
+    def _lock_tally(game, question_index: int):
+        """
+        Get the tally row of a question, locked until the transaction ends.
+
+        The row is created from the existing votes the first time the
+        question is tallied (questions voted before tallies existed).
+
+        Args:
+            game: Game instance
+            question_index: Question index
+
+        Returns:
+            GameQuestionTally instance
+        """
+        from games.models import GameQuestionTally
+
+        tallies = GameQuestionTally.objects.select_for_update()
+        tally = tallies.filter(game=game, question_index=question_index).first()
+        if tally is None:
+            created, _ = GameQuestionTally.objects.get_or_create(
+                game=game,
+                question_index=question_index,
+                defaults=GameService._tally_from_votes(game.pk, question_index),
+            )
+            tally = tallies.get(pk=created.pk)
+        return tally
+
+    @staticmethod
+    def _invalidate_tally(game_id: int, question_index: int) -> None:
+        """
+        Expire the cached tally of a question (after a vote committed).
+
+        Sets a new random version: a single atomic write, so commit callbacks
+        of concurrent votes may run in any order.
+        """
+        key = GAME_TALLY_VERSION_KEY.format(game_id=game_id, question_index=question_index)
+        cache.set(key, uuid.uuid4().hex, timeout=GAME_TALLY_CACHE_TIMEOUT)
+
+    @staticmethod
+    def _read_tally(game_id: int, question_index: int) -> Dict:
+        """Read the committed tally of a question from the database."""
+        from games.models import GameQuestionTally
+
+        counts = GameQuestionTally.objects.filter(
+            game_id=game_id,
+            question_index=question_index
+        ).values("vote_counts", "total_votes").first()
+        if counts is None:
+            counts = GameService._tally_from_votes(game_id, question_index)
+        return counts
 
-        total_votes = len(votes)
+    @staticmethod
+    def get_question_tally(game, question_index: Optional[int] = None) -> Dict:
+        """
+        Get the vote counts of a question (current question by default).
+
+        Read from the cache, then from the tally row on a miss. The cached
+        tally is tagged with the version read before the database: a vote
+        committed during the read changes the version, so a stale tally is
+        never served once the vote's commit callback ran.
+
+        Args:
+            game: Game instance
+            question_index: Question index
+
+        Returns:
+            Dict with vote_counts and total_votes
+        """
+        if question_index is None:
+            question_index = game.current_question_index
+        key = GAME_TALLY_CACHE_KEY.format(game_id=game.pk, question_index=question_index)
+        version_key = GAME_TALLY_VERSION_KEY.format(game_id=game.pk, question_index=question_index)
+
+        cached = cache.get_many([key, version_key])
+        version = cached.get(version_key)
+        if version is None:
+            # add(): never overwrites the version set by a vote meanwhile
+            cache.add(version_key, uuid.uuid4().hex, timeout=GAME_TALLY_CACHE_TIMEOUT)
+            version = cache.get(version_key)
+        tally = cached.get(key)
+        if tally is not None and tally["version"] == version:
+            return tally["counts"]
+
+        counts = GameService._read_tally(game.pk, question_index)
+        if version is not None:
+            cache.set(key, {"version": version, "counts": counts}, timeout=GAME_TALLY_CACHE_TIMEOUT)
+        return counts
+
+    @staticmethod
+    def _stats(game, counts: Dict) -> Dict:
+        """Build the stats dict of a question from its tally."""
+        confirmed_count = game.confirmed_participants
+        if confirmed_count is None:
+            # Games created before the count was snapshotted
+            confirmed_count = game.event.confirmed_seats
+        total_votes = counts["total_votes"]
 
         return {
             "total_votes": total_votes,
             "confirmed_participants": confirmed_count,
-            "vote_counts": vote_counts,
+            "vote_counts": dict(counts["vote_counts"]),
             "votes_remaining": max(0, confirmed_count - total_votes),
         }
 
+    @staticmethod
+    def get_game_stats(game) -> Dict:
+        """
+        Get statistics for a game's current question.
+
+        Args:
+            game: Game instance
+
+        Returns:
+            Dict with vote counts and statistics for current question
+        """
+        return GameService._stats(game, GameService.get_question_tally(game))
+
     @staticmethod
     def get_active_game(event) -> Optional:
         """
@@ -445,7 +612,7 @@ class GameService(BaseService):
             PermissionDenied: If user is not organizer
             ValidationError: If game is not in ACTIVE status
         """
-        from games.models import GameVote, GameStatus
+        from games.models import GameStatus
         from collections import Counter
 
         # Validate organizer permission
@@ -459,12 +626,9 @@ class GameService(BaseService):
         if game.answer_revealed:
             raise ValidationError({"game": "Answer already revealed for this question"})
 
-        # Get all votes for current question
-        votes = GameVote.objects.filter(
-            game=game,
-            question_index=game.current_question_index
-        ).values_list('answer', flat=True)
-        total_votes = len(votes)
+        # Current question's tally (locked: no vote is counted meanwhile)
+        tally = GameService._lock_tally(game, game.current_question_index)
+        total_votes = tally.total_votes
 
         if total_votes == 0:
             # No votes - mark as incorrect with no answer
@@ -474,7 +638,7 @@ class GameService(BaseService):
             game.final_answer = None
             game.save(update_fields=['status', 'answer_revealed', 'is_correct', 'final_answer', 'updated_at'])
 
-            return {
+            result = {
                 "status": "revealed",
                 "correct_answer": game.correct_answer,
                 "team_answer": None,
@@ -482,9 +646,11 @@ class GameService(BaseService):
                 "vote_counts": {},
                 "total_votes": 0
             }
+            GameService._publish(game, "reveal", {"question_index": game.current_question_index, **result})
+            return result
 
         # Calculate majority vote
-        vote_counts = Counter(votes)
+        vote_counts = Counter(tally.vote_counts)
 
         # Get the highest vote count
         max_count = max(vote_counts.values())
@@ -503,7 +669,7 @@ class GameService(BaseService):
         game.final_answer = most_common_answer
         game.save(update_fields=['status', 'answer_revealed', 'is_correct', 'final_answer', 'updated_at'])
 
-        return {
+        result = {
             "status": "revealed",
             "correct_answer": game.correct_answer,
             "team_answer": most_common_answer,
@@ -511,6 +677,8 @@ class GameService(BaseService):
             "vote_counts": dict(vote_counts),
             "total_votes": total_votes
         }
+        GameService._publish(game, "reveal", {"question_index": game.current_question_index, **result})
+        return result
 
     @staticmethod
     @transaction.atomic
@@ -557,16 +725,9 @@ class GameService(BaseService):
             # Calculate and save final results with badges
             game_result = GameService._calculate_final_results(game)
 
-            return {
-                "status": "completed",
-                "message": "All questions completed",
-                "result": {
-                    "total_questions": game_result.total_questions,
-                    "correct_answers": game_result.correct_answers,
-                    "score_percentage": float(game_result.score_percentage),
-                    "badge_type": game_result.badge_type
-                }
-            }
+            result = GameService._completed_result(game_result, "All questions completed")
+            GameService._publish(game, "completed", result)
+            return result
 
         # Load next question
         next_question_data = game.questions_data[next_index]
@@ -592,16 +753,20 @@ class GameService(BaseService):
             'is_correct', 'final_answer', 'status', 'updated_at'
         ])
 
-        return {
+        result = {
             "status": "next_question",
             "current_question": next_index + 1,
             "total_questions": game.total_questions,
             "question": {
                 "id": game.question_id,
                 "text": game.question_text,
-                "image_url": game.image_url
+                "image_url": game.image_url,
+                "options": game.options,
+                "context": game.context
             }
         }
+        GameService._publish(game, "next_question", {"question_index": next_index, **result})
+        return result
 
     @staticmethod
     @transaction.atomic
@@ -621,28 +786,16 @@ class GameService(BaseService):
         Returns:
             GameResult instance
         """
-        from games.models import GameResult, Badge, BadgeType, GameVote
+        from games.models import GameResult, Badge, BadgeType
         from bookings.models import BookingStatus
 
-        # Count correct answers across all questions
+        # Count correct answers across all questions (one grouped query)
+        counts_by_question = GameService._vote_counts_by_question(game)
         correct_count = 0
-        for question_data in game.questions_data:
-            question_index = game.questions_data.index(question_data)
-            question_correct_answer = question_data.get("correct_answer")
-
-            # Get votes for this question
-            votes = GameVote.objects.filter(
-                game=game,
-                question_index=question_index
-            ).values_list('answer', flat=True)
-
-            if votes:
-                from collections import Counter
-                vote_counts = Counter(votes)
-                most_common_answer = vote_counts.most_common(1)[0][0]
-
-                if most_common_answer == question_correct_answer:
-                    correct_count += 1
+        for question_index, question_data in enumerate(game.questions_data):
+            counts = counts_by_question.get(question_index)
+            if counts and counts[0][0] == question_data.get("correct_answer"):
+                correct_count += 1
 
         # Calculate score percentage
         total_questions = game.total_questions
@@ -672,20 +825,46 @@ class GameService(BaseService):
             game_result.badge_type = badge_type
             game_result.save()
 
-        # Award badges to all confirmed participants
+        # Award badges to all confirmed participants (existing badges are kept)
         confirmed_participants = game.event.bookings.filter(
             status=BookingStatus.CONFIRMED
         ).values_list('user', flat=True)
 
-        for user_id in confirmed_participants:
-            Badge.objects.get_or_create(
-                game_result=game_result,
-                user_id=user_id,
-                defaults={'badge_type': badge_type}
-            )
+        Badge.objects.bulk_create(
+            [
+                Badge(game_result=game_result, user_id=user_id, badge_type=badge_type)
+                for user_id in confirmed_participants
+            ],
+            ignore_conflicts=True,
+        )
 
         return game_result
 
+    @staticmethod
+    def _vote_counts_by_question(game) -> Dict[int, List[Tuple[str, int]]]:
+        """
+        Count the votes of every question of a game in one grouped query.
+
+        Answers are sorted most voted first; ties go to the answer voted most
+        recently, as Counter.most_common() over the votes (newest first) did.
+
+        Args:
+            game: Game instance
+
+        Returns:
+            Dict mapping question_index to a list of (answer, count)
+        """
+        from games.models import GameVote
+
+        rows = GameVote.objects.filter(game=game).order_by().values(
+            "question_index", "answer"
+        ).annotate(count=Count("id"), last_vote=Max("created_at"))
+
+        counts_by_question = {}
+        for row in sorted(rows, key=lambda row: (-row["count"], -row["last_vote"].timestamp())):
+            counts_by_question.setdefault(row["question_index"], []).append((row["answer"], row["count"]))
+        return counts_by_question
+
     @staticmethod
     def get_detailed_results(game) -> Dict:
         """
@@ -704,39 +883,33 @@ class GameService(BaseService):
             Dict with detailed results per question
         """
         from games.models import GameVote
-        from collections import Counter
 
         if game.status != 'COMPLETED':
             raise ValidationError({"game": "Results only available for completed games"})
 
+        # All votes of the game (newest first) and their counts, two queries in total
+        votes_by_question = {}
+        for vote in GameVote.objects.filter(game=game).select_related('user'):
+            votes_by_question.setdefault(vote.question_index, []).append({
+                "user_id": vote.user_id,
+                "user_email": vote.user.email,
+                "answer": vote.answer,
+                "created_at": vote.created_at.isoformat()
+            })
+        counts_by_question = GameService._vote_counts_by_question(game)
+
         results_by_question = []
 
         for question_index, question_data in enumerate(game.questions_data):
-            # Get all votes for this question
-            votes = GameVote.objects.filter(
-                game=game,
-                question_index=question_index
-            ).select_related('user')
-
-            # Serialize votes
-            votes_data = [
-                {
-                    "user_id": vote.user_id,
-                    "user_email": vote.user.email,
-                    "answer": vote.answer,
-                    "created_at": vote.created_at.isoformat()
-                }
-                for vote in votes
-            ]
-
-            # Calculate majority answer
-            vote_answers = [v.answer for v in votes]
+            votes_data = votes_by_question.get(question_index, [])
+
+            # Majority answer
+            counts = counts_by_question.get(question_index)
             team_answer = None
             is_correct = False
 
-            if vote_answers:
-                vote_counts = Counter(vote_answers)
-                team_answer = vote_counts.most_common(1)[0][0]
+            if counts:
+                team_answer = counts[0][0]
                 is_correct = (team_answer == question_data.get("correct_answer"))
 
             results_by_question.append({
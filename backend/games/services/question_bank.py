@@ -0,0 +1,203 @@
+"""
+Preloaded game question bank.
+
+All game content files (fixtures/games/{game_type}_{language}.json) are read
+once, when a server process starts (config.asgi / config.wsgi call warm_up(),
+so no request pays the file I/O; management commands load the bank only if
+they use it), and partitioned by (language, game_type, difficulty). Game
+creation then samples a partition directly: no file read, no filtering and no
+copy of the full list.
+
+The bank reloads itself when the content files change: sample() compares the
+files' modification times and sizes at most every QUESTION_BANK_CHECK_SECONDS
+and swaps in a freshly built index if they differ. Readers never see a
+half-built index.
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+from ..constants import QUESTION_BANK_CHECK_SECONDS
+
+logger = logging.getLogger("games.question_bank")
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def warm_up():
+    """
+    Load the process-wide bank (server entry points, before the first request).
+
+    Never blocks startup: on failure the bank loads on first use and raises there.
+    """
+    try:
+        QuestionBank.default().load()
+    except (OSError, ValueError):
+        logger.exception("Question bank warm-up failed")
+
+
+class QuestionBank:
+    """
+    Index of game questions partitioned by language, game type and difficulty.
+
+    Questions are shared between callers and must not be mutated.
+
+    Example:
+        >>> bank = QuestionBank.default()
+        >>> bank.sample("en", "picture_description", "easy", k=5)
+    """
+
+    def __init__(self, content_dir=None, check_interval=QUESTION_BANK_CHECK_SECONDS, clock=time.monotonic):
+        """
+        Args:
+            content_dir (str|Path): Directory of the JSON content files
+                (defaults to fixtures/games)
+            check_interval (float): Seconds between checks for changed files
+            clock (callable): Monotonic time source (seconds)
+        """
+        self.content_dir = Path(content_dir or Path(settings.BASE_DIR) / "fixtures" / "games")
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index = None  # (partitions, files), replaced as a whole on reload
+        self._signature = None
+        self._checked_at = None
+
+    @classmethod
+    def default(cls):
+        """Process-wide bank of fixtures/games."""
+        global _default
+        with _default_lock:
+            if _default is None:
+                _default = cls()
+            return _default
+
+    # ==========================================================================
+    # LOADING
+    # ==========================================================================
+
+    def _scan(self):
+        """Signature of the content files: (name, mtime, size) of each file."""
+        try:
+            entries = os.scandir(self.content_dir)
+        except FileNotFoundError:
+            return ()
+        with entries:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ))
+
+    def load(self):
+        """
+        Read every content file and build the index.
+
+        Returns:
+            int: Number of questions loaded
+        """
+        with self._lock:
+            signature = self._scan()
+            partitions = {}
+            files = set()
+            for name, _, _ in signature:
+                game_type, _, language = name[:-len(".json")].rpartition("_")
+                if not game_type:
+                    logger.warning(f"Ignoring game content file with unexpected name: {name}")
+                    continue
+                with open(self.content_dir / name, "r", encoding="utf-8") as f:
+                    questions = json.load(f)
+                files.add((language, game_type))
+                for question in questions:
+                    key = (language, game_type, question.get("difficulty"))
+                    partitions.setdefault(key, []).append(question)
+
+            self._index = ({key: tuple(questions) for key, questions in partitions.items()}, frozenset(files))
+            self._signature = signature
+            self._checked_at = self._clock()
+
+        count = sum(len(questions) for questions in self._index[0].values())
+        logger.info(f"Question bank loaded: {count} questions in {len(self._index[0])} partitions")
+        return count
+
+    def refresh(self, force=False):
+        """
+        Reload the index if the content files changed.
+
+        Files are checked at most every check_interval seconds unless force.
+
+        Returns:
+            bool: True if the index was (re)loaded
+        """
+        if self._index is None:
+            self.load()
+            return True
+        if not force and self._clock() - self._checked_at < self.check_interval:
+            return False
+
+        self._checked_at = self._clock()
+        if self._scan() == self._signature:
+            return False
+        logger.info("Game content files changed, reloading question bank")
+        try:
+            self.load()
+        except (OSError, ValueError):
+            # File being written or invalid: keep serving the previous content
+            logger.exception("Question bank reload failed, keeping the previous index")
+            return False
+        return True
+
+    # ==========================================================================
+    # READS
+    # ==========================================================================
+
+    def questions(self, language_code, game_type, difficulty):
+        """
+        All questions of a partition (shared tuple, not a copy).
+
+        Raises:
+            FileNotFoundError: If there is no content file for the language and type
+        """
+        self.refresh()
+        partitions, files = self._index
+        if (language_code, game_type) not in files:
+            raise FileNotFoundError(
+                f"Game content file not found: {self.content_dir / f'{game_type}_{language_code}.json'}"
+            )
+        return partitions.get((language_code, game_type, difficulty), ())
+
+    def sample(self, language_code, game_type, difficulty, k=None):
+        """
+        Random questions of a partition, in random order.
+
+        Costs O(k): indexes are sampled, the partition is not copied.
+
+        Args:
+            language_code (str): Language code (fr, en, nl)
+            game_type (str): Type of game
+            difficulty (str): Difficulty level
+            k (int): Number of questions (all of the partition if None)
+
+        Returns:
+            list: Up to k questions (empty if the partition is empty)
+
+        Raises:
+            FileNotFoundError: If there is no content file for the language and type
+        """
+        questions = self.questions(language_code, game_type, difficulty)
+        count = len(questions) if k is None else min(k, len(questions))
+        return [questions[index] for index in random.sample(range(len(questions)), count)]
+
+    def stats(self):
+        """Number of questions per 'language/game_type/difficulty' partition."""
+        self.refresh()
+        partitions = self._index[0]
+        return {"/".join(map(str, key)): len(partitions[key]) for key in sorted(partitions, key=lambda key: tuple(map(str, key)))}
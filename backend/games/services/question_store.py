@@ -0,0 +1,310 @@
+"""
+Database-backed game question store.
+
+Large question sets (thousands per language) are imported into the
+GameQuestion table with `manage.py import_game_content` instead of being
+added to fixtures/games/*.json, which every process holds in memory.
+
+- Reading: content files are streamed record by record (JSONL line by line,
+  JSON arrays element by element), so memory does not grow with file size.
+- Validation: each record must have the structure GameService stores in
+  Game.questions_data (id, difficulty, question, correct_answer, options,
+  context, image_url); invalid records are reported and skipped.
+- Dedupe: by question id, within the import and against the table (unique
+  question_id; existing questions are kept unless update=True).
+- Writing: bulk_create by batches of QUESTION_IMPORT_BATCH_SIZE.
+- Sampling: k questions of a (language, game type, difficulty) are read from
+  a random position of the random_key index, O(log n + k) whatever the size
+  of the store.
+"""
+
+import json
+import random
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import URLValidator
+from django.db import transaction
+
+from common.services.base import BaseService
+from ..constants import QUESTION_IMPORT_BATCH_SIZE, QUESTION_IMPORT_MAX_ERRORS
+
+LANGUAGE_CODE = re.compile(r"^[a-z]{2,5}$")
+CONTENT_FILE_NAME = re.compile(r"^(?P<game_type>[a-z_]+)_(?P<language>[a-z]{2,5})\.jsonl?$")
+UPDATE_FIELDS = ["language_code", "game_type", "difficulty", "question", "correct_answer", "options", "context", "image_url"]
+
+
+def _iter_json_array(f, chunk_size=64 * 1024) -> Iterator:
+    """Yield the elements of a JSON array read from f, one at a time."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    eof = False
+
+    while True:
+        buffer = buffer.lstrip()
+        if buffer:
+            if not started:
+                if buffer[0] != "[":
+                    raise ValueError("Expected a JSON array of questions")
+                buffer = buffer[1:]
+                started = True
+                continue
+            if buffer[0] == ",":
+                buffer = buffer[1:]
+                continue
+            if buffer[0] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A value ending the buffer may be cut: wait for its separator
+                if end < len(buffer) or eof:
+                    yield item
+                    buffer = buffer[end:]
+                    continue
+
+        if eof:
+            raise ValueError("Unexpected end of JSON array")
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+
+class QuestionStore(BaseService):
+    """Import and sampling of the GameQuestion table."""
+
+    # ==========================================================================
+    # SAMPLING
+    # ==========================================================================
+
+    @staticmethod
+    def sample(language_code: str, game_type: str, difficulty: str, k: int) -> Optional[List[Dict]]:
+        """
+        Get k random questions of a partition, in random order.
+
+        Args:
+            language_code: Language code
+            game_type: Type of game
+            difficulty: Difficulty level
+            k: Number of questions
+
+        Returns:
+            List of question dicts (content-file format), empty if the
+            partition is empty, or None if no question was imported for the
+            language and game type (callers fall back to the content files)
+        """
+        from games.models import GameQuestion
+
+        partition = GameQuestion.objects.filter(
+            language_code=language_code,
+            game_type=game_type,
+            difficulty=difficulty,
+        ).order_by("random_key")
+
+        start = random.random()
+        picked = list(partition.filter(random_key__gte=start)[:k])
+        if len(picked) < k:
+            picked += list(partition.filter(random_key__lt=start)[:k - len(picked)])
+
+        if not picked:
+            imported = GameQuestion.objects.filter(language_code=language_code, game_type=game_type).exists()
+            return [] if imported else None
+
+        random.shuffle(picked)
+        return [question.as_content() for question in picked]
+
+    # ==========================================================================
+    # IMPORT
+    # ==========================================================================
+
+    @staticmethod
+    def read_file(path) -> Iterator[Tuple[str, object]]:
+        """
+        Stream the records of a JSON (array) or JSONL content file.
+
+        Args:
+            path: File path (.jsonl: one question per line)
+
+        Yields:
+            tuple: (position, record) with position "line N" or "item N"
+
+        Raises:
+            ValueError: If the file is not valid JSON/JSONL
+        """
+        path = Path(path)
+        with open(path, "r", encoding="utf-8") as f:
+            if path.suffix == ".jsonl":
+                for number, line in enumerate(f, start=1):
+                    if line.strip():
+                        try:
+                            yield f"line {number}", json.loads(line)
+                        except json.JSONDecodeError as e:
+                            yield f"line {number}", e
+            else:
+                for number, record in enumerate(_iter_json_array(f), start=1):
+                    yield f"item {number}", record
+
+    @staticmethod
+    def defaults_from_filename(path) -> Dict[str, str]:
+        """Language and game type given by a {game_type}_{language}.json(l) file name."""
+        from games.models import GameType
+
+        match = CONTENT_FILE_NAME.match(Path(path).name)
+        if not match or match.group("game_type") not in GameType.values:
+            return {}
+        return {"language_code": match.group("language"), "game_type": match.group("game_type")}
+
+    @staticmethod
+    def clean(record, language_code: Optional[str] = None, game_type: Optional[str] = None) -> Dict:
+        """
+        Validate a content record and map it to GameQuestion fields.
+
+        Args:
+            record: Decoded record (content-file format)
+            language_code: Language when the record has no "language" key
+            game_type: Game type when the record has no "game_type" key
+
+        Returns:
+            Dict of GameQuestion field values
+
+        Raises:
+            ValueError: Describing every problem of the record
+        """
+        from games.models import GameDifficulty, GameType
+
+        if isinstance(record, Exception):
+            raise ValueError(f"invalid JSON: {record}")
+        if not isinstance(record, dict):
+            raise ValueError("a question must be a JSON object")
+
+        def text(key, max_length=None, required=True):
+            value = record.get(key)
+            if value is None or value == "":
+                if required:
+                    errors.append(f"{key} is required")
+                return None
+            if not isinstance(value, str):
+                errors.append(f"{key} must be a string")
+                return None
+            if max_length and len(value) > max_length:
+                errors.append(f"{key} is longer than {max_length} characters")
+            return value
+
+        errors = []
+        cleaned = {
+            "question_id": text("id", 50),
+            "language_code": record.get("language") or record.get("language_code") or language_code,
+            "game_type": record.get("game_type") or game_type,
+            "difficulty": record.get("difficulty"),
+            "question": text("question"),
+            "correct_answer": text("correct_answer", 255),
+            "options": record.get("options") or [],
+            "context": text("context", required=False),
+            "image_url": text("image_url", 200, required=False),
+        }
+
+        if not isinstance(cleaned["language_code"], str) or not LANGUAGE_CODE.match(cleaned["language_code"]):
+            errors.append(f"invalid language: {cleaned['language_code']!r}")
+        if cleaned["game_type"] not in GameType.values:
+            errors.append(f"invalid game_type: {cleaned['game_type']!r}")
+        if cleaned["difficulty"] not in GameDifficulty.values:
+            errors.append(f"invalid difficulty: {cleaned['difficulty']!r}")
+
+        options = cleaned["options"]
+        if not isinstance(options, list) or not all(isinstance(option, str) and option for option in options):
+            errors.append("options must be a list of non-empty strings")
+        elif len(set(options)) != len(options):
+            errors.append("options contain duplicates")
+        elif options and cleaned["correct_answer"] and cleaned["correct_answer"] not in options:
+            errors.append("correct_answer is not one of the options")
+
+        if cleaned["image_url"]:
+            try:
+                URLValidator()(cleaned["image_url"])
+            except DjangoValidationError:
+                errors.append("image_url is not a valid URL")
+
+        if errors:
+            raise ValueError("; ".join(errors))
+        return cleaned
+
+    @staticmethod
+    def import_questions(
+        records: Iterable[Tuple[str, object]],
+        language_code: Optional[str] = None,
+        game_type: Optional[str] = None,
+        update: bool = False,
+        dry_run: bool = False,
+        batch_size: int = QUESTION_IMPORT_BATCH_SIZE,
+    ) -> Dict:
+        """
+        Validate, dedupe and bulk insert content records.
+
+        Args:
+            records: (position, record) pairs, e.g. from read_file()
+            language_code: Default language of the records
+            game_type: Default game type of the records
+            update: Overwrite questions whose id already exists
+            dry_run: Validate only, write nothing
+            batch_size: Questions per bulk_create
+
+        Returns:
+            Dict with read, valid, invalid, duplicates and written counts,
+            and errors: up to QUESTION_IMPORT_MAX_ERRORS (position, message)
+        """
+        from games.models import GameQuestion
+
+        stats = {"read": 0, "valid": 0, "invalid": 0, "duplicates": 0, "written": 0, "errors": []}
+        seen = set()
+        batch = []
+
+        def flush():
+            if not batch or dry_run:
+                batch.clear()
+                return
+            with transaction.atomic():
+                if update:
+                    GameQuestion.objects.bulk_create(
+                        batch,
+                        update_conflicts=True,
+                        unique_fields=["question_id"],
+                        update_fields=UPDATE_FIELDS,
+                    )
+                    stats["written"] += len(batch)
+                else:
+                    existing = set(GameQuestion.objects.filter(
+                        question_id__in=[question.question_id for question in batch]
+                    ).values_list("question_id", flat=True))
+                    GameQuestion.objects.bulk_create(batch, ignore_conflicts=True)
+                    stats["written"] += len(batch) - len(existing)
+                    stats["duplicates"] += len(existing)
+            batch.clear()
+
+        for position, record in records:
+            stats["read"] += 1
+            try:
+                cleaned = QuestionStore.clean(record, language_code=language_code, game_type=game_type)
+            except ValueError as e:
+                stats["invalid"] += 1
+                if len(stats["errors"]) < QUESTION_IMPORT_MAX_ERRORS:
+                    stats["errors"].append((position, str(e)))
+                continue
+
+            stats["valid"] += 1
+            if cleaned["question_id"] in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(cleaned["question_id"])
+
+            batch.append(GameQuestion(**cleaned))
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+
+        return stats
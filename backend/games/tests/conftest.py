@@ -3,6 +3,7 @@ Pytest fixtures for games tests.
 """
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
 
@@ -14,6 +15,12 @@ from bookings.models import Booking, BookingStatus
 from games.models import Game, GameStatus
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear cached vote tallies (keyed by game id, reused across tests)."""
+    cache.clear()
+
+
 @pytest.fixture
 def organizer_user(db):
     """Create organizer user."""
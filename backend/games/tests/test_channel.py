@@ -0,0 +1,202 @@
+"""
+Tests for the real-time game channel (SSE stream and fan-out).
+"""
+
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from games.models import GameChannelEvent, GameStatus
+from games.services import GameChannel, GameService
+
+
+def _parse(chunk):
+    """Decode one SSE message into a dict of its fields."""
+    text = chunk.decode() if isinstance(chunk, bytes) else chunk
+    fields = dict(line.split(": ", 1) for line in text.strip().splitlines() if not line.startswith(":"))
+    if "data" in fields:
+        fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+@pytest.fixture
+def channel(monkeypatch):
+    """Process channel without poller thread (polls are driven by the tests)."""
+    channel = GameChannel(autostart=False)
+    monkeypatch.setattr(GameChannel, "default", classmethod(lambda cls: channel))
+    return channel
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def _drain(loop, subscription):
+    """Run the loop until queued pushes are applied, return queued messages."""
+    loop.run_until_complete(asyncio.sleep(0))
+    messages = []
+    while not subscription.queue.empty():
+        messages.append(subscription.queue.get_nowait())
+    return messages
+
+
+@pytest.mark.django_db
+class TestGameChannel:
+    """Test suite for publishing and fan-out."""
+
+    def test_vote_published_to_subscribers_after_commit(
+        self, channel, loop, active_game, participant_user, confirmed_booking, django_capture_on_commit_callbacks
+    ):
+        """Test a vote pushes the new tally once the transaction commits."""
+        subscription = channel.subscribe(active_game.pk, loop=loop)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            GameService.submit_vote(active_game, participant_user, "mountain")
+            assert _drain(loop, subscription) == []
+
+        (message,) = _drain(loop, subscription)
+        assert message["event"] == GameChannelEvent.Type.VOTE
+        assert message["data"]["vote_counts"] == {"mountain": 1}
+        assert message["data"]["total_votes"] == 1
+
+    def test_poll_delivers_events_of_other_workers_once(self, channel, loop, active_game):
+        """Test rows written by another process are fanned out once."""
+        subscription = channel.subscribe(active_game.pk, loop=loop)
+        event = GameChannelEvent.objects.create(
+            game=active_game,
+            event_type=GameChannelEvent.Type.REVEAL,
+            payload={"correct_answer": "mountain"},
+        )
+
+        assert channel.poll_once() == 1
+        assert channel.poll_once() == 0
+        (message,) = _drain(loop, subscription)
+        assert message["id"] == event.pk
+        assert message["data"] == {"correct_answer": "mountain"}
+
+    def test_slow_subscriber_is_disconnected(self, active_game, loop):
+        """Test a full queue ends the stream instead of growing."""
+        channel = GameChannel(queue_size=2, autostart=False)
+        subscription = channel.subscribe(active_game.pk, loop=loop)
+        for _ in range(3):
+            GameChannelEvent.objects.create(game=active_game, event_type=GameChannelEvent.Type.VOTE)
+
+        channel.poll_once()
+
+        assert _drain(loop, subscription) == [None]
+        assert subscription.overflowed
+
+    def test_next_question_and_completion_published(
+        self, channel, active_game, organizer_user, django_capture_on_commit_callbacks
+    ):
+        """Test organizer transitions are stored on the channel."""
+        active_game.questions_data = [{"id": "q1", "correct_answer": "mountain"}]
+        active_game.total_questions = 1
+        active_game.status = GameStatus.SHOWING_RESULTS
+        active_game.answer_revealed = True
+        active_game.save()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            GameService.next_question(active_game, organizer_user)
+
+        events = list(GameChannelEvent.objects.filter(game=active_game))
+        assert [event.event_type for event in events] == [GameChannelEvent.Type.COMPLETED]
+        assert events[0].payload["game_status"] == GameStatus.COMPLETED
+        assert events[0].payload["result"]["total_questions"] == 1
+
+    def test_purge_deletes_only_expired_events_in_chunks(self, active_game):
+        """Test purge() removes rows past the retention window, chunk by chunk."""
+        from datetime import timedelta
+        from django.utils import timezone
+        from games.constants import GAME_CHANNEL_RETENTION_HOURS
+
+        old = [GameChannelEvent.objects.create(game=active_game, event_type=GameChannelEvent.Type.VOTE) for _ in range(3)]
+        recent = GameChannelEvent.objects.create(game=active_game, event_type=GameChannelEvent.Type.VOTE)
+        expired_at = timezone.now() - timedelta(hours=GAME_CHANNEL_RETENTION_HOURS, minutes=1)
+        GameChannelEvent.objects.filter(pk__in=[event.pk for event in old]).update(created_at=expired_at)
+
+        deleted = GameChannel.purge(chunk_size=2)
+
+        assert sorted(deleted) == sorted(event.pk for event in old)
+        assert list(GameChannelEvent.objects.values_list("pk", flat=True)) == [recent.pk]
+
+    def test_completion_does_not_purge(self, channel, active_game):
+        """Test publishing a completion leaves old rows to the sweeper."""
+        from datetime import timedelta
+        from django.utils import timezone
+
+        old = GameChannelEvent.objects.create(game=active_game, event_type=GameChannelEvent.Type.VOTE)
+        GameChannelEvent.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=30))
+
+        GameChannel.publish(active_game, GameChannelEvent.Type.COMPLETED, {})
+
+        assert GameChannelEvent.objects.filter(pk=old.pk).exists()
+
+
+@pytest.mark.django_db
+class TestGameStreamView:
+    """Test suite for the SSE endpoint."""
+
+    def _open(self, user, game, headers=None):
+        async def read():
+            client = AsyncClient()
+            token = str(AccessToken.for_user(user)) if user else ""
+            response = await client.get(
+                f"/api/v1/games/{game.pk}/stream/",
+                {"access_token": token} if token else {},
+                headers=headers or {},
+            )
+            if not response.streaming:
+                return response, []
+            chunks = []
+            iterator = aiter(response.streaming_content)
+            for _ in range(2):
+                chunks.append(await anext(iterator))
+            await iterator.aclose()
+            return response, chunks
+
+        return async_to_sync(read)()
+
+    def test_stream_starts_with_snapshot(self, channel, active_game, participant_user, confirmed_booking):
+        """Test participants receive the game state first."""
+        response, chunks = self._open(participant_user, active_game)
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream"
+        assert chunks[0].startswith(b"retry: ")
+        snapshot = _parse(chunks[1])
+        assert snapshot["event"] == "snapshot"
+        assert snapshot["data"]["game"]["id"] == active_game.pk
+        assert channel.subscriber_count() == 0
+
+    def test_stream_resumes_from_last_event_id(self, channel, active_game, participant_user, confirmed_booking):
+        """Test a reconnection replays only the missed events."""
+        first = GameChannelEvent.objects.create(game=active_game, event_type=GameChannelEvent.Type.VOTE)
+        missed = GameChannelEvent.objects.create(game=active_game, event_type=GameChannelEvent.Type.REVEAL)
+
+        _, chunks = self._open(participant_user, active_game, headers={"Last-Event-ID": str(first.pk)})
+
+        message = _parse(chunks[1])
+        assert message["event"] == GameChannelEvent.Type.REVEAL
+        assert message["id"] == str(missed.pk)
+
+    def test_stream_requires_access(self, channel, active_game, random_user, monkeypatch):
+        """Test users outside the event cannot follow the game, nor subscribe to it."""
+        subscribe = mock.Mock(wraps=channel.subscribe)
+        monkeypatch.setattr(channel, "subscribe", subscribe)
+
+        response, _ = self._open(random_user, active_game)
+        assert response.status_code == 404
+
+        response, _ = self._open(None, active_game)
+        assert response.status_code == 401
+
+        subscribe.assert_not_called()
@@ -0,0 +1,99 @@
+"""
+Tests for the preloaded question bank.
+"""
+
+import json
+import os
+
+import pytest
+
+from games.services import QuestionBank
+from games.services.question_bank import warm_up
+
+
+def _write(directory, name, questions, mtime=None):
+    path = directory / name
+    path.write_text(json.dumps(questions), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def content_dir(tmp_path):
+    _write(tmp_path, "picture_description_en.json", [
+        {"id": f"pd_{difficulty}_{index}", "difficulty": difficulty}
+        for difficulty in ("easy", "hard")
+        for index in range(5)
+    ])
+    _write(tmp_path, "word_association_fr.json", [{"id": "wa_1", "difficulty": "easy"}])
+    return tmp_path
+
+
+class TestQuestionBank:
+    """Test suite for QuestionBank."""
+
+    def test_partitions_by_language_type_and_difficulty(self, content_dir):
+        """Test questions are indexed once per partition."""
+        bank = QuestionBank(content_dir)
+
+        assert bank.load() == 11
+        assert bank.stats() == {
+            "en/picture_description/easy": 5,
+            "en/picture_description/hard": 5,
+            "fr/word_association/easy": 1,
+        }
+
+    def test_sample_returns_distinct_questions_of_partition(self, content_dir):
+        """Test sampling picks k distinct questions of the right partition."""
+        bank = QuestionBank(content_dir)
+
+        sample = bank.sample("en", "picture_description", "hard", k=3)
+
+        assert len(sample) == 3
+        assert len({question["id"] for question in sample}) == 3
+        assert all(question["difficulty"] == "hard" for question in sample)
+        assert len(bank.sample("en", "picture_description", "easy")) == 5
+        assert bank.sample("en", "picture_description", "medium") == []
+
+    def test_missing_content_file_raises(self, content_dir):
+        """Test unknown language/type keeps raising FileNotFoundError."""
+        bank = QuestionBank(content_dir)
+
+        with pytest.raises(FileNotFoundError):
+            bank.sample("nl", "picture_description", "easy")
+
+    def test_reloads_when_files_change(self, content_dir):
+        """Test changed content files are picked up after the check interval."""
+        now = [0.0]
+        bank = QuestionBank(content_dir, check_interval=5, clock=lambda: now[0])
+        bank.load()
+        _write(content_dir, "word_association_fr.json", [
+            {"id": "wa_1", "difficulty": "easy"},
+            {"id": "wa_2", "difficulty": "easy"},
+        ], mtime=1_000_000)
+
+        assert len(bank.sample("fr", "word_association", "easy")) == 1  # Not checked yet
+        now[0] = 10.0
+        assert len(bank.sample("fr", "word_association", "easy")) == 2
+
+    def test_invalid_file_keeps_previous_index(self, content_dir):
+        """Test a half-written file does not break game creation."""
+        bank = QuestionBank(content_dir, check_interval=0)
+        bank.load()
+        (content_dir / "word_association_fr.json").write_text("[{", encoding="utf-8")
+        os.utime(content_dir / "word_association_fr.json", (1_000_000, 1_000_000))
+
+        assert not bank.refresh()
+        assert len(bank.sample("fr", "word_association", "easy")) == 1
+
+    def test_warm_up_never_raises(self, content_dir, monkeypatch):
+        """Test a server process starts even if content cannot be loaded."""
+        (content_dir / "word_association_fr.json").write_text("[{", encoding="utf-8")
+        bank = QuestionBank(content_dir)
+        monkeypatch.setattr(QuestionBank, "default", classmethod(lambda cls: bank))
+
+        warm_up()
+
+        with pytest.raises(ValueError):
+            bank.sample("fr", "word_association", "easy")
@@ -0,0 +1,137 @@
+"""
+Tests for the database question store and the import_game_content command.
+"""
+
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from games.models import GameQuestion
+from games.services import GameService, QuestionStore
+from games.services.question_store import _iter_json_array
+
+
+def _question(question_id, difficulty="easy", **fields):
+    return {
+        "id": question_id,
+        "difficulty": difficulty,
+        "question": f"Question {question_id}?",
+        "correct_answer": "mountain",
+        "options": ["mountain", "beach", "city", "forest"],
+        **fields,
+    }
+
+
+def _import(*args):
+    out = io.StringIO()
+    call_command("import_game_content", *map(str, args), stdout=out)
+    return out.getvalue()
+
+
+class TestJsonArrayStreaming:
+    """Test suite for the incremental JSON array reader."""
+
+    def test_reads_elements_across_chunk_boundaries(self):
+        """Test objects cut by a chunk boundary are read whole."""
+        questions = [_question(f"q{index}", context="é" * index) for index in range(50)]
+
+        records = list(_iter_json_array(io.StringIO(json.dumps(questions, indent=2)), chunk_size=7))
+
+        assert records == questions
+
+    def test_truncated_array_raises(self):
+        """Test a file cut in the middle is rejected."""
+        with pytest.raises(ValueError):
+            list(_iter_json_array(io.StringIO('[{"id": "q1"}, {"id": '), chunk_size=4))
+
+
+@pytest.mark.django_db
+class TestImportGameContentCommand:
+    """Test suite for manage.py import_game_content."""
+
+    def test_imports_jsonl_with_defaults_from_file_name(self, tmp_path):
+        """Test records are validated, deduped and written with the file's language and type."""
+        path = tmp_path / "picture_description_fr.jsonl"
+        path.write_text("\n".join(json.dumps(_question(f"q{index}")) for index in range(5)) + "\n", encoding="utf-8")
+
+        output = _import(path, "--batch-size", "2")
+
+        assert "written=5" in output
+        assert GameQuestion.objects.filter(language_code="fr", game_type="picture_description").count() == 5
+
+    def test_skips_duplicates_and_reports_invalid_records(self, tmp_path):
+        """Test duplicate ids are kept once and invalid records fail the command."""
+        GameQuestion.objects.create(
+            question_id="existing", language_code="en", game_type="word_association",
+            difficulty="easy", question="Old?", correct_answer="old",
+        )
+        path = tmp_path / "questions.json"
+        path.write_text(json.dumps([
+            _question("q1"),
+            _question("q1"),
+            _question("existing"),
+            _question("bad", difficulty="extreme"),
+            _question("bad2", correct_answer="volcano"),
+        ]), encoding="utf-8")
+
+        with pytest.raises(CommandError, match="2 invalid"):
+            _import(path, "--language", "en", "--game-type", "word_association")
+
+        assert set(GameQuestion.objects.values_list("question_id", flat=True)) == {"existing", "q1"}
+        assert GameQuestion.objects.get(question_id="existing").question == "Old?"
+
+    def test_update_overwrites_existing_questions(self, tmp_path):
+        """Test --update replaces the content of known ids."""
+        path = tmp_path / "word_association_en.jsonl"
+        path.write_text(json.dumps(_question("q1")) + "\n", encoding="utf-8")
+        _import(path)
+        path.write_text(json.dumps(_question("q1", difficulty="hard")) + "\n", encoding="utf-8")
+
+        _import(path, "--update")
+
+        assert GameQuestion.objects.get(question_id="q1").difficulty == "hard"
+
+    def test_dry_run_writes_nothing(self, tmp_path):
+        """Test --dry-run only validates."""
+        path = tmp_path / "word_association_en.jsonl"
+        path.write_text(json.dumps(_question("q1")) + "\n", encoding="utf-8")
+
+        output = _import(path, "--dry-run")
+
+        assert "valid (dry run)=1" in output
+        assert not GameQuestion.objects.exists()
+
+
+@pytest.mark.django_db
+class TestQuestionStoreSampling:
+    """Test suite for sampling imported questions."""
+
+    @pytest.fixture
+    def imported(self):
+        QuestionStore.import_questions(
+            [(index, _question(f"q{index}", difficulty="hard" if index % 2 else "easy")) for index in range(40)],
+            language_code="en",
+            game_type="picture_description",
+        )
+
+    def test_sample_returns_distinct_questions_of_partition(self, imported):
+        """Test k distinct questions of the requested difficulty are returned."""
+        sample = QuestionStore.sample("en", "picture_description", "hard", k=15)
+
+        assert len(sample) == 15
+        assert len({question["id"] for question in sample}) == 15
+        assert all(question["difficulty"] == "hard" for question in sample)
+        assert len(QuestionStore.sample("en", "picture_description", "easy", k=50)) == 20
+        assert QuestionStore.sample("en", "picture_description", "medium", k=5) == []
+        assert QuestionStore.sample("fr", "picture_description", "easy", k=5) is None
+
+    def test_game_questions_come_from_store_when_imported(self, imported):
+        """Test game creation samples the store, capped per game, and falls back to files."""
+        questions = GameService._get_questions_by_difficulty("en", "picture_description", "easy")
+
+        assert len(questions) == 10
+        assert all(question["id"].startswith("q") for question in questions)
+        assert GameService._get_questions_by_difficulty("en", "word_association", "easy")  # Content files
@@ -5,7 +5,7 @@ Tests for game services.
 import pytest
 from rest_framework.exceptions import ValidationError, PermissionDenied
 
-from games.models import Game, GameVote, GameStatus
+from games.models import Game, GameVote, GameStatus, GameQuestionTally
 from games.services import GameService
 
 
@@ -258,6 +258,162 @@ class TestGameServiceStats:
         assert stats["total_votes"] == 0  # No votes in fixture
 
 
+@pytest.mark.django_db
+class TestGameServiceTally:
+    """Test suite for the incremental vote tally."""
+
+    def test_submit_vote_updates_tally(
+        self, active_game, participant_user, participant_user_2, confirmed_booking, confirmed_booking_2,
+        django_capture_on_commit_callbacks
+    ):
+        """Test each vote increments the question's tally row."""
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            GameService.submit_vote(active_game, participant_user, "mountain")
+            GameService.submit_vote(active_game, participant_user_2, "beach")
+
+        # Assert
+        tally = GameQuestionTally.objects.get(game=active_game, question_index=0)
+        assert tally.vote_counts == {"mountain": 1, "beach": 1}
+        assert tally.total_votes == 2
+
+    def test_stats_read_without_scanning_votes(
+        self, active_game, participant_user, confirmed_booking, django_capture_on_commit_callbacks,
+        django_assert_num_queries
+    ):
+        """Test stats of a voted question come from the tally row, then the cache."""
+        # Arrange
+        active_game.confirmed_participants = 4
+        active_game.save()
+        with django_capture_on_commit_callbacks(execute=True):
+            GameService.submit_vote(active_game, participant_user, "mountain")
+
+        # Act
+        with django_assert_num_queries(1):
+            stats = GameService.get_game_stats(active_game)
+        with django_assert_num_queries(0):
+            cached = GameService.get_game_stats(active_game)
+
+        # Assert
+        assert stats == cached == {
+            "total_votes": 1,
+            "confirmed_participants": 4,
+            "vote_counts": {"mountain": 1},
+            "votes_remaining": 3,
+        }
+
+    def test_tally_read_during_a_vote_not_cached_as_current(
+        self, active_game, participant_user, confirmed_booking, django_capture_on_commit_callbacks, monkeypatch
+    ):
+        """Test a tally read before a vote committed is not served after it."""
+        # Arrange: a vote commits while a reader is reading the old tally
+        read_tally = GameService._read_tally
+
+        def read_then_vote(game_id, question_index):
+            counts = read_tally(game_id, question_index)
+            with django_capture_on_commit_callbacks(execute=True):
+                GameService.submit_vote(active_game, participant_user, "mountain")
+            return counts
+
+        monkeypatch.setattr(GameService, "_read_tally", staticmethod(read_then_vote))
+        assert GameService.get_question_tally(active_game)["total_votes"] == 0
+        monkeypatch.setattr(GameService, "_read_tally", staticmethod(read_tally))
+
+        # Act
+        counts = GameService.get_question_tally(active_game)
+
+        # Assert
+        assert counts == {"vote_counts": {"mountain": 1}, "total_votes": 1}
+
+    def test_create_game_snapshots_confirmed_participants(
+        self, published_event, organizer_user, confirmed_booking, confirmed_booking_2
+    ):
+        """Test the participant count is stored on the game."""
+        # Arrange
+        published_event.refresh_from_db()
+
+        # Act
+        game = GameService.create_game(
+            event=published_event,
+            created_by=organizer_user,
+            game_type="picture_description",
+            skip_time_validation=True,
+        )
+
+        # Assert
+        assert game.confirmed_participants == published_event.confirmed_seats == 2
+
+
+@pytest.mark.django_db
+class TestGameServiceFinalResults:
+    """Test suite for final results and badges."""
+
+    def _play(self, game, users, answers_per_question):
+        """Complete a game whose questions received the given answers."""
+        game.questions_data = [
+            {"id": f"q{index}", "question": f"Question {index}", "correct_answer": "right"}
+            for index in range(len(answers_per_question))
+        ]
+        game.total_questions = len(answers_per_question)
+        game.status = GameStatus.COMPLETED
+        game.save()
+        for question_index, answers in enumerate(answers_per_question):
+            for user, answer in zip(users, answers):
+                GameVote.objects.create(game=game, user=user, question_index=question_index, answer=answer)
+
+    def test_final_results_and_badges(self, active_game, multiple_participants):
+        """Test correct answers are counted per question and every participant gets a badge."""
+        # Arrange
+        self._play(active_game, multiple_participants, [
+            ["right", "right", "wrong"],
+            ["wrong", "wrong", "right"],
+            ["right"],
+            [],
+        ])
+
+        # Act
+        result = GameService._calculate_final_results(active_game)
+
+        # Assert
+        assert result.correct_answers == 2
+        assert float(result.score_percentage) == 50.0
+        assert result.badge_type == "victory"
+        assert result.badges.count() == len(multiple_participants)
+
+    def test_final_results_cost_fixed_statements(self, active_game, multiple_participants):
+        """Test completion does not issue queries per question or per participant."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        # Arrange
+        self._play(active_game, multiple_participants, [["right"] * 5 for _ in range(6)])
+
+        # Act
+        with CaptureQueriesContext(connection) as completion:
+            GameService._calculate_final_results(active_game)
+        with CaptureQueriesContext(connection) as details:
+            results = GameService.get_detailed_results(active_game)
+
+        # Assert
+        statements = [query["sql"] for query in completion.captured_queries]
+        assert sum('FROM "games_gamevote"' in sql for sql in statements) == 1
+        assert sum('INTO "games_badge"' in sql for sql in statements) == 1
+        assert len(details) == 2
+        assert all(question["is_correct"] for question in results["questions"])
+        assert results["questions"][0]["total_votes"] == 5
+
+    def test_tie_goes_to_most_recent_answer(self, active_game, multiple_participants):
+        """Test tie-breaking matches the previous Counter.most_common() order."""
+        # Arrange
+        self._play(active_game, multiple_participants, [["wrong", "right"]])
+
+        # Act
+        results = GameService.get_detailed_results(active_game)
+
+        # Assert
+        assert results["questions"][0]["team_answer"] == "right"
+
+
 @pytest.mark.django_db
 class TestGameServiceGetActiveGame:
     """Test suite for get_active_game."""
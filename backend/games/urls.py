@@ -2,11 +2,12 @@
 
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import GameViewSet
+from .views import GameViewSet, game_stream
 
 router = DefaultRouter()
 router.register(r"games", GameViewSet, basename="game")
 
 urlpatterns = [
+    path("games/<int:pk>/stream/", game_stream, name="game-stream"),
     path("", include(router.urls)),
 ]
@@ -5,6 +5,7 @@ This module provides RESTful endpoints for creating games,
 submitting votes, and retrieving game statistics.
 """
 
+from django.db import transaction
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -484,3 +485,157 @@ class GameViewSet(viewsets.ReadOnlyModelViewSet):
 
         serializer = GameResultSerializer(game_result, context={"request": request})
         return Response(serializer.data)
+
+
+def _authenticate_stream(request):
+    """
+    Authenticate a stream request with the API's JWT authentication.
+
+    EventSource cannot send headers, so the access token may also be passed
+    as the access_token query parameter.
+
+    Returns:
+        User: Authenticated active user
+
+    Raises:
+        NotAuthenticated: If no token is provided
+        AuthenticationFailed: If the token is invalid or revoked
+        PermissionDenied: If the user is inactive
+    """
+    from rest_framework.exceptions import NotAuthenticated
+    from users.auth import JWTAuthenticationWithDenylist
+
+    authentication = JWTAuthenticationWithDenylist()
+    header = authentication.get_header(request)
+    raw_token = authentication.get_raw_token(header) if header else None
+    raw_token = raw_token or request.GET.get("access_token")
+    if not raw_token:
+        raise NotAuthenticated()
+
+    user = authentication.get_user(authentication.get_validated_token(raw_token))
+    if not user.is_active:
+        raise PermissionDenied("User account is inactive")
+    return user
+
+
+def _authorize_stream(request, pk):
+    """
+    Authenticate a stream request and check access to the game.
+
+    Raises:
+        NotAuthenticated, AuthenticationFailed, PermissionDenied: See _authenticate_stream()
+        NotFound: If the game does not exist or the user may not follow it
+    """
+    user = _authenticate_stream(request)
+    game = Game.objects.select_related("event").filter(pk=pk).first()
+    if game is None or not GameService.can_access_game(game, user):
+        raise NotFound("Game not found")
+
+
+def _open_stream(request, pk, last_event_id):
+    """
+    Build the first messages of an authorized game stream.
+
+    Without Last-Event-ID the stream starts with a snapshot of the game
+    (GameSerializer, stats included); on reconnection the stored events
+    missed since Last-Event-ID are replayed instead.
+
+    Returns:
+        tuple: (Game, list of SSE messages, id of the last event they cover)
+    """
+    from .services import GameChannel
+
+    game = Game.objects.select_related("event", "created_by").filter(pk=pk).first()
+    if game is None:
+        raise NotFound("Game not found")  # Deleted since _authorize_stream()
+
+    if last_event_id is not None:
+        missed = GameChannel.replay(game.pk, last_event_id)
+        last_id = missed[-1]["id"] if missed else last_event_id
+        return game, missed, last_id
+
+    last_id = GameChannel.last_event_id(game.pk)
+    snapshot = {
+        "id": last_id,
+        "event": "snapshot",
+        "data": {"game": GameSerializer(game, context={"request": request}).data},
+    }
+    return game, [snapshot], last_id
+
+
+@transaction.non_atomic_requests  # Async view: each query commits on its own
+async def game_stream(request, pk):
+    """
+    Server-Sent Events stream of a game (GET /api/v1/games/{id}/stream/).
+
+    Pushes snapshot, vote, reveal, next_question and completed events
+    (see games.services.game_channel) and ends after completed. Replaces
+    polling of the stats and active endpoints. Clients reconnect with
+    Last-Event-ID (EventSource does it automatically) to resume.
+    """
+    import asyncio
+    from asgiref.sync import sync_to_async
+    from django.http import JsonResponse, StreamingHttpResponse
+    from rest_framework.exceptions import APIException
+    from .constants import GAME_CHANNEL_HEARTBEAT_SECONDS, GAME_CHANNEL_RETRY_MS
+    from .models import GameChannelEvent
+    from .services.game_channel import GameChannel, format_sse
+
+    if request.method != "GET":
+        return JsonResponse({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    # Only authorized clients subscribe (and may start the channel's poller)
+    try:
+        await sync_to_async(_authorize_stream)(request, pk)
+    except APIException as e:
+        detail = e.detail if isinstance(e.detail, dict) else {"detail": e.detail}
+        return JsonResponse(detail, status=e.status_code)
+
+    # Subscribe before reading the snapshot: nothing committed in between is lost
+    channel = GameChannel.default()
+    subscription = channel.subscribe(pk)
+    try:
+        game, opening, last_id = await sync_to_async(_open_stream)(request, pk, last_event_id)
+    except APIException as e:
+        channel.unsubscribe(subscription)
+        return JsonResponse({"detail": e.detail}, status=e.status_code)
+    except BaseException:
+        channel.unsubscribe(subscription)
+        raise
+
+    async def events():
+        try:
+            yield f"retry: {GAME_CHANNEL_RETRY_MS}\n\n"
+            for message in opening:
+                yield format_sse(message["event"], message["data"], message["id"])
+                if message["event"] == GameChannelEvent.Type.COMPLETED:
+                    return
+            if game.status == GameStatus.COMPLETED:
+                return
+
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), GAME_CHANNEL_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if message is None:
+                    return  # Too far behind: the client reconnects and replays
+                if message["id"] <= last_id:
+                    continue  # Already covered by the snapshot or replay
+                yield format_sse(message["event"], message["data"], message["id"])
+                if message["event"] == GameChannelEvent.Type.COMPLETED:
+                    return
+        finally:
+            channel.unsubscribe(subscription)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: flush each event
+    return response
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0002_alter_language_options_alter_language_code_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='language',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='Timestamp of the last change (HTTP Last-Modified)'),
+        ),
+    ]
@@ -54,6 +54,10 @@ class Language(models.Model):
         auto_now_add=True,
         help_text="Timestamp when language was added"
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Timestamp of the last change (HTTP Last-Modified)"
+    )
 
     class Meta:
         ordering = ["sort_order", "code"]
@@ -135,3 +135,23 @@ class LanguageViewSetTests(TestCase):
         self.assertIn("previous", response.data)
         self.assertIn("results", response.data)
         self.assertEqual(response.data["count"], 2)  # 2 active languages
+
+    def test_conditional_get(self):
+        """Unchanged languages answer 304; an edit changes the ETag."""
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        self.lang_en.label_nl = "Engelse"
+        self.lang_en.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_invalid_id_not_found(self):
+        """A non-numeric id is a 404, not a conditional-GET error."""
+        response = self.client.get(f"{self.url}abc/", HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -4,7 +4,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiResp
 
 from .models import Language
 from .serializers import LanguageSerializer
-from common.mixins import HateoasOptionsMixin
+from common.mixins import ConditionalGetMixin, HateoasOptionsMixin
 from common.metadata import HateoasMetadata
 
 
@@ -36,12 +36,13 @@ from common.metadata import HateoasMetadata
     ),
 )
 @extend_schema(tags=["Languages"])
-class LanguageViewSet(HateoasOptionsMixin, ReadOnlyModelViewSet):
+class LanguageViewSet(ConditionalGetMixin, HateoasOptionsMixin, ReadOnlyModelViewSet):
     """
     Read-only ViewSet for available languages.
 
     Provides list and detail views for languages available on the platform.
     No authentication required - this is public data.
+    Supports conditional GET (ETag / Last-Modified).
     """
     queryset = Language.objects.filter(is_active=True).order_by("sort_order", "code")
     serializer_class = LanguageSerializer
@@ -49,3 +50,17 @@ class LanguageViewSet(HateoasOptionsMixin, ReadOnlyModelViewSet):
     metadata_class = HateoasMetadata
 
     extra_hateoas = {"related": {"self": "/api/v1/languages/"}}
+
+    def get_conditional_state(self, request):
+        """Validators from max(updated_at) and count of active languages."""
+        from django.db.models import Count, Max
+
+        queryset = self.get_queryset()
+        if self.action == "retrieve":
+            queryset = self.get_conditional_object_queryset(queryset)
+            if queryset is None:
+                return None
+        stats = queryset.aggregate(last_modified=Max("updated_at"), count=Count("id"))
+        if not stats["count"]:
+            return None
+        return (stats["last_modified"].isoformat(), stats["count"]), stats["last_modified"]
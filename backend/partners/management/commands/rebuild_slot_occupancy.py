@@ -0,0 +1,74 @@
+"""
+Django management command to rebuild the partner slot occupancy ledger.
+
+Recomputes PartnerSlotOccupancy from the events and bookings tables.
+Run it after the initial migration, after a bulk data import, or to
+repair drift reported by --verify.
+
+Usage:
+    python manage.py rebuild_slot_occupancy
+    python manage.py rebuild_slot_occupancy --verify
+    python manage.py rebuild_slot_occupancy --partner 12
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from partners.services import OccupancyService
+
+
+class Command(BaseCommand):
+    help = "Rebuild (or verify) the partner slot occupancy ledger"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only report buckets that differ from a full recomputation",
+        )
+        parser.add_argument(
+            "--partner",
+            type=int,
+            default=None,
+            help="Restrict the rebuild/verification to one partner id",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the rebuild or verification."""
+        partner_id = options["partner"]
+
+        try:
+            self.stdout.write(
+                f'[{timezone.now()}] Starting slot occupancy {"verification" if options["verify"] else "rebuild"}...'
+            )
+
+            if options["verify"]:
+                drift = OccupancyService.verify(partner_id=partner_id)
+                for item in drift:
+                    self.stdout.write(
+                        f'  partner={item["partner_id"]} slot={item["slot_start"].isoformat()} '
+                        f'stored={item["stored"]} expected={item["expected"]}'
+                    )
+                if drift:
+                    self.stdout.write(
+                        self.style.ERROR(f'✗ {len(drift)} slot bucket(s) out of sync')
+                    )
+                else:
+                    self.stdout.write(self.style.SUCCESS('✓ Slot occupancy ledger is in sync'))
+                return
+
+            written = OccupancyService.rebuild(partner_id=partner_id)
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Rebuilt {written} slot bucket(s)')
+            )
+
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'Error during slot occupancy rebuild: {str(e)}')
+            )
+            raise
+
+        finally:
+            self.stdout.write(
+                f'[{timezone.now()}] Slot occupancy command completed.'
+            )
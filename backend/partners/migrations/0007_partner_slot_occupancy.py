@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0006_partner_owner'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartnerSlotOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slot_start', models.DateTimeField(help_text='Start of the hour bucket (UTC, truncated to the hour)')),
+                ('reserved_seats', models.PositiveIntegerField(default=0, help_text='Seats allocated to active events in this bucket')),
+                ('confirmed_seats', models.PositiveIntegerField(default=0, help_text='Confirmed bookings in this bucket')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('partner', models.ForeignKey(help_text='Partner venue this bucket belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='slot_occupancy', to='partners.partner')),
+            ],
+            options={
+                'verbose_name': 'Partner Slot Occupancy',
+                'verbose_name_plural': 'Partner Slot Occupancy',
+                'ordering': ['partner', 'slot_start'],
+                'constraints': [models.UniqueConstraint(fields=('partner', 'slot_start'), name='unique_partner_slot_bucket')],
+            },
+        ),
+    ]
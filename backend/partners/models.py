@@ -56,16 +56,56 @@ class Partner(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Fields rendered in event payloads (events feed cache)
+    EVENT_FEED_FIELDS = frozenset({"name", "address", "city", "reputation", "capacity", "is_active"})
+    # Fields feeding the search documents of the partner's events
+    EVENT_SEARCH_FIELDS = frozenset({"name", "address", "city"})
+
     class Meta:
         ordering = ["name"]
         verbose_name = "Partner Venue"
         verbose_name_plural = "Partner Venues"
 
     def save(self, *args, **kwargs):
-        """Auto-generate API key on creation."""
+        """
+        Auto-generate API key on creation.
+
+        Events embed partner fields: when one of them changed (compared with
+        the stored row, within update_fields if given), refresh the events
+        feed and, for searched fields, the search documents of this
+        partner's events.
+        """
+        from events.services import EventFeedCacheService
+
         if not self.api_key:
             self.api_key = secrets.token_hex(32)
+        update_fields = kwargs.get("update_fields")
+        watched = self.EVENT_FEED_FIELDS if update_fields is None else self.EVENT_FEED_FIELDS.intersection(update_fields)
+        changed = set() if self._state.adding else self._changed_fields(watched)
         super().save(*args, **kwargs)
+        if changed:
+            EventFeedCacheService.invalidate()
+        if changed & self.EVENT_SEARCH_FIELDS:
+            self.refresh_event_search_documents()
+
+    def _changed_fields(self, fields):
+        """Fields among `fields` whose value differs from the stored row."""
+        if not fields:
+            return set()
+        stored = Partner.objects.filter(pk=self.pk).values(*fields).first()
+        if stored is None:
+            return set(fields)
+        return {field for field in fields if stored[field] != getattr(self, field)}
+
+    def refresh_event_search_documents(self):
+        """Rebuild the search document of every event held here (bulk update)."""
+        from events.models import Event
+
+        events = list(Event.objects.filter(partner=self).select_related("language"))
+        for event in events:
+            event.partner = self
+            event.search_document = event.build_search_document()
+        Event.objects.bulk_update(events, ["search_document"], batch_size=500)
 
     def get_available_capacity(self, datetime_start, datetime_end):
         """
@@ -100,3 +140,54 @@ class Partner(models.Model):
     def __str__(self):
         status = "[active]" if self.is_active else "[inactive]"
         return f"{self.name} ({self.capacity} seats, {status})"
+
+
+class PartnerSlotOccupancy(models.Model):
+    """
+    Per-partner occupancy ledger, one row per hour bucket.
+
+    Keeps the seat counters that capacity checks need so they no longer have
+    to scan every event a venue has ever hosted:
+
+    - reserved_seats: sum of max_participants of active events
+      (DRAFT, PENDING_CONFIRMATION, PUBLISHED) touching the bucket
+    - confirmed_seats: confirmed bookings of PUBLISHED/PENDING_CONFIRMATION
+      events touching the bucket
+
+    Rows are maintained by OccupancyService whenever an event or booking
+    changes, and can be rebuilt with `manage.py rebuild_slot_occupancy`.
+    """
+
+    partner = models.ForeignKey(
+        Partner,
+        on_delete=models.CASCADE,
+        related_name="slot_occupancy",
+        help_text="Partner venue this bucket belongs to",
+    )
+    slot_start = models.DateTimeField(
+        help_text="Start of the hour bucket (UTC, truncated to the hour)"
+    )
+    reserved_seats = models.PositiveIntegerField(
+        default=0, help_text="Seats allocated to active events in this bucket"
+    )
+    confirmed_seats = models.PositiveIntegerField(
+        default=0, help_text="Confirmed bookings in this bucket"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["partner", "slot_start"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["partner", "slot_start"],
+                name="unique_partner_slot_bucket",
+            ),
+        ]
+        verbose_name = "Partner Slot Occupancy"
+        verbose_name_plural = "Partner Slot Occupancy"
+
+    def __str__(self):
+        return (
+            f"{self.partner_id} @ {self.slot_start:%Y-%m-%d %H:%M} "
+            f"(reserved={self.reserved_seats}, confirmed={self.confirmed_seats})"
+        )
@@ -35,3 +35,28 @@ class PartnerSerializer(serializers.ModelSerializer):
             "self": request.build_absolute_uri(f"/api/v1/partners/{obj.id}/"),
             "events": request.build_absolute_uri(f"/api/v1/events/?partner={obj.id}")
         }
+
+
+class PartnerAvailabilitySerializer(PartnerSerializer):
+    """
+    Partner venue with its free seats on a requested time slot.
+
+    Used by the venue finder; expects a queryset annotated by
+    PartnerService.find_available_partners().
+    """
+
+    available_seats = serializers.IntegerField(
+        read_only=True, help_text="Seats left on the requested slot"
+    )
+    event_capacity_max = serializers.SerializerMethodField(
+        help_text="Max participants allowed for a new event on this slot"
+    )
+
+    class Meta(PartnerSerializer.Meta):
+        fields = PartnerSerializer.Meta.fields + ["available_seats", "event_capacity_max"]
+
+    def get_event_capacity_max(self, obj) -> int:
+        """Per-event cap: min(MAX_PARTICIPANTS_PER_EVENT, available seats)."""
+        from common.constants import MAX_PARTICIPANTS_PER_EVENT
+
+        return min(MAX_PARTICIPANTS_PER_EVENT, obj.available_seats)
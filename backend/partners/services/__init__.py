@@ -1,4 +1,5 @@
 """Partner services module."""
 from .partner_service import PartnerService
+from .occupancy_service import OccupancyService
 
-__all__ = ["PartnerService"]
+__all__ = ["PartnerService", "OccupancyService"]
@@ -0,0 +1,517 @@
+"""
+Partner slot occupancy ledger service.
+
+Maintains PartnerSlotOccupancy rows (one per partner and hour bucket) and
+answers capacity reads from them, so a capacity check costs one indexed
+lookup over the overlapping buckets instead of a scan of the venue history.
+
+ARCHITECTURE RULE:
+    Event and Booking models call this service after every change that can
+    move seats (status, datetime_start, partner, max_participants).
+    PartnerService reads capacity through get_slot_load().
+
+BUCKET MODEL:
+    An event occupies every hour bucket touched by its
+    [datetime_start, datetime_start + DEFAULT_EVENT_DURATION_HOURS) interval.
+    The load of a time window is the peak load of the buckets it touches.
+    For windows aligned on the hour (availability grid, events created from
+    the UI) this equals the sum over overlapping events; for other windows it
+    is still an upper bound of the concurrent occupancy.
+
+USAGE EXAMPLE:
+    >>> from partners.services import OccupancyService
+    >>> reserved, confirmed = OccupancyService.get_slot_load(
+    ...     partner, datetime_start, datetime_end
+    ... )
+    >>> OccupancyService.refresh_for_event(event)  # after an event change
+"""
+
+from collections import defaultdict
+from datetime import timedelta, timezone as dt_timezone
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from common.services.base import BaseService
+from common.constants import DEFAULT_EVENT_DURATION_HOURS, MAX_PARTICIPANTS_PER_EVENT
+
+# Ledger granularity
+SLOT_BUCKET = timedelta(hours=1)
+
+# Event statuses that allocate seats (max_participants) on the venue
+RESERVING_STATUSES = ("DRAFT", "PENDING_CONFIRMATION", "PUBLISHED")
+
+# Event statuses whose confirmed bookings occupy seats on the venue
+CONFIRMED_STATUSES = ("PENDING_CONFIRMATION", "PUBLISHED")
+
+# Per-partner cache version, changed after every committed ledger write
+CACHE_VERSION_KEY = "partners:occupancy:version:{partner_id}"
+
+
+class OccupancyService(BaseService):
+    """
+    Service layer for the partner slot occupancy ledger.
+
+    Writes always recompute the touched buckets from the events table while
+    holding a row lock on them, so counters cannot drift under concurrent
+    bookings. Reads only touch the ledger.
+
+    All methods are @staticmethod for easy testing and no state management.
+    """
+
+    # ==========================================================================
+    # BUCKET HELPERS
+    # ==========================================================================
+
+    @staticmethod
+    def bucket_start(value):
+        """
+        Truncate a datetime to the start of its hour bucket (UTC).
+
+        Args:
+            value (datetime): Timezone-aware datetime
+
+        Returns:
+            datetime: Bucket start in UTC
+        """
+        return value.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def buckets_for_range(datetime_start, datetime_end):
+        """
+        List the hour buckets touched by [datetime_start, datetime_end).
+
+        Args:
+            datetime_start (datetime): Start of the window (timezone-aware)
+            datetime_end (datetime): End of the window (exclusive)
+
+        Returns:
+            list: Bucket starts in chronological order
+        """
+        buckets = []
+        current = OccupancyService.bucket_start(datetime_start)
+        while current < datetime_end:
+            buckets.append(current)
+            current += SLOT_BUCKET
+        return buckets
+
+    @staticmethod
+    def event_buckets(datetime_start):
+        """List the buckets occupied by an event starting at datetime_start."""
+        duration = timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
+        return OccupancyService.buckets_for_range(datetime_start, datetime_start + duration)
+
+    @staticmethod
+    def _accumulate(events, counters, only_buckets=None):
+        """
+        Add event contributions to a {(partner_id, bucket): [reserved, confirmed]} dict.
+
+        Args:
+            events: Iterable of (partner_id, datetime_start, status, max_participants, confirmed_seats)
+            counters: defaultdict to update in place
+            only_buckets: Optional set of buckets to restrict the update to
+        """
+        for partner_id, start, status, max_participants, confirmed in events:
+            for bucket in OccupancyService.event_buckets(start):
+                if only_buckets is not None and bucket not in only_buckets:
+                    continue
+                slot = counters[(partner_id, bucket)]
+                if status in RESERVING_STATUSES:
+                    slot[0] += max_participants or MAX_PARTICIPANTS_PER_EVENT
+                if status in CONFIRMED_STATUSES:
+                    slot[1] += confirmed
+
+    @staticmethod
+    def _active_events():
+        """
+        Active events with their confirmed bookings count.
+
+        Reads the Event.confirmed_seats counter (no bookings join); run
+        reconcile_confirmed_seats before a rebuild if counters may have drifted.
+        """
+        from events.models import Event
+
+        return (
+            Event.objects.filter(status__in=RESERVING_STATUSES)
+            .order_by()
+            .values_list(
+                "partner_id", "datetime_start", "status", "max_participants", "confirmed_seats"
+            )
+        )
+
+    # ==========================================================================
+    # READS
+    # ==========================================================================
+
+    @staticmethod
+    def get_slot_load(partner, datetime_start, datetime_end, exclude_event_id=None):
+        """
+        Get the peak reserved and confirmed seats for a time window.
+
+        Args:
+            partner (Partner): Partner instance (or primary key)
+            datetime_start (datetime): Start of the window (timezone-aware)
+            datetime_end (datetime): End of the window (exclusive)
+            exclude_event_id (int): Optional event whose reservation is ignored
+                (used when re-validating an existing event)
+
+        Returns:
+            tuple: (reserved_seats, confirmed_seats)
+        """
+        from partners.models import PartnerSlotOccupancy
+
+        partner_id = getattr(partner, "pk", partner)
+        buckets = OccupancyService.buckets_for_range(datetime_start, datetime_end)
+        if not buckets:
+            return 0, 0
+
+        rows = {
+            slot_start: [reserved, confirmed]
+            for slot_start, reserved, confirmed in PartnerSlotOccupancy.objects.filter(
+                partner_id=partner_id,
+                slot_start__gte=buckets[0],
+                slot_start__lte=buckets[-1],
+            ).values_list("slot_start", "reserved_seats", "confirmed_seats")
+        }
+
+        if exclude_event_id and rows:
+            from events.models import Event
+
+            excluded = (
+                Event.objects.filter(
+                    pk=exclude_event_id,
+                    partner_id=partner_id,
+                    status__in=RESERVING_STATUSES,
+                )
+                .values_list("datetime_start", "max_participants")
+                .first()
+            )
+            if excluded:
+                excluded_start, excluded_seats = excluded
+                for bucket in OccupancyService.event_buckets(excluded_start):
+                    if bucket in rows:
+                        rows[bucket][0] -= excluded_seats or MAX_PARTICIPANTS_PER_EVENT
+
+        if not rows:
+            return 0, 0
+
+        reserved = max(max(0, slot[0]) for slot in rows.values())
+        confirmed = max(slot[1] for slot in rows.values())
+        return reserved, confirmed
+
+    @staticmethod
+    def get_slots_load(partner_ids, datetime_start, datetime_end):
+        """
+        Get the stored buckets of several partners over a window in one query.
+
+        Args:
+            partner_ids (iterable): Partner primary keys
+            datetime_start (datetime): Start of the window (timezone-aware)
+            datetime_end (datetime): End of the window (exclusive)
+
+        Returns:
+            dict: {(partner_id, bucket): (reserved_seats, confirmed_seats)}
+                  Missing buckets are empty (0, 0).
+        """
+        from partners.models import PartnerSlotOccupancy
+
+        buckets = OccupancyService.buckets_for_range(datetime_start, datetime_end)
+        if not buckets:
+            return {}
+
+        rows = PartnerSlotOccupancy.objects.filter(
+            partner_id__in=list(partner_ids),
+            slot_start__gte=buckets[0],
+            slot_start__lte=buckets[-1],
+        ).values_list("partner_id", "slot_start", "reserved_seats", "confirmed_seats")
+        return {
+            (partner_id, slot_start): (reserved, confirmed)
+            for partner_id, slot_start, reserved, confirmed in rows
+        }
+
+    # ==========================================================================
+    # CACHE VERSIONING
+    # ==========================================================================
+
+    @staticmethod
+    def get_cache_versions(partner_ids):
+        """
+        Get the cache version of several partners (one cache round-trip).
+
+        Data derived from the ledger can be cached under a key that includes
+        this version: any event or booking change of the partner makes it stale.
+
+        Args:
+            partner_ids (iterable): Partner primary keys
+
+        Returns:
+            dict: {partner_id: version}
+        """
+        keys = {pid: CACHE_VERSION_KEY.format(partner_id=pid) for pid in partner_ids}
+        stored = cache.get_many(list(keys.values()))
+
+        versions, missing = {}, {}
+        for pid, key in keys.items():
+            if key in stored:
+                versions[pid] = stored[key]
+            else:
+                versions[pid] = missing[key] = uuid4().hex
+        if missing:
+            cache.set_many(missing, timeout=None)
+        return versions
+
+    @staticmethod
+    def invalidate_cache(partner_ids):
+        """
+        Change the cache version of partners once the current transaction commits.
+
+        Bumping after commit guarantees a reader cannot cache pre-commit data
+        under the new version.
+
+        Args:
+            partner_ids (iterable): Partner primary keys
+        """
+        keys = [CACHE_VERSION_KEY.format(partner_id=pid) for pid in set(partner_ids)]
+        if keys:
+            transaction.on_commit(lambda: cache.delete_many(keys))
+
+    # ==========================================================================
+    # WRITES
+    # ==========================================================================
+
+    @staticmethod
+    @transaction.atomic
+    def refresh_slots(partner_id, buckets):
+        """
+        Recompute the given buckets of a partner from the events table.
+
+        The bucket rows are created if missing and locked (SELECT ... FOR UPDATE)
+        before the recount, so concurrent writers on the same slot serialize and
+        each one counts the bookings committed by the previous one.
+
+        Args:
+            partner_id (int): Partner primary key
+            buckets (iterable): Hour bucket starts to recompute
+
+        Returns:
+            list: Updated PartnerSlotOccupancy rows
+        """
+        from partners.models import PartnerSlotOccupancy
+
+        buckets = sorted(set(buckets))
+        if not buckets:
+            return []
+
+        PartnerSlotOccupancy.objects.bulk_create(
+            [PartnerSlotOccupancy(partner_id=partner_id, slot_start=b) for b in buckets],
+            ignore_conflicts=True,
+        )
+        rows = list(
+            PartnerSlotOccupancy.objects.select_for_update()
+            .filter(partner_id=partner_id, slot_start__in=buckets)
+            .order_by("slot_start")
+        )
+
+        events = OccupancyService._active_events().filter(partner_id=partner_id).overlapping(
+            buckets[0], buckets[-1] + SLOT_BUCKET
+        )
+        counters = defaultdict(lambda: [0, 0])
+        OccupancyService._accumulate(events, counters, only_buckets=set(buckets))
+
+        now = timezone.now()
+        for row in rows:
+            row.reserved_seats, row.confirmed_seats = counters[(partner_id, row.slot_start)]
+            row.updated_at = now
+        PartnerSlotOccupancy.objects.bulk_update(
+            rows, ["reserved_seats", "confirmed_seats", "updated_at"]
+        )
+        OccupancyService.invalidate_cache([partner_id])
+        return rows
+
+    @staticmethod
+    @transaction.atomic
+    def allocate_event_seats(partner, datetime_start, create_event):
+        """
+        Allocate seats for a new event on a slot, serialized per (partner, slot).
+
+        Locks the ledger buckets of the slot (SELECT ... FOR UPDATE), recounts
+        them from the events table, then lets `create_event` insert the event
+        while the lock is held. Competing allocations on the same partner and
+        slot wait for each other instead of both passing the capacity check;
+        other slots and partners are not blocked. The lock is released when
+        the surrounding transaction commits.
+
+        Business Rules:
+            - Seats left = partner.capacity - reserved seats (max_participants
+              of overlapping active events)
+            - Per-event capacity = min(6, seats left), at least 3 required
+
+        Args:
+            partner (Partner): Venue
+            datetime_start (datetime): Event start (timezone-aware)
+            create_event (callable): Called with the allocated per-event
+                capacity; must create and return the event
+
+        Returns:
+            Event: Result of create_event
+
+        Raises:
+            InsufficientCapacityError: If fewer than 3 seats are left once locked
+
+        Example:
+            >>> event = OccupancyService.allocate_event_seats(
+            ...     partner, start,
+            ...     lambda seats: Event.objects.create(..., max_participants=seats),
+            ... )
+        """
+        from common.constants import MIN_PARTICIPANTS_PER_EVENT
+        from common.exceptions import InsufficientCapacityError
+
+        rows = OccupancyService.refresh_slots(
+            partner.pk, OccupancyService.event_buckets(datetime_start)
+        )
+        reserved = max(row.reserved_seats for row in rows)
+        available = max(0, partner.capacity - reserved)
+        seats = min(MAX_PARTICIPANTS_PER_EVENT, available)
+
+        if seats < MIN_PARTICIPANTS_PER_EVENT:
+            raise InsufficientCapacityError(
+                f"Partner '{partner.name}' has insufficient capacity for this time slot. "
+                f"Available: {available} seats, Minimum required: {MIN_PARTICIPANTS_PER_EVENT} seats."
+            )
+        return create_event(seats)
+
+    @staticmethod
+    def refresh_for_windows(windows):
+        """
+        Recompute the buckets occupied by events starting at the given times.
+
+        Args:
+            windows (iterable): (partner_id, datetime_start) pairs
+        """
+        by_partner = defaultdict(set)
+        for partner_id, datetime_start in windows:
+            if partner_id and datetime_start:
+                by_partner[partner_id].update(OccupancyService.event_buckets(datetime_start))
+
+        for partner_id, buckets in by_partner.items():
+            OccupancyService.refresh_slots(partner_id, buckets)
+
+    @staticmethod
+    def refresh_for_event(event, previous=None):
+        """
+        Bring the ledger up to date after an event or one of its bookings changed.
+
+        Args:
+            event (Event): Event instance (may already be deleted)
+            previous (tuple): Optional (partner_id, datetime_start) the event
+                occupied before the change, when it was moved
+
+        Example:
+            >>> event.status = Event.Status.CANCELLED
+            >>> event.save(update_fields=["status"])
+            >>> OccupancyService.refresh_for_event(event)
+        """
+        windows = [(event.partner_id, event.datetime_start)]
+        if previous and tuple(previous) != windows[0]:
+            windows.append(tuple(previous))
+        OccupancyService.refresh_for_windows(windows)
+
+    # ==========================================================================
+    # REBUILD / VERIFY
+    # ==========================================================================
+
+    @staticmethod
+    def compute_expected(partner_id=None):
+        """
+        Compute the ledger from scratch.
+
+        Args:
+            partner_id (int): Optional partner to restrict the computation to
+
+        Returns:
+            dict: {(partner_id, bucket): [reserved_seats, confirmed_seats]}
+        """
+        events = OccupancyService._active_events()
+        if partner_id:
+            events = events.filter(partner_id=partner_id)
+
+        counters = defaultdict(lambda: [0, 0])
+        OccupancyService._accumulate(events.iterator(), counters)
+        return counters
+
+    @staticmethod
+    def verify(partner_id=None):
+        """
+        Compare the stored ledger with a full recomputation.
+
+        Args:
+            partner_id (int): Optional partner to restrict the check to
+
+        Returns:
+            list: Drifted buckets as dicts with partner_id, slot_start,
+                  expected (reserved, confirmed) and stored (reserved, confirmed)
+        """
+        from partners.models import PartnerSlotOccupancy
+
+        expected = OccupancyService.compute_expected(partner_id)
+        stored_qs = PartnerSlotOccupancy.objects.all()
+        if partner_id:
+            stored_qs = stored_qs.filter(partner_id=partner_id)
+        stored = {
+            (p, slot): (reserved, confirmed)
+            for p, slot, reserved, confirmed in stored_qs.values_list(
+                "partner_id", "slot_start", "reserved_seats", "confirmed_seats"
+            ).iterator()
+        }
+
+        drift = []
+        for key in sorted(set(expected) | set(stored)):
+            want = tuple(expected.get(key, (0, 0)))
+            have = stored.get(key, (0, 0))
+            if want != have:
+                drift.append({
+                    "partner_id": key[0],
+                    "slot_start": key[1],
+                    "expected": want,
+                    "stored": have,
+                })
+        return drift
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(partner_id=None):
+        """
+        Replace the stored ledger with a full recomputation.
+
+        Args:
+            partner_id (int): Optional partner to restrict the rebuild to
+
+        Returns:
+            int: Number of bucket rows written
+        """
+        from partners.models import PartnerSlotOccupancy
+
+        expected = OccupancyService.compute_expected(partner_id)
+
+        stale = PartnerSlotOccupancy.objects.all()
+        if partner_id:
+            stale = stale.filter(partner_id=partner_id)
+        touched = set(stale.order_by().values_list("partner_id", flat=True).distinct())
+        touched.update(p for p, _ in expected)
+        stale.delete()
+        OccupancyService.invalidate_cache(touched)
+
+        rows = [
+            PartnerSlotOccupancy(
+                partner_id=p,
+                slot_start=slot,
+                reserved_seats=reserved,
+                confirmed_seats=confirmed,
+            )
+            for (p, slot), (reserved, confirmed) in expected.items()
+        ]
+        PartnerSlotOccupancy.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
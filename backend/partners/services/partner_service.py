@@ -30,11 +30,24 @@ USAGE EXAMPLE:
     ...     print(f"Cannot host: {error}")
 """
 
-from datetime import timedelta
-from django.db.models import Prefetch
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
 
 from common.services.base import BaseService
-from common.constants import DEFAULT_EVENT_DURATION_HOURS
+from common.constants import (
+    AVAILABILITY_CACHE_TIMEOUT,
+    AVAILABILITY_FIRST_SLOT_HOUR,
+    AVAILABILITY_LAST_SLOT_HOUR,
+    DEFAULT_EVENT_DURATION_HOURS,
+    MAX_PARTICIPANTS_PER_EVENT,
+    MIN_ADVANCE_BOOKING_HOURS,
+    MIN_PARTICIPANTS_PER_EVENT,
+)
+
+# Reserved seats of one partner for one day, valid for one ledger version
+AVAILABILITY_CACHE_KEY = "partners:availability:{partner_id}:{day}:{version}"
 
 
 class PartnerService(BaseService):
@@ -65,14 +78,13 @@ class PartnerService(BaseService):
                 available_capacity = partner.capacity - sum(confirmed_bookings_in_overlapping_events)
 
         Algorithm:
-            1. Find all PUBLISHED/PENDING_CONFIRMATION events at this partner
-            2. Filter to only events overlapping with [datetime_start, datetime_end]
-            3. Count confirmed bookings in each overlapping event
-            4. Return: partner.capacity - total_confirmed_bookings
+            1. Read the PartnerSlotOccupancy buckets touched by the time slot
+            2. Take the peak confirmed seats of PUBLISHED/PENDING_CONFIRMATION events
+            3. Return: partner.capacity - peak_confirmed_bookings
 
         Optimization:
-            Uses prefetch_related() to avoid N+1 queries when counting bookings.
-            Single database query fetches all events with their confirmed bookings.
+            Reads the slot occupancy ledger (see OccupancyService) instead of
+            scanning every event of the venue: one indexed query per call.
 
         Args:
             partner (Partner): Partner instance to check capacity for
@@ -110,34 +122,10 @@ class PartnerService(BaseService):
             - partners.models.Partner.get_available_capacity() (delegate)
             - Event creation validation
         """
-        from events.models import Event
-        from bookings.models import Booking, BookingStatus
-
-        # Get all potentially overlapping events at this partner
-        # Use prefetch_related to avoid N+1 queries on bookings
-        potential_events = Event.objects.filter(
-            partner=partner,
-            status__in=['PUBLISHED', 'PENDING_CONFIRMATION']  # Only count active events
-        ).prefetch_related(
-            Prefetch(
-                'bookings',
-                queryset=Booking.objects.filter(status=BookingStatus.CONFIRMED),
-                to_attr='confirmed_bookings'
-            )
-        )
-
-        # Filter to only truly overlapping events and count bookings
-        total_reserved = 0
-        for event in potential_events:
-            event_end = event.datetime_start + timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
-
-            # Check if event overlaps with requested time slot
-            if event.datetime_start < datetime_end and event_end > datetime_start:
-                # Use prefetched confirmed_bookings (no additional query)
-                confirmed_count = len(event.confirmed_bookings)
-                total_reserved += confirmed_count
+        from partners.services.occupancy_service import OccupancyService
 
-        return max(0, partner.capacity - total_reserved)
+        _, confirmed = OccupancyService.get_slot_load(partner, datetime_start, datetime_end)
+        return max(0, partner.capacity - confirmed)
 
     @staticmethod
     def get_reserved_capacity_by_events(partner, datetime_start, datetime_end, exclude_event_id=None):
@@ -150,6 +138,9 @@ class PartnerService(BaseService):
             exceed the partner's capacity. CANCELLED and FINISHED events do not
             reserve capacity.
 
+            Read from the slot occupancy ledger (peak of the hour buckets
+            touched by the slot), see OccupancyService.
+
         Args:
             partner: Partner instance
             datetime_start: Start of the slot
@@ -159,35 +150,12 @@ class PartnerService(BaseService):
         Returns:
             int: Total reserved capacity across overlapping events
         """
-        from events.models import Event
-
-        active_statuses = [
-            Event.Status.DRAFT,
-            Event.Status.PENDING_CONFIRMATION,
-            Event.Status.PUBLISHED,
-        ]
+        from partners.services.occupancy_service import OccupancyService
 
-        events = Event.objects.filter(
-            partner=partner,
-            status__in=active_statuses,
+        reserved, _ = OccupancyService.get_slot_load(
+            partner, datetime_start, datetime_end, exclude_event_id=exclude_event_id
         )
-        if exclude_event_id:
-            events = events.exclude(id=exclude_event_id)
-
-        total_reserved = 0
-        from datetime import timedelta
-        from common.constants import DEFAULT_EVENT_DURATION_HOURS
-        for ev in events:
-            ev_end = ev.datetime_start + timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
-            if ev.datetime_start < datetime_end and ev_end > datetime_start:
-                # Reserve per-event capacity (fallback to 6 if not set)
-                try:
-                    per_event_cap = int(getattr(ev, 'max_participants', 6) or 6)
-                except Exception:
-                    per_event_cap = 6
-                total_reserved += max(0, per_event_cap)
-
-        return total_reserved
+        return reserved
 
     @staticmethod
     def get_available_capacity_by_reservations(partner, datetime_start, datetime_end, exclude_event_id=None):
@@ -201,6 +169,173 @@ class PartnerService(BaseService):
         )
         return max(0, partner.capacity - reserved)
 
+    @staticmethod
+    def get_availability_grid(partners, start_date, end_date):
+        """
+        Compute the hourly availability grid of several partners over a date range.
+
+        Business Rules:
+            - Slots start every hour from 12:00 to 21:00 (local time), 1h each
+            - Remaining capacity = partner.capacity - reserved seats of
+              overlapping active events (sum of max_participants)
+            - Per-event cap is min(6, remaining); an event needs at least 3 seats
+            - Slots < 3h from now are not creatable
+
+        Optimization:
+            The reserved seats of every (partner, day) are cached under the
+            partner's ledger version (see OccupancyService.get_cache_versions),
+            so they stay valid until the partner's next event/booking change.
+            Cache misses are filled from ONE query over the slot occupancy
+            ledger for all missing partners and days.
+
+        Args:
+            partners (iterable): Partner instances
+            start_date (date): First day (inclusive)
+            end_date (date): Last day (inclusive)
+
+        Returns:
+            dict: {partner_id: [{"date": "YYYY-MM-DD", "slots": [...]}, ...]}
+                  Each slot: time, capacity_remaining, event_capacity_max, can_create
+
+        Example:
+            >>> grid = PartnerService.get_availability_grid([partner], today, today)
+            >>> grid[partner.id][0]["slots"][0]
+            {'time': '12:00', 'capacity_remaining': 44, 'event_capacity_max': 6, 'can_create': True}
+        """
+        from partners.services.occupancy_service import OccupancyService
+
+        tz = timezone.get_current_timezone()
+        duration = timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
+        hours = range(AVAILABILITY_FIRST_SLOT_HOUR, AVAILABILITY_LAST_SLOT_HOUR + 1)
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        slot_starts = {
+            day: [
+                timezone.make_aware(datetime(day.year, day.month, day.day, hour), tz)
+                for hour in hours
+            ]
+            for day in days
+        }
+
+        partners = list(partners)
+        versions = OccupancyService.get_cache_versions([p.pk for p in partners])
+        keys = {
+            (p.pk, day): AVAILABILITY_CACHE_KEY.format(
+                partner_id=p.pk, day=day.isoformat(), version=versions[p.pk]
+            )
+            for p in partners
+            for day in days
+        }
+        cached = cache.get_many(list(keys.values()))
+        reserved = {pair: cached[key] for pair, key in keys.items() if key in cached}
+
+        missing = [pair for pair in keys if pair not in reserved]
+        if missing:
+            missing_days = sorted({day for _, day in missing})
+            loads = OccupancyService.get_slots_load(
+                {pid for pid, _ in missing},
+                slot_starts[missing_days[0]][0],
+                slot_starts[missing_days[-1]][-1] + duration,
+            )
+            to_cache = {}
+            for pid, day in missing:
+                reserved[(pid, day)] = [
+                    max(
+                        loads.get((pid, bucket), (0, 0))[0]
+                        for bucket in OccupancyService.buckets_for_range(start, start + duration)
+                    )
+                    for start in slot_starts[day]
+                ]
+                to_cache[keys[(pid, day)]] = reserved[(pid, day)]
+            cache.set_many(to_cache, timeout=AVAILABILITY_CACHE_TIMEOUT)
+
+        # Time-dependent rules are applied after the cache
+        now = timezone.now()
+        grid = {}
+        for partner in partners:
+            grid[partner.pk] = []
+            for day in days:
+                slots = []
+                for start, seats in zip(slot_starts[day], reserved[(partner.pk, day)]):
+                    remaining = max(0, partner.capacity - seats)
+                    event_cap = min(MAX_PARTICIPANTS_PER_EVENT, remaining)
+                    hours_until = (start - now).total_seconds() / 3600.0
+                    slots.append({
+                        "time": start.strftime("%H:%M"),
+                        "capacity_remaining": remaining,
+                        "event_capacity_max": event_cap,
+                        "can_create": (
+                            hours_until >= MIN_ADVANCE_BOOKING_HOURS
+                            and event_cap >= MIN_PARTICIPANTS_PER_EVENT
+                        ),
+                    })
+                grid[partner.pk].append({"date": day.isoformat(), "slots": slots})
+        return grid
+
+    @staticmethod
+    def find_available_partners(datetime_start, city=None, min_seats=MIN_PARTICIPANTS_PER_EVENT):
+        """
+        Find active partners able to host an event at a given time.
+
+        Business Rules:
+            A venue qualifies when it has at least `min_seats` (never less
+            than MIN_PARTICIPANTS_PER_EVENT) seats left on the slot. Seats
+            left = capacity - reserved seats, i.e. the sum of
+            max_participants of overlapping active events, as when creating
+            an event (get_available_capacity_by_reservations()). This is
+            stricter than can_host_event(), which only counts confirmed
+            bookings.
+
+        Optimization:
+            Remaining capacity of every partner is computed in ONE query:
+            the partner queryset is annotated with the peak reserved seats of
+            the slot occupancy ledger buckets touched by the slot.
+
+        Args:
+            datetime_start (datetime): Proposed event start (timezone-aware)
+            city (str): Optional city filter (case-insensitive)
+            min_seats (int): Minimum free seats required (default: 3)
+
+        Returns:
+            QuerySet: Partners annotated with reserved_seats and available_seats,
+                      ranked by available_seats (desc), then reputation and name
+
+        Example:
+            >>> venues = PartnerService.find_available_partners(start, city="Brussels", min_seats=6)
+            >>> [(p.name, p.available_seats) for p in venues]
+            [('Bar du Centre', 44), ('Café Central', 12)]
+        """
+        from django.db.models import F, IntegerField, Max, OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+        from partners.models import Partner, PartnerSlotOccupancy
+        from partners.services.occupancy_service import OccupancyService
+
+        datetime_end = datetime_start + timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
+        buckets = OccupancyService.buckets_for_range(datetime_start, datetime_end)
+        min_seats = max(int(min_seats), MIN_PARTICIPANTS_PER_EVENT)
+
+        peak_reserved = (
+            PartnerSlotOccupancy.objects.filter(partner=OuterRef("pk"), slot_start__in=buckets)
+            .order_by()
+            .values("partner")
+            .annotate(peak=Max("reserved_seats"))
+            .values("peak")
+        )
+
+        queryset = Partner.objects.filter(is_active=True)
+        if city:
+            queryset = queryset.filter(city__iexact=city)
+
+        return (
+            queryset.annotate(
+                reserved_seats=Coalesce(
+                    Subquery(peak_reserved, output_field=IntegerField()), Value(0)
+                )
+            )
+            .annotate(available_seats=F("capacity") - F("reserved_seats"))
+            .filter(available_seats__gte=min_seats)
+            .order_by("-available_seats", "-reputation", "name")
+        )
+
     @staticmethod
     def search_partners(search_query, active_only=True):
         """
@@ -0,0 +1,146 @@
+"""Tests for the partner slot occupancy ledger."""
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from bookings.models import Booking, BookingStatus
+from events.models import Event
+from events.services import EventService
+from languages.models import Language
+from partners.models import Partner, PartnerSlotOccupancy
+from partners.services import OccupancyService, PartnerService
+
+User = get_user_model()
+
+
+class OccupancyServiceTests(TestCase):
+    """Test ledger maintenance and capacity reads."""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            email="orga@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.participant = User.objects.create_user(
+            email="guest@example.com", password="testpass123", age=25, consent_given=True
+        )
+        self.language = Language.objects.create(
+            code="fr", label_fr="Francais", label_en="French", label_nl="Frans"
+        )
+        self.partner = Partner.objects.create(
+            name="Test Bar", address="Rue Test 123", capacity=20, is_active=True
+        )
+        self.start = (timezone.now() + timedelta(days=2)).replace(
+            hour=18, minute=0, second=0, microsecond=0
+        )
+        self.end = self.start + timedelta(hours=1)
+
+    def _event(self, start=None, status=Event.Status.PUBLISHED, max_participants=6):
+        return Event.objects.create(
+            organizer=self.organizer,
+            partner=self.partner,
+            language=self.language,
+            theme="Ledger",
+            difficulty="easy",
+            datetime_start=start or self.start,
+            status=status,
+            max_participants=max_participants,
+        )
+
+    def _confirm(self, event, user=None):
+        return Booking.objects.create(
+            user=user or self.participant,
+            event=event,
+            amount_cents=700,
+            status=BookingStatus.CONFIRMED,
+        )
+
+    def test_event_creation_reserves_seats(self):
+        """Creating an active event fills its bucket."""
+        self._event(max_participants=5)
+        self._event()
+
+        self.assertEqual(
+            PartnerService.get_reserved_capacity_by_events(self.partner, self.start, self.end), 11
+        )
+        self.assertEqual(
+            PartnerService.get_available_capacity_by_reservations(self.partner, self.start, self.end), 9
+        )
+
+    def test_exclude_event_id(self):
+        """An excluded event does not count against its own slot."""
+        event = self._event(max_participants=5)
+        self._event()
+
+        reserved = PartnerService.get_reserved_capacity_by_events(
+            self.partner, self.start, self.end, exclude_event_id=event.id
+        )
+        self.assertEqual(reserved, 6)
+
+    def test_confirmed_booking_updates_available_capacity(self):
+        """Confirmed bookings are counted, cancelled ones released."""
+        event = self._event()
+        booking = self._confirm(event)
+        self._confirm(event, user=self.organizer)
+
+        self.assertEqual(PartnerService.get_available_capacity(self.partner, self.start, self.end), 18)
+
+        booking.mark_cancelled()
+        self.assertEqual(PartnerService.get_available_capacity(self.partner, self.start, self.end), 19)
+
+    def test_cancelled_event_releases_seats(self):
+        """Cancelling an event empties its bucket."""
+        event = self._event()
+        self._confirm(event)
+
+        event.status = Event.Status.CANCELLED
+        event.save(update_fields=["status", "updated_at"])
+
+        self.assertEqual(OccupancyService.get_slot_load(self.partner, self.start, self.end), (0, 0))
+
+    def test_moved_event_releases_previous_slot(self):
+        """Moving an event frees the old bucket and fills the new one."""
+        event = self._event()
+        event.datetime_start = self.start + timedelta(hours=2)
+        event.save()
+
+        self.assertEqual(OccupancyService.get_slot_load(self.partner, self.start, self.end), (0, 0))
+        later = OccupancyService.get_slot_load(
+            self.partner, self.start + timedelta(hours=2), self.end + timedelta(hours=2)
+        )
+        self.assertEqual(later, (6, 0))
+
+    def test_unaligned_event_occupies_both_buckets(self):
+        """An event starting at :30 counts in both hours it touches."""
+        self._event(start=self.start + timedelta(minutes=30))
+
+        self.assertEqual(OccupancyService.get_slot_load(self.partner, self.start, self.end)[0], 6)
+        self.assertEqual(
+            OccupancyService.get_slot_load(self.partner, self.end, self.end + timedelta(hours=1))[0], 6
+        )
+
+    def test_deleted_event_releases_seats(self):
+        """Deleting an event (including bulk draft cleanup) empties its bucket."""
+        self._event(status=Event.Status.DRAFT).delete()
+        self.assertEqual(OccupancyService.get_slot_load(self.partner, self.start, self.end), (0, 0))
+
+        past = timezone.now() - timedelta(hours=2)
+        self._event(start=past, status=Event.Status.DRAFT)
+        EventService.cleanup_expired_drafts()
+        self.assertEqual(OccupancyService.get_slot_load(self.partner, past, past + timedelta(hours=1)), (0, 0))
+
+    def test_rebuild_and_verify_command(self):
+        """The command reports drift and repairs it."""
+        self._confirm(self._event())
+        PartnerSlotOccupancy.objects.update(reserved_seats=0)
+
+        out = StringIO()
+        call_command("rebuild_slot_occupancy", "--verify", stdout=out)
+        self.assertIn("1 slot bucket(s) out of sync", out.getvalue())
+
+        call_command("rebuild_slot_occupancy", stdout=StringIO())
+        self.assertEqual(OccupancyService.verify(), [])
+        self.assertEqual(OccupancyService.get_slot_load(self.partner, self.start, self.end), (6, 1))
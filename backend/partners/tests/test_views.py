@@ -1,5 +1,10 @@
 """Tests for Partner views."""
+from datetime import datetime, timedelta
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -108,9 +113,182 @@ class PartnerViewSetTests(TestCase):
 
         self.assertNotIn('api_key', response.data)
 
+    def test_list_conditional_get(self):
+        """Unchanged partners answer 304 to If-None-Match / If-Modified-Since."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url)
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(any('"partners_partner"."name"' in q['sql'] for q in ctx.captured_queries))
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.active_partner.name = "Renamed Bar"
+        self.active_partner.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve_conditional_get(self):
+        """Detail ETags are per partner; unknown partners still 404."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse("partner-detail", args=[self.active_partner.pk])
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        missing = reverse("partner-detail", args=[9999])
+        self.assertEqual(self.client.get(missing, HTTP_IF_NONE_MATCH=etag).status_code, 404)
+        self.assertEqual(self.client.get("/api/v1/partners/abc/").status_code, 404)
+
     def test_create_partner_forbidden_for_non_admin(self):
         """Test creating a partner is forbidden for non-admin users."""
         self.client.force_authenticate(user=self.user)  
         data = {"name": "New Bar", "address": "Rue X", "city": "Brussels", "capacity": 40}
         response = self.client.post(self.url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AvailabilityFixturesMixin:
+    """Partners, organizer and helpers shared by the availability tests."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+
+        self.client = APIClient()
+        self.lang = Language.objects.create(
+            code="fr", label_fr="Français", label_en="French", label_nl="Frans"
+        )
+        self.user = User.objects.create_user(
+            email="test@example.com", password="testpass123", age=25
+        )
+        self.client.force_authenticate(user=self.user)
+        self.bar = Partner.objects.create(name="Bar", address="Rue 1", capacity=20, is_active=True)
+        self.cafe = Partner.objects.create(name="Cafe", address="Rue 2", capacity=12, is_active=True)
+        self.day = (timezone.localdate() + timedelta(days=2))
+
+    @staticmethod
+    def _ledger_queries(ctx):
+        return sum("partners_partnerslotoccupancy" in q["sql"] for q in ctx.captured_queries)
+
+    def _event_at(self, partner, hour, max_participants=6):
+        from events.models import Event
+
+        start = timezone.make_aware(datetime(self.day.year, self.day.month, self.day.day, hour))
+        return Event.objects.create(
+            organizer=self.user, partner=partner, language=self.lang, theme="T",
+            difficulty="easy", datetime_start=start, max_participants=max_participants,
+            status=Event.Status.PUBLISHED,
+        )
+
+
+class PartnerAvailabilityTests(AvailabilityFixturesMixin, TestCase):
+    """Test the availability endpoints."""
+
+    def test_single_date_keeps_slot_list_shape(self):
+        """?date= returns the slots of that day."""
+        self._event_at(self.bar, 18, max_participants=5)
+        url = reverse("partner-availability", args=[self.bar.pk])
+        response = self.client.get(url, {"date": self.day.isoformat()})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["slots"]), 10)
+        slot = next(s for s in response.data["slots"] if s["time"] == "18:00")
+        self.assertEqual(slot["capacity_remaining"], 15)
+        self.assertEqual(slot["event_capacity_max"], 6)
+        self.assertTrue(slot["can_create"])
+
+    def test_grid_for_several_partners_and_days(self):
+        """The grid covers every partner × day × slot with a constant number of queries."""
+        self._event_at(self.cafe, 12, max_participants=6)
+        self._event_at(self.cafe, 12, max_participants=4)
+        url = reverse("partner-availability-grid")
+        params = {
+            "partners": f"{self.bar.pk},{self.cafe.pk}",
+            "start_date": self.day.isoformat(),
+            "end_date": (self.day + timedelta(days=2)).isoformat(),
+        }
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+
+        self.assertEqual(self._ledger_queries(ctx), 1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        grid = {p["partner"]: p["days"] for p in response.data["partners"]}
+        self.assertEqual(len(grid[self.bar.pk]), 3)
+        noon = grid[self.cafe.pk][0]["slots"][0]
+        self.assertEqual(noon["capacity_remaining"], 2)
+        self.assertFalse(noon["can_create"])
+
+    def test_grid_is_cached_until_partner_changes(self):
+        """A cached grid is reused, then invalidated by a new event."""
+        url = reverse("partner-availability", args=[self.bar.pk])
+        params = {"date": self.day.isoformat()}
+        self.client.get(url, params)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+        self.assertEqual(self._ledger_queries(ctx), 0)
+        self.assertEqual(response.data["slots"][0]["capacity_remaining"], 20)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._event_at(self.bar, 12)
+        response = self.client.get(url, params)
+        self.assertEqual(response.data["slots"][0]["capacity_remaining"], 14)
+
+    def test_range_longer_than_horizon_rejected(self):
+        """A range beyond the booking horizon is refused."""
+        url = reverse("partner-availability", args=[self.bar.pk])
+        response = self.client.get(url, {
+            "start_date": self.day.isoformat(),
+            "end_date": (self.day + timedelta(days=10)).isoformat(),
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PartnerVenueFinderTests(AvailabilityFixturesMixin, TestCase):
+    """Test the /partners/available/ venue finder."""
+
+    def _slot(self, hour=18):
+        return timezone.make_aware(datetime(self.day.year, self.day.month, self.day.day, hour))
+
+    def test_ranked_by_free_seats(self):
+        """Venues are ranked by free seats on the slot, full venues excluded."""
+        self._event_at(self.bar, 18, max_participants=6)
+        self._event_at(self.cafe, 18, max_participants=6)
+        self._event_at(self.cafe, 18, max_participants=4)
+        url = reverse("partner-available")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, {"datetime": self._slot().isoformat()})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(p["id"], p["available_seats"]) for p in response.data["results"]],
+            [(self.bar.pk, 14)],
+        )
+        self.assertEqual(self._ledger_queries(ctx), 1)
+
+    def test_city_and_min_seats_filters(self):
+        """City and min_seats narrow the results."""
+        self.cafe.city = "Liège"
+        self.cafe.save()
+        url = reverse("partner-available")
+        params = {"datetime": self._slot().isoformat(), "city": "liège"}
+
+        response = self.client.get(url, params)
+        self.assertEqual([p["id"] for p in response.data["results"]], [self.cafe.pk])
+        self.assertEqual(response.data["results"][0]["event_capacity_max"], 6)
+
+        response = self.client.get(url, {**params, "min_seats": 13})
+        self.assertEqual(response.data["results"], [])
+
+    def test_invalid_datetime_rejected(self):
+        """Outside business hours is refused like event creation."""
+        url = reverse("partner-available")
+        response = self.client.get(url, {"datetime": self._slot(hour=23).isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -2,15 +2,15 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.utils import timezone
-from datetime import datetime, timedelta
+from datetime import datetime
 from drf_spectacular.utils import (
-    extend_schema, extend_schema_view, OpenApiResponse, OpenApiExample
+    extend_schema, extend_schema_view, OpenApiResponse, OpenApiExample, OpenApiParameter
 )
 from .models import Partner
-from .serializers import PartnerSerializer
+from .serializers import PartnerSerializer, PartnerAvailabilitySerializer
 from .permissions import IsPartnerOwnerOnly
 from common.permissions import IsAuthenticatedAndActive, IsAdminUser
+from common.mixins import ConditionalGetMixin
 
 
 @extend_schema_view(
@@ -92,7 +92,7 @@ from common.permissions import IsAuthenticatedAndActive, IsAdminUser
     ),
 )
 @extend_schema(tags=["Partners"])
-class PartnerViewSet(viewsets.ModelViewSet):
+class PartnerViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     Partner venue ViewSet.
 
@@ -105,6 +105,9 @@ class PartnerViewSet(viewsets.ModelViewSet):
     Queryset filtering:
         - GET operations (list/retrieve): Only active partners
         - Other operations (create/update/delete): All partners
+
+    Conditional GET:
+        - list/retrieve answer 304 when max(updated_at) and count are unchanged
     """
 
     serializer_class = PartnerSerializer
@@ -153,83 +156,235 @@ class PartnerViewSet(viewsets.ModelViewSet):
         # Default: all partners (for admin)
         return Partner.objects.all()
 
+    def get_conditional_state(self, request):
+        """Validators from max(updated_at) and count of the listed partners."""
+        from django.db.models import Count, Max
+
+        queryset = self.get_queryset()
+        if self.action == "retrieve":
+            queryset = self.get_conditional_object_queryset(queryset)
+            if queryset is None:
+                return None
+        stats = queryset.aggregate(last_modified=Max("updated_at"), count=Count("id"))
+        if not stats["count"]:
+            return None
+        return (stats["last_modified"].isoformat(), stats["count"]), stats["last_modified"]
+
+    AVAILABILITY_RULES = (
+        "Rules:\n"
+        "- Event duration = 1h\n"
+        "- Business hours: start at 12:00..20:59, 21:00 allowed (exact)\n"
+        "- Partner capacity respected across overlapping events (sum of max_participants)\n"
+        "- New event requires at least 3 seats available; per-event cap is min(6, remaining)\n"
+        "- Slots < 3h from now are not creatable"
+    )
+
+    AVAILABILITY_PARAMETERS = [
+        OpenApiParameter("date", str, description="Single day (YYYY-MM-DD)"),
+        OpenApiParameter("start_date", str, description="First day of the range (YYYY-MM-DD)"),
+        OpenApiParameter("end_date", str, description="Last day of the range, inclusive (max 8 days)"),
+    ]
+
+    @staticmethod
+    def _parse_availability_range(params):
+        """
+        Parse the requested days from query params.
+
+        Accepts either `date` or `start_date` (+ optional `end_date`).
+        The range cannot exceed the booking horizon (MAX_FUTURE_BOOKING_DAYS + today).
+
+        Returns:
+            tuple: (start_date, end_date, error_response)
+        """
+        from common.constants import MAX_FUTURE_BOOKING_DAYS
+
+        start_str = params.get("start_date") or params.get("date")
+        end_str = params.get("end_date") or start_str
+        if not start_str:
+            return None, None, Response(
+                {"error": "Missing 'date' or 'start_date' (YYYY-MM-DD)"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
+            end_date = datetime.strptime(end_str, "%Y-%m-%d").date()
+        except ValueError:
+            return None, None, Response(
+                {"error": "Invalid date format. Expected YYYY-MM-DD."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if end_date < start_date:
+            return None, None, Response(
+                {"error": "'end_date' must be on or after 'start_date'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if (end_date - start_date).days > MAX_FUTURE_BOOKING_DAYS:
+            return None, None, Response(
+                {"error": f"Date range cannot exceed {MAX_FUTURE_BOOKING_DAYS + 1} days."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return start_date, end_date, None
+
     @extend_schema(
-        summary="Get partner availability for a given date",
+        summary="Get partner availability for a date or date range",
         description=(
-            "Returns hourly slots (12:00..21:00) for the requested date with remaining capacity "
-            "for the venue and the max per-event capacity allowed by business rules.\n\n"
-            "Rules:\n"
-            "- Event duration = 1h\n"
-            "- Business hours: start at 12:00..20:59, 21:00 allowed (exact)\n"
-            "- Partner capacity respected across overlapping events (sum of max_participants)\n"
-            "- New event requires at least 3 seats available; per-event cap is min(6, remaining)\n"
-            "- Slots < 3h from now are not creatable"
+            "Returns hourly slots (12:00..21:00) with remaining capacity for the venue "
+            "and the max per-event capacity allowed by business rules.\n\n"
+            "With `date`, returns the slots of that day. With `start_date`/`end_date`, "
+            "returns one entry per day (up to the 7-day booking horizon).\n\n"
+            + AVAILABILITY_RULES
         ),
-        parameters=[],
+        parameters=AVAILABILITY_PARAMETERS,
         responses={200: OpenApiResponse(description="Availability returned")},
     )
     @action(detail=True, methods=["GET"], url_path="availability")
     def availability(self, request, pk=None):
         partner = self.get_object()
 
-        date_str = request.query_params.get("date")
-        if not date_str:
-            return Response({"error": "Missing 'date' (YYYY-MM-DD)"}, status=status.HTTP_400_BAD_REQUEST)
+        start_date, end_date, error = self._parse_availability_range(request.query_params)
+        if error:
+            return error
 
-        # Parse date as naive date, then combine with hours and make aware
-        try:
-            year, month, day = map(int, date_str.split("-"))
-            base_date = datetime(year, month, day)
-        except Exception:
-            return Response({"error": "Invalid date format. Expected YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
-
-        from django.utils.timezone import is_naive, make_aware, get_current_timezone
-        tz = get_current_timezone()
-
-        # Build hourly slots: 12:00..21:00
-        slots = []
-        now = timezone.now()
-        from common.constants import (
-            DEFAULT_EVENT_DURATION_HOURS,
-            MIN_PARTICIPANTS_PER_EVENT as MIN_PAX,
-            MAX_PARTICIPANTS_PER_EVENT as MAX_PAX,
-            MIN_ADVANCE_BOOKING_HOURS,
+        from partners.services import PartnerService
+        days = PartnerService.get_availability_grid([partner], start_date, end_date)[partner.id]
+
+        if "date" in request.query_params and "start_date" not in request.query_params:
+            return Response(
+                {"date": days[0]["date"], "partner": partner.id, "slots": days[0]["slots"]},
+                status=200,
+            )
+        return Response(
+            {
+                "partner": partner.id,
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "days": days,
+            },
+            status=200,
         )
 
-        for hour in range(12, 22):  # 12..21 inclusive
-            minute = 0
-            # Business hours rule: 21:00 allowed only if exactly 21:00
-            if hour == 21:
-                minute = 0
-            elif hour > 21:
-                continue
-
-            dt_start = datetime(base_date.year, base_date.month, base_date.day, hour, minute, 0)
-            if is_naive(dt_start):
-                dt_start = make_aware(dt_start, tz)
-            dt_end = dt_start + timedelta(hours=DEFAULT_EVENT_DURATION_HOURS)
-
-            # 3h advance rule
-            hours_until = (dt_start - now).total_seconds() / 3600.0
-
-            from partners.services import PartnerService
-            remaining = PartnerService.get_available_capacity_by_reservations(
-                partner, dt_start, dt_end
+    @extend_schema(
+        summary="Get availability grid for several partners",
+        description=(
+            "Returns the hourly availability of several active partners over a date "
+            "range (up to the 7-day booking horizon), computed in a single query.\n\n"
+            "`partners` is a comma-separated list of partner ids (max 20).\n\n"
+            + AVAILABILITY_RULES
+        ),
+        parameters=[
+            OpenApiParameter("partners", str, required=True, description="Comma-separated partner ids"),
+            *AVAILABILITY_PARAMETERS,
+        ],
+        responses={200: OpenApiResponse(description="Availability grid returned")},
+    )
+    @action(detail=False, methods=["GET"], url_path="availability")
+    def availability_grid(self, request):
+        from common.constants import AVAILABILITY_MAX_PARTNERS
+
+        try:
+            partner_ids = [
+                int(pid) for pid in request.query_params.get("partners", "").split(",") if pid.strip()
+            ]
+        except ValueError:
+            return Response(
+                {"error": "'partners' must be a comma-separated list of ids."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not partner_ids:
+            return Response({"error": "Missing 'partners'."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(partner_ids) > AVAILABILITY_MAX_PARTNERS:
+            return Response(
+                {"error": f"At most {AVAILABILITY_MAX_PARTNERS} partners per request."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-            event_cap = min(MAX_PAX, max(0, int(remaining)))
-            can_create = (hours_until >= MIN_ADVANCE_BOOKING_HOURS) and (event_cap >= MIN_PAX)
+        start_date, end_date, error = self._parse_availability_range(request.query_params)
+        if error:
+            return error
 
-            slots.append(
-                {
-                    "time": f"{hour:02d}:{minute:02d}",
-                    "capacity_remaining": int(remaining),
-                    "event_capacity_max": int(event_cap),
-                    "can_create": bool(can_create),
-                }
+        partners = Partner.objects.filter(id__in=partner_ids, is_active=True).order_by("id")
+
+        from partners.services import PartnerService
+        grid = PartnerService.get_availability_grid(partners, start_date, end_date)
+
+        return Response(
+            {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "partners": [
+                    {"partner": partner_id, "days": days} for partner_id, days in grid.items()
+                ],
+            },
+            status=200,
+        )
+
+    @extend_schema(
+        summary="Find partners available at a given time",
+        description=(
+            "Returns the active partners able to host a new event at `datetime`, "
+            "ranked by free seats (then reputation).\n\n"
+            "Rules:\n"
+            "- Same scheduling rules as event creation (3h advance, 7-day horizon, 12:00..21:00)\n"
+            "- Free seats = capacity - sum of max_participants of overlapping active events\n"
+            "- `min_seats` defaults to (and cannot be lower than) 3"
+        ),
+        parameters=[
+            OpenApiParameter("datetime", str, required=True, description="Event start (ISO 8601)"),
+            OpenApiParameter("city", str, description="City (case-insensitive)"),
+            OpenApiParameter("min_seats", int, description="Minimum free seats (default 3)"),
+        ],
+        responses={
+            200: PartnerAvailabilitySerializer(many=True),
+            400: OpenApiResponse(description="Invalid parameters"),
+        },
+    )
+    @action(detail=False, methods=["GET"], url_path="available")
+    def available(self, request):
+        from django.core.exceptions import ValidationError
+        from django.utils.dateparse import parse_datetime
+        from django.utils.timezone import is_naive, make_aware
+        from common.constants import MIN_PARTICIPANTS_PER_EVENT
+        from events.validators import validate_event_datetime
+        from partners.services import PartnerService
+
+        raw_datetime = request.query_params.get("datetime")
+        try:
+            datetime_start = parse_datetime(raw_datetime or "")
+        except ValueError:
+            datetime_start = None
+        if datetime_start is None:
+            return Response(
+                {"error": "Missing or invalid 'datetime' (ISO 8601)."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
+        if is_naive(datetime_start):
+            datetime_start = make_aware(datetime_start)
 
-        return Response({"date": date_str, "partner": partner.id, "slots": slots}, status=200)
+        try:
+            min_seats = int(request.query_params.get("min_seats", MIN_PARTICIPANTS_PER_EVENT))
+        except ValueError:
+            return Response(
+                {"error": "'min_seats' must be an integer."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            validate_event_datetime(datetime_start)
+        except ValidationError as e:
+            return Response({"error": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        partners = PartnerService.find_available_partners(
+            datetime_start,
+            city=request.query_params.get("city"),
+            min_seats=min_seats,
+        )
+        serializer = PartnerAvailabilitySerializer(partners, many=True, context={"request": request})
+        return Response(
+            {"datetime": datetime_start.isoformat(), "results": serializer.data},
+            status=status.HTTP_200_OK,
+        )
 
     @extend_schema(
         summary="Get my partner details (owner only)",
@@ -286,8 +441,12 @@ class PartnerViewSet(viewsets.ModelViewSet):
             "- Only accessible to users who own a partner\n"
             "- Admin cannot access this endpoint\n"
             "- Returns all bookings (PENDING, CONFIRMED, CANCELLED) for events at this partner\n"
-            "- Ordered by event datetime (most recent first)"
+            "- Ordered by event datetime (most recent first)\n"
+            "- Plain list by default; `?cursor=` returns keyset pages (count: null)"
         ),
+        parameters=[
+            OpenApiParameter("cursor", str, description="Keyset pagination cursor (empty for the first page)"),
+        ],
         responses={
             200: OpenApiResponse(description="List of bookings for this partner"),
             403: OpenApiResponse(description="User is not a partner owner"),
@@ -303,19 +462,35 @@ class PartnerViewSet(viewsets.ModelViewSet):
             Admin is BLOCKED from this endpoint.
             Returns all bookings for events held at their venue.
 
+        Pagination:
+            Plain list by default; `?cursor=` returns keyset pages
+            ({"count": null, "next", "previous", "results"}).
+
         Returns:
             Response: List of bookings with event details
         """
+        from django.db.models import F
+        from bookings.models import Booking
+        from bookings.serializers import BookingSerializer
+        from common.pagination import KeysetPagination
+
         partner = request.user.owned_partner
 
         # Get all bookings for events at this partner
-        from bookings.models import Booking
         bookings = Booking.objects.filter(
             event__partner=partner
-        ).select_related('event', 'user').order_by('-event__datetime_start')
+        ).select_related('event', 'user').annotate(
+            event_start=F('event__datetime_start')
+        ).order_by('-event_start', 'id')
+
+        if 'cursor' in request.query_params:
+            paginator = KeysetPagination()
+            paginator.ordering = ('-event_start', 'id')
+            page = paginator.paginate_queryset(bookings, request, view=self)
+            serializer = BookingSerializer(page, many=True, context={'request': request})
+            return paginator.get_paginated_response(serializer.data)
 
         # Serialize bookings
-        from bookings.serializers import BookingSerializer
         serializer = BookingSerializer(bookings, many=True, context={'request': request})
 
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Payment
+from .models import Payment, RefundRequest, StripeWebhookEvent
 
 @admin.register(Payment)
 class PaymentAdmin(admin.ModelAdmin):
@@ -8,3 +8,21 @@ class PaymentAdmin(admin.ModelAdmin):
     list_filter = ("status", "currency", "created_at")
     search_fields = ("stripe_checkout_session_id", "stripe_payment_intent_id", "user__email", "booking__public_id")
     readonly_fields = ("created_at", "updated_at")
+
+
+@admin.register(RefundRequest)
+class RefundRequestAdmin(admin.ModelAdmin):
+    list_display = ("id", "booking", "status", "attempts", "next_attempt_at",
+                    "stripe_refund_id", "reason", "created_at")
+    list_filter = ("status", "reason", "created_at")
+    search_fields = ("idempotency_key", "stripe_refund_id", "booking__public_id")
+    readonly_fields = ("idempotency_key", "refund_payment", "created_at", "updated_at", "processed_at")
+
+
+@admin.register(StripeWebhookEvent)
+class StripeWebhookEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "stripe_event_id", "event_type", "ordering_key", "status",
+                    "attempts", "stripe_created", "received_at")
+    list_filter = ("status", "event_type", "received_at")
+    search_fields = ("stripe_event_id", "ordering_key")
+    readonly_fields = ("stripe_event_id", "payload", "received_at", "updated_at", "processed_at")
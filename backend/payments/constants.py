@@ -18,6 +18,20 @@ REQUIRE_TEST_MODE = True  # Force sk_test_ keys only (no real money)
 DEFAULT_SUCCESS_PATH = "/stripe/success"
 DEFAULT_CANCEL_PATH = "/stripe/cancel"
 
+# ==============================================================================
+# STRIPE CLIENT (payments.services.stripe_gateway)
+# ==============================================================================
+
+# Bounded so a slow Stripe never holds a gunicorn worker past its 30s timeout
+STRIPE_CONNECT_TIMEOUT_SECONDS = 3
+STRIPE_READ_TIMEOUT_SECONDS = 8
+STRIPE_MAX_RETRIES = 2  # Network / 5xx / 429 only, same idempotency key
+STRIPE_RETRY_BACKOFF_SECONDS = 0.25  # 0.25s, 0.5s (+ jitter)
+STRIPE_CALL_BUDGET_SECONDS = 20  # No retry starts past this total duration
+STRIPE_POOL_SIZE = 10  # Keep-alive connections per process
+STRIPE_BREAKER_FAILURE_THRESHOLD = 5  # Consecutive failures that open the circuit
+STRIPE_BREAKER_RESET_SECONDS = 30  # Open circuit lets one probe through after this
+
 # ==============================================================================
 # PAYMENT BUSINESS RULES
 # ==============================================================================
@@ -31,6 +45,30 @@ MAX_PAYMENT_RETRIES = 3  # Maximum payment attempts per booking
 # Refund deadline (must match booking cancellation deadline)
 REFUND_DEADLINE_HOURS = 3  # Cannot refund after this time before event
 
+# ==============================================================================
+# REFUND OUTBOX
+# ==============================================================================
+
+# Refunds triggered by event cancellation run after commit, off the request
+REFUND_OUTBOX_WORKERS = 4  # Bounded thread pool per process
+REFUND_OUTBOX_BATCH_SIZE = 50  # Requests dispatched / drained per call
+REFUND_OUTBOX_MAX_ATTEMPTS = 6  # Then FAILED (critical audit log)
+REFUND_OUTBOX_BACKOFF_BASE_SECONDS = 30  # 30s, 1m, 2m, 4m, 8m
+REFUND_OUTBOX_BACKOFF_MAX_SECONDS = 60 * 60
+REFUND_OUTBOX_LEASE_SECONDS = 5 * 60  # PROCESSING rows older than this are re-claimed
+
+# ==============================================================================
+# WEBHOOK INBOX
+# ==============================================================================
+
+# Verified webhook events are stored and processed after commit, off the request
+WEBHOOK_INBOX_WORKERS = 4  # Bounded thread pool per process
+WEBHOOK_INBOX_BATCH_SIZE = 100  # Events dispatched / drained per call
+WEBHOOK_INBOX_MAX_ATTEMPTS = 8  # Then FAILED (critical audit log), replay by hand
+WEBHOOK_INBOX_BACKOFF_BASE_SECONDS = 10  # 10s, 20s, 40s, ...
+WEBHOOK_INBOX_BACKOFF_MAX_SECONDS = 30 * 60
+WEBHOOK_INBOX_LEASE_SECONDS = 5 * 60  # PROCESSING rows older than this are re-claimed
+
 # ==============================================================================
 # STRIPE WEBHOOK EVENTS
 # ==============================================================================
@@ -15,6 +15,11 @@ class StripeError(PaymentError):
     pass
 
 
+class StripeUnavailableError(StripeError):
+    """Stripe circuit breaker is open (Stripe failing or too slow): call refused."""
+    pass
+
+
 class RefundError(PaymentError):
     """Base exception for refund-related errors."""
     pass
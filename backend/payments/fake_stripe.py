@@ -0,0 +1,219 @@
+"""
+Offline fake of the Stripe API endpoints used by Conversa.
+
+Serves the subset of the API that StripeGateway calls, with the same JSON
+shapes, so checkout and refund paths can be exercised and load-tested without
+network access or a Stripe account:
+
+- POST /v1/checkout/sessions
+- GET  /v1/checkout/sessions/{id}
+- POST /v1/refunds
+
+Idempotency keys are honoured like Stripe does (a replayed key returns the
+first response). Latency and 5xx errors can be injected to test timeouts,
+retries and the circuit breaker.
+
+Run it with `manage.py fake_stripe` and set DJANGO_STRIPE_API_BASE to its URL,
+or start it in-process (tests, `manage.py stripe_loadtest --fake`):
+
+    >>> with FakeStripeServer(latency_ms=50) as server:
+    ...     gateway = StripeGateway("sk_test_fake", api_base=server.url)
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+SESSION_PATH = re.compile(r"^/v1/checkout/sessions/(?P<id>[^/?]+)$")
+
+
+def _unflatten(pairs):
+    """Decode Stripe form encoding (metadata[key]=value) into nested dicts."""
+    result = {}
+    for key, value in pairs:
+        parts = re.findall(r"[^\[\]]+", key)
+        node = result
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+    return result
+
+
+class FakeStripeServer:
+    """
+    Threaded HTTP server answering like the Stripe API.
+
+    Attributes:
+        requests (Counter): Requests served per "METHOD path-pattern"
+        log (list): (method, path, Idempotency-Key) of every request received
+        fail_next (int): Answer that many next requests with a 500
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, jitter_ms=0, error_rate=0.0):
+        """
+        Args:
+            host (str): Bind address
+            port (int): Bind port (0 = any free port)
+            latency_ms (float): Delay added to every response
+            jitter_ms (float): Random extra delay, uniform in [0, jitter_ms]
+            error_rate (float): Fraction of requests answered with a 500
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.requests = Counter()
+        self.log = []
+        self.fail_next = 0
+        self.sessions = {}
+        self.refunds = {}
+        self._idempotent = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like api.stripe.com
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-stripe", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ==========================================================================
+    # REQUEST HANDLING
+    # ==========================================================================
+
+    def _handle(self, handler, method):
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length).decode() if length else ""
+        params = _unflatten(parse_qsl(body, keep_blank_values=True))
+        path = handler.path.split("?", 1)[0]
+
+        delay = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+
+        key = handler.headers.get("Idempotency-Key") if method == "POST" else None
+        with self._lock:
+            self.log.append((method, path, key))
+            replay = self._idempotent.get(key) if key else None
+            injected = self.fail_next > 0
+            if injected:
+                self.fail_next -= 1
+        if replay:
+            self._respond(handler, *replay, replayed=True)
+            return
+
+        if injected or (self.error_rate and random.random() < self.error_rate):
+            status, payload = 500, {"error": {"type": "api_error", "message": "Injected fake error"}}
+        else:
+            status, payload = self._route(method, path, params)
+
+        if key and status < 500:
+            with self._lock:
+                self._idempotent[key] = (status, payload)
+        self._respond(handler, status, payload)
+
+    def _route(self, method, path, params):
+        match = SESSION_PATH.match(path)
+        if method == "POST" and path == "/v1/checkout/sessions":
+            self.requests["POST /v1/checkout/sessions"] += 1
+            return 200, self._create_session(params)
+        if method == "GET" and match:
+            self.requests["GET /v1/checkout/sessions/{id}"] += 1
+            session = self.sessions.get(match.group("id"))
+            if session is None:
+                return 404, {"error": {
+                    "type": "invalid_request_error",
+                    "code": "resource_missing",
+                    "message": f"No such checkout.session: '{match.group('id')}'",
+                }}
+            return 200, session
+        if method == "POST" and path == "/v1/refunds":
+            self.requests["POST /v1/refunds"] += 1
+            return 200, self._create_refund(params)
+
+        self.requests["unknown"] += 1
+        return 404, {"error": {"type": "invalid_request_error", "message": f"Unrecognized request URL ({method}: {path})"}}
+
+    def _create_session(self, params):
+        session_id = f"cs_test_fake_{uuid.uuid4().hex[:24]}"
+        line_item = (params.get("line_items") or {}).get("0") or {}
+        amount = int((line_item.get("price_data") or {}).get("unit_amount") or 0)
+        session = {
+            "id": session_id,
+            "object": "checkout.session",
+            "url": f"{self.url}/pay/{session_id}",
+            "status": "open",
+            "expires_at": int(time.time()) + 24 * 3600,  # Stripe default
+            "mode": params.get("mode", "payment"),
+            "amount_total": amount,
+            "payment_intent": None,
+            "client_reference_id": params.get("client_reference_id"),
+            "customer_email": params.get("customer_email"),
+            "metadata": params.get("metadata") or {},
+        }
+        with self._lock:
+            self.sessions[session_id] = session
+        return session
+
+    def _create_refund(self, params):
+        refund = {
+            "id": f"re_fake_{uuid.uuid4().hex[:24]}",
+            "object": "refund",
+            "amount": int(params.get("amount") or 0),
+            "payment_intent": params.get("payment_intent"),
+            "status": "succeeded",
+            "metadata": params.get("metadata") or {},
+        }
+        with self._lock:
+            self.refunds[refund["id"]] = refund
+        return refund
+
+    @staticmethod
+    def _respond(handler, status, payload, replayed=False):
+        body = json.dumps(payload).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.send_header("Request-Id", f"req_fake_{uuid.uuid4().hex[:14]}")
+        if replayed:
+            handler.send_header("Idempotent-Replayed", "true")
+        handler.end_headers()
+        handler.wfile.write(body)
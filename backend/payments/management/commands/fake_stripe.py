@@ -0,0 +1,58 @@
+"""
+Django management command to run the offline fake Stripe API.
+
+Usage:
+    python manage.py fake_stripe
+    python manage.py fake_stripe --port 12111 --latency-ms 200 --jitter-ms 100 --error-rate 0.05
+
+Point the backend at it with DJANGO_STRIPE_API_BASE=http://localhost:12111 to
+exercise checkout and refund paths (or load-test them) without network access.
+Stops on Ctrl+C / SIGTERM.
+"""
+
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from payments.fake_stripe import FakeStripeServer
+
+
+class Command(BaseCommand):
+    help = "Run a local fake of the Stripe API (checkout sessions, refunds)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+        parser.add_argument("--port", type=int, default=12111, help="Bind port (default: 12111)")
+        parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response")
+        parser.add_argument("--jitter-ms", type=float, default=0, help="Random extra delay per response")
+        parser.add_argument(
+            "--error-rate",
+            type=float,
+            default=0.0,
+            help="Fraction of requests answered with a 500 (0.0-1.0)",
+        )
+
+    def handle(self, *args, **options):
+        """Serve until interrupted."""
+        server = FakeStripeServer(
+            host=options["host"],
+            port=options["port"],
+            latency_ms=options["latency_ms"],
+            jitter_ms=options["jitter_ms"],
+            error_rate=options["error_rate"],
+        )
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+        server.start()
+        self.stdout.write(self.style.SUCCESS(f"✓ Fake Stripe API listening on {server.url}"))
+        self.stdout.write(f"  export DJANGO_STRIPE_API_BASE={server.url}")
+        try:
+            stop.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+            for route, count in sorted(server.requests.items()):
+                self.stdout.write(f"  {route}: {count} request(s)")
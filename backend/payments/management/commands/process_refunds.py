@@ -0,0 +1,59 @@
+"""
+Django management command to execute queued refunds (refund outbox).
+
+Usage:
+    python manage.py process_refunds
+    python manage.py process_refunds --retry-failed
+
+Refunds are normally executed right after commit by the worker pool, and
+retried by run_scheduler on their backoff deadline. This command drains the
+due requests by hand; --retry-failed first puts FAILED requests back in the
+queue (e.g. after fixing a Stripe configuration issue).
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from payments.constants import REFUND_OUTBOX_BATCH_SIZE
+from payments.models import RefundRequest
+from payments.services import RefundOutboxService
+
+
+class Command(BaseCommand):
+    help = "Execute due refund requests from the refund outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Re-queue FAILED requests before draining",
+        )
+
+    def handle(self, *args, **options):
+        """Drain the refund outbox."""
+        now = timezone.now()
+
+        if options["retry_failed"]:
+            requeued = RefundRequest.objects.filter(status=RefundRequest.Status.FAILED).update(
+                status=RefundRequest.Status.PENDING,
+                attempts=0,
+                next_attempt_at=now,
+                updated_at=now,
+            )
+            self.stdout.write(f"Re-queued {requeued} failed refund request(s)")
+
+        results = []
+        while True:
+            batch = RefundOutboxService.drain(now=now)
+            results.extend(batch)
+            if len(batch) < REFUND_OUTBOX_BATCH_SIZE:
+                break
+
+        for pk, status in results:
+            self.stdout.write(f"  refund_request={pk} status={status}")
+
+        failed = sum(1 for _, status in results if status == RefundRequest.Status.FAILED)
+        if failed:
+            self.stdout.write(self.style.ERROR(f"✗ {failed} refund(s) failed"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✓ Processed {len(results)} refund request(s)"))
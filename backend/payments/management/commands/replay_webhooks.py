@@ -0,0 +1,93 @@
+"""
+Django management command to replay Stripe webhook events from the inbox.
+
+Usage:
+    python manage.py replay_webhooks                      # Process due events
+    python manage.py replay_webhooks --failed             # Replay FAILED events
+    python manage.py replay_webhooks --event evt_123 --event evt_456
+    python manage.py replay_webhooks --type checkout.session.completed --since 2025-01-31T00:00
+
+Events are normally processed right after the webhook commits, and retried by
+run_scheduler on their backoff deadline. This command re-queues the selected
+events (any status, handlers are idempotent) and processes the inbox in the
+calling process, in Stripe order per booking.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from payments.constants import WEBHOOK_INBOX_BATCH_SIZE
+from payments.models import StripeWebhookEvent
+from payments.services import WebhookInboxService
+
+
+class Command(BaseCommand):
+    help = "Replay Stripe webhook events stored in the webhook inbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--event",
+            action="append",
+            dest="events",
+            metavar="EVENT_ID",
+            help="Stripe event id to replay (repeatable)",
+        )
+        parser.add_argument(
+            "--failed",
+            action="store_true",
+            help="Replay all FAILED events",
+        )
+        parser.add_argument(
+            "--type",
+            dest="event_type",
+            help="Only replay events of this Stripe type",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only replay events created at Stripe after this ISO datetime",
+        )
+
+    def handle(self, *args, **options):
+        """Re-queue the selected events, then drain the inbox."""
+        now = timezone.now()
+        selected = StripeWebhookEvent.objects.all()
+        filtered = False
+
+        if options["events"]:
+            selected = selected.filter(stripe_event_id__in=options["events"])
+            filtered = True
+        if options["failed"]:
+            selected = selected.filter(status=StripeWebhookEvent.Status.FAILED)
+            filtered = True
+        if options["event_type"]:
+            selected = selected.filter(event_type=options["event_type"])
+            filtered = True
+        if options["since"]:
+            since = parse_datetime(options["since"])
+            if since is None:
+                raise CommandError(f"Invalid --since datetime: {options['since']}")
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            selected = selected.filter(stripe_created__gte=since)
+            filtered = True
+
+        if filtered:
+            requeued = WebhookInboxService.requeue(selected, now=now)
+            self.stdout.write(f"Re-queued {requeued} webhook event(s)")
+
+        results = []
+        while True:
+            batch = WebhookInboxService.drain(now=now)
+            results.extend(batch)
+            if len(batch) < WEBHOOK_INBOX_BATCH_SIZE:
+                break
+
+        for pk, status in results:
+            self.stdout.write(f"  webhook_event={pk} status={status}")
+
+        failed = sum(1 for _, status in results if status != StripeWebhookEvent.Status.PROCESSED)
+        if failed:
+            self.stdout.write(self.style.ERROR(f"✗ {failed} event(s) not processed (retry scheduled or failed)"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✓ Processed {len(results)} webhook event(s)"))
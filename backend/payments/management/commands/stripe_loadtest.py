@@ -0,0 +1,117 @@
+"""
+Django management command to load-test the Stripe client layer.
+
+Usage:
+    python manage.py stripe_loadtest --fake                       # In-process fake server
+    python manage.py stripe_loadtest --fake --latency-ms 300 --error-rate 0.1
+    python manage.py stripe_loadtest --requests 500 --concurrency 20 --operation refund
+
+Fires the checkout-session and refund calls of PaymentService / RefundService
+(same payload shapes, one idempotency key per logical call) through a
+StripeGateway, from a thread pool, and prints throughput plus the gateway's
+per-operation latency histograms and circuit breaker state. Without --fake it
+targets STRIPE_API_BASE, which must point at a fake (`manage.py fake_stripe`):
+the command refuses to load-test the real Stripe API.
+"""
+
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from payments.fake_stripe import FakeStripeServer
+from payments.services import StripeGateway
+
+OPERATIONS = ("checkout", "refund")
+
+
+def _checkout(gateway):
+    booking_id = str(uuid.uuid4())
+    session = gateway.create_checkout_session({
+        "mode": "payment",
+        "line_items": [{
+            "price_data": {
+                "currency": "eur",
+                "unit_amount": 700,
+                "product_data": {"name": "Conversa - Language Exchange Event"},
+            },
+            "quantity": 1,
+        }],
+        "success_url": "http://localhost:4200/fr/stripe/success",
+        "cancel_url": "http://localhost:4200/fr/stripe/cancel",
+        "client_reference_id": booking_id,
+        "metadata": {"booking_public_id": booking_id, "user_id": "loadtest"},
+    })
+    gateway.retrieve_checkout_session(session.id)
+
+
+def _refund(gateway):
+    booking_id = str(uuid.uuid4())
+    gateway.create_refund(
+        {
+            "payment_intent": f"pi_loadtest_{booking_id[:8]}",
+            "metadata": {"booking_public_id": booking_id, "reason": "booking_cancelled"},
+        },
+        idempotency_key=f"refund:{booking_id}",
+    )
+
+
+class Command(BaseCommand):
+    help = "Load-test checkout and refund Stripe calls against a fake Stripe API"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Calls per operation (default: 200)")
+        parser.add_argument("--concurrency", type=int, default=10, help="Concurrent threads (default: 10)")
+        parser.add_argument(
+            "--operation",
+            action="append",
+            choices=OPERATIONS,
+            help="Operation to run (repeatable, default: all)",
+        )
+        parser.add_argument("--fake", action="store_true", help="Start an in-process fake Stripe server")
+        parser.add_argument("--latency-ms", type=float, default=50, help="Fake server latency (with --fake)")
+        parser.add_argument("--jitter-ms", type=float, default=50, help="Fake server jitter (with --fake)")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Fake server 500 rate (with --fake)")
+
+    def handle(self, *args, **options):
+        """Run the load test and print the gateway metrics."""
+        server = None
+        if options["fake"]:
+            server = FakeStripeServer(
+                latency_ms=options["latency_ms"],
+                jitter_ms=options["jitter_ms"],
+                error_rate=options["error_rate"],
+            ).start()
+            api_base = server.url
+        else:
+            api_base = getattr(settings, "STRIPE_API_BASE", "")
+            if not api_base:
+                raise CommandError("Set DJANGO_STRIPE_API_BASE to a fake Stripe server, or use --fake")
+
+        gateway = StripeGateway("sk_test_loadtest", api_base=api_base, pool_size=options["concurrency"])
+        calls = {"checkout": _checkout, "refund": _refund}
+        failures = 0
+        try:
+            for operation in options["operation"] or OPERATIONS:
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+                    futures = [pool.submit(calls[operation], gateway) for _ in range(options["requests"])]
+                errors = sum(1 for future in futures if future.exception())
+                failures += errors
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"  {operation}: {options['requests']} call(s) in {elapsed:.2f}s "
+                    f"({options['requests'] / elapsed:.1f}/s), {errors} error(s)"
+                )
+        finally:
+            if server:
+                server.stop()
+
+        self.stdout.write(json.dumps(gateway.metrics(), indent=2))
+        if failures:
+            self.stdout.write(self.style.ERROR(f"✗ {failures} call(s) failed"))
+        else:
+            self.stdout.write(self.style.SUCCESS("✓ Load test complete"))
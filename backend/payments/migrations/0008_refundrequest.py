@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0012_update_booking_unique_constraint'),
+        ('payments', '0007_alter_payment_amount_cents'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RefundRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reason', models.CharField(default='event_cancelled', max_length=100)),
+                ('idempotency_key', models.CharField(help_text='Sent to Stripe; one refund per booking', max_length=100, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('succeeded', 'Succeeded'), ('skipped', 'Skipped (nothing to refund)'), ('failed', 'Failed')], default='pending', max_length=12)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True)),
+                ('stripe_refund_id', models.CharField(blank=True, max_length=255)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('booking', models.ForeignKey(help_text='Cancelled booking to refund', on_delete=django.db.models.deletion.CASCADE, related_name='refund_requests', to='bookings.booking')),
+                ('refund_payment', models.ForeignKey(blank=True, help_text='Negative Payment recorded once refunded', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='payments.payment')),
+                ('requested_by', models.ForeignKey(blank=True, help_text='User who cancelled (null for system cancellations)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Refund request',
+                'verbose_name_plural': 'Refund requests',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='payments_re_status_4e0747_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:31
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0008_refundrequest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StripeWebhookEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stripe_event_id', models.CharField(help_text='Stripe event id (evt_...), deduplicates redeliveries', max_length=255, unique=True)),
+                ('event_type', models.CharField(max_length=100)),
+                ('ordering_key', models.CharField(blank=True, help_text='Booking public id (or Stripe object id): events sharing it run in order', max_length=255)),
+                ('stripe_created', models.DateTimeField(help_text='Event creation time at Stripe')),
+                ('payload', models.JSONField(help_text='Verified event body')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('processed', 'Processed'), ('ignored', 'Ignored (unhandled type)'), ('failed', 'Failed')], default='pending', max_length=12)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Stripe webhook event',
+                'verbose_name_plural': 'Stripe webhook events',
+                'ordering': ['stripe_created', 'id'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='payments_st_status_ef334f_idx'), models.Index(fields=['ordering_key', 'stripe_created'], name='payments_st_orderin_d42c83_idx')],
+            },
+        ),
+    ]
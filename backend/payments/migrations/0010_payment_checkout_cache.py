@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0009_stripewebhookevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='checkout_expires_at',
+            field=models.DateTimeField(blank=True, help_text='Cached session valid until min(Stripe session expiry, booking expiry)', null=True),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='checkout_url',
+            field=models.TextField(blank=True, default='', help_text='Stripe Checkout URL of the open session'),
+        ),
+    ]
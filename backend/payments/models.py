@@ -2,6 +2,7 @@
 from django.db import models
 from django.conf import settings
 from django.core import validators
+from django.utils import timezone
 
 
 class Payment(models.Model):
@@ -47,6 +48,19 @@ class Payment(models.Model):
         help_text="Stripe Payment Intent ID",
     )
 
+    # Open Checkout Session state, cached to answer checkout retries locally.
+    # Valid while PENDING and before checkout_expires_at; webhooks clear it.
+    checkout_url = models.TextField(
+        blank=True,
+        default="",
+        help_text="Stripe Checkout URL of the open session",
+    )
+    checkout_expires_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="Cached session valid until min(Stripe session expiry, booking expiry)",
+    )
+
     # Payment details
     amount_cents = models.IntegerField(
         default=0,
@@ -117,3 +131,139 @@ class Payment(models.Model):
         super().__init__(*args, **kwargs)
         if alias and not getattr(self, "stripe_checkout_session_id", None):
             self.stripe_checkout_session_id = alias
+
+
+class RefundRequest(models.Model):
+    """
+    Outbox row for a Stripe refund executed after commit.
+
+    Written in the same transaction as the cancellation that triggers it, so
+    a refund is never lost nor issued for a rolled-back cancellation.
+    RefundOutboxService executes it outside any transaction, retries with
+    backoff and sends idempotency_key to Stripe, so a retried or re-claimed
+    row never refunds twice.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        PROCESSING = "processing", "Processing"
+        SUCCEEDED = "succeeded", "Succeeded"
+        SKIPPED = "skipped", "Skipped (nothing to refund)"
+        FAILED = "failed", "Failed"
+
+    booking = models.ForeignKey(
+        "bookings.Booking",
+        on_delete=models.CASCADE,
+        related_name="refund_requests",
+        help_text="Cancelled booking to refund",
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        help_text="User who cancelled (null for system cancellations)",
+    )
+    refund_payment = models.ForeignKey(
+        Payment,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        help_text="Negative Payment recorded once refunded",
+    )
+    reason = models.CharField(max_length=100, default="event_cancelled")
+    idempotency_key = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="Sent to Stripe; one refund per booking",
+    )
+
+    # Execution state
+    status = models.CharField(
+        max_length=12,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    stripe_refund_id = models.CharField(max_length=255, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "payments"
+        ordering = ["created_at"]
+        verbose_name = "Refund request"
+        verbose_name_plural = "Refund requests"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self):
+        return f"RefundRequest#{self.id} {self.status} booking={self.booking_id}"
+
+
+class StripeWebhookEvent(models.Model):
+    """
+    Inbox row for a verified Stripe webhook delivery.
+
+    The webhook endpoint only checks the signature and inserts the event;
+    stripe_event_id is unique, so a redelivered event is acknowledged
+    without being processed again. WebhookInboxService processes the rows
+    after commit, in Stripe order per booking (ordering_key).
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        PROCESSING = "processing", "Processing"
+        PROCESSED = "processed", "Processed"
+        IGNORED = "ignored", "Ignored (unhandled type)"
+        FAILED = "failed", "Failed"
+
+    stripe_event_id = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text="Stripe event id (evt_...), deduplicates redeliveries",
+    )
+    event_type = models.CharField(max_length=100)
+    ordering_key = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Booking public id (or Stripe object id): events sharing it run in order",
+    )
+    stripe_created = models.DateTimeField(help_text="Event creation time at Stripe")
+    payload = models.JSONField(help_text="Verified event body")
+
+    # Processing state
+    status = models.CharField(
+        max_length=12,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    # Timestamps
+    received_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "payments"
+        ordering = ["stripe_created", "id"]
+        verbose_name = "Stripe webhook event"
+        verbose_name_plural = "Stripe webhook events"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+            models.Index(fields=["ordering_key", "stripe_created"]),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} {self.stripe_event_id} ({self.status})"
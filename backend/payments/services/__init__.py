@@ -10,7 +10,7 @@ from __future__ import annotations
 import importlib
 from typing import Any
 
-__all__ = ["PaymentService", "RefundService"]
+__all__ = ["PaymentService", "RefundService", "RefundOutboxService", "WebhookInboxService", "StripeGateway"]
 
 
 def __getattr__(name: str) -> Any:  # lazy attribute loading
@@ -18,4 +18,10 @@ def __getattr__(name: str) -> Any:  # lazy attribute loading
         return importlib.import_module(".payment_service", __name__).PaymentService
     if name == "RefundService":
         return importlib.import_module(".refund_service", __name__).RefundService
+    if name == "RefundOutboxService":
+        return importlib.import_module(".refund_outbox_service", __name__).RefundOutboxService
+    if name == "WebhookInboxService":
+        return importlib.import_module(".webhook_inbox_service", __name__).WebhookInboxService
+    if name == "StripeGateway":
+        return importlib.import_module(".stripe_gateway", __name__).StripeGateway
     raise AttributeError(name)
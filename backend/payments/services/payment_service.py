@@ -5,9 +5,12 @@ Handles payment session creation, confirmation, and status updates.
 """
 from __future__ import annotations
 
+from datetime import datetime, timezone as dt_timezone
+
 import stripe
 from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 from django.core.exceptions import ValidationError
 
 from common.services.base import BaseService
@@ -22,7 +25,6 @@ from ..constants import (
     STATUS_CANCELED,
 )
 from ..validators import (
-    validate_stripe_test_mode,
     validate_booking_is_payable,
     validate_payment_retry_limit,
 )
@@ -33,10 +35,11 @@ class PaymentService(BaseService):
     """Service for payment operations."""
 
     @staticmethod
-    def _initialize_stripe() -> None:
-        """Initialize Stripe with TEST key."""
-        validate_stripe_test_mode()
-        stripe.api_key = settings.STRIPE_SECRET_KEY
+    def _stripe():
+        """Pooled Stripe client (validates TEST mode)."""
+        from .stripe_gateway import StripeGateway
+
+        return StripeGateway.default()
 
     @staticmethod
     def _get_valid_pending_payment(booking):
@@ -56,6 +59,39 @@ class PaymentService(BaseService):
             .first()
         )
 
+    @staticmethod
+    def _lock_booking(booking):
+        """Lock the booking row until the end of the transaction (no-op outside one)."""
+        from bookings.models import Booking
+
+        if transaction.get_connection().in_atomic_block:
+            list(Booking.objects.select_for_update().filter(pk=booking.pk).values_list("pk", flat=True))
+
+    @staticmethod
+    def _has_cached_checkout(payment, now=None) -> bool:
+        """Whether payment's cached Checkout Session can be returned as is."""
+        now = now or timezone.now()
+        return bool(
+            payment.checkout_url
+            and payment.checkout_expires_at
+            and now < payment.checkout_expires_at
+        )
+
+    @staticmethod
+    def _cache_checkout(payment, session, booking) -> None:
+        """
+        Cache an open session's URL on payment (not saved).
+
+        Valid until the session or the booking expires, whichever is first:
+        past booking.expires_at the booking is not payable anyway.
+        """
+        expires_at = booking.expires_at
+        session_expiry = getattr(session, "expires_at", None)
+        if session_expiry:
+            expires_at = min(expires_at, datetime.fromtimestamp(session_expiry, tz=dt_timezone.utc))
+        payment.checkout_url = session.url or ""
+        payment.checkout_expires_at = expires_at
+
     @staticmethod
     def create_checkout_session(booking, user, success_url: str, cancel_url: str):
         """
@@ -66,7 +102,9 @@ class PaymentService(BaseService):
             - Booking must not be expired
             - Maximum retry limit not exceeded
             - If amount = 0 → bypass Stripe, confirm directly
-            - Reuses existing PENDING payment session if still valid (not expired)
+            - Reuses existing PENDING payment session if still valid (not expired);
+              its URL is cached on the Payment, so retries within the session /
+              booking TTL make no Stripe call
 
         Args:
             booking: Booking instance
@@ -100,17 +138,33 @@ class PaymentService(BaseService):
                 booking, user, currency, success_url
             )
 
+        # Serialize concurrent checkouts of one booking (double-click on "pay"):
+        # the second request waits here, then reuses the first one's session
+        PaymentService._lock_booking(booking)
+
         # Check if there's an existing PENDING payment for this booking
         existing_payment = PaymentService._get_valid_pending_payment(booking)
         if existing_payment:
             # Reuse existing session ONLY if booking is still valid (not expired)
             # This prevents reusing a session for an expired booking
             if not booking.is_expired:
-                PaymentService._initialize_stripe()
+                # Cached session still valid: answered without calling Stripe
+                if PaymentService._has_cached_checkout(existing_payment):
+                    return (
+                        existing_payment.checkout_url,
+                        existing_payment.stripe_checkout_session_id,
+                        existing_payment,
+                    )
                 try:
-                    session = stripe.checkout.Session.retrieve(existing_payment.stripe_checkout_session_id)
+                    session = PaymentService._stripe().retrieve_checkout_session(
+                        existing_payment.stripe_checkout_session_id
+                    )
                     # Only reuse if session is still open (not expired)
                     if session.status == 'open':
+                        PaymentService._cache_checkout(existing_payment, session, booking)
+                        existing_payment.save(
+                            update_fields=['checkout_url', 'checkout_expires_at', 'updated_at']
+                        )
                         return session.url, session.id, existing_payment
                     else:
                         # Session expired, mark as canceled and create new one
@@ -126,11 +180,9 @@ class PaymentService(BaseService):
                 existing_payment.save(update_fields=['status', 'updated_at'])
 
         # Create Stripe Checkout session
-        PaymentService._initialize_stripe()
-
-        session = stripe.checkout.Session.create(
-            mode="payment",
-            line_items=[
+        session = PaymentService._stripe().create_checkout_session({
+            "mode": "payment",
+            "line_items": [
                 {
                     "price_data": {
                         "currency": currency.lower(),
@@ -144,24 +196,24 @@ class PaymentService(BaseService):
                     "quantity": BOOKING_QUANTITY,  # Always 1 seat per booking
                 }
             ],
-            success_url=success_url,
-            cancel_url=cancel_url,
-            customer_email=user.email,
-            client_reference_id=str(booking.public_id),
-            metadata={
+            "success_url": success_url,
+            "cancel_url": cancel_url,
+            "customer_email": user.email,
+            "client_reference_id": str(booking.public_id),
+            "metadata": {
                 "booking_public_id": str(booking.public_id),
                 "user_id": str(user.id),
             },
-            payment_intent_data={
+            "payment_intent_data": {
                 "metadata": {
                     "booking_public_id": str(booking.public_id),
                     "user_id": str(user.id),
                 }
             },
-        )
+        })
 
         # Create new Payment record (each retry = new Stripe session)
-        payment = Payment.objects.create(
+        payment = Payment(
             booking=booking,
             user=user,
             stripe_checkout_session_id=session.id,
@@ -169,6 +221,8 @@ class PaymentService(BaseService):
             currency=currency,
             status=STATUS_PENDING,
         )
+        PaymentService._cache_checkout(payment, session, booking)
+        payment.save()
 
         # Log payment creation
         AuditService.log_payment_created(payment, user)
@@ -259,6 +313,9 @@ class PaymentService(BaseService):
         if payment_intent_id:
             payment.stripe_payment_intent_id = payment_intent_id
         payment.raw_event = raw_event
+        # Session completed: drop its cached state
+        payment.checkout_url = ""
+        payment.checkout_expires_at = None
 
         # Confirm booking if still pending (use service to trigger side-effects like event publish)
         if booking.status == BookingStatus.PENDING:
@@ -366,7 +423,7 @@ class PaymentService(BaseService):
         else:
             return 0
 
-        count = qs.update(status=STATUS_FAILED)
+        count = qs.update(status=STATUS_FAILED, checkout_url="", checkout_expires_at=None)
 
         if count > 0:
             for payment in qs:
@@ -395,7 +452,7 @@ class PaymentService(BaseService):
         count = (
             Payment.objects.filter(
                 stripe_checkout_session_id=session_id, status=STATUS_PENDING
-            ).update(status=STATUS_CANCELED)
+            ).update(status=STATUS_CANCELED, checkout_url="", checkout_expires_at=None)
         )
 
         return count
@@ -0,0 +1,296 @@
+"""
+Transactional outbox for Stripe refunds.
+
+Cancelling an event (manually or by the auto-cancel sweep) must not call
+Stripe while the cancellation transaction holds its row locks. Instead the
+cancellation writes one RefundRequest per CONFIRMED booking in the same
+transaction (enqueue). After commit, the due requests are handed to a bounded
+thread pool (dispatch); anything the pool could not finish is picked up again
+by drain(), which the lifecycle scheduler fires on next_attempt_at.
+
+Execution is at-least-once: a request is claimed with a single conditional
+UPDATE (only one worker wins), the Stripe call carries the request's
+idempotency key, and a PROCESSING row whose worker died is re-claimed after
+REFUND_OUTBOX_LEASE_SECONDS. Transient failures back off exponentially;
+permanent ones (or too many attempts) end in FAILED with a critical audit log.
+"""
+
+import logging
+from datetime import timedelta
+
+import stripe
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from common.services.base import BaseService
+from common.utils.worker_pool import get_pool
+from ..constants import (
+    REFUND_OUTBOX_BACKOFF_BASE_SECONDS,
+    REFUND_OUTBOX_BACKOFF_MAX_SECONDS,
+    REFUND_OUTBOX_BATCH_SIZE,
+    REFUND_OUTBOX_LEASE_SECONDS,
+    REFUND_OUTBOX_MAX_ATTEMPTS,
+    REFUND_OUTBOX_WORKERS,
+    STATUS_SUCCEEDED,
+)
+from ..exceptions import PaymentIntentMissingError
+from ..models import Payment, RefundRequest
+
+logger = logging.getLogger("payments.refund")
+
+# Errors retrying cannot fix
+PERMANENT_ERRORS = (
+    PaymentIntentMissingError,
+    DjangoValidationError,  # Stripe not in test mode
+    stripe.error.InvalidRequestError,
+    stripe.error.AuthenticationError,
+    stripe.error.PermissionError,
+)
+
+
+class RefundOutboxService(BaseService):
+    """Service for the refund outbox (enqueue, dispatch, execute, retry)."""
+
+    OPEN_STATUSES = (RefundRequest.Status.PENDING, RefundRequest.Status.PROCESSING)
+
+    @staticmethod
+    def enqueue(bookings, requested_by=None, reason="event_cancelled"):
+        """
+        Record refund requests for CONFIRMED bookings being cancelled.
+
+        Must run inside the cancelling transaction; the requests are
+        dispatched to the worker pool once it commits. A booking already
+        queued is ignored (idempotency_key is unique per booking).
+
+        Args:
+            bookings: Booking instances (pk and public_id are used)
+            requested_by: User who cancelled (None for system)
+            reason: Refund reason (audit)
+
+        Returns:
+            int: Number of bookings submitted
+        """
+        requests = [
+            RefundRequest(
+                booking_id=booking.pk,
+                requested_by=requested_by,
+                reason=reason,
+                idempotency_key=f"refund:{booking.public_id}",
+            )
+            for booking in bookings
+        ]
+        if not requests:
+            return 0
+
+        RefundRequest.objects.bulk_create(requests, ignore_conflicts=True)
+        transaction.on_commit(RefundOutboxService.dispatch)
+        return len(requests)
+
+    @staticmethod
+    def pending_count(event):
+        """Number of refunds of event's bookings not executed yet."""
+        return RefundRequest.objects.filter(
+            booking__event=event,
+            status__in=RefundOutboxService.OPEN_STATUSES,
+        ).count()
+
+    @staticmethod
+    def _due(now):
+        """Requests ready to run: due PENDING rows and expired PROCESSING leases."""
+        return Q(status=RefundRequest.Status.PENDING, next_attempt_at__lte=now) | Q(
+            status=RefundRequest.Status.PROCESSING,
+            updated_at__lte=now - timedelta(seconds=REFUND_OUTBOX_LEASE_SECONDS),
+        )
+
+    @staticmethod
+    def next_deadline():
+        """Earliest time a request becomes due (None if the outbox is empty)."""
+        from django.db.models import Min
+
+        deadlines = RefundRequest.objects.filter(
+            status__in=RefundOutboxService.OPEN_STATUSES
+        ).aggregate(
+            pending=Min("next_attempt_at", filter=Q(status=RefundRequest.Status.PENDING)),
+            processing=Min("updated_at", filter=Q(status=RefundRequest.Status.PROCESSING)),
+        )
+        candidates = [deadlines["pending"]]
+        if deadlines["processing"]:
+            candidates.append(deadlines["processing"] + timedelta(seconds=REFUND_OUTBOX_LEASE_SECONDS))
+        return min((d for d in candidates if d), default=None)
+
+    @staticmethod
+    def due_ids(now=None, limit=REFUND_OUTBOX_BATCH_SIZE):
+        """Ids of the requests ready to run, oldest first."""
+        now = now or timezone.now()
+        return list(
+            RefundRequest.objects.filter(RefundOutboxService._due(now))
+            .order_by("next_attempt_at", "pk")
+            .values_list("pk", flat=True)[:limit]
+        )
+
+    @staticmethod
+    def dispatch():
+        """
+        Hand the due requests to the worker pool (called on commit).
+
+        Returns:
+            list: Submitted request ids
+        """
+        ids = RefundOutboxService.due_ids()
+        executor = get_pool("refund-outbox", REFUND_OUTBOX_WORKERS)
+        for pk in ids:
+            executor.submit(RefundOutboxService._run_in_worker, pk)
+        return ids
+
+    @staticmethod
+    def _run_in_worker(pk):
+        """Pool entry point: worker threads own (and close) their connection."""
+        try:
+            RefundOutboxService.process(pk)
+        except Exception:
+            logger.exception(f"Refund request {pk} crashed")
+        finally:
+            connection.close()
+
+    @staticmethod
+    def drain(now=None, limit=REFUND_OUTBOX_BATCH_SIZE):
+        """
+        Execute the due requests in the calling thread.
+
+        Returns:
+            list: (request id, resulting status) of the requests this call ran
+        """
+        now = now or timezone.now()
+        results = []
+        for pk in RefundOutboxService.due_ids(now, limit):
+            status = RefundOutboxService.process(pk, now=now)
+            if status:
+                results.append((pk, status))
+        return results
+
+    @staticmethod
+    def process(pk, now=None):
+        """
+        Claim and execute one refund request.
+
+        Args:
+            pk: RefundRequest id
+            now: Reference time (defaults to timezone.now())
+
+        Returns:
+            str: Resulting status, or None if another worker owns the request
+        """
+        now = now or timezone.now()
+
+        # One conditional UPDATE: only one worker wins the claim
+        claimed = RefundRequest.objects.filter(RefundOutboxService._due(now), pk=pk).update(
+            status=RefundRequest.Status.PROCESSING,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        if not claimed:
+            return None
+
+        request = RefundRequest.objects.select_related(
+            "booking", "booking__event", "requested_by"
+        ).get(pk=pk)
+
+        try:
+            status, refund_payment, refund_id = RefundOutboxService._execute(request)
+        except Exception as e:
+            return RefundOutboxService._record_failure(request, e, now)
+
+        request.status = status
+        request.refund_payment = refund_payment
+        request.stripe_refund_id = refund_id or ""
+        request.last_error = ""
+        request.processed_at = timezone.now()
+        request.save(update_fields=[
+            "status", "refund_payment", "stripe_refund_id", "last_error", "processed_at", "updated_at",
+        ])
+        return status
+
+    @staticmethod
+    def _execute(request):
+        """
+        Refund the booking of request.
+
+        Returns:
+            tuple: (status, refund Payment or None, Stripe refund id or None)
+        """
+        from .refund_service import RefundService
+
+        booking = request.booking
+        payment = Payment.objects.filter(
+            booking=booking,
+            status=STATUS_SUCCEEDED,
+        ).order_by("-created_at").first()
+
+        if not payment:
+            return RefundRequest.Status.SKIPPED, None, None
+
+        # Latest successful payment is negative: already refunded
+        if payment.amount_cents < 0:
+            return RefundRequest.Status.SUCCEEDED, payment, (payment.raw_event or {}).get("refund_id")
+
+        if booking.amount_cents == 0 or payment.amount_cents == 0:
+            with transaction.atomic():
+                _, _, refund_payment = RefundService._handle_zero_amount_refund(
+                    booking, payment, request.requested_by
+                )
+            return RefundRequest.Status.SUCCEEDED, refund_payment, None
+
+        # Network call outside any transaction; retries reuse the idempotency key
+        refund = RefundService._create_stripe_refund(
+            booking, payment, request.requested_by, idempotency_key=request.idempotency_key
+        )
+        with transaction.atomic():
+            refund_payment = RefundService._record_stripe_refund(
+                booking, payment, refund, request.requested_by, reason=request.reason
+            )
+        return RefundRequest.Status.SUCCEEDED, refund_payment, refund.id
+
+    @staticmethod
+    def backoff(attempts):
+        """Delay before the next attempt after `attempts` failures."""
+        delay = REFUND_OUTBOX_BACKOFF_BASE_SECONDS * 2 ** max(0, attempts - 1)
+        return timedelta(seconds=min(delay, REFUND_OUTBOX_BACKOFF_MAX_SECONDS))
+
+    @staticmethod
+    def _record_failure(request, error, now):
+        """Schedule a retry, or give up on permanent errors / too many attempts."""
+        from audit.services import AuditService
+
+        request.last_error = f"{type(error).__name__}: {error}"[:2000]
+        permanent = isinstance(error, PERMANENT_ERRORS)
+
+        if permanent or request.attempts >= REFUND_OUTBOX_MAX_ATTEMPTS:
+            request.status = RefundRequest.Status.FAILED
+            request.processed_at = timezone.now()
+            AuditService.log_critical(
+                action="refund_failed",
+                message=f"Refund for booking {request.booking.public_id} failed after "
+                        f"{request.attempts} attempt(s): {request.last_error}",
+                user=request.requested_by,
+                error_details={
+                    "refund_request_id": request.id,
+                    "booking_id": request.booking_id,
+                    "attempts": request.attempts,
+                    "permanent": permanent,
+                    "error": request.last_error,
+                },
+            )
+        else:
+            request.status = RefundRequest.Status.PENDING
+            request.next_attempt_at = now + RefundOutboxService.backoff(request.attempts)
+            logger.warning(
+                f"Refund request {request.id} attempt {request.attempts} failed, "
+                f"retry at {request.next_attempt_at}: {request.last_error}"
+            )
+
+        request.save(update_fields=[
+            "status", "last_error", "next_attempt_at", "processed_at", "updated_at",
+        ])
+        return request.status
@@ -4,13 +4,12 @@ Refund service for Stripe integration.
 Handles automatic refunds when bookings are cancelled.
 """
 import stripe
-from django.conf import settings
 from django.db import transaction
 
 from common.services.base import BaseService
 from ..models import Payment
 from ..constants import STATUS_SUCCEEDED
-from ..validators import validate_stripe_test_mode, validate_refund_eligibility
+from ..validators import validate_refund_eligibility
 from ..exceptions import (
     RefundProcessingError,
     PaymentIntentMissingError,
@@ -22,10 +21,11 @@ class RefundService(BaseService):
     """Service for refund operations."""
 
     @staticmethod
-    def _initialize_stripe():
-        """Initialize Stripe with TEST key."""
-        validate_stripe_test_mode()
-        stripe.api_key = settings.STRIPE_SECRET_KEY
+    def _stripe():
+        """Pooled Stripe client (validates TEST mode)."""
+        from .stripe_gateway import StripeGateway
+
+        return StripeGateway.default()
 
     @staticmethod
     @transaction.atomic
@@ -121,55 +121,12 @@ class RefundService(BaseService):
         Returns:
             tuple: (success, message, refund_payment or None)
         """
-        RefundService._initialize_stripe()
-
-        # Get payment intent ID
-        payment_intent_id = payment.stripe_payment_intent_id
-
-        if not payment_intent_id:
-            raise PaymentIntentMissingError(
-                f"Payment {payment.id} has no payment_intent_id - cannot refund"
-            )
-
         try:
-            # Create Stripe refund
-            refund = stripe.Refund.create(
-                payment_intent=payment_intent_id,
-                metadata={
-                    "booking_public_id": str(booking.public_id),
-                    "cancelled_by_user_id": str(cancelled_by.id),
-                    "reason": "booking_cancelled",
-                },
-            )
-
-            # Ensure currency is valid 3-letter code
-            currency = str(payment.currency).upper().strip()[:3] if payment.currency else "EUR"
-
-            # Create refund payment record (negative amount)
-            refund_payment = Payment.objects.create(
-                user=payment.user,
-                booking=booking,
-                amount_cents=-abs(payment.amount_cents),  # Negative for refund
-                currency=currency,
-                status=STATUS_SUCCEEDED,
-                stripe_payment_intent_id=payment_intent_id,
-                raw_event={
-                    "type": "refund",
-                    "refund_id": str(refund.id),
-                    "amount": int(getattr(refund, "amount", 0)) if hasattr(refund, "amount") else 0,
-                    "status": str(getattr(refund, "status", "")),
-                },
-            )
-
-            # Log refund
-            from audit.services import AuditService
-
-            AuditService.log_payment_refunded(
-                refund_payment,
-                cancelled_by,
-                amount_cents=payment.amount_cents,
-                refund_id=refund.id,
+            # Same key as the refund outbox: one Stripe refund per booking
+            refund = RefundService._create_stripe_refund(
+                booking, payment, cancelled_by, idempotency_key=f"refund:{booking.public_id}"
             )
+            refund_payment = RefundService._record_stripe_refund(booking, payment, refund, cancelled_by)
 
             return True, f"Refund processed: {refund.id}", refund_payment
 
@@ -189,6 +146,89 @@ class RefundService(BaseService):
             )
             raise RefundProcessingError(f"Data error during refund: {str(e)}") from e
 
+    @staticmethod
+    def _create_stripe_refund(booking, payment, cancelled_by, idempotency_key=None):
+        """
+        Create the Stripe refund (network call, keep it out of transactions).
+
+        Args:
+            booking: Booking instance
+            payment: Successful Payment to refund
+            cancelled_by: User who cancelled (None for system)
+            idempotency_key: Optional Stripe idempotency key (retries return
+                the refund created by the first attempt)
+
+        Returns:
+            stripe.Refund
+
+        Raises:
+            PaymentIntentMissingError: If payment has no payment_intent_id
+        """
+        # Get payment intent ID
+        payment_intent_id = payment.stripe_payment_intent_id
+
+        if not payment_intent_id:
+            raise PaymentIntentMissingError(
+                f"Payment {payment.id} has no payment_intent_id - cannot refund"
+            )
+
+        params = {
+            "payment_intent": payment_intent_id,
+            "metadata": {
+                "booking_public_id": str(booking.public_id),
+                "cancelled_by_user_id": str(cancelled_by.id) if cancelled_by else "system",
+                "reason": "booking_cancelled",
+            },
+        }
+        return RefundService._stripe().create_refund(params, idempotency_key=idempotency_key)
+
+    @staticmethod
+    def _record_stripe_refund(booking, payment, refund, cancelled_by, reason=None):
+        """
+        Record a Stripe refund as a negative Payment and audit it.
+
+        Args:
+            booking: Booking instance
+            payment: Refunded Payment
+            refund: stripe.Refund returned by _create_stripe_refund
+            cancelled_by: User who cancelled (None for system)
+            reason: Optional audit reason
+
+        Returns:
+            Payment: Refund payment record
+        """
+        # Ensure currency is valid 3-letter code
+        currency = str(payment.currency).upper().strip()[:3] if payment.currency else "EUR"
+
+        # Create refund payment record (negative amount)
+        refund_payment = Payment.objects.create(
+            user=payment.user,
+            booking=booking,
+            amount_cents=-abs(payment.amount_cents),  # Negative for refund
+            currency=currency,
+            status=STATUS_SUCCEEDED,
+            stripe_payment_intent_id=payment.stripe_payment_intent_id,
+            raw_event={
+                "type": "refund",
+                "refund_id": str(refund.id),
+                "amount": int(getattr(refund, "amount", 0)) if hasattr(refund, "amount") else 0,
+                "status": str(getattr(refund, "status", "")),
+            },
+        )
+
+        # Log refund
+        from audit.services import AuditService
+
+        AuditService.log_payment_refunded(
+            refund_payment,
+            cancelled_by,
+            amount_cents=payment.amount_cents,
+            refund_id=refund.id,
+            reason=reason,
+        )
+
+        return refund_payment
+
     @staticmethod
     def get_refund_amount(booking):
         """
@@ -267,21 +307,22 @@ class RefundService(BaseService):
             return False, "Payment already refunded", payment
 
         # Process Stripe refund (NO validation checks)
-        RefundService._initialize_stripe()
-
         if not payment_intent_id:
             logger.error(f"Payment {payment.id} has no payment_intent_id")
             return False, "Payment has no payment_intent_id - cannot refund", None
 
         try:
             # Create Stripe refund
-            refund = stripe.Refund.create(
-                payment_intent=payment_intent_id,
-                metadata={
-                    "booking_public_id": str(booking.public_id),
-                    "reason": reason,
-                    "emergency_refund": "true",
+            refund = RefundService._stripe().create_refund(
+                {
+                    "payment_intent": payment_intent_id,
+                    "metadata": {
+                        "booking_public_id": str(booking.public_id),
+                        "reason": reason,
+                        "emergency_refund": "true",
+                    },
                 },
+                idempotency_key=f"emergency-refund:{booking.public_id}",
             )
 
             logger.info(f"Stripe refund created: {refund.id}")
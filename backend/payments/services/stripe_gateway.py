@@ -0,0 +1,282 @@
+"""
+Pooled, instrumented Stripe client.
+
+All Stripe API calls go through one StripeGateway per process
+(StripeGateway.default()) instead of the global `stripe.api_key` and the
+library's default HTTP client:
+
+- Keep-alive pool: one requests.Session with STRIPE_POOL_SIZE connections
+  shared by all threads, so calls skip the TCP/TLS handshake.
+- Timeouts: every call has a connect and a read timeout, and retries stop
+  at STRIPE_CALL_BUDGET_SECONDS: a slow Stripe never holds a gunicorn worker
+  past its own timeout.
+- Retries: network errors, 429 and 5xx are retried with backoff. Writes
+  always carry an idempotency key (the caller's, or one generated per
+  logical call), so a retried write is never executed twice by Stripe.
+- Circuit breaker: after STRIPE_BREAKER_FAILURE_THRESHOLD consecutive
+  transient failures, calls fail at once with StripeUnavailableError until
+  a probe call succeeds.
+- Metrics: latency histogram and counters per Stripe operation (metrics()).
+
+STRIPE_API_BASE (settings) points the client at another server, e.g. the
+offline fake of `manage.py fake_stripe` for load tests.
+"""
+
+import logging
+import random
+import threading
+import time
+import uuid
+
+import requests
+import stripe
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from common.utils.circuit_breaker import CircuitBreaker
+from common.utils.latency_histogram import LatencyHistogram
+from ..constants import (
+    STRIPE_BREAKER_FAILURE_THRESHOLD,
+    STRIPE_BREAKER_RESET_SECONDS,
+    STRIPE_CALL_BUDGET_SECONDS,
+    STRIPE_CONNECT_TIMEOUT_SECONDS,
+    STRIPE_MAX_RETRIES,
+    STRIPE_POOL_SIZE,
+    STRIPE_READ_TIMEOUT_SECONDS,
+    STRIPE_RETRY_BACKOFF_SECONDS,
+)
+from ..exceptions import StripeUnavailableError
+
+logger = logging.getLogger("payments.stripe")
+
+# Stripe errors worth retrying (and counted by the circuit breaker)
+TRANSIENT_ERRORS = (
+    stripe.error.APIConnectionError,  # Network error or timeout
+    stripe.error.RateLimitError,  # 429
+    stripe.error.APIError,  # 5xx
+)
+
+_default = None
+_default_lock = threading.Lock()
+
+
+class StripeGateway:
+    """
+    Stripe API client with pooling, timeouts, retries and a circuit breaker.
+
+    Example:
+        >>> gateway = StripeGateway.default()
+        >>> session = gateway.create_checkout_session({...})
+        >>> gateway.create_refund({"payment_intent": "pi_..."}, idempotency_key="refund:...")
+    """
+
+    def __init__(
+        self,
+        api_key,
+        api_base=None,
+        connect_timeout=STRIPE_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=STRIPE_READ_TIMEOUT_SECONDS,
+        max_retries=STRIPE_MAX_RETRIES,
+        retry_backoff=STRIPE_RETRY_BACKOFF_SECONDS,
+        budget=STRIPE_CALL_BUDGET_SECONDS,
+        pool_size=STRIPE_POOL_SIZE,
+        breaker=None,
+        sleep=time.sleep,
+    ):
+        """
+        Args:
+            api_key (str): Stripe secret key (sk_test_...)
+            api_base (str): API base URL (defaults to Stripe's)
+            connect_timeout (float): Seconds to open a connection
+            read_timeout (float): Seconds to wait for a response
+            max_retries (int): Retries of a transient failure
+            retry_backoff (float): First retry delay, doubled per retry
+            budget (float): No retry starts if it could end past this many seconds
+            pool_size (int): Keep-alive connections
+            breaker (CircuitBreaker): Defaults to one built from the constants
+            sleep (callable): Used between retries
+        """
+        self.api_key = api_key
+        self.api_base = api_base or None
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.budget = budget
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=STRIPE_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=STRIPE_BREAKER_RESET_SECONDS,
+        )
+        self._sleep = sleep
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self._client = stripe.StripeClient(
+            api_key,
+            base_addresses={"api": self.api_base} if self.api_base else None,
+            http_client=stripe.RequestsClient(timeout=(connect_timeout, read_timeout), session=session),
+            max_network_retries=0,  # Retried here, where the breaker and metrics see them
+        )
+
+        self._metrics_lock = threading.Lock()
+        self._operations = {}
+
+    @classmethod
+    def default(cls):
+        """
+        Process-wide gateway for the configured key and API base.
+
+        Rebuilt when the settings change (tests with override_settings).
+
+        Raises:
+            ValidationError: If the key is not a Stripe TEST key
+        """
+        from ..validators import validate_stripe_test_mode
+
+        global _default
+        validate_stripe_test_mode()
+        api_key = settings.STRIPE_SECRET_KEY
+        api_base = getattr(settings, "STRIPE_API_BASE", "") or None
+
+        with _default_lock:
+            if _default is None or (_default.api_key, _default.api_base) != (api_key, api_base):
+                _default = cls(api_key, api_base=api_base)
+            return _default
+
+    @staticmethod
+    def default_metrics():
+        """Metrics of the process-wide gateway (None if no Stripe call was made yet)."""
+        gateway = _default
+        return gateway.metrics() if gateway else None
+
+    # ==========================================================================
+    # OPERATIONS
+    # ==========================================================================
+
+    def create_checkout_session(self, params, idempotency_key=None):
+        """Create a Checkout Session (POST /v1/checkout/sessions)."""
+        return self._call(
+            "checkout.session.create",
+            lambda options: self._client.v1.checkout.sessions.create(params, options),
+            write=True,
+            idempotency_key=idempotency_key,
+        )
+
+    def retrieve_checkout_session(self, session_id):
+        """Retrieve a Checkout Session (GET /v1/checkout/sessions/{id})."""
+        return self._call(
+            "checkout.session.retrieve",
+            lambda options: self._client.v1.checkout.sessions.retrieve(session_id, options=options),
+        )
+
+    def create_refund(self, params, idempotency_key=None):
+        """Create a Refund (POST /v1/refunds)."""
+        return self._call(
+            "refund.create",
+            lambda options: self._client.v1.refunds.create(params, options),
+            write=True,
+            idempotency_key=idempotency_key,
+        )
+
+    # ==========================================================================
+    # CALL PIPELINE
+    # ==========================================================================
+
+    def _call(self, operation, request, write=False, idempotency_key=None):
+        """
+        Run request(options) with breaker, retries and metrics.
+
+        Args:
+            operation (str): Metrics name of the Stripe operation
+            request (callable): Performs the call, receives RequestOptions
+            write (bool): POST call: an idempotency key is always sent
+            idempotency_key (str): Caller's key (one is generated if None)
+
+        Raises:
+            StripeUnavailableError: If the circuit is open
+            stripe.error.StripeError: Last error once retries are exhausted
+        """
+        options = {}
+        if write:
+            options["idempotency_key"] = idempotency_key or f"{operation}:{uuid.uuid4().hex}"
+
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self._count(operation, "rejected")
+                raise StripeUnavailableError(f"Stripe unavailable (circuit open), {operation} not attempted")
+
+            attempt += 1
+            self._count(operation, "calls")
+            attempt_started = time.monotonic()
+            try:
+                result = request(options)
+            except TRANSIENT_ERRORS as e:
+                self._observe(operation, attempt_started)
+                self._count(operation, "errors")
+                self.breaker.record_failure()
+
+                delay = self.retry_backoff * 2 ** (attempt - 1) * (1 + random.random() * 0.2)
+                worst_end = time.monotonic() - started + delay + self.connect_timeout + self.read_timeout
+                if attempt > self.max_retries or worst_end > self.budget:
+                    logger.warning(f"Stripe {operation} failed after {attempt} attempt(s): {e}")
+                    raise
+                logger.info(f"Stripe {operation} attempt {attempt} failed ({type(e).__name__}), retrying")
+                self._count(operation, "retries")
+                self._sleep(delay)
+                continue
+            except stripe.error.StripeError:
+                # 4xx: Stripe answered, the request itself is wrong
+                self._observe(operation, attempt_started)
+                self._count(operation, "errors")
+                self.breaker.record_success()
+                raise
+
+            self._observe(operation, attempt_started)
+            self.breaker.record_success()
+            return result
+
+    # ==========================================================================
+    # METRICS
+    # ==========================================================================
+
+    def _operation(self, operation):
+        stats = self._operations.get(operation)
+        if stats is None:
+            with self._metrics_lock:
+                stats = self._operations.setdefault(operation, {
+                    "calls": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "rejected": 0,
+                    "latency": LatencyHistogram(),
+                })
+        return stats
+
+    def _count(self, operation, counter):
+        stats = self._operation(operation)
+        with self._metrics_lock:
+            stats[counter] += 1
+
+    def _observe(self, operation, attempt_started):
+        self._operation(operation)["latency"].observe((time.monotonic() - attempt_started) * 1000)
+
+    def metrics(self):
+        """
+        Per-operation counters and latency histograms, plus breaker state.
+
+        Returns:
+            dict: {"breaker": {...}, "operations": {operation: {...}}}
+        """
+        with self._metrics_lock:
+            operations = {name: dict(stats) for name, stats in self._operations.items()}
+        return {
+            "breaker": self.breaker.snapshot(),
+            "operations": {
+                name: {**{k: v for k, v in stats.items() if k != "latency"}, "latency": stats["latency"].snapshot()}
+                for name, stats in sorted(operations.items())
+            },
+        }
@@ -0,0 +1,376 @@
+"""
+Durable inbox for Stripe webhook events.
+
+The webhook endpoint only verifies the signature and stores the event
+(receive), unique on the Stripe event id: Stripe retries and duplicate
+deliveries cost one INSERT ... ON CONFLICT and are acknowledged at once.
+After commit, the events are handed to a bounded thread pool (dispatch);
+anything the pool could not finish is picked up again by drain(), which the
+lifecycle scheduler fires on next_attempt_at.
+
+Events of one booking (same ordering_key) are processed one at a time, in
+Stripe creation order: an event is only claimed when no earlier event of its
+key is still open. Events of different bookings run in parallel. A failed
+handler is retried with exponential backoff (it holds back the later events
+of its booking); after WEBHOOK_INBOX_MAX_ATTEMPTS it ends in FAILED with a
+critical audit log and can be replayed with `manage.py replay_webhooks`.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import connection, transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from common.services.base import BaseService
+from common.utils.worker_pool import get_pool
+from ..constants import (
+    WEBHOOK_EVENT_CHECKOUT_COMPLETED,
+    WEBHOOK_EVENT_PAYMENT_FAILED,
+    WEBHOOK_EVENT_SESSION_EXPIRED,
+    WEBHOOK_INBOX_BACKOFF_BASE_SECONDS,
+    WEBHOOK_INBOX_BACKOFF_MAX_SECONDS,
+    WEBHOOK_INBOX_BATCH_SIZE,
+    WEBHOOK_INBOX_LEASE_SECONDS,
+    WEBHOOK_INBOX_MAX_ATTEMPTS,
+    WEBHOOK_INBOX_WORKERS,
+)
+from ..models import StripeWebhookEvent
+
+logger = logging.getLogger("payments.webhook")
+
+HANDLED_EVENT_TYPES = (
+    WEBHOOK_EVENT_CHECKOUT_COMPLETED,
+    WEBHOOK_EVENT_PAYMENT_FAILED,
+    WEBHOOK_EVENT_SESSION_EXPIRED,
+)
+
+
+class WebhookInboxService(BaseService):
+    """Service for the Stripe webhook inbox (receive, dispatch, process, replay)."""
+
+    OPEN_STATUSES = (StripeWebhookEvent.Status.PENDING, StripeWebhookEvent.Status.PROCESSING)
+
+    # ==========================================================================
+    # RECEIVE
+    # ==========================================================================
+
+    @staticmethod
+    def ordering_key(event_type, data):
+        """
+        Key serializing the events of one booking.
+
+        Checkout sessions and payment intents both carry booking_public_id
+        in their metadata; the Stripe object id is the fallback.
+        """
+        metadata = data.get("metadata") or {}
+        key = metadata.get("booking_public_id")
+        if not key and event_type.startswith("checkout.session."):
+            key = data.get("client_reference_id")
+        return str(key or data.get("id") or "")
+
+    @staticmethod
+    def receive(event):
+        """
+        Store a verified Stripe event; a redelivery is a no-op.
+
+        Unhandled event types are stored as IGNORED (kept for replay and
+        dedup). New handled events are dispatched once the request commits.
+
+        Args:
+            event (dict): Verified Stripe event body
+
+        Returns:
+            tuple: (StripeWebhookEvent, created)
+        """
+        event_type = event.get("type") or ""
+        data = (event.get("data") or {}).get("object") or {}
+        created_ts = event.get("created")
+        stripe_created = (
+            datetime.fromtimestamp(created_ts, tz=dt_timezone.utc) if created_ts else timezone.now()
+        )
+        handled = event_type in HANDLED_EVENT_TYPES
+
+        row, created = StripeWebhookEvent.objects.get_or_create(
+            stripe_event_id=event["id"],
+            defaults={
+                "event_type": event_type,
+                "ordering_key": WebhookInboxService.ordering_key(event_type, data),
+                "stripe_created": stripe_created,
+                "payload": event,
+                "status": (
+                    StripeWebhookEvent.Status.PENDING if handled else StripeWebhookEvent.Status.IGNORED
+                ),
+            },
+        )
+        if created and handled:
+            transaction.on_commit(WebhookInboxService.dispatch)
+        return row, created
+
+    # ==========================================================================
+    # SCHEDULING
+    # ==========================================================================
+
+    @staticmethod
+    def _due(now):
+        """
+        Events ready to run: due PENDING rows and expired PROCESSING leases,
+        whose booking has no earlier open event.
+        """
+        earlier_open = StripeWebhookEvent.objects.filter(
+            ordering_key=OuterRef("ordering_key"),
+            status__in=WebhookInboxService.OPEN_STATUSES,
+        ).filter(
+            Q(stripe_created__lt=OuterRef("stripe_created"))
+            | Q(stripe_created=OuterRef("stripe_created"), pk__lt=OuterRef("pk"))
+        )
+        ready = Q(status=StripeWebhookEvent.Status.PENDING, next_attempt_at__lte=now) | Q(
+            status=StripeWebhookEvent.Status.PROCESSING,
+            updated_at__lte=now - timedelta(seconds=WEBHOOK_INBOX_LEASE_SECONDS),
+        )
+        return ready & (Q(ordering_key="") | ~Exists(earlier_open))
+
+    @staticmethod
+    def next_deadline():
+        """Earliest time an event becomes due (None if the inbox is empty)."""
+        from django.db.models import Min
+
+        deadlines = StripeWebhookEvent.objects.filter(
+            status__in=WebhookInboxService.OPEN_STATUSES
+        ).aggregate(
+            pending=Min("next_attempt_at", filter=Q(status=StripeWebhookEvent.Status.PENDING)),
+            processing=Min("updated_at", filter=Q(status=StripeWebhookEvent.Status.PROCESSING)),
+        )
+        candidates = [deadlines["pending"]]
+        if deadlines["processing"]:
+            candidates.append(deadlines["processing"] + timedelta(seconds=WEBHOOK_INBOX_LEASE_SECONDS))
+        return min((d for d in candidates if d), default=None)
+
+    @staticmethod
+    def due_ids(now=None, limit=WEBHOOK_INBOX_BATCH_SIZE, ordering_key=None):
+        """Ids of the events ready to run, in Stripe order."""
+        now = now or timezone.now()
+        queryset = StripeWebhookEvent.objects.filter(WebhookInboxService._due(now))
+        if ordering_key is not None:
+            queryset = queryset.filter(ordering_key=ordering_key)
+        return list(queryset.order_by("stripe_created", "pk").values_list("pk", flat=True)[:limit])
+
+    @staticmethod
+    def dispatch():
+        """
+        Hand the due events to the worker pool (called on commit).
+
+        Returns:
+            list: Submitted event ids
+        """
+        ids = WebhookInboxService.due_ids()
+        pool = get_pool("webhook-inbox", WEBHOOK_INBOX_WORKERS)
+        for pk in ids:
+            pool.submit(WebhookInboxService._run_in_worker, pk)
+        return ids
+
+    @staticmethod
+    def _run_in_worker(pk):
+        """
+        Pool entry point: process the event, then the next events of its
+        booking that it was holding back. Closes the thread's connection.
+        """
+        try:
+            WebhookInboxService.process_chain(pk)
+        except Exception:
+            logger.exception(f"Webhook event {pk} crashed")
+        finally:
+            connection.close()
+
+    @staticmethod
+    def process_chain(pk, now=None):
+        """
+        Process an event and the following due events of the same booking.
+
+        Returns:
+            list: (event id, resulting status) of the events processed
+        """
+        results = []
+        while pk:
+            status = WebhookInboxService.process(pk, now=now)
+            if status is None:
+                break
+            results.append((pk, status))
+            if status != StripeWebhookEvent.Status.PROCESSED:
+                break
+            key = StripeWebhookEvent.objects.values_list("ordering_key", flat=True).get(pk=pk)
+            next_ids = WebhookInboxService.due_ids(now, limit=1, ordering_key=key) if key else []
+            pk = next_ids[0] if next_ids else None
+        return results
+
+    @staticmethod
+    def drain(now=None, limit=WEBHOOK_INBOX_BATCH_SIZE):
+        """
+        Process the due events in the calling thread.
+
+        Returns:
+            list: (event id, resulting status) of the events this call ran
+        """
+        now = now or timezone.now()
+        results = []
+        for pk in WebhookInboxService.due_ids(now, limit):
+            results.extend(WebhookInboxService.process_chain(pk, now=now))
+        return results
+
+    # ==========================================================================
+    # PROCESSING
+    # ==========================================================================
+
+    @staticmethod
+    def process(pk, now=None):
+        """
+        Claim and handle one event.
+
+        Args:
+            pk: StripeWebhookEvent id
+            now: Reference time (defaults to timezone.now())
+
+        Returns:
+            str: Resulting status, or None if the event is not claimable
+                 (not due, held back by an earlier event, or owned by another worker)
+        """
+        now = now or timezone.now()
+
+        # One conditional UPDATE: only one worker wins the claim
+        claimed = StripeWebhookEvent.objects.filter(WebhookInboxService._due(now), pk=pk).update(
+            status=StripeWebhookEvent.Status.PROCESSING,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        if not claimed:
+            return None
+
+        row = StripeWebhookEvent.objects.get(pk=pk)
+        try:
+            # Side effects and the PROCESSED mark commit together
+            with transaction.atomic():
+                WebhookInboxService.handle(row.event_type, (row.payload.get("data") or {}).get("object") or {})
+                row.status = StripeWebhookEvent.Status.PROCESSED
+                row.last_error = ""
+                row.processed_at = timezone.now()
+                row.save(update_fields=["status", "last_error", "processed_at", "updated_at"])
+        except Exception as e:
+            return WebhookInboxService._record_failure(row, e, now)
+
+        logger.info(f"Webhook event {row.stripe_event_id} ({row.event_type}) processed")
+        return row.status
+
+    @staticmethod
+    def handle(event_type, data):
+        """
+        Apply a Stripe event to payments and bookings.
+
+        Args:
+            event_type (str): Stripe event type
+            data (dict): Event data object (checkout session or payment intent)
+        """
+        from .payment_service import PaymentService
+
+        if event_type == WEBHOOK_EVENT_CHECKOUT_COMPLETED:
+            booking_public_id = (
+                (data.get("metadata") or {}).get("booking_public_id") or data.get("client_reference_id")
+            )
+            if booking_public_id:
+                PaymentService.confirm_payment_from_webhook(
+                    booking_public_id=booking_public_id,
+                    session_id=data.get("id"),
+                    payment_intent_id=data.get("payment_intent"),
+                    raw_event=data,
+                )
+            else:
+                logger.warning("No booking_public_id found in webhook data")
+
+        elif event_type == WEBHOOK_EVENT_PAYMENT_FAILED:
+            PaymentService.mark_payment_failed(
+                session_id=(data.get("metadata") or {}).get("stripe_session_id"),
+                payment_intent_id=data.get("id"),
+                reason=(data.get("last_payment_error") or {}).get("message"),
+                raw_event=data,
+            )
+
+        elif event_type == WEBHOOK_EVENT_SESSION_EXPIRED:
+            session_id = data.get("id")
+            if session_id:
+                PaymentService.mark_session_canceled(session_id)
+
+        else:
+            logger.info(f"Unhandled event type: {event_type}")
+
+    @staticmethod
+    def backoff(attempts):
+        """Delay before the next attempt after `attempts` failures."""
+        delay = WEBHOOK_INBOX_BACKOFF_BASE_SECONDS * 2 ** max(0, attempts - 1)
+        return timedelta(seconds=min(delay, WEBHOOK_INBOX_BACKOFF_MAX_SECONDS))
+
+    @staticmethod
+    def _record_failure(row, error, now):
+        """
+        Schedule a retry, or give up after too many attempts.
+
+        Every error is retried: "Payment not found" is expected when Stripe
+        delivers before the checkout request has committed.
+        """
+        from audit.services import AuditService
+
+        row.last_error = f"{type(error).__name__}: {error}"[:2000]
+
+        if row.attempts >= WEBHOOK_INBOX_MAX_ATTEMPTS:
+            row.status = StripeWebhookEvent.Status.FAILED
+            row.processed_at = timezone.now()
+            AuditService.log_critical(
+                action="webhook_failed",
+                message=f"Stripe event {row.stripe_event_id} ({row.event_type}) failed after "
+                        f"{row.attempts} attempt(s): {row.last_error}",
+                error_details={
+                    "webhook_event_id": row.id,
+                    "stripe_event_id": row.stripe_event_id,
+                    "ordering_key": row.ordering_key,
+                    "attempts": row.attempts,
+                    "error": row.last_error,
+                },
+            )
+        else:
+            row.status = StripeWebhookEvent.Status.PENDING
+            row.next_attempt_at = now + WebhookInboxService.backoff(row.attempts)
+            logger.warning(
+                f"Webhook event {row.stripe_event_id} attempt {row.attempts} failed, "
+                f"retry at {row.next_attempt_at}: {row.last_error}"
+            )
+
+        row.save(update_fields=["status", "last_error", "next_attempt_at", "processed_at", "updated_at"])
+        return row.status
+
+    # ==========================================================================
+    # REPLAY
+    # ==========================================================================
+
+    @staticmethod
+    def requeue(queryset, now=None):
+        """
+        Put events back in the inbox to be processed again.
+
+        Handlers are idempotent (a confirmed booking is not confirmed twice),
+        so replaying an already processed event is safe.
+
+        Args:
+            queryset: StripeWebhookEvent rows to replay
+            now: Reference time (defaults to timezone.now())
+
+        Returns:
+            int: Number of events re-queued
+        """
+        now = now or timezone.now()
+        return queryset.filter(event_type__in=HANDLED_EVENT_TYPES).update(
+            status=StripeWebhookEvent.Status.PENDING,
+            attempts=0,
+            next_attempt_at=now,
+            last_error="",
+            processed_at=None,
+            updated_at=now,
+        )
@@ -0,0 +1,114 @@
+"""
+Tests for PaymentService checkout retries.
+
+The open Checkout Session is cached on the Payment: retries within its TTL
+are answered without any Stripe call. Stripe is the in-process fake server
+(no network access).
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from bookings.models import Booking, BookingStatus
+from events.models import Event
+from languages.models import Language
+from partners.models import Partner
+from payments.fake_stripe import FakeStripeServer
+from payments.models import Payment
+from payments.services import PaymentService
+
+User = get_user_model()
+
+
+class CheckoutSessionCacheTestCase(TestCase):
+    """Test suite for the cached Checkout Session state."""
+
+    def setUp(self):
+        """Create a PENDING booking and point Stripe at the fake server."""
+        self.server = FakeStripeServer().start()
+        self.addCleanup(self.server.stop)
+        settings_override = override_settings(STRIPE_SECRET_KEY="sk_test_fake", STRIPE_API_BASE=self.server.url)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        organizer = User.objects.create_user(
+            email="organizer@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        self.participant = User.objects.create_user(
+            email="participant@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        event = Event.objects.create(
+            organizer=organizer,
+            partner=Partner.objects.create(
+                name="Test Bar", address="123 Test St", city="Brussels", capacity=50, is_active=True,
+            ),
+            language=Language.objects.create(
+                code="fr", label_fr="Francais", label_en="French", label_nl="Frans", is_active=True,
+            ),
+            theme="Checkout",
+            difficulty="easy",
+            datetime_start=timezone.now() + timedelta(days=2),
+            status=Event.Status.PUBLISHED,
+        )
+        self.booking = Booking.objects.create(
+            user=self.participant, event=event, amount_cents=700, status=BookingStatus.PENDING,
+        )
+
+    def _checkout(self):
+        return PaymentService.create_checkout_session(
+            booking=self.booking,
+            user=self.participant,
+            success_url="http://localhost/success",
+            cancel_url="http://localhost/cancel",
+        )
+
+    def _stripe_calls(self):
+        return [(method, path) for method, path, _ in self.server.log]
+
+    def test_retry_is_answered_locally(self):
+        """A double-click returns the same session with a single Stripe call."""
+        url, session_id, payment = self._checkout()
+        retry_url, retry_id, retry_payment = self._checkout()
+
+        self.assertEqual((retry_url, retry_id, retry_payment.pk), (url, session_id, payment.pk))
+        self.assertEqual(self._stripe_calls(), [("POST", "/v1/checkout/sessions")])
+        # TTL aligned on the booking (15 min) rather than the session (24h)
+        self.assertEqual(payment.checkout_expires_at, self.booking.expires_at)
+
+    def test_row_without_cache_is_refreshed_once(self):
+        """A pending payment without cached state is checked at Stripe once, then cached."""
+        _, session_id, payment = self._checkout()
+        Payment.objects.filter(pk=payment.pk).update(checkout_url="", checkout_expires_at=None)
+
+        self._checkout()
+        self._checkout()
+
+        self.assertEqual(self._stripe_calls(), [
+            ("POST", "/v1/checkout/sessions"),
+            ("GET", f"/v1/checkout/sessions/{session_id}"),
+        ])
+
+    def test_expired_cache_checks_stripe(self):
+        """Past its TTL the cached state is not trusted."""
+        _, session_id, payment = self._checkout()
+        Payment.objects.filter(pk=payment.pk).update(checkout_expires_at=timezone.now() - timedelta(seconds=1))
+
+        self._checkout()
+
+        self.assertEqual(self._stripe_calls()[-1], ("GET", f"/v1/checkout/sessions/{session_id}"))
+
+    def test_expired_webhook_invalidates_session(self):
+        """checkout.session.expired clears the cache: the next retry opens a new session."""
+        _, session_id, payment = self._checkout()
+
+        PaymentService.mark_session_canceled(session_id)
+        _, new_session_id, new_payment = self._checkout()
+
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, Payment.PaymentStatus.CANCELED)
+        self.assertEqual(payment.checkout_url, "")
+        self.assertNotEqual(new_session_id, session_id)
+        self.assertNotEqual(new_payment.pk, payment.pk)
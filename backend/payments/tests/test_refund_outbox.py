@@ -0,0 +1,154 @@
+"""
+Tests for the refund outbox.
+
+Refunds triggered by event cancellation are recorded in the cancelling
+transaction and executed after commit, with retry, backoff and a Stripe
+idempotency key. Stripe is mocked: no network access.
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import stripe
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from audit.models import AuditLog
+from bookings.models import Booking, BookingStatus
+from events.models import Event
+from events.services import EventService
+from languages.models import Language
+from partners.models import Partner
+from payments.constants import REFUND_OUTBOX_MAX_ATTEMPTS
+from payments.models import Payment, RefundRequest
+from payments.services import RefundOutboxService
+
+User = get_user_model()
+
+CREATE_REFUND = "payments.services.stripe_gateway.StripeGateway.create_refund"
+
+
+@override_settings(STRIPE_SECRET_KEY="sk_test_outbox")
+class RefundOutboxTestCase(TestCase):
+    """Test suite for RefundOutboxService."""
+
+    def setUp(self):
+        """Create a PUBLISHED event with one paid CONFIRMED booking."""
+        self.organizer = User.objects.create_user(
+            email="organizer@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        self.participant = User.objects.create_user(
+            email="participant@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        language = Language.objects.create(
+            code="fr", label_fr="Francais", label_en="French", label_nl="Frans", is_active=True,
+        )
+        partner = Partner.objects.create(
+            name="Test Bar", address="123 Test St", city="Brussels", capacity=50, is_active=True,
+        )
+        self.event = Event.objects.create(
+            organizer=self.organizer,
+            partner=partner,
+            language=language,
+            theme="Refunds",
+            difficulty="easy",
+            datetime_start=timezone.now() + timedelta(days=2),
+            status=Event.Status.PUBLISHED,
+        )
+        self.booking = Booking.objects.create(
+            user=self.participant,
+            event=self.event,
+            amount_cents=700,
+            status=BookingStatus.CONFIRMED,
+        )
+        self.payment = Payment.objects.create(
+            user=self.participant,
+            booking=self.booking,
+            amount_cents=700,
+            currency="EUR",
+            status=Payment.PaymentStatus.SUCCEEDED,
+            stripe_payment_intent_id="pi_outbox",
+        )
+
+    def _cancel_event(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            EventService.cancel_event(event=self.event, cancelled_by=self.organizer)
+        return callbacks
+
+    def test_cancel_event_queues_refund_without_calling_stripe(self):
+        """The cancellation only writes an outbox row and dispatches it on commit."""
+        with patch(CREATE_REFUND) as create:
+            callbacks = self._cancel_event()
+
+        create.assert_not_called()
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, BookingStatus.CANCELLED)
+        request = RefundRequest.objects.get(booking=self.booking)
+        self.assertEqual(request.status, RefundRequest.Status.PENDING)
+        self.assertEqual(request.idempotency_key, f"refund:{self.booking.public_id}")
+        self.assertIn(RefundOutboxService.dispatch, callbacks)
+        self.assertEqual(RefundOutboxService.pending_count(self.event), 1)
+
+    def test_drain_refunds_with_idempotency_key(self):
+        """A due request calls Stripe once with its key and records the refund."""
+        self._cancel_event()
+
+        refund = MagicMock(id="re_123", amount=700, status="succeeded")
+        with patch(CREATE_REFUND, return_value=refund) as create:
+            results = RefundOutboxService.drain()
+
+        request = RefundRequest.objects.get(booking=self.booking)
+        self.assertEqual(results, [(request.pk, RefundRequest.Status.SUCCEEDED)])
+        self.assertEqual(create.call_args.kwargs["idempotency_key"], request.idempotency_key)
+        self.assertEqual(request.stripe_refund_id, "re_123")
+        self.assertEqual(request.refund_payment.amount_cents, -700)
+        self.assertEqual(RefundOutboxService.pending_count(self.event), 0)
+
+        # Already executed: a second worker cannot claim it again
+        self.assertIsNone(RefundOutboxService.process(request.pk))
+
+    def test_transient_error_backs_off_then_fails(self):
+        """Network errors retry with exponential backoff until the attempt limit."""
+        self._cancel_event()
+        request = RefundRequest.objects.get(booking=self.booking)
+        now = timezone.now()
+
+        with patch(CREATE_REFUND, side_effect=stripe.error.APIConnectionError("timeout")):
+            status = RefundOutboxService.process(request.pk, now=now)
+            request.refresh_from_db()
+            self.assertEqual(status, RefundRequest.Status.PENDING)
+            self.assertEqual(request.attempts, 1)
+            self.assertEqual(request.next_attempt_at, now + RefundOutboxService.backoff(1))
+            self.assertEqual(RefundOutboxService.drain(now=now), [])  # Not due yet
+
+            while request.status == RefundRequest.Status.PENDING:
+                RefundOutboxService.process(request.pk, now=request.next_attempt_at)
+                request.refresh_from_db()
+
+        self.assertEqual(request.status, RefundRequest.Status.FAILED)
+        self.assertEqual(request.attempts, REFUND_OUTBOX_MAX_ATTEMPTS)
+        self.assertTrue(AuditLog.objects.filter(action="refund_failed").exists())
+
+    def test_permanent_error_fails_immediately(self):
+        """A payment without payment intent cannot be refunded by retrying."""
+        Payment.objects.filter(pk=self.payment.pk).update(stripe_payment_intent_id=None)
+        self._cancel_event()
+
+        results = RefundOutboxService.drain()
+
+        self.assertEqual(results[0][1], RefundRequest.Status.FAILED)
+        self.assertEqual(RefundRequest.objects.get(booking=self.booking).attempts, 1)
+
+    def test_cancel_endpoint_reports_pending_refunds(self):
+        """POST /events/{id}/cancel/ returns at once with the refunds still pending."""
+        client = APIClient()
+        client.force_authenticate(self.organizer)
+
+        with patch(CREATE_REFUND) as create:
+            response = client.post(f"/api/v1/events/{self.event.id}/cancel/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["refunds_pending"], 1)
+        create.assert_not_called()
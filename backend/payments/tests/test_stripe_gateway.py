@@ -0,0 +1,154 @@
+"""
+Tests for the pooled Stripe client.
+
+Calls go to the in-process fake Stripe server over local HTTP: no network
+access. Covers timeouts, retries with idempotency keys, the circuit breaker
+and the checkout path of PaymentService.
+"""
+
+import time
+from datetime import timedelta
+
+import stripe
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from bookings.models import Booking, BookingStatus
+from events.models import Event
+from languages.models import Language
+from partners.models import Partner
+from payments.exceptions import StripeUnavailableError
+from payments.fake_stripe import FakeStripeServer
+from payments.models import Payment
+from payments.services import PaymentService, StripeGateway
+
+User = get_user_model()
+
+
+class StripeGatewayTestCase(TestCase):
+    """Test suite for StripeGateway against the fake Stripe API."""
+
+    def setUp(self):
+        self.server = FakeStripeServer().start()
+        self.addCleanup(self.server.stop)
+
+    def _gateway(self, **kwargs):
+        kwargs.setdefault("sleep", lambda seconds: None)
+        return StripeGateway("sk_test_fake", api_base=self.server.url, **kwargs)
+
+    def test_retry_reuses_idempotency_key(self):
+        """A 5xx is retried with the same key; Stripe creates a single refund."""
+        gateway = self._gateway()
+        self.server.fail_next = 1
+
+        refund = gateway.create_refund({"payment_intent": "pi_1"})
+
+        keys = [key for _, path, key in self.server.log if path == "/v1/refunds"]
+        self.assertEqual(len(keys), 2)
+        self.assertEqual(keys[0], keys[1])
+        self.assertTrue(keys[0].startswith("refund.create:"))
+        self.assertEqual(list(self.server.refunds), [refund.id])
+
+        stats = gateway.metrics()["operations"]["refund.create"]
+        self.assertEqual((stats["calls"], stats["errors"], stats["retries"]), (2, 1, 1))
+        self.assertEqual(stats["latency"]["count"], 2)
+
+    def test_caller_key_makes_writes_idempotent(self):
+        """The same caller key returns the refund created by the first call."""
+        gateway = self._gateway()
+
+        first = gateway.create_refund({"payment_intent": "pi_1"}, idempotency_key="refund:abc")
+        second = gateway.create_refund({"payment_intent": "pi_1"}, idempotency_key="refund:abc")
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(len(self.server.refunds), 1)
+
+    def test_slow_stripe_is_cut_by_read_timeout(self):
+        """A response slower than the read timeout fails fast instead of blocking."""
+        self.server.latency_ms = 500
+        gateway = self._gateway(read_timeout=0.1, max_retries=0)
+
+        started = time.monotonic()
+        with self.assertRaises(stripe.error.APIConnectionError):
+            gateway.retrieve_checkout_session("cs_missing")
+
+        self.assertLess(time.monotonic() - started, 0.45)
+
+    def test_circuit_opens_and_rejects_without_calling_stripe(self):
+        """Consecutive failures open the circuit; calls are refused at once."""
+        from common.utils.circuit_breaker import CircuitBreaker
+
+        gateway = self._gateway(max_retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        self.server.fail_next = 10
+
+        for _ in range(2):
+            with self.assertRaises(stripe.error.APIError):
+                gateway.create_refund({"payment_intent": "pi_1"})
+        received = len(self.server.log)
+
+        with self.assertRaises(StripeUnavailableError):
+            gateway.create_refund({"payment_intent": "pi_1"})
+
+        self.assertEqual(len(self.server.log), received)
+        metrics = gateway.metrics()
+        self.assertEqual(metrics["breaker"]["state"], "open")
+        self.assertEqual(metrics["operations"]["refund.create"]["rejected"], 1)
+
+    def test_client_errors_are_not_retried(self):
+        """A 4xx means Stripe is up: no retry, breaker stays closed."""
+        gateway = self._gateway()
+
+        with self.assertRaises(stripe.error.InvalidRequestError):
+            gateway.retrieve_checkout_session("cs_missing")
+
+        self.assertEqual(len(self.server.log), 1)
+        self.assertEqual(gateway.metrics()["breaker"]["consecutive_failures"], 0)
+
+    def test_checkout_path_offline(self):
+        """PaymentService creates a checkout session through the fake API."""
+        organizer = User.objects.create_user(
+            email="organizer@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        participant = User.objects.create_user(
+            email="participant@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        event = Event.objects.create(
+            organizer=organizer,
+            partner=Partner.objects.create(
+                name="Test Bar", address="123 Test St", city="Brussels", capacity=50, is_active=True,
+            ),
+            language=Language.objects.create(
+                code="fr", label_fr="Francais", label_en="French", label_nl="Frans", is_active=True,
+            ),
+            theme="Gateway",
+            difficulty="easy",
+            datetime_start=timezone.now() + timedelta(days=2),
+            status=Event.Status.PUBLISHED,
+        )
+        booking = Booking.objects.create(
+            user=participant, event=event, amount_cents=700, status=BookingStatus.PENDING,
+        )
+
+        with override_settings(STRIPE_SECRET_KEY="sk_test_fake", STRIPE_API_BASE=self.server.url):
+            url, session_id, payment = PaymentService.create_checkout_session(
+                booking=booking,
+                user=participant,
+                success_url="http://localhost/success",
+                cancel_url="http://localhost/cancel",
+            )
+            # Second call reuses the open session
+            _, reused_id, _ = PaymentService.create_checkout_session(
+                booking=booking,
+                user=participant,
+                success_url="http://localhost/success",
+                cancel_url="http://localhost/cancel",
+            )
+
+        self.assertEqual(reused_id, session_id)
+        self.assertTrue(url.startswith(self.server.url))
+        self.assertEqual(payment.stripe_checkout_session_id, session_id)
+        self.assertEqual(Payment.objects.filter(booking=booking).count(), 1)
+        session = self.server.sessions[session_id]
+        self.assertEqual(session["metadata"]["booking_public_id"], str(booking.public_id))
+        self.assertEqual(session["amount_total"], 700)
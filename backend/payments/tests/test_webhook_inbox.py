@@ -0,0 +1,205 @@
+"""
+Tests for the Stripe webhook inbox.
+
+The webhook endpoint only verifies and stores events; processing runs after
+commit, deduplicated by Stripe event id and ordered per booking. Signature
+verification is mocked: no network access.
+"""
+
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from audit.models import AuditLog
+from bookings.models import Booking, BookingStatus
+from events.models import Event
+from languages.models import Language
+from partners.models import Partner
+from payments.constants import WEBHOOK_INBOX_MAX_ATTEMPTS
+from payments.models import Payment, StripeWebhookEvent
+from payments.services import WebhookInboxService
+
+User = get_user_model()
+
+
+def _event(event_id, event_type, obj, created):
+    return {
+        "id": event_id,
+        "type": event_type,
+        "created": int(created.timestamp()),
+        "data": {"object": obj},
+    }
+
+
+@override_settings(STRIPE_WEBHOOK_SECRET="whsec_inbox")
+class WebhookInboxTestCase(TestCase):
+    """Test suite for WebhookInboxService and the webhook endpoint."""
+
+    def setUp(self):
+        """Create a PENDING booking with an open checkout session."""
+        organizer = User.objects.create_user(
+            email="organizer@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        self.participant = User.objects.create_user(
+            email="participant@example.com", password="testpass123", age=25, consent_given=True,
+        )
+        language = Language.objects.create(
+            code="fr", label_fr="Francais", label_en="French", label_nl="Frans", is_active=True,
+        )
+        partner = Partner.objects.create(
+            name="Test Bar", address="123 Test St", city="Brussels", capacity=50, is_active=True,
+        )
+        event = Event.objects.create(
+            organizer=organizer,
+            partner=partner,
+            language=language,
+            theme="Webhooks",
+            difficulty="easy",
+            datetime_start=timezone.now() + timedelta(days=2),
+            status=Event.Status.PUBLISHED,
+        )
+        self.booking = Booking.objects.create(
+            user=self.participant,
+            event=event,
+            amount_cents=700,
+            status=BookingStatus.PENDING,
+        )
+        self.payment = Payment.objects.create(
+            user=self.participant,
+            booking=self.booking,
+            amount_cents=700,
+            currency="EUR",
+            status=Payment.PaymentStatus.PENDING,
+            stripe_checkout_session_id="cs_inbox",
+        )
+        self.now = timezone.now()
+        self.session = {
+            "id": "cs_inbox",
+            "payment_intent": "pi_inbox",
+            "client_reference_id": str(self.booking.public_id),
+            "metadata": {"booking_public_id": str(self.booking.public_id)},
+        }
+
+    def _post(self, event):
+        client = APIClient()
+        with patch("payments.views.validate_stripe_webhook_signature", return_value=event):
+            return client.post(
+                "/api/v1/payments/stripe-webhook/",
+                data=json.dumps(event),
+                content_type="application/json",
+                HTTP_STRIPE_SIGNATURE="t=1,v1=sig",
+            )
+
+    def test_webhook_stores_event_and_acks_duplicates(self):
+        """The endpoint only stores the event; a redelivery is acknowledged without effect."""
+        event = _event("evt_1", "checkout.session.completed", self.session, self.now)
+
+        with patch("payments.services.PaymentService.confirm_payment_from_webhook") as confirm:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                first = self._post(event)
+            second = self._post(event)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.data, {"detail": "ok"})
+        confirm.assert_not_called()
+        row = StripeWebhookEvent.objects.get()
+        self.assertEqual(row.status, StripeWebhookEvent.Status.PENDING)
+        self.assertEqual(row.ordering_key, str(self.booking.public_id))
+        self.assertIn(WebhookInboxService.dispatch, callbacks)
+
+    def test_drain_confirms_booking(self):
+        """checkout.session.completed confirms the booking when processed."""
+        WebhookInboxService.receive(_event("evt_1", "checkout.session.completed", self.session, self.now))
+
+        results = WebhookInboxService.drain()
+
+        row = StripeWebhookEvent.objects.get()
+        self.assertEqual(results, [(row.pk, StripeWebhookEvent.Status.PROCESSED)])
+        self.booking.refresh_from_db()
+        self.payment.refresh_from_db()
+        self.assertEqual(self.booking.status, BookingStatus.CONFIRMED)
+        self.assertEqual(self.payment.status, Payment.PaymentStatus.SUCCEEDED)
+        self.assertEqual(self.payment.stripe_payment_intent_id, "pi_inbox")
+
+    def test_unhandled_type_is_ignored(self):
+        """Event types without handler are stored as IGNORED, never processed."""
+        row, created = WebhookInboxService.receive(
+            _event("evt_x", "customer.created", {"id": "cus_1"}, self.now)
+        )
+
+        self.assertTrue(created)
+        self.assertEqual(row.status, StripeWebhookEvent.Status.IGNORED)
+        self.assertEqual(WebhookInboxService.drain(), [])
+
+    def test_events_of_a_booking_run_in_stripe_order(self):
+        """A failing event holds back the later events of its booking, not the others."""
+        WebhookInboxService.receive(
+            _event("evt_late", "checkout.session.expired", self.session, self.now)
+        )
+        WebhookInboxService.receive(
+            _event("evt_early", "checkout.session.completed", self.session, self.now - timedelta(seconds=5))
+        )
+        WebhookInboxService.receive(
+            _event("evt_other", "checkout.session.expired", {"id": "cs_other"}, self.now)
+        )
+        early, late, other = (
+            StripeWebhookEvent.objects.get(stripe_event_id=key).pk
+            for key in ("evt_early", "evt_late", "evt_other")
+        )
+        now = timezone.now()
+        self.assertEqual(WebhookInboxService.due_ids(now), [early, other])
+
+        handled = []
+
+        def flaky(event_type, data):
+            handled.append(event_type)
+            if len(handled) == 1:
+                raise RuntimeError("database hiccup")
+
+        with patch.object(WebhookInboxService, "handle", side_effect=flaky):
+            results = WebhookInboxService.drain(now=now)
+            self.assertEqual(dict(results), {
+                early: StripeWebhookEvent.Status.PENDING,
+                other: StripeWebhookEvent.Status.PROCESSED,
+            })
+            self.assertIsNone(WebhookInboxService.process(late, now=now))
+
+            retry_at = StripeWebhookEvent.objects.get(pk=early).next_attempt_at
+            results = WebhookInboxService.drain(now=retry_at)
+
+        self.assertEqual(results, [
+            (early, StripeWebhookEvent.Status.PROCESSED),
+            (late, StripeWebhookEvent.Status.PROCESSED),
+        ])
+        self.assertEqual(handled[-2:], ["checkout.session.completed", "checkout.session.expired"])
+
+    def test_failed_event_can_be_replayed(self):
+        """After the attempt limit the event is FAILED; replay_webhooks runs it again."""
+        WebhookInboxService.receive(_event("evt_1", "checkout.session.completed", self.session, self.now))
+        row = StripeWebhookEvent.objects.get()
+
+        with patch.object(WebhookInboxService, "handle", side_effect=RuntimeError("boom")):
+            while row.status == StripeWebhookEvent.Status.PENDING:
+                WebhookInboxService.process(row.pk, now=row.next_attempt_at)
+                row.refresh_from_db()
+
+        self.assertEqual(row.status, StripeWebhookEvent.Status.FAILED)
+        self.assertEqual(row.attempts, WEBHOOK_INBOX_MAX_ATTEMPTS)
+        self.assertTrue(AuditLog.objects.filter(action="webhook_failed").exists())
+
+        out = StringIO()
+        call_command("replay_webhooks", "--failed", stdout=out)
+
+        row.refresh_from_db()
+        self.assertEqual(row.status, StripeWebhookEvent.Status.PROCESSED)
+        self.assertIn("Re-queued 1 webhook event(s)", out.getvalue())
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, BookingStatus.CONFIRMED)
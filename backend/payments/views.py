@@ -5,6 +5,7 @@ Handles Stripe Checkout session creation and webhook events.
 """
 from __future__ import annotations
 
+import json
 import re
 from urllib.parse import urlencode
 
@@ -27,14 +28,11 @@ from .serializers import (
     APIErrorSerializer,
     WebhookAckSerializer,
 )
-from .services import PaymentService
+from .services import PaymentService, WebhookInboxService
 from .validators import validate_stripe_webhook_signature
 from .constants import (
     DEFAULT_SUCCESS_PATH,
     DEFAULT_CANCEL_PATH,
-    WEBHOOK_EVENT_CHECKOUT_COMPLETED,
-    WEBHOOK_EVENT_PAYMENT_FAILED,
-    WEBHOOK_EVENT_SESSION_EXPIRED,
 )
 from bookings.models import Booking
 
@@ -162,10 +160,14 @@ class StripeWebhookView(views.APIView):
     """
     Stripe webhook endpoint (TEST mode).
 
-    Handles Stripe events:
+    Verifies the signature, stores the event in the webhook inbox (unique on
+    the Stripe event id) and acknowledges. The events are processed after
+    commit by WebhookInboxService:
         - checkout.session.completed → Confirms booking and payment
         - payment_intent.payment_failed → Marks payment as failed
         - checkout.session.expired → Marks session as canceled
+
+    Redeliveries of an event already stored are acknowledged without effect.
     """
 
     authentication_classes = []
@@ -224,44 +226,16 @@ class StripeWebhookView(views.APIView):
 
             raise DRFValidationError(detail=str(e))
 
-        event_type = event.get("type")
-        data = event.get("data", {}).get("object", {})
-        logger.info(f"Event type: {event_type}")
-
-        if event_type == WEBHOOK_EVENT_CHECKOUT_COMPLETED:
-            booking_public_id = (
-                (data.get("metadata") or {}).get("booking_public_id") or data.get("client_reference_id")
-            )
-            session_id = data.get("id")
-            payment_intent_id = data.get("payment_intent")
-
-            if booking_public_id:
-                PaymentService.confirm_payment_from_webhook(
-                    booking_public_id=booking_public_id,
-                    session_id=session_id,
-                    payment_intent_id=payment_intent_id,
-                    raw_event=data,
-                )
-            else:
-                logger.warning("No booking_public_id found in webhook data")
-
-        elif event_type == WEBHOOK_EVENT_PAYMENT_FAILED:
-            payment_intent_id = data.get("id")
-            session_id = (data.get("metadata") or {}).get("stripe_session_id")
-            reason = (data.get("last_payment_error") or {}).get("message")
-            PaymentService.mark_payment_failed(
-                session_id=session_id,
-                payment_intent_id=payment_intent_id,
-                reason=reason,
-                raw_event=data,
-            )
+        if not event.get("id"):
+            from rest_framework.exceptions import ValidationError as DRFValidationError
 
-        elif event_type == WEBHOOK_EVENT_SESSION_EXPIRED:
-            session_id = data.get("id")
-            if session_id:
-                PaymentService.mark_session_canceled(session_id)
+            raise DRFValidationError(detail="Missing event id")
 
+        # Store only: processing runs after commit, off the request (WebhookInboxService)
+        webhook_event, created = WebhookInboxService.receive(json.loads(request.body))
+        if created:
+            logger.info(f"Event {webhook_event.stripe_event_id} ({webhook_event.event_type}) queued")
         else:
-            logger.info(f"Unhandled event type: {event_type}")
+            logger.info(f"Duplicate delivery of {webhook_event.stripe_event_id} ignored")
 
         return Response({"detail": "ok"}, status=status.HTTP_200_OK)
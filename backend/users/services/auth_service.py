@@ -309,7 +309,11 @@ class AuthService(BaseService):
             status=Event.Status.DRAFT
         )
 
+        from partners.services import OccupancyService
+
+        windows = list(draft_events.values_list("partner_id", "datetime_start"))
         draft_events.delete()
+        OccupancyService.refresh_for_windows(windows)
 
         # 5. Anonymize user data
         from .user_service import UserService